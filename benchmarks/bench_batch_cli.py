@@ -0,0 +1,83 @@
+# benchmarks/bench_batch_cli.py
+
+"""
+Throughput of `zeno validate` over a directory of configs by worker count.
+
+Generates count configs (a listener list with a unique_by rule each,
+about 20 KB) and a schema in a temporary directory, then times
+run_batch("validate", ...) with 1, 2, 4, ... workers up to the CPU
+count. Reports files per second and the speed-up over one process.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_batch_cli.py [count]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from zeno.cli.batch import expand_paths, run_batch
+
+
+SCHEMA = """zeno_schema: "2.0"
+application: "ZENO"
+format: "yaml"
+
+root:
+  type: object
+  properties:
+    listeners:
+      type: array
+      unique_by: port
+      items:
+        type: object
+        properties:
+          port:
+            type: integer
+          host:
+            type: string
+"""
+
+
+def _config(i: int) -> str:
+    listeners = [{"port": 1000 + n, "host": f"plc-{i}-{n}.plant.example.com"} for n in range(400)]
+    return yaml.safe_dump({"listeners": listeners}, sort_keys=False)
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cpus = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cpus:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cpus:
+        workers.append(cpus)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        (folder / "schema.zs").write_text(SCHEMA, encoding="utf-8")
+        for i in range(count):
+            (folder / f"config-{i:04d}.yaml").write_text(_config(i), encoding="utf-8")
+        paths = expand_paths([str(folder)])
+
+        print(f"{count} configs, {cpus} CPUs")
+        print(f"{'jobs':>6}{'seconds':>10}{'files/s':>10}{'speed-up':>10}{'ok':>6}")
+        base = None
+        for jobs in workers:
+            start = time.perf_counter()
+            results = run_batch("validate", paths, schema_path=str(folder / "schema.zs"), jobs=jobs)
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            ok = all(result["ok"] for result in results)
+            print(f"{jobs:>6}{elapsed:>10.2f}{count / elapsed:>10.1f}{base / elapsed:>10.2f}{str(ok):>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
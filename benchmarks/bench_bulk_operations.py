@@ -0,0 +1,93 @@
+# benchmarks/bench_bulk_operations.py
+
+"""
+Bulk operations versus the equivalent runs of single operations.
+
+For each list size, times reversing the list with one reorder_list against
+one move_node per item, and copying the list with one clone_subtree
+against an apply_batch of add_node / update_scalar operations.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_bulk_operations.py [max_items]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from zeno.adapters import yaml_adapter
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+from zeno.core.traversal import preorder_ids
+from zeno.core.types import NodeType
+
+
+def _build(item_count: int) -> IRStore:
+    plain = {"devices": [{"host": f"dev-{i}", "port": 502} for i in range(item_count)]}
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    yaml_adapter._parse_object(store, store.get_node(root_id), plain)
+    return store
+
+
+def _ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def _copy_operations(store: IRStore, source_id: int) -> list[Operation]:
+    """What a client without clone_subtree sends: one add per node, then values."""
+    ops = []
+    new_ids = {}
+    for nid in preorder_ids(store, source_id):
+        node = store.get_node(nid)
+        new_ids[nid] = new_id = store.allocate_id()
+        parent_id = store.root_id if nid == source_id else new_ids[node.parent_id]
+        key = "copy" if nid == source_id else node.key
+        ops.append(Operation.create("add_node", None, {
+            "parent_id": parent_id, "node_type": node.type, "key": key, "node_id": new_id,
+        }))
+        if node.type == NodeType.SCALAR:
+            ops.append(Operation.create("update_scalar", new_id, {"node_id": new_id, "value": node.value}))
+    return ops
+
+
+def main() -> int:
+    max_items = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    print(f"{'items':>10}{'moves ms':>12}{'reorder ms':>12}{'adds ms':>12}{'clone ms':>12}")
+    item_count = 100
+    while item_count <= max_items:
+        store = _build(item_count)
+        processor = OperationProcessor(store)
+        devices_id = store.get_child_by_key(store.root_id, "devices")
+
+        def reverse_by_moves():
+            items = list(store.iter_children(devices_id))
+            for index, item_id in enumerate(reversed(items)):
+                processor.apply(Operation.create("move_node", item_id, {"node_id": item_id, "index": index}))
+
+        def reverse_by_reorder():
+            order = list(range(item_count - 1, -1, -1))
+            processor.apply(Operation.create("reorder_list", devices_id, {"node_id": devices_id, "order": order}))
+
+        def copy_by_adds():
+            processor.apply_batch(_copy_operations(store, devices_id))
+
+        def copy_by_clone():
+            processor.apply(Operation.create("clone_subtree", devices_id, {
+                "node_id": devices_id, "parent_id": store.root_id, "key": "clone",
+            }))
+
+        moves, reorder = _ms(reverse_by_moves), _ms(reverse_by_reorder)
+        adds, clone = _ms(copy_by_adds), _ms(copy_by_clone)
+        print(f"{item_count:>10}{moves:>12.1f}{reorder:>12.1f}{adds:>12.1f}{clone:>12.1f}")
+        item_count *= 10
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
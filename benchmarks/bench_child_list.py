@@ -0,0 +1,74 @@
+# benchmarks/bench_child_list.py
+
+"""
+Positional edits on a large LIST: plain list vs ChildList.
+
+Reorders and deletes items in one LIST through the IRStore API (the path
+move_node and remove_node take) and reports total time per backend.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_child_list.py [item_count] [edit_count]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from zeno.core import child_list
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+def _build(item_count: int) -> tuple[IRStore, int, list[int]]:
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    list_node = Node.create(NodeType.LIST)
+    store.add_unlinked_node(list_node)
+    store.link_child(parent_id=root_id, child_id=list_node.id, key="listeners")
+    ids = []
+    for i in range(item_count):
+        item = Node.create(NodeType.SCALAR)
+        item.value = i
+        store.add_unlinked_node(item)
+        store.link_child(parent_id=list_node.id, child_id=item.id)
+        ids.append(item.id)
+    return store, list_node.id, ids
+
+
+def _edits(store: IRStore, list_id: int, ids: list[int], edit_count: int) -> float:
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for i in range(edit_count):
+        pick = rng.randrange(len(ids))
+        child_id = ids[pick]
+        if i % 4 == 3:
+            store.unlink_child(child_id=child_id)
+            store.delete_subtree(node_id=child_id)
+            ids[pick] = ids[-1]
+            ids.pop()
+        else:
+            store.child_index(child_id)
+            store.move_child(child_id=child_id, index=rng.randrange(store.child_count(list_id)))
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    edit_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    print(f"items: {item_count}  edits: {edit_count}")
+    threshold = child_list.CHILD_LIST_THRESHOLD
+    for label, limit in (("plain list", sys.maxsize), ("ChildList", threshold)):
+        child_list.CHILD_LIST_THRESHOLD = limit
+        store, list_id, ids = _build(item_count)
+        elapsed = _edits(store, list_id, ids, edit_count)
+        print(f"{label:<12}{elapsed:>10.3f}s")
+    child_list.CHILD_LIST_THRESHOLD = threshold
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+# benchmarks/bench_columnar_store.py
+
+"""
+IRStore (dict of Node) vs ColumnarIRStore (struct of arrays).
+
+Reports bytes per node, build throughput and whole-tree serialization time
+on the same generated document.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_columnar_store.py [node_count]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+
+from zeno.adapters import yaml_adapter
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+FIELDS_PER_ITEM = 4
+
+
+def _make_plain(node_count: int) -> dict:
+    """Fleet-style list of small objects with repetitive keys and values."""
+    item_count = node_count // (FIELDS_PER_ITEM + 1)
+    items = [
+        {"host": f"dev-{i}", "port": 502, "enabled": True, "unit": i % 16}
+        for i in range(item_count)
+    ]
+    return {"devices": items}
+
+
+def _build(backend: type, plain: dict) -> tuple[IRStore, float, float]:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+
+    store = backend()
+    root_id = store.create_root(NodeType.OBJECT)
+    yaml_adapter._parse_object(store, store.get_node(root_id), plain)
+
+    elapsed = time.perf_counter() - start
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, elapsed, (after - before) / len(store)
+
+
+def main() -> int:
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    plain = _make_plain(node_count)
+
+    print(f"target nodes: {node_count}")
+    print(f"{'backend':<18}{'B/node':>10}{'build s':>10}{'to_plain s':>12}")
+
+    for backend in (IRStore, ColumnarIRStore):
+        store, build_s, per_node = _build(backend, plain)
+
+        start = time.perf_counter()
+        yaml_adapter._node_to_plain(store.get_node(store.root_id), store)
+        plain_s = time.perf_counter() - start
+
+        print(f"{backend.__name__:<18}{per_node:>10.1f}{build_s:>10.2f}{plain_s:>12.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+# benchmarks/bench_fragment_cache.py
+
+"""
+Cached versus full saves after a one-scalar edit.
+
+For each size, parses a generated config into an IRStore, saves it once
+through a FragmentCache to fill it, then repeatedly edits one scalar via
+the OperationProcessor and saves again: through the cache (splicing
+unchanged fragments) and through plain serialize_to. Reports the mean
+time per save and checks that both outputs are byte-identical.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_fragment_cache.py [megabytes ...]
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import time
+
+import yaml
+
+from zeno.adapters.yaml_adapter import parse, serialize_to
+from zeno.adapters.yaml_fragments import FragmentCache
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+EDITS = 10
+
+
+def _device(i: int) -> dict:
+    return {
+        "host": f"device-{i:05d}.plant.example.com",
+        "port": 502,
+        "enabled": True,
+        "timeout": 1.5,
+        "tags": ["line-a", "modbus", "critical"],
+        "registers": {"start": 40001, "count": 64, "scale": 0.1},
+        "description": "Primary controller for the pressure loop on line A",
+    }
+
+
+def _store(megabytes: float) -> IRStore:
+    item_bytes = len(yaml.safe_dump([_device(0)], sort_keys=False))
+    count = int(megabytes * 1024 * 1024 / item_bytes)
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    parse(yaml.safe_dump({"devices": [_device(i) for i in range(count)]}, sort_keys=False), store)
+    return store
+
+
+def _save(store: IRStore, fragments: FragmentCache | None) -> tuple[str, float]:
+    out = io.StringIO()
+    start = time.perf_counter()
+    serialize_to(out, store, store.get_node(store.root_id), fragments=fragments)
+    return out.getvalue(), time.perf_counter() - start
+
+
+def main() -> int:
+    sizes = [float(arg) for arg in sys.argv[1:]] or [1.0, 4.0]
+    print(f"{'MB':>6}{'nodes':>10}{'first s':>10}{'full s':>10}{'cached s':>10}{'same':>6}")
+    for megabytes in sizes:
+        store = _store(megabytes)
+        processor = OperationProcessor(store)
+        fragments = FragmentCache(processor.versions)
+        _, first_s = _save(store, fragments)
+
+        devices = list(store.iter_children(store.get_child_by_key(store.root_id, "devices")))
+        full_s = cached_s = 0.0
+        same = True
+        for edit in range(EDITS):
+            host_id = store.get_child_by_key(devices[edit * len(devices) // EDITS], "host")
+            processor.apply(Operation.create("update_scalar", host_id, {"node_id": host_id, "value": f"edit-{edit}"}))
+            full, seconds = _save(store, None)
+            full_s += seconds
+            cached, seconds = _save(store, fragments)
+            cached_s += seconds
+            same = same and full == cached
+        print(
+            f"{megabytes:>6.1f}{len(store):>10}{first_s:>10.2f}"
+            f"{full_s / EDITS:>10.3f}{cached_s / EDITS:>10.3f}{str(same):>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+# benchmarks/bench_json_adapter.py
+
+"""
+JSON versus YAML adapter on identical documents.
+
+For each size, generates a config, writes it once as YAML and once as
+JSON, and reports parse time (text into a fresh IRStore) and serialize
+time (IR to a temporary file via serialize_to) for both adapters. JSON
+parsing is timed with orjson when it is installed and with the json
+module alone; output never depends on it. Checks that both parses give
+the same tree.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_json_adapter.py [megabytes ...]
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from zeno.adapters import json_adapter, yaml_adapter
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+def _device(i: int) -> dict:
+    return {
+        "host": f"device-{i:05d}.plant.example.com",
+        "port": 502,
+        "enabled": True,
+        "timeout": 1.5,
+        "tags": ["line-a", "modbus", "critical"],
+        "registers": {"start": 40001, "count": 64, "scale": 0.1},
+        "description": "Primary controller for the pressure loop on line A",
+    }
+
+
+def _data(megabytes: float) -> dict:
+    item_bytes = len(yaml.safe_dump([_device(0)], sort_keys=False))
+    count = int(megabytes * 1024 * 1024 / item_bytes)
+    return {"devices": [_device(i) for i in range(count)]}
+
+
+def _parse(adapter, text: str) -> tuple[float, IRStore]:
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    gc.collect()
+    start = time.perf_counter()
+    adapter.parse(text, store)
+    return time.perf_counter() - start, store
+
+
+def _save(adapter, path: Path, store: IRStore) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    with path.open("w", encoding="utf-8") as f:
+        adapter.serialize_to(f, store, store.get_node(store.root_id))
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    sizes = [float(arg) for arg in sys.argv[1:]] or [1.0, 4.0]
+    print(f"JSON decoder: {'orjson' if json_adapter.HAVE_ORJSON else 'json'}")
+    print(f"{'MB':>6}{'nodes':>10}{'yaml in':>10}{'json in':>10}{'no orjson':>11}"
+          f"{'yaml out':>10}{'json out':>10}{'same':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out"
+        for megabytes in sizes:
+            data = _data(megabytes)
+            yaml_text = yaml.safe_dump(data, sort_keys=False)
+            json_text = json.dumps(data, indent=2)
+
+            yaml_in, yaml_store = _parse(yaml_adapter, yaml_text)
+            json_in, json_store = _parse(json_adapter, json_text)
+            orjson, json_adapter.orjson = json_adapter.orjson, None
+            try:
+                plain_in, _ = _parse(json_adapter, json_text)
+            finally:
+                json_adapter.orjson = orjson
+            yaml_out = _save(yaml_adapter, path, yaml_store)
+            json_out = _save(json_adapter, path, json_store)
+
+            same = json_adapter.serialize(yaml_store.get_node(yaml_store.root_id), yaml_store) == \
+                path.read_text(encoding="utf-8")
+            print(f"{megabytes:>6.1f}{len(yaml_store):>10}{yaml_in:>10.2f}{json_in:>10.2f}{plain_in:>11.2f}"
+                  f"{yaml_out:>10.2f}{json_out:>10.2f}{str(same):>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+# benchmarks/bench_node_handles.py
+
+"""
+Parse and render throughput with store-local integer node handles.
+
+Reports:
+- id allocation cost: uuid4() vs IRStore.allocate_id()
+- IR build throughput from already-loaded plain data
+- full yaml_adapter.parse throughput (YAML load + IR build)
+- TreeRenderer tree-data build throughput (skipped without PySide6)
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_node_handles.py [node_count]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from uuid import uuid4
+
+import yaml
+
+from zeno.adapters import yaml_adapter
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+FIELDS_PER_ITEM = 4
+
+
+def _make_plain(node_count: int) -> dict:
+    """Build {"items": [{f0..f3}, ...]} with roughly node_count IR nodes."""
+    item_count = node_count // (FIELDS_PER_ITEM + 1)
+    items = [
+        {f"f{j}": f"value-{i}-{j}" for j in range(FIELDS_PER_ITEM)}
+        for i in range(item_count)
+    ]
+    return {"items": items}
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>12,.0f} nodes/s  ({seconds:.3f}s)"
+
+
+def _bench_ids(count: int) -> None:
+    start = time.perf_counter()
+    for _ in range(count):
+        uuid4()
+    uuid_s = time.perf_counter() - start
+
+    store = IRStore()
+    start = time.perf_counter()
+    for _ in range(count):
+        store.allocate_id()
+    handle_s = time.perf_counter() - start
+
+    print(f"id alloc uuid4        {_rate(count, uuid_s)}")
+    print(f"id alloc handle       {_rate(count, handle_s)}")
+
+
+def _bench_build(plain: dict) -> IRStore:
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+
+    start = time.perf_counter()
+    yaml_adapter._parse_object(store, store.get_node(root_id), plain)
+    elapsed = time.perf_counter() - start
+
+    print(f"IR build              {_rate(len(store._nodes), elapsed)}")
+    return store
+
+
+def _bench_parse(text: str) -> None:
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+
+    start = time.perf_counter()
+    yaml_adapter.parse(text, store)
+    elapsed = time.perf_counter() - start
+
+    print(f"yaml parse            {_rate(len(store._nodes), elapsed)}")
+
+
+def _bench_render(store: IRStore) -> None:
+    try:
+        from zeno.ui.tree_renderer import TreeRenderer
+    except ImportError as e:
+        print(f"render                skipped ({e})")
+        return
+
+    class _TreeSink:
+        def set_tree(self, tree_data) -> None:
+            self.tree_data = tree_data
+
+    renderer = TreeRenderer(store, _TreeSink(), None, lambda: None)
+    renderer.set_root_id(store.root_id)
+
+    start = time.perf_counter()
+    renderer.render_ir_tree_top_level()
+    elapsed = time.perf_counter() - start
+
+    print(f"render tree data      {_rate(len(store._nodes), elapsed)}")
+
+
+def main() -> int:
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    plain = _make_plain(node_count)
+    text = yaml.safe_dump(plain, sort_keys=False)
+
+    print(f"target nodes: {node_count}")
+    _bench_ids(node_count)
+    store = _bench_build(plain)
+    _bench_parse(text)
+    _bench_render(store)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+# benchmarks/bench_node_memory.py
+
+"""
+Bytes-per-node benchmark: legacy dataclass Node vs slots-based Node.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_node_memory.py [count]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+from uuid import UUID, uuid4
+
+from zeno.core.node import Node
+from zeno.core.types import NodeType
+
+
+@dataclass
+class LegacyNode:
+    """Replica of the pre-slots Node layout (baseline)."""
+
+    id: UUID
+    type: NodeType
+    parent_id: Optional[UUID] = None
+    key: Optional[str] = None
+    value: Optional[Any] = None
+    children: list[UUID] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def _measure(factory: Callable[[int], Any], count: int) -> float:
+    """Return allocated bytes per node, excluding the holding list."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    nodes = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    holder = sys.getsizeof(nodes)
+    return (after - before - holder) / count
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    # The uuid objects are identical in both layouts; share them so only
+    # the node representation is measured.
+    ids = [uuid4() for _ in range(count)]
+
+    cases = [
+        ("scalar leaf", NodeType.SCALAR),
+        ("object", NodeType.OBJECT),
+    ]
+
+    print(f"nodes per case: {count}")
+    print(f"{'case':<14}{'legacy B/node':>16}{'slots B/node':>16}{'saved':>10}")
+
+    for label, node_type in cases:
+        legacy = _measure(lambda i: LegacyNode(id=ids[i], type=node_type, value=i), count)
+        slots = _measure(lambda i: Node(id=ids[i], type=node_type, value=i), count)
+        saved = 100.0 * (legacy - slots) / legacy
+        print(f"{label:<14}{legacy:>16.1f}{slots:>16.1f}{saved:>9.1f}%")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+# benchmarks/bench_operation_batch.py
+
+"""
+OperationProcessor throughput: one apply() per op vs apply_batch().
+
+Builds the same list of add_node operations (objects with a few scalar
+fields, ids preallocated) and applies it both ways on fresh stores.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_operation_batch.py [item_count] [batch_size]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+FIELDS_PER_ITEM = 4
+
+
+def _operations(store: IRStore, item_count: int) -> list[Operation]:
+    root_id = store.root_id
+    list_id = store.allocate_id()
+    ops = [Operation.create("add_node", None, {
+        "parent_id": root_id, "node_type": NodeType.LIST, "key": "items", "node_id": list_id,
+    })]
+    for _ in range(item_count):
+        item_id = store.allocate_id()
+        ops.append(Operation.create("add_node", None, {
+            "parent_id": list_id, "node_type": NodeType.OBJECT, "key": None, "node_id": item_id,
+        }))
+        for j in range(FIELDS_PER_ITEM):
+            ops.append(Operation.create("add_node", None, {
+                "parent_id": item_id, "node_type": NodeType.SCALAR, "key": f"f{j}",
+                "node_id": store.allocate_id(),
+            }))
+    return ops
+
+
+def _fresh() -> IRStore:
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    return store
+
+
+def main() -> int:
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+    store = _fresh()
+    ops = _operations(store, item_count)
+    processor = OperationProcessor(store)
+    start = time.perf_counter()
+    for op in ops:
+        processor.apply(op)
+    single_s = time.perf_counter() - start
+
+    store = _fresh()
+    ops = _operations(store, item_count)
+    processor = OperationProcessor(store)
+    start = time.perf_counter()
+    for i in range(0, len(ops), batch_size):
+        processor.apply_batch(ops[i:i + batch_size])
+    batch_s = time.perf_counter() - start
+
+    print(f"ops: {len(ops)}  batch size: {batch_size}")
+    print(f"apply        {len(ops) / single_s:>12,.0f} ops/s  ({single_s:.3f}s)")
+    print(f"apply_batch  {len(ops) / batch_s:>12,.0f} ops/s  ({batch_s:.3f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+# benchmarks/bench_operation_log.py
+
+"""
+Cost of persisting one edit: log append versus full re-serialization.
+
+For each document size, times appending one scalar edit to the operation
+log, serializing the whole document to YAML (what a save-per-edit would
+cost), and recovering the document from a log holding a checkpoint plus
+1000 edits.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_operation_log.py [max_items]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from zeno.adapters import yaml_adapter
+from zeno.core.operation import Operation
+from zeno.core.operation_log import OperationLog, recover
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+EDITS = 1_000
+
+
+def _build(item_count: int) -> IRStore:
+    plain = {"devices": [{"host": f"dev-{i}", "port": 502} for i in range(item_count)]}
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    yaml_adapter._parse_object(store, store.get_node(root_id), plain)
+    return store
+
+
+def main() -> int:
+    max_items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"{'items':>10}{'append us':>12}{'serialize ms':>14}{'recover ms':>12}")
+    item_count = 1_000
+    with tempfile.TemporaryDirectory() as tmp:
+        while item_count <= max_items:
+            store = _build(item_count)
+            processor = OperationProcessor(store)
+            path = Path(tmp) / f"doc-{item_count}.yaml.zwal"
+            log = OperationLog(path, store, checkpoint_every=EDITS + 1)
+            log.attach(processor)
+
+            devices_id = store.get_child_by_key(store.root_id, "devices")
+            item_id = store.get_node(devices_id).children[item_count // 2]
+            port_id = store.get_child_by_key(item_id, "port")
+
+            start = time.perf_counter()
+            for i in range(EDITS):
+                processor.apply(Operation.create("update_scalar", port_id, {"node_id": port_id, "value": i}))
+            append_us = (time.perf_counter() - start) / EDITS * 1e6
+            log.close()
+
+            start = time.perf_counter()
+            yaml_adapter.serialize(store.get_node(store.root_id), store)
+            serialize_ms = (time.perf_counter() - start) * 1e3
+
+            start = time.perf_counter()
+            recover(path)
+            recover_ms = (time.perf_counter() - start) * 1e3
+
+            print(f"{item_count:>10}{append_us:>12.1f}{serialize_ms:>14.1f}{recover_ms:>12.1f}")
+            item_count *= 10
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
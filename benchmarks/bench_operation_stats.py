@@ -0,0 +1,66 @@
+# benchmarks/bench_operation_stats.py
+
+"""
+Cost of operation instrumentation.
+
+Times update_scalar throughput through OperationProcessor.apply before
+instrumentation is enabled, while it is enabled, and after it is disabled
+again. The first and last runs should match: disabled instrumentation
+leaves the plain dispatch path in place.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_operation_stats.py [edits]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.operation_stats import format_stats
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+def _run(processor: OperationProcessor, ops: list[Operation]) -> float:
+    """Edits per second."""
+    start = time.perf_counter()
+    for op in ops:
+        processor.apply(op)
+    return len(ops) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    edits = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    processor = OperationProcessor(store)
+    processor.apply(Operation.create("add_node", None, {
+        "parent_id": root_id, "node_type": NodeType.SCALAR, "key": "value",
+    }))
+    value_id = store.get_child_by_key(root_id, "value")
+    ops = [
+        Operation.create("update_scalar", value_id, {"node_id": value_id, "value": i})
+        for i in range(edits)
+    ]
+
+    before = _run(processor, ops)
+    processor.enable_instrumentation()
+    enabled = _run(processor, ops)
+    table = format_stats(processor.stats())
+    processor.disable_instrumentation()
+    after = _run(processor, ops)
+
+    print(f"{'disabled (before)':<20}{before:>12,.0f} ops/s")
+    print(f"{'enabled':<20}{enabled:>12,.0f} ops/s")
+    print(f"{'disabled (after)':<20}{after:>12,.0f} ops/s")
+    print()
+    print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
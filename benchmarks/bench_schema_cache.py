@@ -0,0 +1,101 @@
+# benchmarks/bench_schema_cache.py
+
+"""
+Schema load time: compiling (parse + validate) versus a cache hit.
+
+Generates a schema with count object properties, each with a few typed
+fields and an array, then times load() + validate_structure(), a cold
+compile_schema() that also writes the cache entry, and warm
+compile_schema() calls served from the cache. Checks the cached schema
+equals the compiled one.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_schema_cache.py [count ...]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from zeno.schema.compiled import compile_schema
+from zeno.schema.loader import load
+from zeno.schema.validator import validate_structure
+
+
+def _section() -> dict:
+    return {
+        "type": "object",
+        "required": ["name", "port"],
+        "properties": {
+            "name": {"type": "string"},
+            "port": {"type": "integer"},
+            "enabled": {"type": "boolean"},
+            "scale": {"type": "number"},
+            "points": {
+                "type": "array",
+                "min_items": 1,
+                "unique_by": "tag",
+                "items": {
+                    "type": "object",
+                    "properties": {"tag": {"type": "string"}, "address": {"type": "integer"}},
+                },
+            },
+        },
+    }
+
+
+def _schema_text(count: int) -> str:
+    data = {
+        "zeno_schema": "2.0",
+        "application": "ZENO",
+        "format": "yaml",
+        "root": {
+            "type": "object",
+            "properties": {f"station_{i:05d}": _section() for i in range(count)},
+        },
+    }
+    return yaml.safe_dump(data, sort_keys=False)
+
+
+def _timed(action, repeat: int = 1):
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = action()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def _load_and_validate(path: Path):
+    schema = load(path)
+    validate_structure(schema)
+    return schema
+
+
+def main() -> int:
+    counts = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000]
+    print(f"{'sections':>9}{'KB':>8}{'load':>10}{'cold':>10}{'warm':>10}{'speed-up':>10}{'same':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        for count in counts:
+            path = folder / f"schema-{count}.zs"
+            path.write_text(_schema_text(count), encoding="utf-8")
+            cache = folder / f"cache-{count}"
+
+            load_time, loaded = _timed(lambda: _load_and_validate(path))
+            cold_time, cold = _timed(lambda: compile_schema(path, cache_dir=cache))
+            warm_time, warm = _timed(lambda: compile_schema(path, cache_dir=cache), repeat=5)
+            same = warm == cold and warm.schema.root == loaded.root
+            print(f"{count:>9}{path.stat().st_size / 1024:>8.0f}{load_time * 1000:>8.1f}ms"
+                  f"{cold_time * 1000:>8.1f}ms{warm_time * 1000:>8.1f}ms"
+                  f"{load_time / warm_time:>10.1f}{str(same):>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+# benchmarks/bench_schema_compiler.py
+
+"""
+Compiled schema validators versus the interpreters on MMA documents.
+
+For each size, generates a config for schema/mma_nested_model.zs
+(listeners with memory blocks, policy rules and notify lists) and parses
+it into an IRStore. Then times one pass of both interpreters, which is
+ir_validator.validate(view, root_type) plus validate_ir_semantics(). It
+also times compiling the schema with compile_validator and one pass of
+the compiled SchemaValidator. Runs once on the valid document and once
+with unknown keys and wrong node kinds injected, and checks both give
+the same issues and errors.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_schema_compiler.py [listeners ...]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+from zeno.adapters import yaml_adapter
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+from zeno.schema.compiled import compile_schema
+from zeno.schema.compiler import compile_validator
+from zeno.schema.ir_semantic_validator import validate_ir_semantics
+from zeno.schema.ir_validator import IRStoreView, ValidationError, validate
+
+
+SCHEMA = Path(__file__).resolve().parent.parent / "schema" / "mma_nested_model.zs"
+
+
+def _block(start: int) -> dict:
+    return {"start": start, "count": 64}
+
+
+def _listener(i: int) -> dict:
+    return {
+        "id": f"listener-{i}",
+        "port": 1000 + i,
+        "memory": [
+            {
+                "unit_id": unit,
+                "holding_registers": _block(40001),
+                "input_registers": _block(30001),
+                "coils": _block(1),
+                "discrete_inputs": _block(10001),
+                "policy": {
+                    "rules": [
+                        {"id": f"rule-{r}", "source_ip": [f"10.0.{i % 250}.{r}"], "allow_fc": [3, 4, 6, 16]}
+                        for r in range(4)
+                    ],
+                },
+            }
+            for unit in range(4)
+        ],
+    }
+
+
+def _notify(kind: str, count: int) -> list:
+    return [{"start": n * 8, "count": 8, "name": f"{kind}-{n}"} for n in range(count)]
+
+
+def _document(listeners: int) -> dict:
+    return {
+        "listeners": [_listener(i) for i in range(listeners)],
+        "state_sealing": {"area": "holding_registers", "start": 0, "count": 16},
+        "notify": {kind: _notify(kind, listeners) for kind in ("holding_registers", "coils")},
+    }
+
+
+def _broken(listeners: int) -> dict:
+    data = _document(listeners)
+    for listener in data["listeners"][::10]:
+        listener["debug"] = True  # unknown key
+        listener["memory"][0]["coils"] = [1, 2]  # object expected
+    data["notify"]["coils"][1] = "not an object"
+    return data
+
+
+def _store(data: dict) -> IRStore:
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    yaml_adapter.parse(yaml.safe_dump(data, sort_keys=False), store)
+    return store
+
+
+def _interpret(store: IRStore, root_type):
+    view = IRStoreView(store, store.root_id)
+    try:
+        validate(view, root_type)
+        issues = []
+    except ValidationError as e:
+        issues = e.issues
+    return issues, validate_ir_semantics(root_type, view)
+
+
+def _timed(action, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = action()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50, 200, 800]
+    root_type = compile_schema(SCHEMA, use_cache=False).root_type
+    compile_time, validator = _timed(lambda: compile_validator(root_type))
+    print(f"compile_validator: {compile_time * 1000:.2f} ms")
+    print(f"{'listeners':>10}{'doc':>8}{'nodes':>10}{'interpret':>11}{'compiled':>10}{'speed-up':>10}"
+          f"{'issues':>8}{'same':>6}")
+    for listeners in sizes:
+        for label, data in (("valid", _document(listeners)), ("broken", _broken(listeners))):
+            store = _store(data)
+            interp_time, expected = _timed(lambda: _interpret(store, root_type))
+            compiled_time, got = _timed(lambda: validator(store))
+            same = list(got[0]) == list(expected[0]) and list(got[1]) == list(expected[1])
+            print(f"{listeners:>10}{label:>8}{len(store):>10}{interp_time * 1000:>9.1f}ms"
+                  f"{compiled_time * 1000:>8.1f}ms{interp_time / compiled_time:>10.1f}"
+                  f"{len(got[0]) + len(got[1]):>8}{str(same):>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+# benchmarks/bench_snapshot.py
+
+"""
+Snapshot cost: deepcopy / IRStore.snapshot() vs PersistentIRStore.snapshot().
+
+Builds the same document in each backend, then reports snapshot time,
+build time, and the cost of edits made right after a snapshot (the
+copy-on-write path).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_snapshot.py [node_count]
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+import time
+
+from zeno.adapters import yaml_adapter
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+FIELDS_PER_ITEM = 4
+
+
+def _make_plain(node_count: int) -> dict:
+    item_count = node_count // (FIELDS_PER_ITEM + 1)
+    items = [
+        {"host": f"dev-{i}", "port": 502, "enabled": True, "unit": i % 16}
+        for i in range(item_count)
+    ]
+    return {"devices": items}
+
+
+def _timed(fn) -> tuple[object, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    plain = _make_plain(node_count)
+    print(f"target nodes: {node_count}")
+
+    for backend in (IRStore, PersistentIRStore):
+        store = backend()
+        root_id = store.create_root(NodeType.OBJECT)
+        _, build_s = _timed(lambda: yaml_adapter._parse_object(store, store.get_node(root_id), plain))
+        print(f"{backend.__name__}: build {build_s:.3f}s")
+
+        if backend is IRStore:
+            _, s = _timed(lambda: copy.deepcopy(store._nodes))
+            print(f"  deepcopy(_nodes)    {s * 1000:>10.2f} ms")
+
+        _, s = _timed(store.snapshot)
+        print(f"  snapshot()          {s * 1000:>10.2f} ms")
+
+        # 1000 scalar edits right after a snapshot (copy-on-write path).
+        ids = [nid for nid in store.iter_node_ids() if store.get_node(nid).type == NodeType.SCALAR]
+        store.snapshot()
+        _, s = _timed(lambda: [store.set_value(nid, 0) for nid in ids[:1000]])
+        print(f"  1000 edits          {s * 1000:>10.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+# benchmarks/bench_snapshot_file.py
+
+"""
+Binary snapshot files versus YAML for opening large documents.
+
+For each size, generates a config, parses its YAML text into an IRStore
+and saves it with save_snapshot. Reports the YAML parse time, snapshot
+save time and file size, then the time to open the snapshot
+(load_snapshot), to reach one node deep in the tree and to build every
+node. Checks the mapped store serializes to the same YAML as the parsed
+one.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_snapshot_file.py [megabytes ...]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from zeno.adapters import yaml_adapter
+from zeno.core.snapshot_file import load_snapshot, save_snapshot
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+def _device(i: int) -> dict:
+    return {
+        "host": f"device-{i:05d}.plant.example.com",
+        "port": 502,
+        "enabled": True,
+        "timeout": 1.5,
+        "tags": ["line-a", "modbus", "critical"],
+        "registers": {"start": 40001, "count": 64, "scale": 0.1},
+        "description": "Primary controller for the pressure loop on line A",
+    }
+
+
+def _yaml_text(megabytes: float) -> str:
+    item_bytes = len(yaml.safe_dump([_device(0)], sort_keys=False))
+    count = int(megabytes * 1024 * 1024 / item_bytes)
+    return yaml.safe_dump({"devices": [_device(i) for i in range(count)]}, sort_keys=False)
+
+
+def _timed(action):
+    gc.collect()
+    start = time.perf_counter()
+    result = action()
+    return time.perf_counter() - start, result
+
+
+def _last_scale(store: IRStore):
+    devices = store.get_child_by_key(store.root_id, "devices")
+    last = store.get_node(devices).children[-1]
+    registers = store.get_child_by_key(last, "registers")
+    return store.get_node(store.get_child_by_key(registers, "scale")).value
+
+
+def _build_all(store: IRStore) -> None:
+    for node_id in store.iter_node_ids():
+        store.get_node(node_id)
+
+
+def _text(store: IRStore) -> str:
+    return yaml_adapter.serialize(store.get_node(store.root_id), store)
+
+
+def main() -> int:
+    sizes = [float(arg) for arg in sys.argv[1:]] or [4.0, 16.0]
+    print(f"{'MB':>6}{'nodes':>10}{'yaml in':>10}{'save':>8}{'file MB':>9}"
+          f"{'open':>10}{'one node':>10}{'all':>8}{'same':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "doc.zsnap"
+        for megabytes in sizes:
+            text = _yaml_text(megabytes)
+            store = IRStore()
+            store.create_root(NodeType.OBJECT)
+            parse_time, _ = _timed(lambda: yaml_adapter.parse(text, store))
+            save_time, _ = _timed(lambda: save_snapshot(store, path))
+
+            open_time, mapped = _timed(lambda: load_snapshot(path))
+            reach_time, scale = _timed(lambda: _last_scale(mapped))
+            all_time, _ = _timed(lambda: _build_all(mapped))
+            same = scale == 0.1 and _text(mapped) == _text(store)
+            print(f"{megabytes:>6.1f}{len(store):>10}{parse_time:>10.2f}{save_time:>8.2f}"
+                  f"{path.stat().st_size / 2 ** 20:>9.1f}{open_time * 1000:>8.2f}ms"
+                  f"{reach_time * 1000:>8.2f}ms{all_time:>8.2f}{str(same):>6}")
+            del store, mapped
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+# benchmarks/bench_traversal.py
+
+"""
+Iterative traversal on pathological tree shapes.
+
+Builds a very deep OBJECT chain and a very wide flat LIST through the store
+API, then times pre/post-order walks, serialization to plain data, IR
+validation and subtree deletion. Also times IR build from deeply nested
+plain data. None of these hit the interpreter recursion limit.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_traversal.py [depth] [width]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from zeno.adapters import yaml_adapter
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.traversal import postorder_ids, preorder_ids
+from zeno.core.types import NodeType
+from zeno.schema.ir_validator import IRStoreView, validate
+
+
+def _add(store: IRStore, parent_id: int, node_type: NodeType, key=None, value=None) -> int:
+    node = Node.create(node_type)
+    node.value = value
+    store.add_unlinked_node(node)
+    store.link_child(parent_id=parent_id, child_id=node.id, key=key)
+    return node.id
+
+
+def _deep(depth: int) -> tuple[IRStore, int]:
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    top_id = parent_id = _add(store, root_id, NodeType.OBJECT, key="a")
+    for _ in range(depth - 1):
+        parent_id = _add(store, parent_id, NodeType.OBJECT, key="a")
+    _add(store, parent_id, NodeType.SCALAR, key="leaf", value=1)
+    return store, top_id
+
+
+def _wide(width: int) -> tuple[IRStore, int]:
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    top_id = _add(store, root_id, NodeType.LIST, key="items")
+    for i in range(width):
+        _add(store, top_id, NodeType.SCALAR, value=i)
+    return store, top_id
+
+
+def _timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    print(f"  {label:<16}{time.perf_counter() - start:>10.3f}s")
+
+
+def _run(name: str, store: IRStore, top_id: int) -> None:
+    root_id = store.root_id
+    print(f"{name}: {len(store)} nodes")
+    _timed("preorder", lambda: sum(1 for _ in preorder_ids(store, root_id)))
+    _timed("postorder", lambda: sum(1 for _ in postorder_ids(store, root_id)))
+    _timed("to_plain", lambda: yaml_adapter._node_to_plain(store.get_node(root_id), store))
+    _timed("validate", lambda: validate(IRStoreView(store, root_id)))
+
+    def delete() -> None:
+        store.unlink_child(child_id=top_id)
+        store.delete_subtree(node_id=top_id)
+
+    _timed("delete_subtree", delete)
+
+
+def main() -> int:
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+    _run(f"deep (depth {depth})", *_deep(depth))
+    _run(f"wide (width {width})", *_wide(width))
+
+    data: dict = {"leaf": 1}
+    for _ in range(depth):
+        data = {"a": data}
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    print(f"deep plain data (depth {depth})")
+    _timed("ir build", lambda: yaml_adapter._parse_object(store, store.get_node(root_id), data))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
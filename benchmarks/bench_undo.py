@@ -0,0 +1,64 @@
+# benchmarks/bench_undo.py
+
+"""
+Undo/redo latency versus document size.
+
+For each document size, times undo and redo of a scalar edit and of the
+removal of one list item through OperationProcessor. Both should stay flat
+as the document grows.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_undo.py [max_items]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from zeno.adapters import yaml_adapter
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+def _build(item_count: int) -> IRStore:
+    plain = {"devices": [{"host": f"dev-{i}", "port": 502} for i in range(item_count)]}
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    yaml_adapter._parse_object(store, store.get_node(root_id), plain)
+    return store
+
+
+def _us(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e6
+
+
+def main() -> int:
+    max_items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"{'items':>10}{'edit undo us':>14}{'edit redo us':>14}{'remove undo us':>16}{'remove redo us':>16}")
+    item_count = 1_000
+    while item_count <= max_items:
+        store = _build(item_count)
+        processor = OperationProcessor(store)
+        devices_id = store.get_child_by_key(store.root_id, "devices")
+        item_id = store.get_node(devices_id).children[item_count // 2]
+        port_id = store.get_child_by_key(item_id, "port")
+
+        processor.apply(Operation.create("update_scalar", port_id, {"node_id": port_id, "value": 1}))
+        edit_undo, edit_redo = _us(processor.undo), _us(processor.redo)
+
+        processor.apply(Operation.create("remove_node", item_id, {"node_id": item_id}))
+        remove_undo, remove_redo = _us(processor.undo), _us(processor.redo)
+
+        print(f"{item_count:>10}{edit_undo:>14.1f}{edit_redo:>14.1f}{remove_undo:>16.1f}{remove_redo:>16.1f}")
+        item_count *= 10
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+# benchmarks/bench_yaml_backend.py
+
+"""
+libyaml versus pure-Python YAML on a large config.
+
+Builds a config of about the requested size (default 10 MB of YAML), then
+times load and dump with the pure-Python SafeLoader/SafeDumper against
+the helpers in yaml_backend (libyaml when installed, plus the check that
+keeps output byte-identical), and reports the speed-up.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_yaml_backend.py [megabytes]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import yaml
+
+from zeno.adapters.yaml_backend import HAVE_LIBYAML, safe_dump, safe_load
+
+DUMP_OPTIONS = {"sort_keys": False, "allow_unicode": True}
+
+
+def _device(i: int) -> dict:
+    return {
+        "host": f"device-{i:05d}.plant.example.com",
+        "port": 502,
+        "enabled": True,
+        "timeout": 1.5,
+        "tags": ["line-a", "modbus", "critical"],
+        "registers": {"start": 40001, "count": 64, "scale": 0.1},
+        "description": "Primary controller for the pressure loop on line A",
+    }
+
+
+def _config(megabytes: float) -> dict:
+    item_bytes = len(yaml.dump([_device(0)], Dumper=yaml.SafeDumper, **DUMP_OPTIONS))
+    count = int(megabytes * 1024 * 1024 / item_bytes)
+    return {"devices": [_device(i) for i in range(count)]}
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    data = _config(megabytes)
+
+    pure_text, pure_dump_s = _timed(lambda: yaml.dump(data, Dumper=yaml.SafeDumper, **DUMP_OPTIONS))
+    fast_text, fast_dump_s = _timed(lambda: safe_dump(data, **DUMP_OPTIONS))
+    _, pure_load_s = _timed(lambda: yaml.load(pure_text, Loader=yaml.SafeLoader))
+    _, fast_load_s = _timed(lambda: safe_load(pure_text))
+
+    print(f"libyaml: {'yes' if HAVE_LIBYAML else 'no (pure-Python fallback)'}")
+    print(f"document: {len(pure_text) / 1024 / 1024:.1f} MB, byte-identical: {fast_text == pure_text}")
+    print(f"{'':<8}{'pure s':>10}{'backend s':>12}{'speed-up':>10}")
+    print(f"{'load':<8}{pure_load_s:>10.2f}{fast_load_s:>12.2f}{pure_load_s / fast_load_s:>9.1f}x")
+    print(f"{'dump':<8}{pure_dump_s:>10.2f}{fast_dump_s:>12.2f}{pure_dump_s / fast_dump_s:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+# benchmarks/bench_yaml_emitter.py
+
+"""
+Streaming serialize_to versus serialize + write on growing documents.
+
+For each size, parses a generated config into an IRStore and saves it to
+a temporary file both ways: serialize (plain copy of the tree, then one
+string) followed by a write, and serialize_to straight into the open
+file. Reports wall time and peak traced memory (tracemalloc, measured in
+a separate run) and checks that the files are byte-identical.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_yaml_emitter.py [megabytes ...]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+from zeno.adapters.yaml_adapter import parse, serialize, serialize_to
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+def _device(i: int) -> dict:
+    return {
+        "host": f"device-{i:05d}.plant.example.com",
+        "port": 502,
+        "enabled": True,
+        "timeout": 1.5,
+        "tags": ["line-a", "modbus", "critical"],
+        "registers": {"start": 40001, "count": 64, "scale": 0.1},
+        "description": "Primary controller for the pressure loop on line A",
+    }
+
+
+def _store(megabytes: float) -> IRStore:
+    item_bytes = len(yaml.safe_dump([_device(0)], sort_keys=False))
+    count = int(megabytes * 1024 * 1024 / item_bytes)
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    parse(yaml.safe_dump({"devices": [_device(i) for i in range(count)]}, sort_keys=False), store)
+    return store
+
+
+def _save_string(path: Path, store: IRStore) -> None:
+    path.write_text(serialize(store.get_node(store.root_id), store), encoding="utf-8")
+
+
+def _save_stream(path: Path, store: IRStore) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        serialize_to(f, store, store.get_node(store.root_id))
+
+
+def _measure(save, path: Path, store: IRStore) -> tuple[float, float]:
+    gc.collect()
+    start = time.perf_counter()
+    save(path, store)
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    save(path, store)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1024 / 1024
+
+
+def main() -> int:
+    sizes = [float(arg) for arg in sys.argv[1:]] or [1.0, 4.0]
+    print(f"{'MB':>6}{'nodes':>10}{'string s':>10}{'peak MB':>10}{'stream s':>10}{'peak MB':>10}{'same':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        string_path, stream_path = Path(tmp) / "string.yaml", Path(tmp) / "stream.yaml"
+        for megabytes in sizes:
+            store = _store(megabytes)
+            string_s, string_mb = _measure(_save_string, string_path, store)
+            stream_s, stream_mb = _measure(_save_stream, stream_path, store)
+            same = string_path.read_bytes() == stream_path.read_bytes()
+            print(
+                f"{megabytes:>6.1f}{len(store):>10}{string_s:>10.2f}{string_mb:>10.1f}"
+                f"{stream_s:>10.2f}{stream_mb:>10.2f}{str(same):>6}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+# benchmarks/bench_yaml_events.py
+
+"""
+Event-stream versus load-then-walk YAML parsing into an IRStore.
+
+Parses a generated config (default 2 MB of YAML) with yaml_adapter.parse
+in both modes and reports wall time and peak traced memory (tracemalloc)
+for each; tracing slows parsing, so the timing comes from a separate run.
+The streaming mode never holds the plain dict/list tree, so its peak is
+the store alone.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_yaml_events.py [megabytes]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+
+import yaml
+
+from zeno.adapters.yaml_adapter import parse
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+def _device(i: int) -> dict:
+    return {
+        "host": f"device-{i:05d}.plant.example.com",
+        "port": 502,
+        "enabled": True,
+        "timeout": 1.5,
+        "tags": ["line-a", "modbus", "critical"],
+        "registers": {"start": 40001, "count": 64, "scale": 0.1},
+        "description": "Primary controller for the pressure loop on line A",
+    }
+
+
+def _document(megabytes: float) -> str:
+    item_bytes = len(yaml.safe_dump([_device(0)], sort_keys=False))
+    count = int(megabytes * 1024 * 1024 / item_bytes)
+    return yaml.safe_dump({"devices": [_device(i) for i in range(count)]}, sort_keys=False)
+
+
+def _parse(text: str, streaming: bool) -> IRStore:
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    parse(text, store, streaming=streaming)
+    return store
+
+
+def _measure(text: str, streaming: bool) -> tuple[float, float, int]:
+    """(seconds, peak MB, node count); time and memory come from separate runs."""
+    gc.collect()
+    start = time.perf_counter()
+    store = _parse(text, streaming)
+    seconds = time.perf_counter() - start
+    nodes = len(store)
+    del store
+
+    gc.collect()
+    tracemalloc.start()
+    _parse(text, streaming)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1024 / 1024, nodes
+
+
+def main() -> int:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    text = _document(megabytes)
+
+    tree_s, tree_mb, tree_nodes = _measure(text, streaming=False)
+    events_s, events_mb, events_nodes = _measure(text, streaming=True)
+    assert tree_nodes == events_nodes
+
+    print(f"document: {len(text) / 1024 / 1024:.1f} MB, {events_nodes} nodes")
+    print(f"{'mode':<10}{'seconds':>10}{'peak MB':>10}")
+    print(f"{'tree':<10}{tree_s:>10.2f}{tree_mb:>10.1f}")
+    print(f"{'events':<10}{events_s:>10.2f}{events_mb:>10.1f}")
+    print(f"time {tree_s / events_s:.2f}x, peak memory {tree_mb / events_mb:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
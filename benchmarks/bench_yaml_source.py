@@ -0,0 +1,112 @@
+# benchmarks/bench_yaml_source.py
+
+"""
+Cost of recording source spans, and partial re-parse versus full reload.
+
+Generates a config with many top-level sections (default 2 MB of YAML),
+parses it with and without a SourceMap, and reports the parse time and
+the SourceMap's traced size (tracemalloc, in a separate run). It then
+changes one scalar in a middle section and brings the document up to
+date twice: with reparse_changed, and by parsing the new text in full.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_yaml_source.py [megabytes]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+
+import yaml
+
+from zeno.adapters.yaml_adapter import parse, serialize
+from zeno.adapters.yaml_reparse import reparse_changed
+from zeno.adapters.yaml_source import SourceMap
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+SECTIONS = 50
+
+
+def _device(i: int) -> dict:
+    return {
+        "host": f"device-{i:05d}.plant.example.com",
+        "port": 502,
+        "enabled": True,
+        "timeout": 1.5,
+        "tags": ["line-a", "modbus", "critical"],
+        "registers": {"start": 40001, "count": 64, "scale": 0.1},
+        "description": "Primary controller for the pressure loop on line A",
+    }
+
+
+def _document(megabytes: float) -> str:
+    item_bytes = len(yaml.safe_dump([_device(0)], sort_keys=False))
+    per_section = max(1, int(megabytes * 1024 * 1024 / item_bytes / SECTIONS))
+    data = {
+        f"line_{s:02d}": [_device(s * per_section + i) for i in range(per_section)]
+        for s in range(SECTIONS)
+    }
+    return yaml.safe_dump(data, sort_keys=False)
+
+
+def _parse(text: str, source: SourceMap | None) -> IRStore:
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    parse(text, store, source=source)
+    return store
+
+
+def _timed(action) -> tuple[float, object]:
+    gc.collect()
+    start = time.perf_counter()
+    result = action()
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    text = _document(megabytes)
+
+    plain_s, _ = _timed(lambda: _parse(text, None))
+    source = SourceMap()
+    spans_s, store = _timed(lambda: _parse(text, source))
+
+    # Traced size of a parsed store with and without its SourceMap.
+    gc.collect()
+    tracemalloc.start()
+    spans = SourceMap()
+    kept = (_parse(text, spans), spans)
+    with_spans, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept, spans
+    gc.collect()
+    tracemalloc.start()
+    kept = (_parse(text, None),)
+    without_spans, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    middle = text.index(f"line_{SECTIONS // 2:02d}:")
+    at = text.index("port: 502", middle)
+    changed = text[:at] + "port: 503" + text[at + len("port: 502"):]
+
+    processor = OperationProcessor(store)
+    partial_s, updated = _timed(lambda: reparse_changed(changed, store, processor, source))
+    full_s, full = _timed(lambda: _parse(changed, SourceMap()))
+    same = updated and serialize(store.get_node(store.root_id), store) == serialize(full.get_node(full.root_id), full)
+
+    print(f"document: {len(text) / 1024 / 1024:.1f} MB, {len(store)} nodes, {SECTIONS} sections")
+    print(f"parse             {plain_s:8.2f} s")
+    print(f"parse + spans     {spans_s:8.2f} s   spans {(with_spans - without_spans) / 1024 / 1024:.1f} MB")
+    print(f"full reload       {full_s:8.3f} s")
+    print(f"partial re-parse  {partial_s:8.3f} s   same: {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
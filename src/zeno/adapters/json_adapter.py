@@ -0,0 +1,211 @@
+# src/zeno/adapters/json_adapter.py
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+import re
+from datetime import date, datetime, time
+from typing import Any, Iterator, List, TextIO
+
+from zeno.core.node import Node
+from zeno.core.node_records import plain_node_type
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId, NodeType
+
+# orjson is optional: it only speeds up decoding. Output is written by
+# serialize_to below either way, so the text never depends on it.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+HAVE_ORJSON = orjson is not None
+
+# Digit runs that may be integers beyond 64 bits, which some orjson
+# versions decode as floats; such texts are decoded by the json module.
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+# Pieces buffered before each stream.write.
+_FLUSH_PIECES = 4096
+
+_INDENT = "  "
+
+_encode_str = json.encoder.encode_basestring  # C version when available
+
+
+def serialize(node: Node, store: IRStore) -> str:
+    """
+    Serialize a Node tree to JSON string (2-space indent, UTF-8 text).
+
+    The text equals json.dumps(data, indent=2, ensure_ascii=False) plus a
+    final newline, where data is the plain form of the tree. Values JSON
+    has no type for are written as YAML loads them back into strings:
+    dates and times in ISO format, bytes as base64, sets as lists.
+    """
+    out = io.StringIO()
+    serialize_to(out, store, node)
+    return out.getvalue()
+
+
+def serialize_to(stream: TextIO, store: IRStore, node: Node) -> None:
+    """Write serialize(node, store) to stream straight from the IR (no plain copy)."""
+    pieces: List[str] = []
+    if node.type == NodeType.SCALAR:
+        pieces.append(_scalar(node.value))
+    else:
+        _write_container(stream, store, node, pieces)
+    pieces.append("\n")
+    stream.write("".join(pieces))
+
+
+def parse(json_text: str | bytes, store: IRStore) -> None:
+    """
+    Parse JSON text and populate an IRStore.
+
+    Assumes store already has a root node created. Decodes with orjson
+    when installed (the json module takes what orjson rejects or may get
+    wrong: NaN / Infinity literals, integers beyond 64 bits), then creates
+    all nodes through IRStore.insert_nodes in one pass.
+    """
+    data = _loads(json_text)
+    if data is None:
+        return
+
+    if not store.has_root():
+        raise ValueError("Store must have a root node before parsing")
+
+    if isinstance(data, (dict, list)):
+        store.insert_nodes(_nodes(store, store.root_id, data))
+    else:
+        # Scalar at root level
+        store.set_value(store.root_id, data)
+
+
+# ============================================================
+# Serialization (Node → JSON text)
+# ============================================================
+
+def _write_container(stream: TextIO, store: IRStore, root: Node, pieces: List[str]) -> None:
+    """Append root's subtree to pieces, flushing them to stream as they pile up."""
+    append = pieces.append
+    get_node = store.get_node
+    iter_children = store.iter_children
+
+    # Open containers: (children iterator, is object, any child written yet).
+    stack: List[list] = [[iter_children(root.id), root.type == NodeType.OBJECT, False]]
+    append("{" if root.type == NodeType.OBJECT else "[")
+    while stack:
+        frame = stack[-1]
+        child_id = next(frame[0], None)
+        depth = len(stack)
+        if child_id is None:
+            stack.pop()
+            close = "}" if frame[1] else "]"
+            append("\n" + _INDENT * (depth - 1) + close if frame[2] else close)
+            continue
+
+        append(",\n" + _INDENT * depth if frame[2] else "\n" + _INDENT * depth)
+        frame[2] = True
+        child = get_node(child_id)
+        if frame[1]:
+            append(_key(child.key))
+            append(": ")
+        if child.type == NodeType.SCALAR:
+            append(_scalar(child.value, depth))
+        elif child.type == NodeType.OBJECT:
+            append("{")
+            stack.append([iter_children(child_id), True, False])
+        else:
+            append("[")
+            stack.append([iter_children(child_id), False, False])
+
+        if len(pieces) >= _FLUSH_PIECES:
+            stream.write("".join(pieces))
+            pieces.clear()
+
+
+def _scalar(value: Any, depth: int = 0) -> str:
+    kind = type(value)
+    if kind is str:
+        return _encode_str(value)
+    if value is None:
+        return "null"
+    if kind is bool:
+        return "true" if value else "false"
+    if kind is int:
+        return int.__repr__(value)
+    if kind is float:
+        return _float(value)
+    # Sets, tuples (!!omap pairs) and the like may span lines: indent those to depth.
+    text = json.dumps(value, indent=2, ensure_ascii=False, default=_plain)
+    return text.replace("\n", "\n" + _INDENT * depth) if depth else text
+
+
+def _float(value: float) -> str:
+    # As json.dumps (allow_nan): repr, or JavaScript's names for non-finite values.
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+
+def _key(key: Any) -> str:
+    """Object key as json.dumps writes it; other key types go through _plain first."""
+    if type(key) is str:
+        return _encode_str(key)
+    if key is None or isinstance(key, (bool, int, float)):
+        return _encode_str(_scalar(key))
+    return _encode_str(str(_plain(key)))
+
+
+def _plain(value: Any) -> Any:
+    """json.dumps default hook for non-JSON scalar values."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# ============================================================
+# Parsing (JSON text → Node tree + Store)
+# ============================================================
+
+def _loads(json_text: str | bytes) -> Any:
+    if isinstance(json_text, (bytes, bytearray)):
+        json_text = json_text.decode("utf-8")
+    if orjson is not None and _LONG_DIGITS.search(json_text) is None:
+        try:
+            return orjson.loads(json_text)
+        except orjson.JSONDecodeError:
+            pass  # let the json module decide (and word any error)
+    return json.loads(json_text)
+
+
+def _nodes(store: IRStore, parent_id: NodeId, data: dict | list) -> Iterator[Node]:
+    """New nodes for data's entries under parent_id, in pre-order, for IRStore.insert_nodes."""
+    stack = [(parent_id, _entries(data))]
+    while stack:
+        container_id, entries = stack[-1]
+        for key, value in entries:
+            node = Node.create(plain_node_type(value))
+            if node.type == NodeType.SCALAR:
+                node.value = value
+            node.id, node.parent_id, node.key = store.allocate_id(), container_id, key
+            yield node
+            if node.type != NodeType.SCALAR:
+                stack.append((node.id, _entries(value)))
+                break
+        else:
+            stack.pop()
+
+
+def _entries(data: dict | list) -> Iterator[tuple]:
+    if isinstance(data, dict):
+        return iter(data.items())
+    return ((None, item) for item in data)
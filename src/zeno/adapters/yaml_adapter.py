@@ -4,38 +4,65 @@ from __future__ import annotations
 
 from typing import Any
 
-import yaml
-
+from zeno.adapters.yaml_backend import safe_dump, safe_load
+from zeno.adapters.yaml_emitter import serialize_to
+from zeno.adapters.yaml_events import UnsupportedEvents, build_from_events
+from zeno.adapters.yaml_source import SourceMap
 from zeno.core.node import Node
-from zeno.core.types import NodeType
+from zeno.core.node_records import plain_node_type
+from zeno.core.types import NodeId, NodeType
 from zeno.core.store import IRStore
+from zeno.core.traversal import preorder_ids
 
 
 def serialize(node: Node, store: IRStore) -> str:
     """
     Serialize a Node tree to YAML string.
     Preserves ordering and structure exactly.
+    serialize_to(stream, store, node) writes the same text to a file
+    without building the string or a plain copy of the tree.
     """
     plain = _node_to_plain(node, store)
-    return yaml.safe_dump(
+    return safe_dump(
         plain,
         sort_keys=False,
         allow_unicode=True,
     )
 
 
-def parse(yaml_text: str, store: IRStore) -> None:
+def parse(
+    yaml_text: str,
+    store: IRStore,
+    *,
+    streaming: bool = True,
+    source: SourceMap | None = None,
+) -> None:
     """
     Parse YAML text and populate an IRStore.
     
     Assumes store already has a root node created.
-    Recursively parses YAML structure into Node tree.
+    With streaming (the default) nodes are built straight from parser
+    events in one pass; documents that need the full loader (merge keys,
+    duplicate keys, !!set / !!omap, ...) fall back to loading plain data
+    first. Either way the Node tree is built iteratively (no recursion
+    depth limit) and holds the same values.
+    Node source spans are recorded in source on the streaming path only;
+    after a fallback it is left empty.
     """
-    data = yaml.safe_load(yaml_text)
+    if streaming:
+        try:
+            build_from_events(yaml_text, store, source)
+            return
+        except UnsupportedEvents:
+            pass
+    elif source is not None:
+        source.clear()
+
+    data = safe_load(yaml_text)
     if data is None:
         return
     
-    if not store._nodes or store._root_id is None:
+    if not store.has_root():
         raise ValueError("Store must have a root node before parsing")
     
     root = store.get_node(store.root_id)
@@ -46,7 +73,7 @@ def parse(yaml_text: str, store: IRStore) -> None:
         _parse_array(store, root, data)
     else:
         # Scalar at root level
-        root.value = data
+        store.set_value(root.id, data)
 
 
 # ============================================================
@@ -59,22 +86,38 @@ def _node_to_plain(node: Node, store: IRStore) -> Any:
     if node.type == NodeType.SCALAR:
         return node.value
     
-    if node.type == NodeType.OBJECT:
-        result = {}
-        for child_id in node.children:
-            child = store.get_node(child_id)
-            key = child.key or ""
-            result[key] = _node_to_plain(child, store)
-        return result
+    if node.type not in (NodeType.OBJECT, NodeType.LIST):
+        return None
+    
+    # Pre-order walk: each container exists before its children are attached.
+    containers: dict = {}
+    result = None
     
-    if node.type == NodeType.LIST:
-        result = []
-        for child_id in node.children:
-            child = store.get_node(child_id)
-            result.append(_node_to_plain(child, store))
-        return result
+    for nid in preorder_ids(store, node.id):
+        current = store.get_node(nid)
+        
+        if current.type == NodeType.OBJECT:
+            plain: Any = {}
+            containers[nid] = plain
+        elif current.type == NodeType.LIST:
+            plain = []
+            containers[nid] = plain
+        elif current.type == NodeType.SCALAR:
+            plain = current.value
+        else:
+            plain = None
+        
+        if nid == node.id:
+            result = plain
+            continue
+        
+        parent_plain = containers[current.parent_id]
+        if type(parent_plain) is dict:
+            parent_plain[current.key or ""] = plain
+        else:
+            parent_plain.append(plain)
     
-    return None
+    return result
 
 
 # ============================================================
@@ -83,50 +126,52 @@ def _node_to_plain(node: Node, store: IRStore) -> Any:
 
 def _parse_object(store: IRStore, obj_node: Node, data: dict) -> None:
     """Parse dict data into object node."""
-    
-    for key, value in data.items():
-        # Create child node
-        child = Node.create(NodeType.SCALAR)
-        
-        if isinstance(value, dict):
-            child.type = NodeType.OBJECT
-            store.add_unlinked_node(child)
-            store.link_child(parent_id=obj_node.id, child_id=child.id, key=key)
-            _parse_object(store, child, value)
-        
-        elif isinstance(value, list):
-            child.type = NodeType.LIST
-            store.add_unlinked_node(child)
-            store.link_child(parent_id=obj_node.id, child_id=child.id, key=key)
-            _parse_array(store, child, value)
-        
-        else:
-            # Scalar
-            child.value = value
-            store.add_unlinked_node(child)
-            store.link_child(parent_id=obj_node.id, child_id=child.id, key=key)
+    _parse_children(store, obj_node.id, data)
 
 
 def _parse_array(store: IRStore, list_node: Node, data: list) -> None:
     """Parse list data into list node."""
+    _parse_children(store, list_node.id, data)
+
+
+def _parse_children(store: IRStore, parent_id: NodeId, data: dict | list) -> None:
+    """
+    Create nodes for nested plain data with an explicit stack (any depth).
+
+    Raises ValueError on a container nested inside itself (a recursive
+    YAML alias such as `a: &a [*a]`), which would never end.
+    """
     
-    for idx, item in enumerate(data):
-        child = Node.create(NodeType.SCALAR)
-        
-        if isinstance(item, dict):
-            child.type = NodeType.OBJECT
-            store.add_unlinked_node(child)
-            store.link_child(parent_id=list_node.id, child_id=child.id)
-            _parse_object(store, child, item)
+    # (node id, container) to fill, or (None, container) once its subtree is done.
+    stack: list[tuple[NodeId | None, dict | list]] = [(parent_id, data)]
+    # ids of the containers on the path from data to the one being filled.
+    open_containers: set[int] = set()
+    
+    while stack:
+        container_id, container = stack.pop()
         
-        elif isinstance(item, list):
-            child.type = NodeType.LIST
-            store.add_unlinked_node(child)
-            store.link_child(parent_id=list_node.id, child_id=child.id)
-            _parse_array(store, child, item)
+        if container_id is None:
+            open_containers.discard(id(container))
+            continue
+        open_containers.add(id(container))
+        stack.append((None, container))
         
+        if isinstance(container, dict):
+            entries = container.items()
         else:
-            # Scalar
-            child.value = item
+            entries = ((None, item) for item in container)
+        
+        for key, value in entries:
+            # Create child node with its final type so leaves keep shared storage
+            child = Node.create(plain_node_type(value))
+            
+            if child.type == NodeType.SCALAR:
+                child.value = value
+            elif id(value) in open_containers:
+                raise ValueError("Recursive alias: a collection contains itself")
+            
             store.add_unlinked_node(child)
-            store.link_child(parent_id=list_node.id, child_id=child.id)
\ No newline at end of file
+            store.link_child(parent_id=container_id, child_id=child.id, key=key)
+            
+            if child.type != NodeType.SCALAR:
+                stack.append((child.id, value))
\ No newline at end of file
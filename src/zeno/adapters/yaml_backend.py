@@ -0,0 +1,72 @@
+# src/zeno/adapters/yaml_backend.py
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+# libyaml bindings are optional: PyYAML built without them only has the
+# pure-Python classes, which produce the same data and text (see below).
+try:
+    from yaml import CSafeDumper as FastSafeDumper
+    from yaml import CSafeLoader as FastSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as FastSafeDumper
+    from yaml import SafeLoader as FastSafeLoader
+
+HAVE_LIBYAML = FastSafeLoader is not yaml.SafeLoader
+
+
+def safe_load(text: str) -> Any:
+    """yaml.safe_load through libyaml when available."""
+    return yaml.load(text, Loader=FastSafeLoader)
+
+
+def safe_dump(data: Any, **options: Any) -> str:
+    """
+    yaml.safe_dump, through libyaml when that gives byte-identical text.
+
+    The libyaml emitter differs from the pure-Python one on a few inputs:
+    empty or non-string keys, strings with line breaks, tabs, other
+    non-printable or non-BMP characters (quoting and line folding), and
+    top-level scalars. Anything else is emitted identically, so only
+    documents free of those use the C dumper.
+    """
+    dumper = FastSafeDumper if HAVE_LIBYAML and emits_identically(data) else yaml.SafeDumper
+    return yaml.dump(data, Dumper=dumper, **options)
+
+
+def emits_identically(data: Any) -> bool:
+    """True if both emitters produce the same text for data (iterative walk)."""
+    if not isinstance(data, (dict, list)):
+        return False
+    stack = [data]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            if not all(map(key_emits_identically, container)):
+                return False
+            values = container.values()
+        else:
+            values = container
+        for value in values:
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+            elif not scalar_emits_identically(value):
+                return False
+    return True
+
+
+def key_emits_identically(key: Any) -> bool:
+    """True for mapping keys both emitters render alike."""
+    return type(key) is str and key != "" and _plain_text(key)
+
+
+def scalar_emits_identically(value: Any) -> bool:
+    """True for non-container values both emitters render alike."""
+    return type(value) is not str or _plain_text(value)
+
+
+def _plain_text(text: str) -> bool:
+    return text.isprintable() and (text.isascii() or max(text) <= "\uffff")
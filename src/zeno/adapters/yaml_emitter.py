@@ -0,0 +1,218 @@
+# src/zeno/adapters/yaml_emitter.py
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, TextIO
+
+import yaml
+from yaml.events import (
+    AliasEvent,
+    DocumentEndEvent,
+    DocumentStartEvent,
+    Event,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+    StreamStartEvent,
+)
+from yaml.nodes import MappingNode, Node as YamlNode, ScalarNode, SequenceNode
+from yaml.representer import SafeRepresenter
+from yaml.resolver import Resolver
+
+from zeno.adapters.yaml_backend import (
+    HAVE_LIBYAML,
+    FastSafeDumper,
+    emits_identically,
+    key_emits_identically,
+    scalar_emits_identically,
+)
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+if TYPE_CHECKING:
+    from zeno.adapters.yaml_fragments import FragmentCache
+
+
+_MAP_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+
+# yaml.Serializer's anchor names, numbered in order of second appearance.
+_ANCHOR_TEMPLATE = "id%03d"
+
+
+def serialize_to(
+    stream: TextIO,
+    store: IRStore,
+    root: Node,
+    *,
+    fragments: FragmentCache | None = None,
+) -> None:
+    """
+    Write the subtree at root to a text stream as YAML, incrementally.
+
+    Emitter events are produced while walking the IR, so no plain copy of
+    the tree and no full output string is built: memory stays flat however
+    large the document. The text is byte-identical to serialize(root, store).
+
+    With a FragmentCache the document is instead spliced from cached
+    fragments of unchanged subtrees (same text; see yaml_fragments).
+    """
+    if fragments is not None and fragments.write(stream, store, root):
+        return
+    fast, shared = scan(store, root)
+    dumper = FastSafeDumper if fast else yaml.SafeDumper
+    events = node_events(store, root, _anchors(shared))
+    yaml.emit(document_events(events), stream, Dumper=dumper, allow_unicode=True)
+
+
+def scan(store: IRStore, root: Node, *, entry: bool = False) -> tuple[bool, List[int]]:
+    """
+    One read-only pass deciding what safe_dump decides up front.
+
+    Returns whether the libyaml emitter renders the subtree identically,
+    and the ids of its non-trivial scalar objects (dates, ...) in order of
+    appearance: objects listed twice are shared and get an anchor. entry
+    means root is emitted inside an enclosing collection (with its key, if
+    it has one) rather than as the document.
+    """
+    representer = SafeRepresenter()
+    fast = HAVE_LIBYAML
+    shared: List[int] = []
+
+    for node, entering in _walk(store, root):
+        if not entering:
+            continue
+        values = []
+        if (entry or node.id != root.id) and node.key is not None:
+            key = node.key or ""
+            fast = fast and key_emits_identically(key)
+            values.append(key)
+        if node.type == NodeType.SCALAR:
+            value = node.value
+            if (node.id == root.id and not entry) or isinstance(value, (dict, list)):
+                # safe_dump never uses libyaml for a top-level scalar.
+                fast = fast and emits_identically(value)
+            else:
+                fast = fast and scalar_emits_identically(value)
+            values.append(value)
+        for value in values:
+            if not representer.ignore_aliases(value):
+                shared.append(id(value))
+    return fast, shared
+
+
+def node_events(
+    store: IRStore,
+    root: Node,
+    anchors: Dict[int, str] | None = None,
+    *,
+    entry: bool = False,
+) -> Iterator[Event]:
+    """
+    Emitter events for the subtree at root, matching yaml.Serializer's.
+
+    anchors maps ids of shared scalar objects to their anchor names; entry
+    emits root's own key first, if it has one (root inside a collection).
+    """
+    representer = SafeRepresenter(default_flow_style=False, sort_keys=False)
+    resolver = Resolver()
+    emitted: set = set()
+
+    def value_events(value: Any) -> Iterator[Event]:
+        anchor = anchors.get(id(value)) if anchors and not representer.ignore_aliases(value) else None
+        if anchor is not None:
+            if anchor in emitted:
+                yield AliasEvent(anchor)
+                return
+            emitted.add(anchor)
+        represented = representer.represent_data(value)
+        if representer.object_keeper:
+            # Sharing is settled by scan; keep the representer's caches empty.
+            representer.represented_objects.clear()
+            representer.object_keeper.clear()
+        yield from _representation_events(represented, anchor, resolver)
+
+    for node, entering in _walk(store, root):
+        if not entering:
+            yield MappingEndEvent() if node.type == NodeType.OBJECT else SequenceEndEvent()
+            continue
+        if (entry or node.id != root.id) and node.key is not None:
+            yield from value_events(node.key or "")
+        if node.type == NodeType.SCALAR:
+            yield from value_events(node.value)
+        elif node.type == NodeType.OBJECT:
+            yield MappingStartEvent(None, _MAP_TAG, True, flow_style=False)
+        else:
+            yield SequenceStartEvent(None, _SEQ_TAG, True, flow_style=False)
+
+
+def document_events(events: Iterable[Event]) -> Iterator[Event]:
+    """Wrap node events in a single-document stream."""
+    yield StreamStartEvent()
+    yield DocumentStartEvent()
+    yield from events
+    yield DocumentEndEvent()
+    yield StreamEndEvent()
+
+
+def _anchors(shared: List[int]) -> Dict[int, str]:
+    """Anchor names for objects listed more than once, numbered by second appearance."""
+    seen: set = set()
+    anchors: Dict[int, str] = {}
+    for object_id in shared:
+        if object_id not in seen:
+            seen.add(object_id)
+        elif object_id not in anchors:
+            anchors[object_id] = _ANCHOR_TEMPLATE % (len(anchors) + 1)
+    return anchors
+
+
+def _walk(store: IRStore, root: Node) -> Iterator[tuple[Node, bool]]:
+    """
+    (node, True) for each node in pre-order and (container, False) once its
+    children are done. Holds one child iterator per level, so memory is
+    bounded by depth rather than by width or size.
+    """
+    yield root, True
+    if root.type == NodeType.SCALAR:
+        return
+    stack = [(root, store.iter_children(root.id))]
+    while stack:
+        node, children = stack[-1]
+        child_id = next(children, None)
+        if child_id is None:
+            stack.pop()
+            yield node, False
+            continue
+        child = store.get_node(child_id)
+        yield child, True
+        if child.type != NodeType.SCALAR:
+            stack.append((child, store.iter_children(child_id)))
+
+
+def _representation_events(node: YamlNode, anchor: str | None, resolver: Resolver) -> Iterator[Event]:
+    """Events for one represented value (as yaml.Serializer.serialize_node)."""
+    if isinstance(node, ScalarNode):
+        implicit = (
+            node.tag == resolver.resolve(ScalarNode, node.value, (True, False)),
+            node.tag == resolver.resolve(ScalarNode, node.value, (False, True)),
+        )
+        yield ScalarEvent(anchor, node.tag, implicit, node.value, style=node.style)
+        return
+
+    implicit = node.tag == resolver.resolve(type(node), node.value, True)
+    if isinstance(node, SequenceNode):
+        yield SequenceStartEvent(anchor, node.tag, implicit, flow_style=node.flow_style)
+        for item in node.value:
+            yield from _representation_events(item, None, resolver)
+        yield SequenceEndEvent()
+    elif isinstance(node, MappingNode):
+        yield MappingStartEvent(anchor, node.tag, implicit, flow_style=node.flow_style)
+        for key, value in node.value:
+            yield from _representation_events(key, None, resolver)
+            yield from _representation_events(value, None, resolver)
+        yield MappingEndEvent()
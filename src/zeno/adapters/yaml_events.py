@@ -0,0 +1,264 @@
+# src/zeno/adapters/yaml_events.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List
+
+from yaml.events import (
+    AliasEvent,
+    DocumentStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+from yaml.nodes import ScalarNode
+
+from zeno.adapters.yaml_backend import FastSafeLoader
+from zeno.adapters.yaml_source import SourceMap
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.traversal import preorder_ids
+from zeno.core.types import NodeId, NodeType
+
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+_COLLECTION_TAGS = {
+    MappingStartEvent: "tag:yaml.org,2002:map",
+    SequenceStartEvent: "tag:yaml.org,2002:seq",
+}
+
+
+class UnsupportedEvents(Exception):
+    """
+    The document needs the full loader: merge keys, duplicate or complex
+    keys, explicit collection tags (!!set, !!omap, ...), undefined or
+    recursive aliases, or more than one document.
+    """
+
+
+class _Frame:
+    """An open mapping or sequence on the parse stack."""
+
+    __slots__ = ("node_id", "is_mapping", "anchor", "key", "has_key", "keys", "key_mark")
+
+    def __init__(self, node_id: NodeId, is_mapping: bool, anchor: str | None) -> None:
+        self.node_id = node_id
+        self.is_mapping = is_mapping
+        self.anchor = anchor
+        self.key: Any = None
+        self.has_key = False
+        self.keys: set = set()
+        self.key_mark = None
+
+
+class _Document:
+    """What the event walk produced beyond the inserted nodes."""
+
+    __slots__ = ("top", "scalar", "has_scalar")
+
+    def __init__(self) -> None:
+        self.top: List[NodeId] = []
+        self.scalar: Any = None
+        self.has_scalar = False
+
+
+def build_from_events(yaml_text: str, store: IRStore, source: SourceMap | None = None) -> None:
+    """
+    Populate the store's root from yaml_text in one pass over parser events.
+
+    Nodes are created as events arrive and fed to IRStore.insert_nodes;
+    no dict/list tree is built. Values match yaml.safe_load. With source,
+    the span of every node (and the text) is recorded there. On any error
+    (including UnsupportedEvents) the nodes added so far are removed again
+    and the store (and source, cleared) is left as it was.
+    """
+    loader = FastSafeLoader(yaml_text)
+    document = _Document()
+    if source is not None:
+        source.clear()
+    try:
+        store.insert_nodes(_nodes(loader, store, document, source))
+    except BaseException:
+        _roll_back(store, document.top)
+        if source is not None:
+            source.clear()
+        raise
+    finally:
+        loader.dispose()
+    if source is not None:
+        source.text = yaml_text
+
+    if document.has_scalar and document.scalar is not None:
+        store.set_value(store.root_id, document.scalar)
+
+
+def _nodes(loader, store: IRStore, document: _Document, source: SourceMap | None) -> Iterator[Node]:
+    """
+    New nodes (parent_id and key set) in pre-order, for IRStore.insert_nodes.
+    Spans go to source when given: from the key (or the value outside
+    mappings) to the end of the value.
+    """
+    anchors: Dict[str, Any] = {}
+    stack: List[_Frame] = []
+    documents = 0
+
+    while loader.check_event():
+        event = loader.get_event()
+        kind = type(event)
+
+        if kind is DocumentStartEvent:
+            documents += 1
+            if documents > 1:
+                raise UnsupportedEvents("multiple documents")
+            continue
+        if kind is MappingEndEvent or kind is SequenceEndEvent:
+            frame = stack.pop()
+            if source is not None:
+                source.end(frame.node_id, event.end_mark)
+            if frame.anchor is not None:
+                # Registered only now: an alias inside its own anchor is recursive.
+                anchors[frame.anchor] = frame.node_id
+            continue
+        if kind not in (ScalarEvent, MappingStartEvent, SequenceStartEvent, AliasEvent):
+            continue
+
+        frame = stack[-1] if stack else None
+
+        if frame is not None and frame.is_mapping and not frame.has_key:
+            if kind is not ScalarEvent or event.anchor is not None:
+                raise UnsupportedEvents("complex or anchored key")
+            key = _scalar(loader, event)
+            if key is _MERGE or key in frame.keys:
+                raise UnsupportedEvents("merge or duplicate key")
+            frame.keys.add(key)
+            frame.key, frame.has_key = key, True
+            frame.key_mark = event.start_mark
+            continue
+
+        if frame is None:
+            if not store.has_root():
+                raise ValueError("Store must have a root node before parsing")
+            parent_id, key = None, None
+        else:
+            parent_id, key = frame.node_id, frame.key
+            frame.key, frame.has_key = None, False
+        if source is not None:
+            if kind is AliasEvent or event.anchor is not None:
+                source.unsectioned()
+            start = frame.key_mark if frame is not None and frame.is_mapping else event.start_mark
+            top = len(stack) == 1 and frame.is_mapping
+
+        if kind is AliasEvent:
+            if event.anchor not in anchors or parent_id is None:
+                raise UnsupportedEvents("undefined, recursive or root alias")
+            target = anchors[event.anchor]
+            if isinstance(target, _ScalarValue):
+                node = Node(id=store.allocate_id(), type=NodeType.SCALAR, parent_id=parent_id, key=key)
+                node.value = target.value
+                yield _track(node, store, document)
+            else:
+                yield from _copies(store, target, parent_id, key, document)
+            continue
+
+        if kind is ScalarEvent:
+            value = _scalar(loader, event)
+            if value is _MERGE:
+                raise UnsupportedEvents("merge value")
+            if event.anchor is not None:
+                anchors[event.anchor] = _ScalarValue(value)
+            if parent_id is None:
+                # Scalar document: the root itself takes the value.
+                document.scalar, document.has_scalar = value, True
+                if source is not None:
+                    source.add(store.root_id, start, event.end_mark)
+                continue
+            node = Node(id=store.allocate_id(), type=NodeType.SCALAR, parent_id=parent_id, key=key)
+            node.value = value
+            if source is not None:
+                source.add(node.id, start, event.end_mark, key, top)
+            yield _track(node, store, document)
+            continue
+
+        if event.tag not in (None, "!", _COLLECTION_TAGS[kind]):
+            raise UnsupportedEvents(f"collection tag {event.tag}")
+        is_mapping = kind is MappingStartEvent
+        anchors.pop(event.anchor, None)
+        if parent_id is None:
+            if source is not None:
+                source.add(store.root_id, start, start)
+                if not is_mapping or event.flow_style:
+                    source.unsectioned()
+            stack.append(_Frame(store.root_id, is_mapping, event.anchor))
+            continue
+        node = Node.create(NodeType.OBJECT if is_mapping else NodeType.LIST)
+        node.id, node.parent_id, node.key = store.allocate_id(), parent_id, key
+        if source is not None:
+            source.add(node.id, start, start, key, top)
+        stack.append(_Frame(node.id, is_mapping, event.anchor))
+        yield _track(node, store, document)
+
+
+class _ScalarValue:
+    """Anchored scalar (anchors on containers map to their node id)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+# Value standing for a resolved merge key ("<<").
+_MERGE = object()
+
+
+def _scalar(loader, event: ScalarEvent) -> Any:
+    """Construct a scalar's value the way the safe loader's composer would."""
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = loader.resolve(ScalarNode, event.value, event.implicit)
+    if tag == _STR_TAG:
+        return event.value
+    if tag == _MERGE_TAG:
+        return _MERGE
+    constructors = loader.yaml_constructors
+    constructor = constructors.get(tag) or constructors[None]
+    return constructor(loader, ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style))
+
+
+def _copies(
+    store: IRStore,
+    source_id: NodeId,
+    parent_id: NodeId,
+    key: Any,
+    document: _Document,
+) -> Iterator[Node]:
+    """Fresh nodes repeating an anchored subtree (already in the store) for an alias."""
+    new_ids: Dict[NodeId, NodeId] = {}
+    for nid in list(preorder_ids(store, source_id)):
+        original = store.get_node(nid)
+        copy = Node.create(original.type)
+        copy.id = new_ids[nid] = store.allocate_id()
+        copy.value = original.value
+        if nid == source_id:
+            copy.parent_id, copy.key = parent_id, key
+        else:
+            copy.parent_id, copy.key = new_ids[original.parent_id], original.key
+        yield _track(copy, store, document)
+
+
+def _track(node: Node, store: IRStore, document: _Document) -> Node:
+    if node.parent_id == store.root_id:
+        document.top.append(node.id)
+    return node
+
+
+def _roll_back(store: IRStore, top: List[NodeId]) -> None:
+    """Remove the subtrees linked directly under the root by a failed build."""
+    root_id = store.root_id if store.has_root() else None
+    for node_id in reversed(top):
+        if store.has_node(node_id) and store.get_node(node_id).parent_id == root_id:
+            store.unlink_child(child_id=node_id)
+            store.delete_subtree(node_id=node_id)
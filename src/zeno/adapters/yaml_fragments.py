@@ -0,0 +1,248 @@
+# src/zeno/adapters/yaml_fragments.py
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, TextIO
+
+from yaml.events import Event
+
+from zeno.adapters.yaml_backend import key_emits_identically
+from zeno.adapters.yaml_emitter import node_events, scan
+from zeno.adapters.yaml_layout import (
+    Context,
+    emit,
+    in_context,
+    kind_of,
+    last_line,
+    placeholder,
+    split_entries,
+    with_placeholder,
+)
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId, NodeType
+from zeno.core.version_stamps import VersionStamps
+
+
+# Subtrees up to this many nodes are rendered and cached as one fragment;
+# larger containers are spliced from a header plus their children.
+UNIT_NODES = 64
+
+# Longer keys may turn into "? key" complex keys; such entries are not split.
+_SPLIT_KEY_CHARS = 30
+
+class _Unit:
+    __slots__ = ("stamp", "context", "text", "shared")
+
+    def __init__(self, stamp: int, context: Context, text: str | None, shared: tuple) -> None:
+        self.stamp = stamp
+        self.context = context
+        # None for a container spliced from its children.
+        self.text = text
+        # Ids of non-trivial scalar objects inside (anchor candidates).
+        self.shared = shared
+
+
+class _Frame:
+    __slots__ = ("node", "context", "kind", "children", "first", "dirty")
+
+    def __init__(self, store: IRStore, node: Node, context: Context) -> None:
+        self.node = node
+        self.context = context
+        self.kind = kind_of(node)
+        self.children = store.iter_children(node.id)
+        self.first = True
+        # (piece index, node, context, stamp) of children to render.
+        self.dirty: List[tuple] = []
+
+
+class FragmentCache:
+    """
+    Rendered YAML of a document's subtrees, reused by later saves.
+
+    A subtree's fragment is the exact text it contributes to the saved file,
+    from the start of its first line up to the next entry. It depends only
+    on the subtree and its emitter context, so it stays valid while the
+    subtree's version stamp (VersionStamps, bumped by OperationProcessor
+    along the path to the root) and context are unchanged. A save renders
+    only changed subtrees and splices everything else, so its cost follows
+    the size of the edit rather than of the document.
+
+    The cache must see every edit through the processor owning versions.
+    Documents with shared scalar objects (YAML anchors on output) and
+    scalar or empty roots are written by the plain streaming path.
+    """
+
+    def __init__(self, versions: VersionStamps) -> None:
+        self._versions = versions
+        self._units: Dict[NodeId, _Unit] = {}
+        self._headers: Dict[tuple, str] = {}
+        # Context -> (offset where a node in it starts, column of that line).
+        self._starts: Dict[Context, tuple[int, int]] = {}
+
+    def clear(self) -> None:
+        self._units.clear()
+
+    def fork(self, versions: VersionStamps) -> FragmentCache:
+        """
+        Cache for writing a store snapshot elsewhere (a worker thread): it
+        starts from these fragments but reads versions, the stamps as of the
+        snapshot. Hand it to adopt once written; until then only the fork
+        is used.
+        """
+        fork = FragmentCache(versions)
+        fork._units, fork._headers, fork._starts = self._units, self._headers, self._starts
+        return fork
+
+    def adopt(self, fork: FragmentCache) -> None:
+        """Take over the fragments a fork rendered."""
+        self._units = fork._units
+
+    def write(self, stream: TextIO, store: IRStore, root: Node) -> bool:
+        """Write root's subtree from fragments; False if it needs the plain path."""
+        if root.type == NodeType.SCALAR or store.child_count(root.id) == 0:
+            return False
+        pieces = self._pieces(store, root)
+        if pieces is None:
+            return False
+        stream.writelines(pieces)
+        return True
+
+    # ------------------------------------------------------------
+    # Splicing
+    # ------------------------------------------------------------
+
+    def _pieces(self, store: IRStore, root: Node) -> List[str] | None:
+        stamp_of = self._versions.stamp
+        cached = self._units
+        units: Dict[NodeId, _Unit] = {}
+        pieces: List[str | None] = []
+        shared: List[int] = []
+        pending: List[_Frame] = []
+        stack = [_Frame(store, root, ())]
+
+        while stack:
+            frame = stack[-1]
+            child_id = next(frame.children, None)
+            if child_id is None:
+                stack.pop()
+                if frame.dirty:
+                    pending.append(frame)
+                continue
+            context = frame.context + ((frame.kind, frame.first),)
+            frame.first = False
+            stamp = stamp_of(child_id)
+
+            unit = cached.get(child_id)
+            if unit is not None and unit.stamp == stamp and unit.context == context:
+                units[child_id] = unit
+                if unit.text is not None:
+                    pieces.append(unit.text)
+                    shared.extend(unit.shared)
+                    continue
+                child = store.get_node(child_id)
+            else:
+                child = store.get_node(child_id)
+                if not _splittable(store, child, frame.kind):
+                    frame.dirty.append((len(pieces), child, context, stamp))
+                    pieces.append(None)
+                    continue
+                units[child_id] = _Unit(stamp, context, None, ())
+
+            pieces.append(self._header(store, child, context))
+            stack.append(_Frame(store, child, context))
+
+        for frame in pending:
+            rendered = self._render_children(store, frame)
+            for (index, child, context, stamp), (text, child_shared) in zip(frame.dirty, rendered):
+                pieces[index] = text
+                units[child.id] = _Unit(stamp, context, text, child_shared)
+                shared.extend(child_shared)
+        self._units = units
+
+        if len(shared) != len(set(shared)):
+            return None  # shared objects need anchors across fragments
+        return pieces
+
+    # ------------------------------------------------------------
+    # Rendering in context
+    # ------------------------------------------------------------
+
+    def _render_children(self, store: IRStore, frame: _Frame) -> List[tuple[str, tuple]]:
+        """(text, shared ids) for frame's dirty children, in one emitter run."""
+        nodes = [child for _, child, _, _ in frame.dirty]
+        first_context = frame.dirty[0][2]
+        fast = True
+        shared: List[tuple] = []
+        for child in nodes:
+            child_fast, child_shared = scan(store, child, entry=True)
+            fast = fast and child_fast
+            shared.append(tuple(child_shared))
+
+        def body() -> Iterator[Event]:
+            for child in nodes:
+                yield from node_events(store, child, entry=True)
+
+        text = emit(in_context(first_context, body()), fast)
+        start, _ = self._start(first_context)
+        column = self._start(frame.context + ((frame.kind, False),))[1]
+        texts = split_entries(text, start, column, frame.kind)
+        if len(texts) != len(nodes):
+            # Unexpected layout: render each child on its own instead.
+            texts = []
+            for child, (_, _, context, _) in zip(nodes, frame.dirty):
+                child_text = emit(in_context(context, node_events(store, child, entry=True)), fast)
+                texts.append(child_text[self._start(context)[0]:])
+        return list(zip(texts, shared))
+
+    def _header(self, store: IRStore, node: Node, context: Context) -> str:
+        """Text of a split container before its first child's line."""
+        memo_key = (context, node.type, node.key)
+        header = self._headers.get(memo_key)
+        if header is None:
+            events = with_placeholder(store, node, context[-1][0])
+            text = emit(in_context(context, events), node.key is None or key_emits_identically(node.key))
+            header = text[self._start(context)[0]:last_line(text)]
+            self._headers[memo_key] = header
+        return header
+
+    def _start(self, context: Context) -> tuple[int, int]:
+        """Offset at which a node in context starts, and that line's indent."""
+        start = self._starts.get(context)
+        if start is None:
+            text = emit(in_context(context, placeholder(context[-1][0])), True)
+            offset = last_line(text)
+            line = text[offset:]
+            start = self._starts[context] = (offset, len(line) - len(line.lstrip(" ")))
+        return start
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+def _splittable(store: IRStore, node: Node, parent_kind: str) -> bool:
+    """Large, non-empty container whose entry line has a plain simple key."""
+    if node.type == NodeType.SCALAR:
+        return False
+    if parent_kind == "M":
+        key = node.key
+        if type(key) is not str or not key or len(key) > _SPLIT_KEY_CHARS or not key.isprintable():
+            return False
+    return not _at_most(store, node.id, UNIT_NODES)
+
+
+def _at_most(store: IRStore, node_id: NodeId, limit: int) -> bool:
+    """True if node_id has at most limit descendants (stops counting past it)."""
+    count = 0
+    stack = [store.iter_children(node_id)]
+    while stack:
+        for child_id in stack[-1]:
+            count += 1
+            if count > limit:
+                return False
+            stack.append(store.iter_children(child_id))
+            break
+        else:
+            stack.pop()
+    return True
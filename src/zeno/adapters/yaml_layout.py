@@ -0,0 +1,119 @@
+# src/zeno/adapters/yaml_layout.py
+
+from __future__ import annotations
+
+import io
+from typing import Iterator, List, Tuple
+
+import yaml
+from yaml.events import (
+    Event,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+
+from zeno.adapters.yaml_backend import FastSafeDumper
+from zeno.adapters.yaml_emitter import document_events, node_events
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+
+
+# Emitter position of a node: per ancestor from the root, its kind ("M" or
+# "S") and whether the path continues through its first child. Everything
+# else about a fragment's text comes from the subtree itself.
+Context = Tuple[Tuple[str, bool], ...]
+
+
+def kind_of(node: Node) -> str:
+    return "M" if node.type == NodeType.OBJECT else "S"
+
+
+def _scalar(text: str) -> ScalarEvent:
+    return ScalarEvent(None, None, (True, False), text)
+
+
+def placeholder(kind: str) -> List[Event]:
+    """A one-line child of a kind container: "a: 0" or "- 0"."""
+    return [_scalar("a"), _scalar("0")] if kind == "M" else [_scalar("0")]
+
+
+def with_placeholder(store: IRStore, node: Node, parent_kind: str) -> List[Event]:
+    """node's key (as emitted) and container start, one placeholder child, its end."""
+    kind = kind_of(node)
+    events: List[Event] = []
+    if parent_kind == "M":
+        events.append(next(node_events(store, node, entry=True)))
+    if kind == "M":
+        events.append(MappingStartEvent(None, None, True, flow_style=False))
+        events += placeholder(kind)
+        events.append(MappingEndEvent())
+    else:
+        events.append(SequenceStartEvent(None, None, True, flow_style=False))
+        events += placeholder(kind)
+        events.append(SequenceEndEvent())
+    return events
+
+
+def in_context(context: Context, body) -> Iterator[Event]:
+    """
+    Open placeholder ancestors reproducing context, then body, then close.
+
+    Where the path does not go through the first child, a placeholder
+    sibling comes first; mapping ancestors reach the next level through a
+    placeholder key.
+    """
+    last = len(context) - 1
+    for depth, (kind, first) in enumerate(context):
+        if kind == "M":
+            yield MappingStartEvent(None, None, True, flow_style=False)
+        else:
+            yield SequenceStartEvent(None, None, True, flow_style=False)
+        if not first:
+            yield from placeholder(kind)
+        if depth < last and kind == "M":
+            yield _scalar("b")
+    yield from body
+    for kind, _ in reversed(context):
+        yield MappingEndEvent() if kind == "M" else SequenceEndEvent()
+
+
+def emit(events: Iterator[Event], fast: bool) -> str:
+    out = io.StringIO()
+    dumper = FastSafeDumper if fast else yaml.SafeDumper
+    yaml.emit(document_events(events), out, Dumper=dumper, allow_unicode=True)
+    return out.getvalue()
+
+
+def last_line(text: str) -> int:
+    """Offset where the last line of newline-terminated text starts."""
+    return text.rfind("\n", 0, len(text) - 1) + 1
+
+
+def split_entries(text: str, start: int, column: int, kind: str) -> List[str]:
+    """
+    Cut text[start:] where sibling entries of a kind container begin: at
+    lines indented exactly column that open a key (mapping) or "-" item.
+    Continuation lines are indented deeper; indentless sequence items and
+    complex-key values (": ") at the same column do not start an entry.
+    """
+    starts = [start]
+    indent = " " * column
+    end = len(text)
+    pos = text.find("\n", start)
+    while pos != -1 and pos + 1 < end:
+        line = pos + 1
+        if text.startswith(indent, line):
+            head = text[line + column:line + column + 2]
+            if head and head[0] not in " \n":
+                opens_entry = head[0] == "-" if kind == "S" else not (
+                    head[0] in "-:" and (len(head) == 1 or head[1] in " \n")
+                )
+                if opens_entry:
+                    starts.append(line)
+        pos = text.find("\n", line)
+    starts.append(end)
+    return [text[a:b] for a, b in zip(starts, starts[1:])]
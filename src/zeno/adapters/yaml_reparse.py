@@ -0,0 +1,145 @@
+# src/zeno/adapters/yaml_reparse.py
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+import yaml
+
+from zeno.adapters.yaml_events import UnsupportedEvents, build_from_events
+from zeno.adapters.yaml_source import SourceMap
+from zeno.core.node import Node
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+from zeno.core.traversal import preorder_ids
+from zeno.core.types import NodeId, NodeType
+
+
+# Block size of the chunked common prefix / suffix scans.
+_CHUNK = 1 << 16
+
+
+def reparse_changed(text: str, store: IRStore, processor: OperationProcessor, source: SourceMap) -> bool:
+    """
+    Bring the document up to date with text, a new version of source.text.
+
+    When the change lies inside one top-level section (a mapping entry,
+    from its key to the next key at column 0), only that section is
+    parsed again and swapped in through a "replace_subtree" operation on
+    processor; source is updated to text. Returns False, changing nothing,
+    when that is not possible and the caller must load text in full: the
+    change touches more than one section or what lies outside them, the
+    section no longer parses alone as the same single key, or the document
+    has been edited since source was recorded (see stamp).
+    """
+    sections = source.sections
+    if not sections or processor.versions.stamp(store.root_id) != source.stamp:
+        return False
+    old = source.text
+    prefix = _common_prefix(old, text)
+    if prefix == len(old) == len(text):
+        return True
+    suffix = _common_suffix(old, text, min(len(old), len(text)) - prefix)
+
+    position = _section_at(sections, prefix)
+    if position is None or len(old) - suffix > source.section_end(position):
+        return False
+    candidates = [position]
+    if prefix == len(old) - suffix == sections[position].index and position > 0:
+        candidates.insert(0, position - 1)  # text inserted between two sections
+    for candidate in candidates:
+        if _reparse_section(text, store, processor, source, candidate):
+            return True
+    return False
+
+
+def _reparse_section(
+    text: str,
+    store: IRStore,
+    processor: OperationProcessor,
+    source: SourceMap,
+    position: int,
+) -> bool:
+    """Replace section position with its counterpart in text, if that parses alone as the same key."""
+    section = source.sections[position]
+    end = source.section_end(position) + len(text) - len(source.text)
+    if end < len(text) and text[end - 1] != "\n":
+        return False  # the next key no longer starts a line
+    section_text = text[section.index:end]
+    if "\n---" in section_text or "\n..." in section_text:
+        return False  # possible document markers: parsed alone, they would mean something else
+    parsed_store = IRStore()
+    parsed_store.create_root(NodeType.OBJECT)
+    parsed = SourceMap()
+    try:
+        build_from_events(section_text, parsed_store, parsed)
+    except (yaml.YAMLError, UnsupportedEvents, ValueError):
+        return False
+    entries = parsed.sections
+    if len(entries) != 1 or parsed_store.child_count(parsed_store.root_id) != 1:
+        return False
+    key = entries[0].key
+    if type(key) is not type(section.key) or key != section.key:
+        return False
+
+    old_ids = list(preorder_ids(store, section.node_id))
+    records, new_ids = _records(parsed_store, entries[0].node_id, store, store.root_id)
+    processor.apply(Operation.create("replace_subtree", section.node_id, {
+        "node_id": section.node_id, "nodes": records,
+    }))
+    source.replace_section(position, old_ids, parsed, new_ids, text)
+    source.stamp = processor.versions.stamp(store.root_id)
+    return True
+
+
+def _section_at(sections, index: int) -> int | None:
+    """Position of the section holding text index, or None before the first."""
+    position = None
+    for candidate, section in enumerate(sections):
+        if section.index > index:
+            break
+        position = candidate
+    return position
+
+
+def _records(parsed_store: IRStore, parsed_id: NodeId, store: IRStore, parent_id: NodeId):
+    """Pre-order Node records copying parsed_id's subtree under parent_id, with ids from store."""
+    new_ids: Dict[NodeId, NodeId] = {}
+    records: List[Node] = []
+    for nid in preorder_ids(parsed_store, parsed_id):
+        original = parsed_store.get_node(nid)
+        new_ids[nid] = store.allocate_id()
+        parent = parent_id if nid == parsed_id else new_ids[original.parent_id]
+        records.append(Node(
+            id=new_ids[nid], type=original.type, parent_id=parent, key=original.key, value=original.value,
+        ))
+    return records, new_ids
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix of a and b (compared a chunk at a time)."""
+    limit = min(len(a), len(b))
+    start = 0
+    while start < limit and a[start:start + _CHUNK] == b[start:start + _CHUNK]:
+        start += _CHUNK
+    start = min(start, limit)
+    end = min(start + _CHUNK, limit)
+    while start < end and a[start] == b[start]:
+        start += 1
+    return start
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of a and b, at most limit."""
+    length = 0
+    while length < limit:
+        step = min(_CHUNK, limit - length)
+        if a[len(a) - length - step:len(a) - length] != b[len(b) - length - step:len(b) - length]:
+            break
+        length += step
+    else:
+        return length
+    while length < limit and a[len(a) - length - 1] == b[len(b) - length - 1]:
+        length += 1
+    return length
@@ -0,0 +1,181 @@
+# src/zeno/adapters/yaml_source.py
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List, NamedTuple
+
+from zeno.core.types import NodeId
+
+
+class Span(NamedTuple):
+    """Where a node came from; 0-based like yaml marks. Mapping entries start at their key."""
+
+    start_index: int
+    start_line: int
+    start_column: int
+    end_index: int
+    end_line: int
+    end_column: int
+
+
+class Section(NamedTuple):
+    """A top-level mapping entry: its node, key, and where its key starts."""
+
+    node_id: NodeId
+    key: Any
+    index: int
+    line: int
+
+
+# Ints per row: section, start index, line, column, end index, line, column.
+_FIELDS = 7
+
+# Row section of nodes outside any top-level entry (the root, list items).
+_NO_SECTION = -1
+
+
+class SourceMap:
+    """
+    Source spans of the nodes parsed from one YAML text.
+
+    Filled by parse(..., source=...) on the event path and kept outside
+    the nodes: one row of seven ints per node in a flat array, found
+    through a node id -> row offset dict. Rows start with their top-level
+    mapping entry (section); a section's rows are read through an offset, so
+    re-parsing one section (see yaml_reparse) only moves the offsets of
+    the sections after it.
+
+    The text itself is kept too, as the base later versions are diffed
+    against, with stamp: the root's VersionStamps stamp while the document
+    still matches text (0, that of a fresh OperationProcessor, after a
+    parse). Nodes created after the parse have no span.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.stamp = 0
+        # Node id -> offset of its row in _marks.
+        self._rows: Dict[NodeId, int] = {}
+        self._marks = array("q")
+        self._sections: List[Section] = []
+        # Per section: (index, line) to add to its rows' marks.
+        self._offsets: List[tuple[int, int]] = []
+        self._sectioned = True
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def span(self, node_id: NodeId) -> Span | None:
+        row = self._rows.get(node_id)
+        if row is None:
+            return None
+        section = self._marks[row]
+        marks = self._marks[row + 1:row + _FIELDS]
+        if section != _NO_SECTION:
+            index, line = self._offsets[section]
+            marks[0] += index
+            marks[1] += line
+            marks[3] += index
+            marks[4] += line
+        return Span(*marks)
+
+    def location(self, node_id: NodeId) -> str | None:
+        """Human-readable start of node_id's span, e.g. "line 3, column 5"."""
+        span = self.span(node_id)
+        if span is None:
+            return None
+        return f"line {span.start_line + 1}, column {span.start_column + 1}"
+
+    @property
+    def sections(self) -> List[Section]:
+        """
+        Top-level entries in source order, or [] when the text is not a
+        block mapping with every key at column 0 and no anchors or aliases
+        (sections could not be re-parsed on their own).
+        """
+        return list(self._sections) if self._sectioned else []
+
+    def section_end(self, position: int) -> int:
+        """Index where section number position ends (the next one's start, or text end)."""
+        if position + 1 < len(self._sections):
+            return self._sections[position + 1].index
+        return len(self.text)
+
+    # ------------------------------------------------------------
+    # Recording (yaml_events)
+    # ------------------------------------------------------------
+
+    def add(self, node_id: NodeId, start, end, key: Any = None, top: bool = False) -> None:
+        """
+        Record node_id's span between two yaml marks (end is updated later
+        for containers); top nodes open a new section at start.
+        """
+        if top:
+            if start.column != 0:
+                self._sectioned = False
+            self._sections.append(Section(node_id, key, start.index, start.line))
+            self._offsets.append((0, 0))
+        marks = self._marks
+        self._rows[node_id] = len(marks)
+        # Nodes belong to the latest section; the root comes before any.
+        marks.extend((
+            len(self._sections) - 1, start.index, start.line, start.column, end.index, end.line, end.column,
+        ))
+
+    def end(self, node_id: NodeId, end) -> None:
+        row = self._rows.get(node_id)
+        if row is not None:
+            marks = self._marks
+            marks[row + 4], marks[row + 5], marks[row + 6] = end.index, end.line, end.column
+
+    def unsectioned(self) -> None:
+        """The text's layout does not allow re-parsing sections on their own."""
+        self._sectioned = False
+
+    # ------------------------------------------------------------
+    # Section replacement (yaml_reparse)
+    # ------------------------------------------------------------
+
+    def replace_section(
+        self,
+        position: int,
+        old_ids: List[NodeId],
+        parsed: SourceMap,
+        new_ids: Dict[NodeId, NodeId],
+        text: str,
+    ) -> None:
+        """
+        Swap section position's rows for those of parsed (the section
+        re-parsed alone from where it started, ids mapped through new_ids)
+        and move the sections after it to their places in text, the new
+        full text.
+        """
+        old = self._sections[position]
+        old_end = self.section_end(position)
+        new_end = old_end + len(text) - len(self.text)
+        lines = text.count("\n", old.index, new_end) - self.text.count("\n", old.index, old_end)
+
+        for node_id in old_ids:
+            self._rows.pop(node_id, None)
+        for parsed_id, node_id in new_ids.items():
+            row = parsed._rows.get(parsed_id)
+            if row is None:
+                continue
+            self._rows[node_id] = len(self._marks)
+            self._marks.append(position)
+            self._marks.extend(parsed._marks[row + 1:row + _FIELDS])
+
+        # The slice may start before the key now (e.g. a blank line was inserted there).
+        entry = parsed._sections[0]
+        self._sections[position] = Section(
+            new_ids[entry.node_id], old.key, old.index + entry.index, old.line + entry.line,
+        )
+        self._offsets[position] = (old.index, old.line)
+        delta = len(text) - len(self.text)
+        for later in range(position + 1, len(self._sections)):
+            base = self._sections[later]
+            self._sections[later] = base._replace(index=base.index + delta, line=base.line + lines)
+            index, line = self._offsets[later]
+            self._offsets[later] = (index + delta, line + lines)
+        self.text = text
@@ -0,0 +1,257 @@
+# src/zeno/cli/batch.py
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+from zeno.adapters import json_adapter, yaml_adapter
+from zeno.core.snapshot_file import load_snapshot, save_snapshot
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+from zeno.schema.compiled import CompiledSchema, compile_schema
+from zeno.schema.compiler import SchemaValidator, compile_validator
+from zeno.schema.ir_validator import IRStoreView, ValidationError, validate
+from zeno.schema.loader import SchemaError
+
+
+# Files picked up when a directory is given.
+CONFIG_SUFFIXES = (".yaml", ".yml", ".json")
+
+# convert --to: output suffix per format.
+FORMATS = {"yaml": ".yaml", "json": ".json", "snapshot": ".zsnap"}
+
+# Schema of this process and its compiled validator, set once by _init_worker.
+_schema: CompiledSchema | None = None
+_validator: SchemaValidator | None = None
+
+
+def main(argv: List[str] | None = None) -> int:
+    """
+    zeno validate / convert over many configs. Prints a JSON report
+    (or writes it to --report) and a one-line summary on stderr; exit
+    status 0 when every file passed, 1 otherwise, 2 on usage errors.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    paths = expand_paths(args.files)
+    if not paths:
+        parser.error("no config files matched")
+    if args.schema is not None:
+        try:
+            _load_schema(args.schema)  # fail once here rather than in every worker
+        except SchemaError as e:
+            parser.error(f"schema: {e}")
+
+    options: Dict[str, Any] = {}
+    if args.command == "convert":
+        options = {"to": args.to, "out_dir": args.out_dir}
+    started = time.perf_counter()
+    results = run_batch(args.command, paths, schema_path=args.schema, jobs=args.jobs, **options)
+    elapsed = time.perf_counter() - started
+
+    failed = sum(not result["ok"] for result in results)
+    report = {
+        "command": args.command,
+        "schema": args.schema,
+        "summary": {
+            "files": len(results),
+            "ok": len(results) - failed,
+            "failed": failed,
+            "jobs": args.jobs,
+            "seconds": round(elapsed, 3),
+            "files_per_second": round(len(results) / elapsed, 1) if elapsed else None,
+        },
+        "files": results,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False, default=str) + "\n"
+    if args.report:
+        Path(args.report).write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    print(f"zeno {args.command}: {len(results) - failed} ok, {failed} failed, "
+          f"{len(results)} files in {elapsed:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def expand_paths(patterns: List[str]) -> List[str]:
+    """Files named by patterns (paths, globs with **, directories searched for configs), sorted, once each."""
+    found: Dict[str, None] = {}
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        for match in sorted(matches):
+            path = Path(match)
+            if path.is_dir():
+                for child in sorted(path.rglob("*")):
+                    if child.suffix.lower() in CONFIG_SUFFIXES and child.is_file():
+                        found[str(child)] = None
+            else:
+                found[str(path)] = None
+    return list(found)
+
+
+def run_batch(
+    command: str,
+    paths: List[str],
+    *,
+    schema_path: str | None = None,
+    jobs: int = 1,
+    **options: Any,
+) -> List[dict]:
+    """
+    One result dict per path, in order. With jobs > 1 the files are
+    spread over that many worker processes, each loading the schema once.
+    """
+    task: Callable[[str], dict] = partial(_TASKS[command], **options)
+    if jobs <= 1 or len(paths) == 1:
+        _init_worker(schema_path)
+        return [task(path) for path in paths]
+    # A few chunks per worker: little IPC per file, and uneven files still balance.
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(schema_path,)) as pool:
+        return list(pool.map(task, paths, chunksize=chunksize))
+
+
+def read_config(path: Path) -> IRStore:
+    """Load a config by suffix: .json, .zsnap (snapshot) or YAML."""
+    suffix = path.suffix.lower()
+    if suffix == ".zsnap":
+        return load_snapshot(path)
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    if suffix == ".json":
+        json_adapter.parse(path.read_bytes(), store)
+    else:
+        yaml_adapter.parse(path.read_text(encoding="utf-8"), store)
+    return store
+
+
+def check(store: IRStore, validator: SchemaValidator | None) -> List[dict]:
+    """
+    Errors of the IR (structural, including the schema's shape) and, given
+    a compiled schema validator, of the schema's rules (ERROR_MODEL objects).
+    """
+    if validator is None:
+        try:
+            validate(IRStoreView(store, store.root_id))
+        except ValidationError as e:
+            return [_error(issue.path, issue.message, "structural") for issue in e.issues]
+        return []
+    issues, errors = validator(store)
+    if issues:
+        return [_error(issue.path, issue.message, "structural") for issue in issues]
+    return [_error(error.path, error.message, "schema_rule") for error in errors]
+
+
+# ============================================================
+# Worker side
+# ============================================================
+
+def _init_worker(schema_path: str | None) -> None:
+    global _schema, _validator
+    _schema = _load_schema(schema_path) if schema_path is not None else None
+    _validator = compile_validator(_schema.root_type) if _schema is not None else None
+
+
+def _load_schema(schema_path: str) -> CompiledSchema:
+    return compile_schema(schema_path)
+
+
+def _validate_file(path: str) -> dict:
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"file": path}
+    store = _read(path, result)
+    if store is not None:
+        result["nodes"] = len(store)
+        result["errors"] = check(store, _validator)
+    return _finish(result, started)
+
+
+def _convert_file(path: str, *, to: str, out_dir: str | None) -> dict:
+    started = time.perf_counter()
+    source = Path(path)
+    target = Path(out_dir or source.parent) / (source.stem + FORMATS[to])
+    result: Dict[str, Any] = {"file": path, "output": str(target)}
+    if target.resolve() == source.resolve():
+        result["errors"] = [_error("$", "output would overwrite the input", "persistence")]
+        return _finish(result, started)
+    store = _read(path, result)
+    if store is None:
+        return _finish(result, started)
+    result["nodes"] = len(store)
+    result["errors"] = check(store, _validator)
+    if result["errors"]:
+        return _finish(result, started)  # invalid configs are not written
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if to == "snapshot":
+            save_snapshot(store, target)
+        else:
+            adapter = json_adapter if to == "json" else yaml_adapter
+            with target.open("w", encoding="utf-8") as f:
+                adapter.serialize_to(f, store, store.get_node(store.root_id))
+    except (OSError, TypeError) as e:
+        result["errors"] = [_error("$", f"cannot write {target}: {e}", "persistence")]
+    return _finish(result, started)
+
+
+_TASKS: Dict[str, Callable[..., dict]] = {
+    "validate": _validate_file,
+    "convert": _convert_file,
+}
+
+
+def _read(path: str, result: dict) -> IRStore | None:
+    """The config at path, or None with the reason in result["errors"]."""
+    try:
+        return read_config(Path(path))
+    except OSError as e:
+        result["errors"] = [_error("$", f"cannot read: {e}", "persistence")]
+    except (yaml.YAMLError, json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+        result["errors"] = [_error("$", f"cannot load: {e}", "structural")]
+    return None
+
+
+def _finish(result: dict, started: float) -> dict:
+    result["ok"] = not result["errors"]
+    result["seconds"] = round(time.perf_counter() - started, 6)
+    return result
+
+
+def _error(path: str, message: str, category: str) -> dict:
+    return {"path": path, "message": message, "category": category, "severity": "error"}
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="zeno", description="Validate or convert many config files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("files", nargs="+", help="config files, globs (** allowed) or directories")
+    common.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    common.add_argument("--report", help="write the JSON report here instead of stdout")
+
+    check_files = commands.add_parser("validate", parents=[common], help="check configs against a schema")
+    check_files.add_argument("--schema", "-s", required=True, help="schema file (.zs)")
+
+    convert = commands.add_parser("convert", parents=[common], help="convert configs to another format")
+    convert.add_argument("--to", required=True, choices=sorted(FORMATS))
+    convert.add_argument("--out-dir", "-o", help="output directory (default: next to each input)")
+    convert.add_argument("--schema", "-s", help="only convert configs valid against this schema")
+    return parser
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,15 +10,18 @@ from zeno.core.store import IRStore
 from zeno.core.types import NodeType
 from zeno.core.operation import Operation
 from zeno.core.operation_processor import OperationProcessor
+from zeno.core.operation_stats import format_stats
 from zeno.adapters.yaml_adapter import serialize
 
 
 def main() -> int:
-    if len(sys.argv) != 2:
-        print("Usage: python -m zeno.cli.test_engine <schema.zs>")
+    args = [arg for arg in sys.argv[1:] if arg != "--stats"]
+    show_stats = len(args) != len(sys.argv) - 1
+    if len(args) != 1:
+        print("Usage: python -m zeno.cli.test_engine <schema.zs> [--stats]")
         return 1
 
-    schema_path = Path(sys.argv[1])
+    schema_path = Path(args[0])
 
     print(f"[1] Loading schema: {schema_path}")
     schema = load_schema(schema_path)
@@ -27,6 +30,8 @@ def main() -> int:
     store = IRStore()
     root_id = store.create_root(NodeType.OBJECT)
     processor = OperationProcessor(store)
+    if show_stats:
+        processor.enable_instrumentation()
 
     print("[3] Expanding schema into IR")
     _expand_schema_into_ir(
@@ -43,6 +48,11 @@ def main() -> int:
     print("\n----- GENERATED OUTPUT -----\n")
     print(output)
 
+    if show_stats:
+        print("----- OPERATION STATS -----\n")
+        print(format_stats(processor.stats()))
+        print()
+
     print("Engine test completed successfully.")
     return 0
 
@@ -83,13 +93,7 @@ def _expand_schema_into_ir(*, store, processor, parent_id, schema_node: dict) ->
         processor.apply(op)
 
         # Find newly created child
-        parent = store.get_node(parent_id)
-        child_id = None
-        for cid in parent.children:
-            c = store.get_node(cid)
-            if c.key == prop_key:
-                child_id = cid
-                break
+        child_id = store.get_child_by_key(parent_id, prop_key)
 
         if child_id is None:
             continue
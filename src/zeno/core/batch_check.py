@@ -0,0 +1,228 @@
+# src/zeno/core/batch_check.py
+
+from __future__ import annotations
+
+from typing import Dict, Sequence, Set
+
+from zeno.core.key_index import link_error
+from zeno.core.operation import Operation
+from zeno.core.node_records import plain_node_type
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId, NodeType
+
+
+class BatchError(ValueError):
+    """A batch operation failed; the store is left as it was before the batch."""
+
+    def __init__(self, index: int, operation: Operation, reason: str) -> None:
+        self.index = index
+        self.operation = operation
+        self.reason = reason
+        super().__init__(f"Operation {index} ({operation.operation_type}): {reason}")
+
+
+class _BatchPlan:
+    """
+    Store view plus the effects of the batch operations checked so far.
+
+    Tracks only what later preconditions depend on: node existence and
+    type, parent links of added nodes, and OBJECT keys taken or freed.
+    """
+
+    def __init__(self, store: IRStore) -> None:
+        self._store = store
+        self._added: Dict[NodeId, NodeType] = {}
+        self._added_parent: Dict[NodeId, NodeId] = {}
+        self._added_key: Dict[NodeId, str | None] = {}
+        self._removed: Set[NodeId] = set()
+        self._keys_taken: Dict[NodeId, Set[str]] = {}
+        self._keys_freed: Dict[NodeId, Set[str]] = {}
+
+    def exists(self, node_id: NodeId) -> bool:
+        # A node is gone if it or any ancestor was removed earlier in the batch.
+        current: NodeId | None = node_id
+        while current is not None:
+            if current in self._removed:
+                return False
+            if current in self._added:
+                current = self._added_parent[current]
+            elif self._store.has_node(current):
+                current = self._store.get_node(current).parent_id
+            else:
+                return False
+        return True
+
+    def is_known(self, node_id: NodeId) -> bool:
+        """True if node_id is in use at this point of the batch."""
+        return (node_id in self._added or self._store.has_node(node_id)) and self.exists(node_id)
+
+    def node_type(self, node_id: NodeId) -> NodeType:
+        if node_id in self._added:
+            return self._added[node_id]
+        return self._store.get_node(node_id).type
+
+    def parent_of(self, node_id: NodeId) -> NodeId | None:
+        if node_id in self._added:
+            return self._added_parent[node_id]
+        return self._store.get_node(node_id).parent_id
+
+    def key_of(self, node_id: NodeId) -> str | None:
+        if node_id in self._added:
+            return self._added_key[node_id]
+        return self._store.get_node(node_id).key
+
+    def key_taken(self, parent_id: NodeId, key: str) -> bool:
+        if key in self._keys_taken.get(parent_id, ()):
+            return True
+        if key in self._keys_freed.get(parent_id, ()):
+            return False
+        if parent_id in self._added:
+            return False
+        return self._store.get_child_by_key(parent_id, key) is not None
+
+    def add(self, node_id: NodeId | None, node_type: NodeType, parent_id: NodeId, key: str | None) -> None:
+        if node_id is not None:
+            self._removed.discard(node_id)
+            self._added[node_id] = node_type
+            self._added_parent[node_id] = parent_id
+            self._added_key[node_id] = key
+        if key is not None:
+            self._keys_freed.get(parent_id, set()).discard(key)
+            self._keys_taken.setdefault(parent_id, set()).add(key)
+
+    def remove(self, node_id: NodeId) -> None:
+        parent_id = self.parent_of(node_id)
+        key = self.key_of(node_id)
+        self._removed.add(node_id)
+        if key is not None:
+            self._keys_taken.get(parent_id, set()).discard(key)
+            self._keys_freed.setdefault(parent_id, set()).add(key)
+
+
+def check_batch(store: IRStore, operations: Sequence[Operation]) -> None:
+    """
+    Validate every operation's preconditions against the store as it will
+    be when that operation runs, without mutating anything.
+
+    Raises BatchError for the first failing operation. Positional checks
+    (move bounds, reorder permutations) depend on sibling order and are
+    left to apply time. An operation type without a check here (one
+    registered by the caller) ends the preflight, since its effects cannot
+    be modelled; the rest of the batch is checked as it applies.
+    """
+    plan = _BatchPlan(store)
+    for index, op in enumerate(operations):
+        if op.operation_type not in _CHECKED:
+            return
+        reason = _check_one(store, plan, op)
+        if reason is not None:
+            raise BatchError(index, op, reason)
+
+
+_CHECKED = frozenset({
+    "add_node", "update_scalar", "remove_node", "move_node", "restore_subtree",
+    "reorder_list", "clone_subtree", "replace_subtree",
+})
+
+
+def _check_link(plan: _BatchPlan, parent_id: NodeId, key: str | None) -> str | None:
+    """Why a new child cannot be linked under parent_id with key, or None."""
+    if not plan.exists(parent_id):
+        return "Parent node does not exist."
+    parent_type = plan.node_type(parent_id)
+    taken = parent_type == NodeType.OBJECT and plan.key_taken(parent_id, key)
+    return link_error(parent_type, key, taken)
+
+
+def _check_one(store: IRStore, plan: _BatchPlan, op: Operation) -> str | None:
+    payload = op.payload
+    kind = op.operation_type
+
+    if kind == "add_node":
+        parent_id = payload["parent_id"]
+        key = payload.get("key")
+        node_id = payload.get("node_id")
+        reason = _check_link(plan, parent_id, key)
+        if reason is not None:
+            return reason
+        if node_id is not None and plan.is_known(node_id):
+            return "Node with this ID already exists."
+        plan.add(node_id, payload["node_type"], parent_id, key)
+        return None
+
+    if kind in ("update_scalar", "remove_node", "move_node"):
+        node_id = payload["node_id"]
+        if not plan.exists(node_id):
+            return "Target node does not exist."
+        if kind == "update_scalar":
+            if plan.node_type(node_id) != NodeType.SCALAR:
+                return "Only scalar nodes can be updated."
+            return None
+        parent_id = plan.parent_of(node_id)
+        if parent_id is None:
+            return "Root node cannot be removed." if kind == "remove_node" else "Cannot move root node."
+        if kind == "remove_node":
+            plan.remove(node_id)
+            return None
+        if plan.node_type(parent_id) != NodeType.LIST:
+            return "Move operation only allowed for LIST children."
+        if "index" not in payload and payload.get("direction") not in ("up", "down"):
+            return f"Invalid direction: {payload.get('direction')}"
+        return None
+
+    if kind == "restore_subtree":
+        nodes = payload["nodes"]
+        top = nodes[0]
+        if not plan.exists(top.parent_id):
+            return "Parent node does not exist."
+        if top.key is not None and plan.key_taken(top.parent_id, top.key):
+            return f"Duplicate object key: {top.key}"
+        if any(plan.is_known(record.id) for record in nodes):
+            return "Node with this ID already exists."
+        for record in nodes:
+            plan.add(record.id, record.type, record.parent_id, record.key)
+        return None
+
+    if kind == "reorder_list":
+        node_id = payload["node_id"]
+        if not plan.exists(node_id):
+            return "Target node does not exist."
+        if plan.node_type(node_id) != NodeType.LIST:
+            return "Reorder operation only allowed for LIST nodes."
+        return None
+
+    if kind == "clone_subtree":
+        if not plan.exists(payload["node_id"]):
+            return "Target node does not exist."
+        reason = _check_link(plan, payload["parent_id"], payload.get("key"))
+        if reason is not None:
+            return reason
+        # Only the copy's root is tracked; its descendants are unknown here.
+        new_id = payload.get("new_id")
+        if new_id is not None and plan.is_known(new_id):
+            return "Node with this ID already exists."
+        plan.add(new_id, plan.node_type(payload["node_id"]), payload["parent_id"], payload.get("key"))
+        return None
+
+    # replace_subtree
+    node_id = payload["node_id"]
+    if not plan.exists(node_id):
+        return "Target node does not exist."
+    parent_id = plan.parent_of(node_id)
+    if parent_id is None:
+        return "Root node cannot be replaced."
+    key = plan.key_of(node_id)
+    plan.remove(node_id)
+    if "nodes" in payload:
+        nodes = payload["nodes"]
+        if any(plan.is_known(record.id) for record in nodes):
+            return "Node with this ID already exists."
+        for record in nodes:
+            plan.add(record.id, record.type, record.parent_id, record.key)
+        return None
+    new_id = payload.get("new_id")
+    if new_id is not None and plan.is_known(new_id):
+        return "Node with this ID already exists."
+    plan.add(new_id, plain_node_type(payload["data"]), parent_id, key)
+    return None
+
@@ -0,0 +1,124 @@
+# src/zeno/core/bulk_handlers.py
+
+from __future__ import annotations
+
+from itertools import count
+from typing import Callable, Dict
+
+from zeno.core.node import Node
+from zeno.core.node_records import check_records, insert_records, plain_records, subtree_records
+from zeno.core.operation import Operation
+from zeno.core.operation_handlers import Handler, inverse_operation, register
+from zeno.core.store import IRStore
+from zeno.core.traversal import preorder_ids
+from zeno.core.types import NodeId, NodeType
+
+
+# Bulk operation type -> handler table: a whole list or subtree in one operation.
+BULK_HANDLERS: Dict[str, Handler] = {}
+
+
+@register("reorder_list", BULK_HANDLERS)
+def apply_reorder_list(store: IRStore, operation: Operation) -> Operation:
+    """Permute a LIST's items: position i receives the item now at order[i]."""
+    node_id: NodeId = operation.payload["node_id"]
+    order: list[int] = operation.payload["order"]
+
+    if not store.has_node(node_id):
+        raise ValueError("Target node does not exist.")
+
+    if store.get_node(node_id).type != NodeType.LIST:
+        raise ValueError("Reorder operation only allowed for LIST nodes.")
+
+    store.reorder_children(node_id, order)
+
+    inverse_order = [0] * len(order)
+    for position, old_position in enumerate(order):
+        inverse_order[old_position] = position
+    return inverse_operation(operation, "reorder_list", {"node_id": node_id, "order": inverse_order})
+
+
+@register("clone_subtree", BULK_HANDLERS)
+def apply_clone_subtree(store: IRStore, operation: Operation) -> Operation:
+    """
+    Deep-copy the subtree at node_id under parent_id (with key / at index).
+
+    Copies get consecutive new ids in pre-order, starting at the optional
+    payload "new_id" (which must head a free run of ids).
+    """
+    payload = operation.payload
+
+    source_id: NodeId = payload["node_id"]
+    parent_id: NodeId = payload["parent_id"]
+
+    if not store.has_node(source_id):
+        raise ValueError("Target node does not exist.")
+    if not store.has_node(parent_id):
+        raise ValueError("Parent node does not exist.")
+
+    next_id = _id_source(store, payload.get("new_id"))
+    new_ids: Dict[NodeId, NodeId] = {}
+    records: list[Node] = []
+    for nid in preorder_ids(store, source_id):
+        # copy() works on every backend's node view and detaches the metadata.
+        record = store.get_node(nid).copy()
+        record.id = new_ids[nid] = next_id()
+        if records:
+            record.parent_id = new_ids[record.parent_id]
+        else:
+            record.parent_id, record.key = parent_id, payload.get("key")
+        records.append(record)
+
+    check_records(store, records)
+    insert_records(store, records, payload.get("index"))
+    return inverse_operation(operation, "remove_node", {"node_id": records[0].id})
+
+
+@register("replace_subtree", BULK_HANDLERS)
+def apply_replace_subtree(store: IRStore, operation: Operation) -> Operation:
+    """
+    Replace the subtree at node_id, in place, with a new one.
+
+    The new subtree is built from plain "data" (dict -> OBJECT, list ->
+    LIST, anything else -> SCALAR) with consecutive new ids starting at the
+    optional "new_id", or given as pre-order Node "nodes" (the inverse).
+    It is checked in full before the old subtree is detached, so a bad
+    replacement leaves the document as it was.
+    """
+    payload = operation.payload
+
+    node_id: NodeId = payload["node_id"]
+
+    if not store.has_node(node_id):
+        raise ValueError("Target node does not exist.")
+
+    if node_id == store.root_id:
+        raise ValueError("Root node cannot be replaced.")
+
+    node = store.get_node(node_id)
+    if "nodes" in payload:
+        records: list[Node] = payload["nodes"]
+    else:
+        next_id = _id_source(store, payload.get("new_id"))
+        records = plain_records(payload["data"], node.parent_id, node.key, next_id)
+    check_records(store, records)
+
+    index = store.child_index(node_id)
+    old_nodes = subtree_records(store, node_id)
+
+    store.unlink_child(child_id=node_id)
+    store.delete_subtree(node_id=node_id)
+    try:
+        insert_records(store, records, index)
+    except ValueError:
+        insert_records(store, old_nodes, index)
+        raise
+
+    return inverse_operation(operation, "replace_subtree", {"node_id": records[0].id, "nodes": old_nodes})
+
+
+def _id_source(store: IRStore, first_id: NodeId | None) -> Callable[[], NodeId]:
+    """Ids for new nodes: a run from first_id, or fresh handles from the store."""
+    if first_id is None:
+        return store.allocate_id
+    return count(first_id).__next__
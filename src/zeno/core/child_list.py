@@ -0,0 +1,198 @@
+# src/zeno/core/child_list.py
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from zeno.core.types import NodeId
+
+
+# Chunks split in half once they grow past this many ids.
+CHUNK_MAX = 512
+
+# add_child and child_sequence swap a plain list for a ChildList past this length.
+CHILD_LIST_THRESHOLD = CHUNK_MAX
+
+
+class _Chunk:
+    """One run of consecutive child ids (compared by identity)."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: List[NodeId]) -> None:
+        self.items = items
+
+
+class ChildList:
+    """
+    Ordered child-id sequence with sub-linear positional edits.
+
+    Ids are held in a list of bounded chunks plus an id -> chunk map, so
+    index(), remove() and insert() touch one chunk and walk the chunk
+    directory instead of shifting the whole sequence: O(n / CHUNK_MAX +
+    CHUNK_MAX). Child ids are unique within a parent, which the id map
+    relies on.
+
+    Supports the list operations the store and UI use on Node.children.
+    """
+
+    __slots__ = ("_chunks", "_owner", "_len")
+
+    def __init__(self, ids: Iterable[NodeId] = ()) -> None:
+        self._chunks: List[_Chunk] = []
+        self._owner: Dict[NodeId, _Chunk] = {}
+        ids = list(ids)
+        for start in range(0, len(ids), CHUNK_MAX // 2):
+            chunk = _Chunk(ids[start:start + CHUNK_MAX // 2])
+            self._chunks.append(chunk)
+            for cid in chunk.items:
+                self._owner[cid] = chunk
+        self._len = len(ids)
+
+    # ------------------------------------------------------------
+    # Read access
+    # ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[NodeId]:
+        return chain.from_iterable(chunk.items for chunk in self._chunks)
+
+    def __reversed__(self) -> Iterator[NodeId]:
+        return chain.from_iterable(reversed(chunk.items) for chunk in reversed(self._chunks))
+
+    def __contains__(self, child_id: object) -> bool:
+        return child_id in self._owner
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        chunk, offset = self._locate(self._normalize(index))
+        return chunk.items[offset]
+
+    def index(self, child_id: NodeId) -> int:
+        chunk = self._owner.get(child_id)
+        if chunk is None:
+            raise ValueError(f"{child_id!r} is not in list")
+        base = 0
+        for current in self._chunks:
+            if current is chunk:
+                return base + chunk.items.index(child_id)
+            base += len(current.items)
+        raise RuntimeError("ChildList chunk directory out of sync.")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ChildList, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # mutable, like list
+
+    def __repr__(self) -> str:
+        return f"ChildList({list(self)!r})"
+
+    # ------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------
+
+    def append(self, child_id: NodeId) -> None:
+        if not self._chunks:
+            self._chunks.append(_Chunk([]))
+        chunk = self._chunks[-1]
+        chunk.items.append(child_id)
+        self._added(chunk, child_id, len(self._chunks) - 1)
+
+    def extend(self, ids: Iterable[NodeId]) -> None:
+        for child_id in ids:
+            self.append(child_id)
+
+    def insert(self, index: int, child_id: NodeId) -> None:
+        if index < 0:
+            index = max(0, self._len + index)
+        if index >= self._len:
+            self.append(child_id)
+            return
+        pos, offset = self._locate_pos(index)
+        chunk = self._chunks[pos]
+        chunk.items.insert(offset, child_id)
+        self._added(chunk, child_id, pos)
+
+    def remove(self, child_id: NodeId) -> None:
+        chunk = self._owner.get(child_id)
+        if chunk is None:
+            raise ValueError(f"{child_id!r} not in list")
+        chunk.items.remove(child_id)
+        self._removed(chunk, child_id)
+
+    def pop(self, index: int = -1) -> NodeId:
+        chunk, offset = self._locate(self._normalize(index))
+        child_id = chunk.items.pop(offset)
+        self._removed(chunk, child_id)
+        return child_id
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    # ------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ChildList index out of range")
+        return index
+
+    def _locate_pos(self, index: int) -> Tuple[int, int]:
+        for pos, chunk in enumerate(self._chunks):
+            size = len(chunk.items)
+            if index < size:
+                return pos, index
+            index -= size
+        raise IndexError("ChildList index out of range")
+
+    def _locate(self, index: int) -> Tuple[_Chunk, int]:
+        pos, offset = self._locate_pos(index)
+        return self._chunks[pos], offset
+
+    def _added(self, chunk: _Chunk, child_id: NodeId, pos: int) -> None:
+        self._owner[child_id] = chunk
+        self._len += 1
+        if len(chunk.items) > CHUNK_MAX:
+            half = len(chunk.items) // 2
+            tail = _Chunk(chunk.items[half:])
+            del chunk.items[half:]
+            for cid in tail.items:
+                self._owner[cid] = tail
+            self._chunks.insert(pos + 1, tail)
+
+    def _removed(self, chunk: _Chunk, child_id: NodeId) -> None:
+        del self._owner[child_id]
+        self._len -= 1
+        if not chunk.items:
+            self._chunks = [c for c in self._chunks if c is not chunk]
+
+
+def child_sequence(child_ids: List[NodeId]) -> List[NodeId] | ChildList:
+    """Container for a whole children sequence: a ChildList past CHILD_LIST_THRESHOLD."""
+    return ChildList(child_ids) if len(child_ids) > CHILD_LIST_THRESHOLD else child_ids
+
+
+def add_child(children: Any, child_id: NodeId, index: int | None) -> List[NodeId] | ChildList:
+    """
+    Insert child_id at index (append if None) and return the container to
+    keep: the same one, or a new one when children was a shared empty
+    tuple or a list that grew past CHILD_LIST_THRESHOLD.
+    """
+    if type(children) is tuple:
+        children = list(children)
+    if index is None:
+        children.append(child_id)
+    else:
+        children.insert(index, child_id)
+    if type(children) is list and len(children) > CHILD_LIST_THRESHOLD:
+        return ChildList(children)
+    return children
@@ -0,0 +1,148 @@
+# src/zeno/core/columnar_node.py
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator
+
+from zeno.core.node import Node
+from zeno.core.types import NodeId, NodeType
+
+if TYPE_CHECKING:
+    from zeno.core.columnar_store import ColumnarIRStore
+
+
+# Row 0 is never issued as a handle, so 0 doubles as the null link.
+NULL_LINK = 0
+# Key/value slot for "no key" / None.
+ABSENT = -1
+# Type code of a free (deleted or never used) row.
+FREE_ROW = -1
+
+TYPE_CODES: Dict[NodeType, int] = {
+    NodeType.OBJECT: 0,
+    NodeType.LIST: 1,
+    NodeType.SCALAR: 2,
+}
+CODE_TYPES: Dict[int, NodeType] = {code: t for t, code in TYPE_CODES.items()}
+
+
+class ColumnarChildren:
+    """
+    Live read-only view of a ColumnarIRStore node's children, in order.
+
+    Length and membership come straight from the columns; iteration and
+    positional access walk the sibling chain (from the nearer end).
+    """
+
+    __slots__ = ("_store", "_node_id")
+
+    def __init__(self, store: "ColumnarIRStore", node_id: NodeId) -> None:
+        self._store = store
+        self._node_id = node_id
+
+    def __len__(self) -> int:
+        return self._store._child_count[self._node_id]
+
+    def __iter__(self) -> Iterator[NodeId]:
+        return self._store.iter_children(self._node_id)
+
+    def __reversed__(self) -> Iterator[NodeId]:
+        prev_sibling = self._store._prev_sibling
+        cid = self._store._last_child[self._node_id]
+        while cid != NULL_LINK:
+            yield cid
+            cid = prev_sibling[cid]
+
+    def __contains__(self, child_id: object) -> bool:
+        store = self._store
+        return store.has_node(child_id) and store._parent[child_id] == self._node_id
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("children index out of range")
+        if index <= length // 2:
+            walk, steps = iter(self), index
+        else:
+            walk, steps = reversed(self), length - 1 - index
+        for _ in range(steps):
+            next(walk)
+        return next(walk)
+
+    def index(self, child_id: NodeId) -> int:
+        for idx, cid in enumerate(self):
+            if cid == child_id:
+                return idx
+        raise ValueError(f"{child_id!r} is not in list")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ColumnarChildren, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # live view, like list
+
+    def __repr__(self) -> str:
+        return f"ColumnarChildren({list(self)!r})"
+
+
+class ColumnarNode:
+    """Read-only Node view over one ColumnarIRStore row."""
+
+    __slots__ = ("_store", "id")
+
+    def __init__(self, store: "ColumnarIRStore", node_id: NodeId) -> None:
+        self._store = store
+        self.id = node_id
+
+    @property
+    def type(self) -> NodeType:
+        return CODE_TYPES[self._store._type[self.id]]
+
+    @property
+    def parent_id(self) -> NodeId | None:
+        return self._store._parent[self.id] or None
+
+    @property
+    def key(self) -> Any:
+        key_id = self._store._key[self.id]
+        return None if key_id == ABSENT else self._store._keys[key_id]
+
+    @property
+    def value(self) -> Any:
+        value_id = self._store._value[self.id]
+        return None if value_id == ABSENT else self._store._values[value_id]
+
+    @property
+    def children(self) -> ColumnarChildren:
+        return ColumnarChildren(self._store, self.id)
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return self._store._metadata.setdefault(self.id, {})
+
+    def get_metadata(self, key: str, default: Any = None) -> Any:
+        return self._store._metadata.get(self.id, {}).get(key, default)
+
+    def copy(self) -> Node:
+        """Detached Node record with this row's current contents."""
+        meta = self._store._metadata.get(self.id)
+        return Node(
+            id=self.id,
+            type=self.type,
+            parent_id=self.parent_id,
+            key=self.key,
+            value=self.value,
+            children=list(self.children) if self.type != NodeType.SCALAR else None,
+            metadata=dict(meta) if meta else None,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnarNode(id={self.id!r}, type={self.type!r}, parent_id={self.parent_id!r}, "
+            f"key={self.key!r}, value={self.value!r}, children={list(self.children)!r})"
+        )
@@ -0,0 +1,290 @@
+# src/zeno/core/columnar_store.py
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterator
+
+from zeno.core.columnar_node import (
+    ABSENT,
+    FREE_ROW,
+    NULL_LINK,
+    TYPE_CODES,
+    ColumnarNode,
+)
+from zeno.core.intern_table import InternTable
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId
+
+
+# OBJECT nodes with fewer children resolve keys by scanning siblings.
+_KEY_INDEX_MIN_CHILDREN = 16
+
+_COLUMNS = (
+    "_type", "_parent", "_key", "_value", "_first_child", "_last_child",
+    "_next_sibling", "_prev_sibling", "_child_count",
+)
+
+
+class ColumnarIRStore(IRStore):
+    """
+    Struct-of-arrays IRStore backend for very large documents.
+
+    One row per node handle, held in parallel typed arrays:
+      type, parent, key-id, value-id, first/last child, next/prev sibling,
+      child count.
+    Keys and scalar values are interned into shared, reference-counted
+    tables (slots are reused once nothing refers to them). Children form an
+    intrusive doubly linked list, so append and unlink are O(1); positional
+    lookups walk the sibling chain. Only OBJECT nodes with many children
+    carry a key -> child dict; small ones compare interned key ids.
+
+    get_node returns a ColumnarNode view; the public API is IRStore's.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._type = array("b", [FREE_ROW])
+        self._parent = array("i", [NULL_LINK])
+        self._key = array("i", [ABSENT])
+        self._value = array("i", [ABSENT])
+        self._first_child = array("i", [NULL_LINK])
+        self._last_child = array("i", [NULL_LINK])
+        self._next_sibling = array("i", [NULL_LINK])
+        self._prev_sibling = array("i", [NULL_LINK])
+        self._child_count = array("i", [0])
+
+        self._keys = InternTable()
+        self._values = InternTable()
+
+        # Sparse: only nodes that ever had metadata written.
+        self._metadata: Dict[NodeId, dict[str, Any]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def snapshot(self) -> ColumnarIRStore:
+        """Point-in-time copy: column arrays are copied wholesale."""
+        snap = ColumnarIRStore()
+        for name in _COLUMNS:
+            setattr(snap, name, array(getattr(self, name).typecode, getattr(self, name)))
+        snap._keys, snap._values = self._keys.copy(), self._values.copy()
+        snap._metadata = {nid: dict(meta) for nid, meta in self._metadata.items()}
+        snap._key_index = self._key_index.copy()
+        snap._count = self._count
+        snap._root_id = self._root_id
+        snap._next_id = self._next_id
+        return snap
+
+    def get_node(self, node_id: NodeId) -> ColumnarNode:
+        if not self.has_node(node_id):
+            raise KeyError(f"Node {node_id} does not exist.")
+        return ColumnarNode(self, node_id)
+
+    def has_node(self, node_id: NodeId) -> bool:
+        return (
+            isinstance(node_id, int)
+            and 0 < node_id < len(self._type)
+            and self._type[node_id] != FREE_ROW
+        )
+
+    def iter_node_ids(self) -> Iterator[NodeId]:
+        type_col = self._type
+        return (i for i in range(1, len(type_col)) if type_col[i] != FREE_ROW)
+
+    def iter_children(self, node_id: NodeId) -> Iterator[NodeId]:
+        """Yield child handles in order without materializing a sequence."""
+        next_sibling = self._next_sibling
+        cid = self._first_child[node_id]
+        while cid != NULL_LINK:
+            yield cid
+            cid = next_sibling[cid]
+
+    def child_count(self, node_id: NodeId) -> int:
+        self.get_node(node_id)
+        return self._child_count[node_id]
+
+    def child_index(self, child_id: NodeId) -> int:
+        parent_id = self.get_node(child_id).parent_id
+        if parent_id is None:
+            raise ValueError("Node has no parent.")
+        for idx, cid in enumerate(self.iter_children(parent_id)):
+            if cid == child_id:
+                return idx
+        raise RuntimeError("Structural corruption: node not in parent's children.")
+
+    # ------------------------------------------------------------
+    # Interning
+    # ------------------------------------------------------------
+
+    # Every key / value column entry other than ABSENT holds one reference.
+
+    def _intern_key(self, key: Any) -> int:
+        return ABSENT if key is None else self._keys.intern(key)
+
+    def _intern_value(self, value: Any) -> int:
+        return ABSENT if value is None else self._values.intern(value)
+
+    def _release(self, column: array, table: InternTable, node_id: NodeId) -> None:
+        slot = column[node_id]
+        if slot != ABSENT:
+            column[node_id] = ABSENT
+            table.release(slot)
+
+    # ------------------------------------------------------------
+    # Key index: only large objects get a dict, small ones scan
+    # ------------------------------------------------------------
+
+    def _key_lookup(self, parent_id: NodeId, key: str) -> NodeId | None:
+        index = self._key_index.get(parent_id)
+        if index is not None:
+            return index.get(key)
+        keys = self._keys
+        key_col = self._key
+        key_id = keys.find(key)
+        if key_id is not None:
+            for cid in self.iter_children(parent_id):
+                if key_col[cid] == key_id:
+                    return cid
+            return None
+        # Absent, or a key type with a slot per node (dates etc.).
+        for cid in self.iter_children(parent_id):
+            if key_col[cid] != ABSENT and keys[key_col[cid]] == key:
+                return cid
+        return None
+
+    def _key_add(self, parent_id: NodeId, key: str, child_id: NodeId) -> None:
+        index = self._key_index.get(parent_id)
+        if index is not None:
+            index[key] = child_id
+        elif self._child_count[parent_id] >= _KEY_INDEX_MIN_CHILDREN:
+            keys = self._keys
+            key_col = self._key
+            self._key_index[parent_id] = {
+                keys[key_col[cid]]: cid for cid in self.iter_children(parent_id)
+            }
+
+    def _key_remove(self, parent_id: NodeId, key: str) -> None:
+        index = self._key_index.get(parent_id)
+        if index is not None:
+            index.pop(key, None)
+
+    # ------------------------------------------------------------
+    # Storage primitives
+    # ------------------------------------------------------------
+
+    def _ensure_row(self, node_id: NodeId) -> None:
+        missing = node_id + 1 - len(self._type)
+        if missing <= 0:
+            return
+        # Grow in batches; spare rows stay FREE_ROW until their handle is issued.
+        missing = max(missing, len(self._type) >> 3, 256)
+        self._type.extend(array("b", [FREE_ROW]) * missing)
+        for col in (self._parent, self._first_child, self._last_child,
+                    self._next_sibling, self._prev_sibling):
+            col.extend(array("i", [NULL_LINK]) * missing)
+        for col in (self._key, self._value):
+            col.extend(array("i", [ABSENT]) * missing)
+        self._child_count.extend(array("i", [0]) * missing)
+
+    def _insert_node(self, node: Node) -> None:
+        node_id = node.id
+        self._ensure_row(node_id)
+        self._type[node_id] = TYPE_CODES[node.type]
+        self._parent[node_id] = NULL_LINK
+        self._key[node_id] = ABSENT
+        self._value[node_id] = self._intern_value(node.value)
+        self._first_child[node_id] = NULL_LINK
+        self._last_child[node_id] = NULL_LINK
+        self._next_sibling[node_id] = NULL_LINK
+        self._prev_sibling[node_id] = NULL_LINK
+        self._child_count[node_id] = 0
+        if node._metadata:
+            self._metadata[node_id] = dict(node._metadata)
+        self._count += 1
+
+    def _attach(
+        self,
+        parent_id: NodeId,
+        child_id: NodeId,
+        key: str | None,
+        index: int | None,
+    ) -> None:
+        self._parent[child_id] = parent_id
+        self._key[child_id] = self._intern_key(key)
+
+        count = self._child_count[parent_id]
+        if index is None or index >= count:
+            prev_id, next_id = self._last_child[parent_id], NULL_LINK
+        else:
+            next_id = self._first_child[parent_id]
+            for _ in range(index):
+                next_id = self._next_sibling[next_id]
+            prev_id = self._prev_sibling[next_id]
+
+        self._prev_sibling[child_id] = prev_id
+        self._next_sibling[child_id] = next_id
+        if prev_id == NULL_LINK:
+            self._first_child[parent_id] = child_id
+        else:
+            self._next_sibling[prev_id] = child_id
+        if next_id == NULL_LINK:
+            self._last_child[parent_id] = child_id
+        else:
+            self._prev_sibling[next_id] = child_id
+
+        self._child_count[parent_id] = count + 1
+
+    def _detach(self, parent_id: NodeId, child_id: NodeId) -> None:
+        if self._parent[child_id] != parent_id:
+            raise RuntimeError("Structural corruption: parent missing child link.")
+
+        prev_id = self._prev_sibling[child_id]
+        next_id = self._next_sibling[child_id]
+        if prev_id == NULL_LINK:
+            self._first_child[parent_id] = next_id
+        else:
+            self._next_sibling[prev_id] = next_id
+        if next_id == NULL_LINK:
+            self._last_child[parent_id] = prev_id
+        else:
+            self._prev_sibling[next_id] = prev_id
+
+        self._child_count[parent_id] -= 1
+        self._parent[child_id] = NULL_LINK
+        self._release(self._key, self._keys, child_id)
+        self._prev_sibling[child_id] = NULL_LINK
+        self._next_sibling[child_id] = NULL_LINK
+
+    def _set_children(self, parent_id: NodeId, child_ids: list[NodeId]) -> None:
+        # Relink the sibling chain in the new order; parent and key rows are unchanged.
+        prev_id = NULL_LINK
+        for cid in child_ids:
+            self._prev_sibling[cid] = prev_id
+            if prev_id == NULL_LINK:
+                self._first_child[parent_id] = cid
+            else:
+                self._next_sibling[prev_id] = cid
+            prev_id = cid
+        if prev_id != NULL_LINK:
+            self._next_sibling[prev_id] = NULL_LINK
+        self._last_child[parent_id] = prev_id
+
+    def _assign_value(self, node_id: NodeId, value: Any) -> None:
+        value_id = self._intern_value(value)
+        self._release(self._value, self._values, node_id)
+        self._value[node_id] = value_id
+
+    def _forget(self, node_id: NodeId) -> None:
+        self._type[node_id] = FREE_ROW
+        # Descendants are forgotten while still linked: their keys go too.
+        self._release(self._key, self._keys, node_id)
+        self._release(self._value, self._values, node_id)
+        self._first_child[node_id] = NULL_LINK
+        self._last_child[node_id] = NULL_LINK
+        self._child_count[node_id] = 0
+        self._metadata.pop(node_id, None)
+        self._count -= 1
+        self._drop_indexes(node_id)
@@ -0,0 +1,241 @@
+# src/zeno/core/hamt.py
+
+from __future__ import annotations
+
+from typing import Any, Iterator, List, Tuple
+
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+_MAX_SHIFT = 64
+
+_MISSING = object()
+
+
+class _Collision:
+    """Entries whose full 64-bit hashes are equal."""
+
+    __slots__ = ("hash", "pairs", "owner")
+
+    def __init__(self, h: int, pairs: List[Tuple[Any, Any]], owner: object) -> None:
+        self.hash = h
+        self.pairs = pairs
+        self.owner = owner
+
+
+class _Bitmap:
+    """
+    Trie level: bitmap of occupied slots plus a dense entry list.
+
+    Each entry is a (key, value) tuple, a child _Bitmap, or a _Collision.
+    A node whose owner matches the editing map's token may be changed in
+    place; any other node is shared and is copied first.
+    """
+
+    __slots__ = ("bitmap", "entries", "owner")
+
+    def __init__(self, bitmap: int, entries: List[Any], owner: object) -> None:
+        self.bitmap = bitmap
+        self.entries = entries
+        self.owner = owner
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _editable(node: _Bitmap, owner: object) -> _Bitmap:
+    if node.owner is owner:
+        return node
+    return _Bitmap(node.bitmap, list(node.entries), owner)
+
+
+def _pair_node(shift: int, a: Tuple[Any, Any], b: Tuple[Any, Any], owner: object) -> Any:
+    ha, hb = _hash(a[0]), _hash(b[0])
+    if ha == hb or shift >= _MAX_SHIFT:
+        return _Collision(ha, [a, b], owner)
+    ia, ib = (ha >> shift) & _MASK, (hb >> shift) & _MASK
+    if ia == ib:
+        return _Bitmap(1 << ia, [_pair_node(shift + _BITS, a, b, owner)], owner)
+    entries = [a, b] if ia < ib else [b, a]
+    return _Bitmap((1 << ia) | (1 << ib), entries, owner)
+
+
+def _assoc(node: _Bitmap, shift: int, h: int, key: Any, value: Any, owner: object) -> Tuple[_Bitmap, bool]:
+    """Return (node with key set, whether key was new)."""
+    bit = 1 << ((h >> shift) & _MASK)
+    idx = (node.bitmap & (bit - 1)).bit_count()
+
+    if not node.bitmap & bit:
+        node = _editable(node, owner)
+        node.entries.insert(idx, (key, value))
+        node.bitmap |= bit
+        return node, True
+
+    entry = node.entries[idx]
+    if type(entry) is tuple:
+        if entry[0] == key:
+            if entry[1] is value:
+                return node, False
+            replacement, added = (key, value), False
+        else:
+            replacement, added = _pair_node(shift + _BITS, entry, (key, value), owner), True
+    elif type(entry) is _Collision:
+        if h != entry.hash:
+            # Push the collision one level down, then insert beside it.
+            sub_shift = shift + _BITS
+            level = _Bitmap(1 << ((entry.hash >> sub_shift) & _MASK), [entry], owner)
+            replacement, added = _assoc(level, sub_shift, h, key, value, owner)
+        else:
+            pairs = [p for p in entry.pairs if p[0] != key]
+            added = len(pairs) == len(entry.pairs)
+            replacement = _Collision(entry.hash, pairs + [(key, value)], owner)
+    else:
+        replacement, added = _assoc(entry, shift + _BITS, h, key, value, owner)
+        if replacement is entry:
+            return node, added
+
+    node = _editable(node, owner)
+    node.entries[idx] = replacement
+    return node, added
+
+
+def _dissoc(node: _Bitmap, shift: int, h: int, key: Any, owner: object) -> Tuple[Any, bool]:
+    """Return (node without key or None if emptied, whether key was present)."""
+    bit = 1 << ((h >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node, False
+    idx = (node.bitmap & (bit - 1)).bit_count()
+    entry = node.entries[idx]
+
+    if type(entry) is tuple:
+        if entry[0] != key:
+            return node, False
+        replacement = None
+    elif type(entry) is _Collision:
+        pairs = [p for p in entry.pairs if p[0] != key]
+        if len(pairs) == len(entry.pairs):
+            return node, False
+        replacement = pairs[0] if len(pairs) == 1 else _Collision(entry.hash, pairs, owner)
+    else:
+        replacement, removed = _dissoc(entry, shift + _BITS, h, key, owner)
+        if not removed:
+            return node, False
+        # Collapse a level that holds a single pair.
+        if replacement is not None and len(replacement.entries) == 1 \
+                and type(replacement.entries[0]) is tuple:
+            replacement = replacement.entries[0]
+
+    node = _editable(node, owner)
+    if replacement is None:
+        del node.entries[idx]
+        node.bitmap &= ~bit
+        if not node.entries and shift:
+            return None, True
+    else:
+        node.entries[idx] = replacement
+    return node, True
+
+
+def _walk(node: Any) -> Iterator[Tuple[Any, Any]]:
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for entry in reversed(current.entries):
+            if type(entry) is tuple:
+                yield entry
+            elif type(entry) is _Collision:
+                yield from entry.pairs
+            else:
+                stack.append(entry)
+
+
+class HamtMap:
+    """
+    Hash array mapped trie with dict-style access and O(1) fork().
+
+    Writes path-copy the trie levels they touch unless this map already
+    owns them, so a map that is being filled behaves like a mutable dict
+    while forks keep seeing the structure they were created from.
+    """
+
+    __slots__ = ("_root", "_len", "_owner")
+
+    def __init__(self) -> None:
+        self._owner = object()
+        self._root = _Bitmap(0, [], self._owner)
+        self._len = 0
+
+    def fork(self) -> HamtMap:
+        """Return a map sharing all current structure; both sides copy on write."""
+        other = HamtMap.__new__(HamtMap)
+        other._root = self._root
+        other._len = self._len
+        other._owner = object()
+        self._owner = object()
+        return other
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        h = hash(key) & _HASH_MASK
+        node = self._root
+        shift = 0
+        while True:
+            bit = 1 << ((h >> shift) & _MASK)
+            bitmap = node.bitmap
+            if not bitmap & bit:
+                return default
+            entry = node.entries[(bitmap & (bit - 1)).bit_count()]
+            kind = type(entry)
+            if kind is tuple:
+                return entry[1] if entry[0] == key else default
+            if kind is _Collision:
+                for k, v in entry.pairs:
+                    if k == key:
+                        return v
+                return default
+            node = entry
+            shift += _BITS
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._root, added = _assoc(self._root, 0, _hash(key), key, value, self._owner)
+        self._len += added
+
+    def __delitem__(self, key: Any) -> None:
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._root, _ = _dissoc(self._root, 0, _hash(key), key, self._owner)
+        self._len -= 1
+        return value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            self[key] = value = default
+        return value
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        return (k for k, _ in _walk(self._root))
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        return _walk(self._root)
+
+    def values(self) -> Iterator[Any]:
+        return (v for _, v in _walk(self._root))
@@ -0,0 +1,93 @@
+# src/zeno/core/intern_table.py
+
+from __future__ import annotations
+
+from struct import pack
+from typing import Any, Dict, Hashable, List
+
+
+# Types whose equal values are interchangeable. Floats are shared by bit
+# pattern (-0.0 is not 0.0); equal dates, datetimes with different UTC
+# offsets, bytes etc. are distinct objects, so each keeps its own slot.
+_SHARED = frozenset({str, int, bool, type(None)})
+
+
+def _token(item: Any) -> Hashable | None:
+    """Table key of a shareable item, None if it gets a slot of its own."""
+    kind = type(item)
+    if kind is float:
+        return (float, pack("<d", item))
+    if kind in _SHARED:
+        return (kind, item)
+    return None
+
+
+class InternTable:
+    """
+    Reference-counted table of shared payloads (ColumnarIRStore keys and
+    scalar values), addressed by slot number.
+
+    Equal payloads share one slot only where that cannot change what is
+    read back (see _token); all others get a slot each. A slot is freed when its last reference is
+    released and reused by the next new payload, so the table holds the
+    payloads in use, not every payload ever assigned.
+    """
+
+    __slots__ = ("_items", "_refs", "_slots", "_free")
+
+    def __init__(self) -> None:
+        self._items: List[Any] = []
+        self._refs: List[int] = []
+        self._slots: Dict[Hashable, int] = {}
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        """Slots in use."""
+        return len(self._items) - len(self._free)
+
+    def __getitem__(self, slot: int) -> Any:
+        return self._items[slot]
+
+    def find(self, item: Any) -> int | None:
+        """Shared slot holding item, without taking a reference (None if absent or not shared)."""
+        token = _token(item)
+        return None if token is None else self._slots.get(token)
+
+    def intern(self, item: Any) -> int:
+        """Slot for item, with one more reference to it."""
+        token = _token(item)
+        slot = None if token is None else self._slots.get(token)
+        if slot is None:
+            slot = self._new_slot(item)
+            if token is not None:
+                self._slots[token] = slot
+        self._refs[slot] += 1
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Drop one reference; the last one frees the slot."""
+        self._refs[slot] -= 1
+        if self._refs[slot]:
+            return
+        token = _token(self._items[slot])
+        if token is not None and self._slots.get(token) == slot:
+            del self._slots[token]
+        self._items[slot] = None
+        self._free.append(slot)
+
+    def copy(self) -> InternTable:
+        table = InternTable()
+        table._items = list(self._items)
+        table._refs = list(self._refs)
+        table._slots = dict(self._slots)
+        table._free = list(self._free)
+        return table
+
+    def _new_slot(self, item: Any) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._items[slot] = item
+            return slot
+        self._items.append(item)
+        self._refs.append(0)
+        return len(self._items) - 1
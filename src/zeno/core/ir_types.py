@@ -0,0 +1,65 @@
+# src/zeno/core/ir_types.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+
+# ============================================================
+# Bound schema types (produced by zeno.schema.binder.bind)
+# ============================================================
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class IRType:
+    """
+    A schema node with its constraints read once, ready for validators.
+
+    Types compare by identity: recursive schemas bind to cyclic types,
+    which value equality could not walk.
+    """
+
+    # Schema type: object, array, string, integer, number or boolean.
+    name: str
+    # Property flag ("required: true"): must exist in its parent object.
+    required: bool = False
+    # IR node kind this type binds to: "object", "list" or "scalar".
+    kind: str = "scalar"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class ScalarType(IRType):
+    """string, integer, number or boolean."""
+
+    enum: tuple | None = None
+    default: Any = None
+    # Uniqueness scope of the value; only "sibling" is defined.
+    unique: str | None = None
+    minimum: int | float | None = None
+    maximum: int | float | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class ObjectType(IRType):
+    """object: the allowed properties by key."""
+
+    name: str = "object"
+    kind: str = "object"
+    # Read-only once bound; not in repr, which cyclic types would never end.
+    properties: Mapping[str, IRType] = field(default_factory=dict, repr=False)
+    # Keys that must be present: the object's "required" list plus
+    # properties flagged "required: true".
+    required_properties: frozenset = frozenset()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class ArrayType(IRType):
+    """array: item type, cardinality and uniqueness."""
+
+    items: IRType = field(repr=False)
+    name: str = "array"
+    kind: str = "list"
+    min_items: int | None = None
+    max_items: int | None = None
+    # Field of the (object) items whose values must differ.
+    unique_by: str | None = None
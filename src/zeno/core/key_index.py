@@ -0,0 +1,40 @@
+# src/zeno/core/key_index.py
+
+from __future__ import annotations
+
+from typing import Any
+
+from zeno.core.types import NodeId, NodeType
+
+
+def link_error(parent_type: NodeType, key: Any, key_taken: bool) -> str | None:
+    """
+    Why a new child cannot be linked under a parent of parent_type with
+    key, or None (key_taken: an OBJECT parent already has a child under key).
+    """
+    if parent_type == NodeType.SCALAR:
+        return "Scalar nodes cannot have children."
+    if parent_type == NodeType.OBJECT:
+        if key is None:
+            return "Object child link requires key."
+        if key_taken:
+            return f"Duplicate object key: {key}"
+    elif key is not None:
+        return "List child link does not allow key."
+    return None
+
+
+class KeyIndex(dict):
+    """
+    OBJECT parent id -> {key: child id}, for keyed child lookup.
+
+    The store's _key_* primitives keep it in sync with link/unlink; a
+    backend may index only some parents (ColumnarIRStore) or fill a
+    parent's entry on first use (MappedIRStore).
+    """
+
+    __slots__ = ()
+
+    def copy(self) -> KeyIndex:
+        """Copy with its own per-parent dicts (for store snapshots)."""
+        return KeyIndex((parent_id, dict(keys)) for parent_id, keys in self.items())
@@ -0,0 +1,123 @@
+# src/zeno/core/mapped_store.py
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterator, Set
+
+from zeno.core.child_list import child_sequence
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId, NodeType
+
+
+class _LazyNodes(dict):
+    """Node dict that builds a missing entry with load (KeyError if there is none)."""
+
+    __slots__ = ("_load",)
+
+    def __init__(self, load: Callable[[NodeId], Node]) -> None:
+        super().__init__()
+        self._load = load
+
+    def __missing__(self, node_id: NodeId) -> Node:
+        node = self[node_id] = self._load(node_id)
+        return node
+
+
+class MappedIRStore(IRStore):
+    """
+    IRStore over a memory-mapped snapshot file (see zeno.core.snapshot_file).
+
+    Opening does no per-node work: a node's Node record is built from the
+    file's tables the first time anything reaches it and kept in _nodes,
+    an ordinary IRStore node from then on. OBJECT key indexes are built on
+    the first keyed lookup under a parent. Edits go to the records in
+    memory; the file itself is never written.
+    """
+
+    def __init__(self, tables) -> None:
+        super().__init__()
+        self._tables = tables
+        self._nodes = _LazyNodes(self._load)
+        self._root_id = tables.root_id
+        self._next_id = tables.next_id
+        self._count = tables.count
+        # File rows deleted since opening (never built again).
+        self._gone: Set[NodeId] = set()
+        # OBJECT nodes built from the file whose key index is not built yet.
+        self._unindexed: Set[NodeId] = set()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def snapshot(self) -> MappedIRStore:
+        """Point-in-time copy sharing the file (O(nodes built so far))."""
+        snap = MappedIRStore(self._tables)
+        snap._nodes.update((nid, node.copy()) for nid, node in self._nodes.items())
+        snap._key_index = self._key_index.copy()
+        snap._root_id = self._root_id
+        snap._next_id = self._next_id
+        snap._count = self._count
+        snap._gone = set(self._gone)
+        snap._unindexed = set(self._unindexed)
+        return snap
+
+    def has_node(self, node_id: NodeId) -> bool:
+        return node_id in self._nodes or (self._tables.has(node_id) and node_id not in self._gone)
+
+    def iter_node_ids(self) -> Iterator[NodeId]:
+        nodes, gone, has = self._nodes, self._gone, self._tables.has
+        for node_id in range(1, self._tables.rows):
+            if node_id not in nodes and node_id not in gone and has(node_id):
+                yield node_id
+        yield from list(nodes)
+
+    def _load(self, node_id: NodeId) -> Node:
+        if node_id in self._gone or not self._tables.has(node_id):
+            raise KeyError(node_id)
+        node = self._tables.node(node_id)
+        node.children = child_sequence(node.children)
+        if node.type == NodeType.OBJECT and node.children:
+            self._unindexed.add(node_id)
+        return node
+
+    def _key_of(self, node_id: NodeId) -> Any:
+        node = dict.get(self._nodes, node_id)
+        return node.key if node is not None else self._tables.key(node_id)
+
+    # ------------------------------------------------------------
+    # Storage primitives
+    # ------------------------------------------------------------
+
+    def _insert_node(self, node: Node) -> None:
+        super()._insert_node(node)
+        self._gone.discard(node.id)
+        self._count += 1
+
+    def _forget(self, node_id: NodeId) -> None:
+        self._nodes[node_id]  # build it so the base class can drop it
+        super()._forget(node_id)
+        if self._tables.has(node_id):
+            self._gone.add(node_id)
+        self._count -= 1
+
+    def _key_lookup(self, parent_id: NodeId, key: str) -> NodeId | None:
+        if parent_id in self._unindexed:
+            self._unindexed.discard(parent_id)
+            key_of = self._key_of
+            keys: Dict[Any, NodeId] = {key_of(cid): cid for cid in self._nodes[parent_id].children}
+            if keys:
+                self._key_index[parent_id] = keys
+        return super()._key_lookup(parent_id, key)
+
+    def _key_add(self, parent_id: NodeId, key: str, child_id: NodeId) -> None:
+        if parent_id not in self._unindexed:  # else built from the children later
+            super()._key_add(parent_id, key, child_id)
+
+    def _key_remove(self, parent_id: NodeId, key: str) -> None:
+        if parent_id not in self._unindexed:
+            super()._key_remove(parent_id, key)
+
+    def _drop_indexes(self, node_id: NodeId) -> None:
+        super()._drop_indexes(node_id)
+        self._unindexed.discard(node_id)
@@ -2,26 +2,99 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from typing import Any, Optional
-from uuid import UUID, uuid4
 
-from zeno.core.types import NodeType
+from zeno.core.types import NodeId, NodeType
+
+
+# Shared, immutable children sequence for leaves (scalars never link children).
+EMPTY_CHILDREN: tuple = ()
 
 
-@dataclass
 class Node:
-    id: UUID
-    type: NodeType
-    parent_id: Optional[UUID] = None
-    key: Optional[str] = None
-    value: Optional[Any] = None
-    children: list[UUID] = field(default_factory=list)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    """
+    IR node record.
+
+    Slots-based to keep per-node overhead small on large documents:
+    - SCALAR nodes share EMPTY_CHILDREN instead of owning a list.
+    - long children lists are swapped for a ChildList by IRStore.
+    - metadata dict is allocated on first write (see `metadata`).
+    - id is a store-local integer handle (see IRStore.allocate_id).
+    """
+
+    __slots__ = ("id", "type", "parent_id", "key", "value", "children", "_metadata")
+
+    def __init__(
+        self,
+        id: Optional[NodeId],
+        type: NodeType,
+        parent_id: Optional[NodeId] = None,
+        key: Optional[str] = None,
+        value: Optional[Any] = None,
+        children: Optional[list[NodeId]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.parent_id = parent_id
+        self.key = key
+        self.value = value
+        if children is None:
+            children = EMPTY_CHILDREN if type == NodeType.SCALAR else []
+        self.children = children
+        self._metadata = metadata or None
 
     @staticmethod
     def create(node_type: NodeType) -> "Node":
+        """Create an unlinked node; IRStore assigns its id on insertion."""
         return Node(
-            id=uuid4(),
+            id=None,
             type=node_type,
-        )
+        )
+
+    def copy(self) -> "Node":
+        """Independent copy with its own children sequence and metadata dict."""
+        return Node(
+            id=self.id,
+            type=self.type,
+            parent_id=self.parent_id,
+            key=self.key,
+            value=self.value,
+            children=type(self.children)(self.children),
+            metadata=dict(self._metadata) if self._metadata else None,
+        )
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Mutable metadata dict, allocated on first access."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    def get_metadata(self, key: str, default: Any = None) -> Any:
+        """Read a metadata entry without allocating the dict."""
+        if self._metadata is None:
+            return default
+        return self._metadata.get(key, default)
+
+    def __repr__(self) -> str:
+        return (
+            f"Node(id={self.id!r}, type={self.type!r}, parent_id={self.parent_id!r}, "
+            f"key={self.key!r}, value={self.value!r}, children={list(self.children)!r}, "
+            f"metadata={self._metadata or {}!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Node):
+            return NotImplemented
+        return (
+            self.id == other.id
+            and self.type == other.type
+            and self.parent_id == other.parent_id
+            and self.key == other.key
+            and self.value == other.value
+            and list(self.children) == list(other.children)
+            and (self._metadata or {}) == (other._metadata or {})
+        )
+
+    __hash__ = None  # mutable record, same as the former dataclass
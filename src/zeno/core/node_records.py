@@ -0,0 +1,108 @@
+# src/zeno/core/node_records.py
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from zeno.core.key_index import link_error
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.traversal import preorder_ids
+from zeno.core.types import NodeId, NodeType
+
+
+# Pre-order Node records describe a whole subtree in operation payloads
+# (restore_subtree, replace_subtree): each record names its parent and
+# key, the first one hangs under an existing node.
+
+
+def subtree_records(store: IRStore, node_id: NodeId) -> list[Node]:
+    """Pre-order Node copies of a subtree (as held by restore_subtree)."""
+    return [store.get_node(nid).copy() for nid in preorder_ids(store, node_id)]
+
+
+def insert_records(store: IRStore, records: list[Node], index: int | None) -> None:
+    """
+    Create nodes from pre-order records and link each to its recorded parent;
+    the first one is linked at index. Records themselves are not modified.
+    If a link fails, the nodes inserted so far are removed again.
+    """
+    for position, record in enumerate(records):
+        node = Node(
+            id=record.id,
+            type=record.type,
+            value=record.value,
+            metadata=dict(record._metadata) if record._metadata else None,
+        )
+        store.add_unlinked_node(node)
+        try:
+            store.link_child(
+                parent_id=record.parent_id,
+                child_id=record.id,
+                key=record.key,
+                index=index if position == 0 else None,
+            )
+        except ValueError:
+            store.delete_subtree(node_id=record.id)
+            if position > 0:
+                store.unlink_child(child_id=records[0].id)
+                store.delete_subtree(node_id=records[0].id)
+            raise
+
+
+def check_records(store: IRStore, records: list[Node]) -> None:
+    """
+    Raise ValueError unless records form one subtree of free ids whose
+    links below the first record are all valid (checked before a
+    replacement detaches the old subtree).
+    """
+    types: dict[NodeId, NodeType] = {}
+    keys: set[tuple[NodeId, Any]] = set()
+    for position, record in enumerate(records):
+        if record.id in types or store.has_node(record.id):
+            raise ValueError("Node with this ID already exists.")
+        if position > 0:
+            parent_type = types.get(record.parent_id)
+            if parent_type is None:
+                raise ValueError("Parent node does not exist.")
+            error = link_error(parent_type, record.key, (record.parent_id, record.key) in keys)
+            if error is not None:
+                raise ValueError(error)
+            if parent_type == NodeType.OBJECT:
+                keys.add((record.parent_id, record.key))
+        types[record.id] = record.type
+
+
+def plain_records(
+    data: Any,
+    parent_id: NodeId,
+    key: str | None,
+    next_id: Callable[[], NodeId],
+) -> list[Node]:
+    """Pre-order Node records for plain data; iterative, so depth is unbounded."""
+    records: list[Node] = []
+    stack: list[tuple[Any, NodeId, str | None]] = [(data, parent_id, key)]
+    while stack:
+        value, parent, item_key = stack.pop()
+        node_type = plain_node_type(value)
+        node = Node(id=next_id(), type=node_type, parent_id=parent, key=item_key)
+        if node_type == NodeType.OBJECT:
+            entries = list(value.items())
+        elif node_type == NodeType.LIST:
+            entries = [(None, item) for item in value]
+        else:
+            node.value = value
+            entries = []
+        records.append(node)
+        for child_key, child in reversed(entries):
+            stack.append((child, node.id, child_key))
+    return records
+
+
+def plain_node_type(value: Any) -> NodeType:
+    """Map a plain Python value to the IR node type that holds it."""
+    if isinstance(value, dict):
+        return NodeType.OBJECT
+    if isinstance(value, list):
+        return NodeType.LIST
+    return NodeType.SCALAR
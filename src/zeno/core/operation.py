@@ -6,18 +6,20 @@ from dataclasses import dataclass
 from typing import Any
 from uuid import UUID, uuid4
 
+from zeno.core.types import NodeId
+
 
 @dataclass(frozen=True)
 class Operation:
     operation_id: UUID
     operation_type: str
-    target_node_id: UUID | None
+    target_node_id: NodeId | None
     payload: dict[str, Any]
 
     @staticmethod
     def create(
         operation_type: str,
-        target_node_id: UUID | None,
+        target_node_id: NodeId | None,
         payload: dict[str, Any],
     ) -> "Operation":
         return Operation(
@@ -25,4 +27,4 @@ class Operation:
             operation_type=operation_type,
             target_node_id=target_node_id,
             payload=payload,
-        )
+        )
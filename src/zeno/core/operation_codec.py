@@ -0,0 +1,131 @@
+# src/zeno/core/operation_codec.py
+
+from __future__ import annotations
+
+import base64
+from datetime import date, datetime
+from typing import Any
+
+from zeno.core.node import Node
+from zeno.core.operation import Operation
+from zeno.core.types import NodeType
+
+
+# Tags for YAML scalar types that JSON cannot carry natively.
+_DATETIME = "$dt"
+_DATE = "$d"
+_BYTES = "$b"
+# Tag of a mapping kept as [key, value] pairs (non-string or tag keys).
+_PAIRS = "$m"
+_TAGS = frozenset((_DATETIME, _DATE, _BYTES, _PAIRS))
+
+
+def encode_value(value: Any) -> Any:
+    """Scalar value → JSON-compatible value."""
+    if isinstance(value, datetime):
+        return {_DATETIME: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE: value.isoformat()}
+    if isinstance(value, bytes):
+        return {_BYTES: base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if _DATETIME in value:
+            return datetime.fromisoformat(value[_DATETIME])
+        if _DATE in value:
+            return date.fromisoformat(value[_DATE])
+        if _BYTES in value:
+            return base64.b64decode(value[_BYTES])
+    return value
+
+
+def _encode_data(data: Any) -> Any:
+    """
+    Plain data (nested dicts/lists of scalars) → JSON-compatible copy.
+    A dict with any non-string key (or a key that reads as a tag) becomes
+    tagged [key, value] pairs, keys encoded like scalar values. Iterative
+    (any depth).
+    """
+    holder = [data]
+    stack: list[tuple[Any, Any]] = [(holder, 0)]
+    while stack:
+        container, slot = stack.pop()
+        value = container[slot]
+        if isinstance(value, dict):
+            if all(isinstance(key, str) and key not in _TAGS for key in value):
+                container[slot] = copy = dict(value)
+                stack.extend((copy, key) for key in copy)
+            else:
+                pairs = [[encode_value(key), item] for key, item in value.items()]
+                container[slot] = {_PAIRS: pairs}
+                stack.extend((pair, 1) for pair in pairs)
+        elif isinstance(value, list):
+            container[slot] = copy = list(value)
+            stack.extend((copy, i) for i in range(len(copy)))
+        else:
+            container[slot] = encode_value(value)
+    return holder[0]
+
+
+def _decode_data(data: Any) -> Any:
+    """Inverse of _encode_data; iterative (any depth)."""
+    holder = [data]
+    stack: list[tuple[Any, Any]] = [(holder, 0)]
+    while stack:
+        container, slot = stack.pop()
+        value = container[slot]
+        if isinstance(value, dict):
+            if _PAIRS in value:
+                container[slot] = copy = {decode_value(key): item for key, item in value[_PAIRS]}
+                stack.extend((copy, key) for key in copy)
+                continue
+            decoded = decode_value(value)
+            if decoded is not value:
+                container[slot] = decoded
+                continue
+            container[slot] = copy = dict(value)
+            stack.extend((copy, key) for key in copy)
+        elif isinstance(value, list):
+            container[slot] = copy = list(value)
+            stack.extend((copy, i) for i in range(len(copy)))
+    return holder[0]
+
+
+def encode_operation(operation: Operation) -> dict:
+    """Operation → compact JSON-compatible dict (operation_id is not kept)."""
+    payload = {}
+    for name, value in operation.payload.items():
+        if name == "node_type":
+            value = value.value
+        elif name in ("value", "key"):
+            value = encode_value(value)
+        elif name == "data":
+            value = _encode_data(value)
+        elif name == "nodes":
+            value = [
+                [n.id, n.type.value, n.parent_id, encode_value(n.key), encode_value(n.value)]
+                for n in value
+            ]
+        payload[name] = value
+    return {"t": operation.operation_type, "p": payload}
+
+
+def decode_operation(record: dict) -> Operation:
+    payload = {}
+    for name, value in record["p"].items():
+        if name == "node_type":
+            value = NodeType(value)
+        elif name in ("value", "key"):
+            value = decode_value(value)
+        elif name == "data":
+            value = _decode_data(value)
+        elif name == "nodes":
+            value = [
+                Node(id=i, type=NodeType(t), parent_id=p, key=decode_value(k), value=decode_value(v))
+                for i, t, p, k, v in value
+            ]
+        payload[name] = value
+    return Operation.create(record["t"], payload.get("node_id"), payload)
@@ -0,0 +1,175 @@
+# src/zeno/core/operation_handlers.py
+
+from __future__ import annotations
+
+from typing import Callable, Dict
+
+from zeno.core.node import Node
+from zeno.core.node_records import insert_records, subtree_records
+from zeno.core.operation import Operation
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId, NodeType
+
+
+# A handler applies one operation to the store and returns its inverse.
+Handler = Callable[[IRStore, Operation], Operation]
+
+# Basic operation type -> handler table; OperationProcessor copies it
+# together with bulk_handlers.BULK_HANDLERS.
+HANDLERS: Dict[str, Handler] = {}
+
+
+def register(operation_type: str, table: Dict[str, Handler] = HANDLERS) -> Callable[[Handler], Handler]:
+    """Decorator adding a handler to table (the basic one by default)."""
+    def decorator(handler: Handler) -> Handler:
+        table[operation_type] = handler
+        return handler
+    return decorator
+
+
+# ============================================================
+# Handlers
+# ============================================================
+
+@register("add_node")
+def apply_add_node(store: IRStore, operation: Operation) -> Operation:
+    payload = operation.payload
+
+    parent_id: NodeId = payload["parent_id"]
+    node_type: NodeType = payload["node_type"]
+    key: str | None = payload.get("key")
+
+    if not store.has_node(parent_id):
+        raise ValueError("Parent node does not exist.")
+
+    new_node = Node.create(node_type)
+    # Optional id reserved with IRStore.allocate_id, so later ops can refer to it.
+    new_node.id = payload.get("node_id")
+
+    store.add_unlinked_node(new_node)
+
+    try:
+        store.link_child(
+            parent_id=parent_id,
+            child_id=new_node.id,
+            key=key,
+        )
+    except ValueError:
+        store.delete_subtree(node_id=new_node.id)
+        raise
+
+    return inverse_operation(operation, "remove_node", {"node_id": new_node.id})
+
+
+@register("update_scalar")
+def apply_update_scalar(store: IRStore, operation: Operation) -> Operation:
+    payload = operation.payload
+
+    node_id: NodeId = payload["node_id"]
+    new_value = payload["value"]
+
+    if not store.has_node(node_id):
+        raise ValueError("Target node does not exist.")
+
+    node = store.get_node(node_id)
+
+    if node.type != NodeType.SCALAR:
+        raise ValueError("Only scalar nodes can be updated.")
+
+    old_value = node.value
+    store.set_value(node_id, new_value)
+
+    return inverse_operation(operation, "update_scalar", {"node_id": node_id, "value": old_value})
+
+
+@register("remove_node")
+def apply_remove_node(store: IRStore, operation: Operation) -> Operation:
+    node_id: NodeId = operation.payload["node_id"]
+
+    if not store.has_node(node_id):
+        raise ValueError("Target node does not exist.")
+
+    if node_id == store.root_id:
+        raise ValueError("Root node cannot be removed.")
+
+    # Capture the subtree for the inverse before it is gone.
+    index = store.child_index(node_id)
+    nodes = subtree_records(store, node_id)
+
+    # Must unlink first, then delete subtree
+    store.unlink_child(child_id=node_id)
+    store.delete_subtree(node_id=node_id)
+
+    return inverse_operation(operation, "restore_subtree", {"nodes": nodes, "index": index})
+
+
+@register("restore_subtree")
+def apply_restore_subtree(store: IRStore, operation: Operation) -> Operation:
+    """Re-create a removed subtree from pre-order Node copies (inverse of remove_node)."""
+    nodes: list[Node] = operation.payload["nodes"]
+    insert_records(store, nodes, operation.payload["index"])
+    return inverse_operation(operation, "remove_node", {"node_id": nodes[0].id})
+
+
+@register("move_node")
+def apply_move_node(store: IRStore, operation: Operation) -> Operation:
+    """
+    Move a node within its parent's children list (for LIST reordering).
+
+    Payload gives either "direction" ("up" / "down", one step) or the
+    target "index" the node should end up at.
+    """
+    payload = operation.payload
+
+    node_id: NodeId = payload["node_id"]
+
+    if not store.has_node(node_id):
+        raise ValueError("Target node does not exist.")
+
+    node = store.get_node(node_id)
+
+    if node.parent_id is None:
+        raise ValueError("Cannot move root node.")
+
+    parent = store.get_node(node.parent_id)
+
+    if parent.type != NodeType.LIST:
+        raise ValueError("Move operation only allowed for LIST children.")
+
+    current_index = store.child_index(node_id)
+
+    if "index" in payload:
+        store.move_child(child_id=node_id, index=payload["index"])
+        return inverse_operation(operation, "move_node", {"node_id": node_id, "index": current_index})
+
+    direction: str = payload["direction"]
+
+    if direction == "up":
+        if current_index == 0:
+            raise ValueError("Cannot move first item up.")
+        new_index = current_index - 1
+    elif direction == "down":
+        if current_index == len(parent.children) - 1:
+            raise ValueError("Cannot move last item down.")
+        new_index = current_index + 1
+    else:
+        raise ValueError(f"Invalid direction: {direction}")
+
+    store.move_child(child_id=node_id, index=new_index)
+
+    opposite = "down" if direction == "up" else "up"
+    return inverse_operation(operation, "move_node", {"node_id": node_id, "direction": opposite})
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+def inverse_operation(operation: Operation, operation_type: str, payload: dict) -> Operation:
+    """Build the operation undoing `operation`; it keeps the same operation_id."""
+    return Operation(
+        operation_id=operation.operation_id,
+        operation_type=operation_type,
+        target_node_id=payload.get("node_id"),
+        payload=payload,
+    )
@@ -0,0 +1,260 @@
+# src/zeno/core/operation_log.py
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, List
+
+from zeno.core.node import Node
+from zeno.core.operation import Operation
+from zeno.core.operation_codec import decode_operation, decode_value, encode_operation, encode_value
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+from zeno.core.traversal import preorder_ids
+from zeno.core.types import NodeType
+
+
+MAGIC = b"ZWAL1\n"
+# Frame header: payload length, crc32 of payload.
+_FRAME = struct.Struct("<II")
+
+# Edit records between automatic checkpoints.
+CHECKPOINT_EVERY = 1000
+
+
+@dataclass(frozen=True)
+class LogMark:
+    """Position in a log after some record (see OperationLog.mark)."""
+
+    # Number of rewrites of the file before the mark (checkpoints, restarts).
+    generation: int
+    offset: int
+    pending: int
+
+
+class OperationLog:
+    """
+    Append-only write-ahead log of the edits applied to one document.
+
+    File layout: MAGIC, then frames of [u32 length][u32 crc32][JSON].
+    The first record is a checkpoint of the whole document; each edit
+    committed through the attached OperationProcessor appends one small
+    record. Every checkpoint_every records the file is atomically
+    rewritten as a single fresh checkpoint, bounding size and replay time.
+    After a save, restart() rewrites it from a checkpoint of the saved
+    state written off the UI thread (prepare_checkpoint), keeping the
+    records of edits made while the file was written.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        store: IRStore,
+        *,
+        checkpoint_every: int = CHECKPOINT_EVERY,
+        fsync: bool = False,
+    ) -> None:
+        self._path = Path(path)
+        self._store = store
+        self._checkpoint_every = checkpoint_every
+        self._fsync = fsync
+        self._file: BinaryIO | None = None
+        self._pending = 0
+        self._generation = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def pending(self) -> int:
+        """Edit records appended since the last checkpoint."""
+        return self._pending
+
+    def attach(self, processor: OperationProcessor, *, checkpoint: bool = True) -> None:
+        """Start a fresh log from the current document (unless restarted already) and follow processor."""
+        if checkpoint:
+            self.checkpoint()
+        processor.add_listener(self.append)
+
+    def detach(self, processor: OperationProcessor) -> None:
+        processor.remove_listener(self.append)
+
+    def append(self, operations: List[Operation]) -> None:
+        """Append one committed edit (processor listener)."""
+        if self._file is None:
+            self.checkpoint()
+        record = {"k": "ops", "ops": [encode_operation(op) for op in operations]}
+        self._file.write(_frame(record))
+        self._flush()
+        self._pending += 1
+        if self._pending >= self._checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Atomically replace the log with a checkpoint of the current document."""
+        self.close()
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            _write_checkpoint(f, self._store)
+        self._replace(tmp, 0)
+
+    def mark(self) -> LogMark | None:
+        """Position after the last record (None while closed), for tail()."""
+        if self._file is None:
+            return None
+        return LogMark(self._generation, self._file.tell(), self._pending)
+
+    def tail(self, mark: LogMark | None) -> tuple[bytes, int] | None:
+        """
+        The records appended since mark, as frames, and their count; None if
+        the file was rewritten since (or there is no mark).
+        """
+        if self._file is None or mark is None or mark.generation != self._generation:
+            return None
+        self._file.flush()
+        with open(self._path, "rb") as f:
+            f.seek(mark.offset)
+            frames = f.read()
+        return frames, self._pending - mark.pending
+
+    def restart(self, prepared: Path, frames: bytes = b"", count: int = 0) -> None:
+        """
+        Atomically replace the log with a prepared checkpoint file (see
+        prepare_checkpoint) followed by count edit records made since its
+        document state, given as frames (see tail()).
+        """
+        self.close()
+        if frames:
+            with open(prepared, "ab") as f:
+                f.write(frames)
+                f.flush()
+                os.fsync(f.fileno())
+        self._replace(prepared, count)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Close and delete the log (document closed without a crash)."""
+        self.close()
+        self._path.unlink(missing_ok=True)
+
+    def _replace(self, checkpoint: Path, pending: int) -> None:
+        os.replace(checkpoint, self._path)
+        self._file = open(self._path, "ab")
+        self._pending = pending
+        self._generation += 1
+
+    def _flush(self) -> None:
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+
+def prepare_checkpoint(log_path: str | Path, store: IRStore) -> Path:
+    """
+    Write a checkpoint of store to a new file next to log_path, to become
+    the log with OperationLog.restart. Safe on a worker thread as long as
+    nothing edits store meanwhile (e.g. a snapshot being saved).
+    """
+    log_path = Path(log_path)
+    fd, name = tempfile.mkstemp(prefix=log_path.name + ".", suffix=".tmp", dir=log_path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            _write_checkpoint(f, store)
+    except BaseException:
+        os.unlink(name)
+        raise
+    return Path(name)
+
+
+def recover(
+    path: str | Path,
+    store_factory: Callable[[], IRStore] = IRStore,
+) -> tuple[IRStore, int] | None:
+    """
+    Rebuild a document from its log: last checkpoint plus later edits.
+
+    Returns (store, replayed edit count), or None if the file is missing
+    or has no checkpoint. A torn or corrupt tail (crash mid-append) ends
+    the replay at the last intact record.
+    """
+    records = list(read_records(path))
+    last = max((i for i, r in enumerate(records) if r["k"] == "checkpoint"), default=None)
+    if last is None:
+        return None
+
+    store = _restore_checkpoint(records[last], store_factory)
+    processor = OperationProcessor(store)
+    replayed = 0
+    for record in records[last + 1:]:
+        processor.apply_batch([decode_operation(op) for op in record["ops"]])
+        replayed += 1
+    return store, replayed
+
+
+def read_records(path: str | Path) -> Iterator[dict]:
+    """Yield intact records in order, stopping at the first bad frame."""
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return
+    if not data.startswith(MAGIC):
+        return
+    pos = len(MAGIC)
+    header = _FRAME.size
+    while pos + header <= len(data):
+        length, crc = _FRAME.unpack_from(data, pos)
+        body = data[pos + header:pos + header + length]
+        if len(body) != length or zlib.crc32(body) != crc:
+            return
+        yield json.loads(body)
+        pos += header + length
+
+
+def _frame(record: dict) -> bytes:
+    body = json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return _FRAME.pack(len(body), zlib.crc32(body)) + body
+
+
+def _write_checkpoint(f: BinaryIO, store: IRStore) -> None:
+    f.write(MAGIC)
+    f.write(_frame(_checkpoint_record(store)))
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _checkpoint_record(store: IRStore) -> dict:
+    nodes: List[list[Any]] = []
+    for node_id in preorder_ids(store, store.root_id):
+        node = store.get_node(node_id)
+        nodes.append([node_id, node.type.value, node.parent_id, encode_value(node.key), encode_value(node.value)])
+    return {"k": "checkpoint", "nodes": nodes}
+
+
+def _restore_checkpoint(record: dict, store_factory: Callable[[], IRStore]) -> IRStore:
+    store = store_factory()
+    (root_id, root_type, _, _, root_value), *rest = record["nodes"]
+    store.create_root(NodeType(root_type), root_id)
+    if root_value is not None:
+        store.set_value(root_id, decode_value(root_value))
+
+    for node_id, node_type, parent_id, key, value in rest:
+        store.add_unlinked_node(Node(id=node_id, type=NodeType(node_type), value=decode_value(value)))
+        store.link_child(parent_id=parent_id, child_id=node_id, key=decode_value(key))
+    return store
+
+
+def log_path_for(document_path: str | Path) -> Path:
+    """Sidecar log location for a document file."""
+    document_path = Path(document_path)
+    return document_path.with_name(document_path.name + ".zwal")
@@ -2,121 +2,204 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+import traceback
+from dataclasses import replace
+from time import perf_counter
+from typing import Callable, Sequence
 
+from zeno.core.batch_check import BatchError, check_batch
+from zeno.core.bulk_handlers import BULK_HANDLERS
 from zeno.core.operation import Operation
+from zeno.core.operation_handlers import HANDLERS, Handler
+from zeno.core.operation_stats import OperationStats
 from zeno.core.store import IRStore
-from zeno.core.types import NodeType
-from zeno.core.node import Node
+from zeno.core.undo_journal import UndoJournal
+from zeno.core.version_stamps import VersionStamps
+
+
+Listener = Callable[[list[Operation]], None]
+ListenerErrorHandler = Callable[[Exception], None]
+
+# Payload field receiving the id of the node an operation created (for listeners).
+_ASSIGNED_ID = {"add_node": "node_id", "clone_subtree": "new_id", "replace_subtree": "new_id"}
 
 
 class OperationProcessor:
-    def __init__(self, store: IRStore) -> None:
+    def __init__(self, store: IRStore, journal: UndoJournal | None = None) -> None:
         self._store = store
-
-    def apply(self, operation: Operation) -> None:
-        if operation.operation_type == "add_node":
-            self._apply_add_node(operation)
-        elif operation.operation_type == "update_scalar":
-            self._apply_update_scalar(operation)
-        elif operation.operation_type == "remove_node":
-            self._apply_remove_node(operation)
-        elif operation.operation_type == "move_node":
-            self._apply_move_node(operation)
-        else:
+        self._journal = journal if journal is not None else UndoJournal()
+        self._listeners: list[tuple[Listener, ListenerErrorHandler | None]] = []
+        self._handlers: dict[str, Handler] = {**HANDLERS, **BULK_HANDLERS}
+        self._stats: OperationStats | None = None
+        self._versions = VersionStamps()
+
+    @property
+    def journal(self) -> UndoJournal:
+        """Undo/redo history of operations applied through this processor."""
+        return self._journal
+
+    @property
+    def versions(self) -> VersionStamps:
+        """Per-node version stamps, bumped along the path to the root by every edit."""
+        return self._versions
+
+    def enable_instrumentation(self, stats: OperationStats | None = None) -> OperationStats:
+        """
+        Time every dispatched operation into stats (a new collector if None).
+
+        Instrumentation swaps in a timing dispatch on this instance; while it
+        is disabled the plain dispatch runs, so there is no per-operation cost.
+        """
+        self._stats = stats if stats is not None else OperationStats()
+        self._dispatch = self._timed_dispatch
+        return self._stats
+
+    def disable_instrumentation(self) -> None:
+        self.__dict__.pop("_dispatch", None)
+        self._stats = None
+
+    def stats(self) -> dict[str, dict]:
+        """Per-operation-type counters (see OperationStats.stats); empty if disabled."""
+        return self._stats.stats() if self._stats is not None else {}
+
+    def register_handler(self, operation_type: str, handler: Handler) -> None:
+        """
+        Handle operation_type with handler(store, operation) -> inverse
+        operation, for this processor only (see operation_handlers).
+        """
+        self._handlers[operation_type] = handler
+
+    def add_listener(self, listener: Listener, on_error: ListenerErrorHandler | None = None) -> None:
+        """
+        Call listener(operations) after every committed edit: apply,
+        apply_batch, undo and redo. Operations are passed as applied, with
+        the assigned node_id filled into add_node payloads.
+
+        The edit is committed before listeners run, so a listener's
+        exception does not propagate: it goes to on_error(exception), or
+        is printed to stderr if there is none, and the next listener runs.
+        """
+        self._listeners.append((listener, on_error))
+
+    def remove_listener(self, listener: Listener) -> None:
+        for entry in self._listeners:
+            if entry[0] == listener:
+                self._listeners.remove(entry)
+                return
+        raise ValueError("Listener is not registered.")
+
+    def apply(self, operation: Operation) -> Operation:
+        """Apply one operation, record it for undo, and return its inverse."""
+        inverse = self._dispatch(operation)
+        self._journal.record([inverse])
+        self._notify([operation], [inverse])
+        return inverse
+
+    def apply_batch(self, operations: Sequence[Operation]) -> list[Operation]:
+        """
+        Apply operations as one transaction: either all of them or none.
+
+        Preconditions of the whole batch are checked before the store is
+        touched (see check_batch); later operations may reference nodes
+        added earlier through a preallocated payload "node_id". If an
+        operation still fails while applying, the ones already applied are
+        undone in reverse order and BatchError is raised.
+
+        The batch is one undo entry. Returns the inverse operations, in the
+        order they must be applied to undo the batch.
+        """
+        operations = list(operations)
+        check_batch(self._store, operations)
+        undo = self._apply_all(operations)
+        self._journal.record(undo, coalesce=False)
+        self._notify(operations, undo)
+        return undo
+
+    def undo(self) -> bool:
+        """Revert the most recent edit; False if there is nothing to undo."""
+        if not self._journal.can_undo():
+            return False
+        entry = self._journal.pop_undo()
+        try:
+            redo = self._apply_all(entry.operations)
+        except BatchError:
+            self._journal.push_undo(entry.operations)
+            raise
+        self._journal.push_redo(redo)
+        self._notify(entry.operations, redo)
+        return True
+
+    def redo(self) -> bool:
+        """Re-apply the most recently undone edit; False if there is none."""
+        if not self._journal.can_redo():
+            return False
+        entry = self._journal.pop_redo()
+        try:
+            undo = self._apply_all(entry.operations)
+        except BatchError:
+            self._journal.push_redo(entry.operations)
+            raise
+        self._journal.push_undo(undo)
+        self._notify(entry.operations, undo)
+        return True
+
+    def _apply_all(self, operations: list[Operation]) -> list[Operation]:
+        """Apply in order, rolling back on failure; return inverses in undo order."""
+        undo: list[Operation] = []
+        for index, operation in enumerate(operations):
+            try:
+                undo.append(self._dispatch(operation))
+            except Exception as e:
+                for inverse in reversed(undo):
+                    self._dispatch(inverse)
+                raise BatchError(index, operation, str(e)) from e
+
+        undo.reverse()
+        return undo
+
+    def _notify(self, operations: list[Operation], undo: list[Operation]) -> None:
+        """undo is in undo order (last inverse first), as _apply_all returns it."""
+        if not self._listeners:
+            return
+        applied = [
+            _resolved(operation, inverse)
+            for operation, inverse in zip(operations, reversed(undo))
+        ]
+        for listener, on_error in list(self._listeners):
+            try:
+                listener(applied)
+            except Exception as e:
+                if on_error is None:
+                    traceback.print_exception(e)
+                else:
+                    on_error(e)
+
+    def _dispatch(self, operation: Operation) -> Operation:
+        handler = self._handlers.get(operation.operation_type)
+        if handler is None:
             raise NotImplementedError(
                 f"Unsupported operation type: {operation.operation_type}"
             )
+        inverse = handler(self._store, operation)
+        self._versions.record(self._store, operation, inverse)
+        return inverse
 
-    def _apply_add_node(self, operation: Operation) -> None:
-        payload = operation.payload
-
-        parent_id: UUID = payload["parent_id"]
-        node_type: NodeType = payload["node_type"]
-        key: str | None = payload.get("key")
-
-        if not self._store.has_node(parent_id):
-            raise ValueError("Parent node does not exist.")
-
-        new_node = Node.create(node_type)
-
-        self._store.add_unlinked_node(new_node)
-
-        self._store.link_child(
-            parent_id=parent_id,
-            child_id=new_node.id,
-            key=key,
-        )
-
-    def _apply_update_scalar(self, operation: Operation) -> None:
-        payload = operation.payload
-
-        node_id: UUID = payload["node_id"]
-        new_value = payload["value"]
-
-        if not self._store.has_node(node_id):
-            raise ValueError("Target node does not exist.")
-
-        node = self._store.get_node(node_id)
-
-        if node.type != NodeType.SCALAR:
-            raise ValueError("Only scalar nodes can be updated.")
-
-        node.value = new_value
-
-    def _apply_remove_node(self, operation: Operation) -> None:
-        payload = operation.payload
-
-        node_id: UUID = payload["node_id"]
-
-        if not self._store.has_node(node_id):
-            raise ValueError("Target node does not exist.")
-
-        if node_id == self._store.root_id:
-            raise ValueError("Root node cannot be removed.")
-
-        # Must unlink first
-        self._store.unlink_child(child_id=node_id)
-
-        # Then delete subtree
-        self._store.delete_subtree(node_id=node_id)
-
-    def _apply_move_node(self, operation: Operation) -> None:
-        """Move a node within its parent's children list (for LIST reordering)."""
-        payload = operation.payload
-
-        node_id: UUID = payload["node_id"]
-        direction: str = payload["direction"]  # "up" or "down"
-
-        if not self._store.has_node(node_id):
-            raise ValueError("Target node does not exist.")
-
-        node = self._store.get_node(node_id)
-
-        if node.parent_id is None:
-            raise ValueError("Cannot move root node.")
-
-        parent = self._store.get_node(node.parent_id)
-
-        if parent.type != NodeType.LIST:
-            raise ValueError("Move operation only allowed for LIST children.")
-
+    def _timed_dispatch(self, operation: Operation) -> Operation:
+        size = len(self._store)
+        start = perf_counter()
         try:
-            current_index = parent.children.index(node_id)
-        except ValueError:
-            raise RuntimeError("Structural corruption: node not in parent's children.")
-
-        if direction == "up":
-            if current_index == 0:
-                raise ValueError("Cannot move first item up.")
-            new_index = current_index - 1
-        elif direction == "down":
-            if current_index == len(parent.children) - 1:
-                raise ValueError("Cannot move last item down.")
-            new_index = current_index + 1
-        else:
-            raise ValueError(f"Invalid direction: {direction}")
-
-        # Remove from current position and insert at new position
-        parent.children.pop(current_index)
-        parent.children.insert(new_index, node_id)
+            inverse = OperationProcessor._dispatch(self, operation)
+        except Exception:
+            self._stats.record(operation, None, perf_counter() - start, 0)
+            raise
+        self._stats.record(operation, inverse, perf_counter() - start, len(self._store) - size)
+        return inverse
+
+
+def _resolved(operation: Operation, inverse: Operation) -> Operation:
+    """Return operation with the id its new node (or subtree root) was assigned."""
+    field = _ASSIGNED_ID.get(operation.operation_type)
+    if field is None or operation.payload.get(field) is not None:
+        return operation
+    payload = {**operation.payload, field: inverse.payload["node_id"]}
+    return replace(operation, payload=payload)
@@ -0,0 +1,154 @@
+# src/zeno/core/operation_stats.py
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, NamedTuple
+
+from zeno.core.operation import Operation
+
+
+# Latency histogram: bucket b counts durations below 2**b microseconds
+# (and at least 2**(b-1)); the last bucket takes everything slower.
+HISTOGRAM_BUCKETS = 32
+
+_PERCENTILES = (("p50_us", 0.50), ("p95_us", 0.95), ("p99_us", 0.99))
+
+
+class OperationEvent(NamedTuple):
+    """One dispatched operation, as passed to event hooks."""
+
+    operation_type: str
+    duration_us: float
+    nodes: int
+    ok: bool
+
+
+class _TypeStats:
+    __slots__ = ("count", "errors", "total_us", "max_us", "nodes", "histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+        self.nodes = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, duration_us: float, nodes: int, ok: bool) -> None:
+        self.count += 1
+        self.errors += not ok
+        self.total_us += duration_us
+        if duration_us > self.max_us:
+            self.max_us = duration_us
+        self.nodes += nodes
+        bucket = min(int(duration_us).bit_length(), HISTOGRAM_BUCKETS - 1)
+        self.histogram[bucket] += 1
+
+    def percentile_us(self, fraction: float) -> float:
+        """Upper bound of the histogram bucket holding the given fraction (capped at max)."""
+        wanted = fraction * self.count
+        seen = 0
+        for bucket, hits in enumerate(self.histogram):
+            seen += hits
+            if hits and seen >= wanted:
+                return min(float(1 << bucket), self.max_us)
+        return 0.0
+
+
+class OperationStats:
+    """
+    Per-operation-type counts, latency histograms and nodes touched.
+
+    Filled by an OperationProcessor with instrumentation enabled (see
+    OperationProcessor.enable_instrumentation); one collector may be shared
+    by several processors. Every recorded operation is also passed to the
+    event hooks as an OperationEvent.
+    """
+
+    def __init__(self) -> None:
+        self._types: Dict[str, _TypeStats] = {}
+        self._hooks: List[Callable[[OperationEvent], None]] = []
+
+    def add_hook(self, hook: Callable[[OperationEvent], None]) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[OperationEvent], None]) -> None:
+        self._hooks.remove(hook)
+
+    def record(self, operation: Operation, inverse: Operation | None, seconds: float, size_delta: int) -> None:
+        """
+        Record one dispatch. inverse is None if the operation failed;
+        size_delta is the change in store node count it caused.
+        """
+        nodes = _nodes_touched(inverse, size_delta) if inverse is not None else 0
+        event = OperationEvent(operation.operation_type, seconds * 1e6, nodes, inverse is not None)
+
+        entry = self._types.get(event.operation_type)
+        if entry is None:
+            entry = self._types[event.operation_type] = _TypeStats()
+        entry.add(event.duration_us, nodes, event.ok)
+
+        for hook in self._hooks:
+            hook(event)
+
+    def reset(self) -> None:
+        self._types.clear()
+
+    def stats(self) -> Dict[str, dict]:
+        """Operation type -> counters and latency percentiles (microseconds)."""
+        result = {}
+        for operation_type, entry in sorted(self._types.items()):
+            row = {
+                "count": entry.count,
+                "errors": entry.errors,
+                "nodes": entry.nodes,
+                "total_us": entry.total_us,
+                "mean_us": entry.total_us / entry.count,
+                "max_us": entry.max_us,
+            }
+            for name, fraction in _PERCENTILES:
+                row[name] = entry.percentile_us(fraction)
+            row["histogram"] = {1 << b: hits for b, hits in enumerate(entry.histogram) if hits}
+            result[operation_type] = row
+        return result
+
+    def summary(self) -> str:
+        """One-line digest for a status bar."""
+        if not self._types:
+            return "No operations"
+        total = sum(entry.count for entry in self._types.values())
+        slowest_type, slowest = max(self._types.items(), key=lambda item: item[1].max_us)
+        return (
+            f"{total} ops, {sum(e.total_us for e in self._types.values()) / total:.0f} µs avg, "
+            f"slowest {slowest_type} {_format_us(slowest.max_us)}"
+        )
+
+
+def format_stats(stats: Dict[str, dict]) -> str:
+    """Plain-text table of OperationStats.stats() for terminals and logs."""
+    header = f"{'operation':<18}{'count':>8}{'errors':>8}{'nodes':>10}{'mean':>10}{'p95':>10}{'max':>10}"
+    lines = [header, "-" * len(header)]
+    for operation_type, row in stats.items():
+        lines.append(
+            f"{operation_type:<18}{row['count']:>8}{row['errors']:>8}{row['nodes']:>10}"
+            f"{_format_us(row['mean_us']):>10}{_format_us(row['p95_us']):>10}{_format_us(row['max_us']):>10}"
+        )
+    return "\n".join(lines)
+
+
+def _format_us(duration_us: float) -> str:
+    if duration_us >= 1000:
+        return f"{duration_us / 1000:.1f} ms"
+    return f"{duration_us:.0f} µs"
+
+
+def _nodes_touched(inverse: Operation, size_delta: int) -> int:
+    """
+    Nodes an operation created, deleted or repositioned, derived from its
+    inverse: deleted subtrees travel in inverse "nodes", permutations in
+    "order", and the store size change gives the nodes created.
+    """
+    payload = inverse.payload
+    removed = len(payload.get("nodes") or ())
+    created = size_delta + removed
+    return max(1, created + removed, len(payload.get("order") or ()))
@@ -0,0 +1,42 @@
+﻿# src/zeno/core/persistent_ids.py
+
+from __future__ import annotations
+
+from typing import Dict
+from uuid import UUID, uuid4
+
+from zeno.core.types import NodeId
+
+
+class PersistentIds:
+    """
+    Two-way map between store-local node handles and stable UUIDs.
+
+    UUIDs are only needed for persistence and external references, so they
+    are derived on first request and dropped with their node.
+    """
+
+    __slots__ = ("_by_node", "_by_uid")
+
+    def __init__(self) -> None:
+        self._by_node: Dict[NodeId, UUID] = {}
+        self._by_uid: Dict[UUID, NodeId] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_node)
+
+    def issue(self, node_id: NodeId) -> UUID:
+        uid = self._by_node.get(node_id)
+        if uid is None:
+            uid = uuid4()
+            self._by_node[node_id] = uid
+            self._by_uid[uid] = node_id
+        return uid
+
+    def resolve(self, uid: UUID) -> NodeId | None:
+        return self._by_uid.get(uid)
+
+    def discard(self, node_id: NodeId) -> None:
+        uid = self._by_node.pop(node_id, None)
+        if uid is not None:
+            del self._by_uid[uid]
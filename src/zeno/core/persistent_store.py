@@ -0,0 +1,155 @@
+# src/zeno/core/persistent_store.py
+
+from __future__ import annotations
+
+from typing import Any, Dict
+from uuid import UUID
+
+from zeno.core.hamt import HamtMap
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId
+
+
+class PersistentIRStore(IRStore):
+    """
+    Structurally shared IRStore with O(1) snapshots.
+
+    Node records and OBJECT key indexes live in HAMTs (see zeno.core.hamt).
+    snapshot() forks both maps in constant time; afterwards the live store
+    copies a Node record, key dict or trie path only the first time it
+    writes to it, so snapshots keep seeing the document as it was and the
+    two share everything that has not been touched since.
+
+    Snapshots are read-only stores: validators, serializers and any other
+    IRStore reader accept them, and every mutating call raises
+    RuntimeError.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._nodes = HamtMap()
+        self._key_index = HamtMap()
+        # Node records / key dicts created or copied since the last snapshot,
+        # and so private to this store. _owned_nodes doubles as a plain-dict
+        # read cache in front of the HAMT.
+        self._owned_nodes: Dict[NodeId, Node] = {}
+        self._owned_keys: Dict[NodeId, Dict[str, NodeId]] = {}
+        self._read_only = False
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    def snapshot(self) -> PersistentIRStore:
+        """Return a read-only view of the current document in O(1)."""
+        snap = PersistentIRStore.__new__(PersistentIRStore)
+        IRStore.__init__(snap)
+        snap._nodes = self._nodes.fork()
+        snap._key_index = self._key_index.fork()
+        snap._root_id = self._root_id
+        snap._next_id = self._next_id
+        snap._owned_nodes = {}
+        snap._owned_keys = {}
+        snap._read_only = True
+
+        # Everything is shared with the snapshot now.
+        self._owned_nodes = {}
+        self._owned_keys = {}
+        return snap
+
+    def get_node(self, node_id: NodeId) -> Node:
+        node = self._owned_nodes.get(node_id)
+        if node is not None:
+            return node
+        return super().get_node(node_id)
+
+    def has_node(self, node_id: NodeId) -> bool:
+        return node_id in self._owned_nodes or node_id in self._nodes
+
+    def allocate_id(self) -> NodeId:
+        self._check_writable()
+        return super().allocate_id()
+
+    def persistent_id(self, node_id: NodeId) -> UUID:
+        self._check_writable()
+        return super().persistent_id(node_id)
+
+    # ------------------------------------------------------------
+    # Copy-on-write
+    # ------------------------------------------------------------
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise RuntimeError("Snapshot store is read-only.")
+
+    def _own_node(self, node_id: NodeId) -> None:
+        if node_id not in self._owned_nodes:
+            node = self._nodes[node_id].copy()
+            self._nodes[node_id] = node
+            self._owned_nodes[node_id] = node
+
+    def _own_keys(self, parent_id: NodeId) -> Dict[str, NodeId]:
+        keys = self._owned_keys.get(parent_id)
+        if keys is None:
+            shared = self._key_index.get(parent_id)
+            keys = dict(shared) if shared else {}
+            self._key_index[parent_id] = keys
+            self._owned_keys[parent_id] = keys
+        return keys
+
+    # ------------------------------------------------------------
+    # Storage primitives
+    # ------------------------------------------------------------
+
+    def _insert_node(self, node: Node) -> None:
+        self._check_writable()
+        super()._insert_node(node)
+        self._owned_nodes[node.id] = node
+
+    def _attach(
+        self,
+        parent_id: NodeId,
+        child_id: NodeId,
+        key: str | None,
+        index: int | None,
+    ) -> None:
+        self._check_writable()
+        self._own_node(parent_id)
+        self._own_node(child_id)
+        super()._attach(parent_id, child_id, key, index)
+
+    def _detach(self, parent_id: NodeId, child_id: NodeId) -> None:
+        self._check_writable()
+        self._own_node(parent_id)
+        self._own_node(child_id)
+        super()._detach(parent_id, child_id)
+
+    def _set_children(self, parent_id: NodeId, child_ids: list[NodeId]) -> None:
+        self._check_writable()
+        self._own_node(parent_id)
+        super()._set_children(parent_id, child_ids)
+
+    def _assign_value(self, node_id: NodeId, value: Any) -> None:
+        self._check_writable()
+        self._own_node(node_id)
+        super()._assign_value(node_id, value)
+
+    def _forget(self, node_id: NodeId) -> None:
+        self._check_writable()
+        super()._forget(node_id)
+        self._owned_nodes.pop(node_id, None)
+        self._owned_keys.pop(node_id, None)
+
+    def _key_lookup(self, parent_id: NodeId, key: str) -> NodeId | None:
+        keys = self._owned_keys.get(parent_id)
+        if keys is None:
+            keys = self._key_index.get(parent_id)
+        return keys.get(key) if keys else None
+
+    def _key_add(self, parent_id: NodeId, key: str, child_id: NodeId) -> None:
+        self._own_keys(parent_id)[key] = child_id
+
+    def _key_remove(self, parent_id: NodeId, key: str) -> None:
+        if parent_id in self._key_index:
+            self._own_keys(parent_id).pop(key, None)
@@ -0,0 +1,275 @@
+# src/zeno/core/snapshot_file.py
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from zeno.core.mapped_store import MappedIRStore
+from zeno.core.node import EMPTY_CHILDREN, Node
+from zeno.core.operation_codec import decode_value, encode_value
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId, NodeType
+
+
+MAGIC = b"ZSNAP\r\n\x1a"
+VERSION = 1
+
+# Header: magic, version, then the table sizes (rows = highest node id + 1),
+# root id (0: none), next id and node count.
+_HEADER = struct.Struct("<8sI4xqqqqqqqq")
+
+# Tables in file order: name, array type code, size field. Each starts on
+# an 8-byte boundary; all integers are little-endian.
+_TABLES = (
+    ("types", "b", "rows"),          # type code per node id, FREE for unused ids
+    ("parents", "i", "rows"),        # parent id, 0 for none
+    ("keys", "i", "rows"),           # row in the key table, ABSENT for none
+    ("tags", "b", "rows"),           # value tag (see _encode)
+    ("values", "q", "rows"),         # value payload
+    ("starts", "i", "rows"),         # first position in children
+    ("counts", "i", "rows"),         # child count
+    ("children", "i", "children"),   # child ids, each node's run in order
+    ("key_tags", "b", "keys"),       # interned keys, encoded as values
+    ("key_values", "q", "keys"),
+    ("offsets", "q", "offsets"),     # string i is text[offsets[i]:offsets[i + 1]]
+    ("text", "B", "text"),           # UTF-8 bytes of the interned strings
+)
+
+FREE = -1
+ABSENT = -1
+_TYPES = (NodeType.OBJECT, NodeType.LIST, NodeType.SCALAR)
+_TYPE_CODES = {node_type: code for code, node_type in enumerate(_TYPES)}
+_SCALAR = _TYPE_CODES[NodeType.SCALAR]
+
+# Value tags. JSON holds what the operation log's codec encodes (dates,
+# bytes, integers beyond 64 bits) as JSON text in the string table.
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _JSON = range(7)
+_INT_MIN, _INT_MAX = -(1 << 63), (1 << 63) - 1
+_FLOAT_BITS = struct.Struct("<d")
+_INT_BITS = struct.Struct("<q")
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def save_snapshot(store: IRStore, path: str | Path) -> None:
+    """
+    Write store (any backend) to path in the binary snapshot format.
+
+    The file is synced to disk and replaced atomically. Node ids, order and values are kept;
+    node metadata is not. Scalar values must be YAML-loadable types the
+    operation log can encode (TypeError otherwise).
+    """
+    path = Path(path)
+    rows = max(store.iter_node_ids(), default=0) + 1
+    columns: Dict[str, array] = {
+        "types": array("b", [FREE]) * rows,
+        "parents": array("i", [0]) * rows,
+        "keys": array("i", [ABSENT]) * rows,
+        "tags": array("b", [_NONE]) * rows,
+        "values": array("q", [0]) * rows,
+        "starts": array("i", [0]) * rows,
+        "counts": array("i", [0]) * rows,
+        "children": array("i"),
+        "key_tags": array("b"),
+        "key_values": array("q"),
+    }
+    strings = _Strings()
+    key_rows: Dict[Tuple[type, Any], int] = {}
+    children = columns["children"]
+    count = 0
+    for node_id in store.iter_node_ids():
+        node = store.get_node(node_id)
+        count += 1
+        columns["types"][node_id] = _TYPE_CODES[node.type]
+        columns["parents"][node_id] = node.parent_id or 0
+        if node.key is not None:
+            token = (type(node.key), node.key)
+            if token not in key_rows:
+                key_rows[token] = len(columns["key_tags"])
+                tag, payload = _encode(node.key, strings)
+                columns["key_tags"].append(tag)
+                columns["key_values"].append(payload)
+            columns["keys"][node_id] = key_rows[token]
+        columns["tags"][node_id], columns["values"][node_id] = _encode(node.value, strings)
+        if node.type != NodeType.SCALAR:
+            columns["starts"][node_id] = len(children)
+            children.extend(store.iter_children(node_id))
+            columns["counts"][node_id] = len(children) - columns["starts"][node_id]
+    columns["offsets"] = strings.offsets
+    columns["text"] = strings.text
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, rows, len(children), len(key_rows), len(strings.offsets), len(strings.text),
+        store.root_id if store.has_root() else 0, store._next_id, count,
+    )
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        for name, _, _ in _TABLES:
+            _write_column(f, columns[name])
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _sync_directory(path.parent)
+
+
+def load_snapshot(path: str | Path) -> MappedIRStore:
+    """
+    Open a snapshot written by save_snapshot.
+
+    The file is mapped into memory and only its header is read here, so
+    opening takes the same time at any size; nodes are built as the
+    returned store reaches them. Raises ValueError for files that are not
+    snapshots, come from another format version or are cut short.
+    """
+    with open(path, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            raise ValueError(f"{path} is not a snapshot file")
+    return MappedIRStore(SnapshotTables(buffer, str(path)))
+
+
+class SnapshotTables:
+    """Read access to the tables of a mapped snapshot file (used by MappedIRStore)."""
+
+    def __init__(self, buffer: mmap.mmap, name: str = "snapshot") -> None:
+        if len(buffer) < _HEADER.size or buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{name} is not a snapshot file")
+        fields = _HEADER.unpack_from(buffer)
+        if fields[1] != VERSION:
+            raise ValueError(f"{name} has snapshot format version {fields[1]}, expected {VERSION}")
+        sizes = dict(zip(("rows", "children", "keys", "offsets", "text"), fields[2:7]))
+        self.rows = sizes["rows"]
+        self.root_id: NodeId | None = fields[7] or None
+        self.next_id: NodeId = fields[8]
+        self.count: int = fields[9]
+
+        offset = _HEADER.size
+        for name_, code, size in _TABLES:
+            length = sizes[size] * array(code).itemsize
+            if offset + length > len(buffer):
+                raise ValueError(f"{name} is truncated")
+            setattr(self, name_, _read_column(buffer, offset, length, code))
+            offset += _padded(length)
+        self._buffer = buffer
+        self._key_cache: Dict[int, Any] = {}
+
+    def has(self, node_id: Any) -> bool:
+        return type(node_id) is int and 0 < node_id < self.rows and self.types[node_id] != FREE
+
+    def node(self, node_id: NodeId) -> Node:
+        """New Node record for a row (has(node_id) must hold)."""
+        code = self.types[node_id]
+        if code == _SCALAR:
+            children = EMPTY_CHILDREN
+        else:
+            start = self.starts[node_id]
+            children = self.children[start:start + self.counts[node_id]].tolist()
+        tag = self.tags[node_id]
+        value = None if tag == _NONE else self._decode(tag, self.values[node_id])
+        parent_id = self.parents[node_id] or None
+        key = None if self.keys[node_id] == ABSENT else self.key(node_id)
+        return Node(node_id, _TYPES[code], parent_id, key, value, children)
+
+    def key(self, node_id: NodeId) -> Any:
+        """The key a row was saved with (without building its Node)."""
+        row = self.keys[node_id]
+        if row == ABSENT:
+            return None
+        try:
+            return self._key_cache[row]
+        except KeyError:
+            key = self._key_cache[row] = self._decode(self.key_tags[row], self.key_values[row])
+            return key
+
+    def _decode(self, tag: int, payload: int) -> Any:
+        if tag == _STR:
+            return self._string(payload)
+        if tag == _INT:
+            return payload
+        if tag == _FLOAT:
+            return _FLOAT_BITS.unpack(_INT_BITS.pack(payload))[0]
+        if tag == _JSON:
+            return decode_value(json.loads(self._string(payload)))
+        return (None, False, True)[tag]
+
+    def _string(self, index: int) -> str:
+        return str(self.text[self.offsets[index]:self.offsets[index + 1]], "utf-8", "surrogatepass")
+
+
+class _Strings:
+    """Interned string table under construction."""
+
+    def __init__(self) -> None:
+        self.offsets = array("q", [0])
+        self.text = bytearray()
+        self._index: Dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.offsets) - 1
+            self.text += value.encode("utf-8", "surrogatepass")
+            self.offsets.append(len(self.text))
+        return index
+
+
+def _encode(value: Any, strings: _Strings) -> Tuple[int, int]:
+    """(tag, payload) for a scalar value."""
+    kind = type(value)
+    if kind is str:
+        return _STR, strings.add(value)
+    if value is None:
+        return _NONE, 0
+    if kind is bool:
+        return (_TRUE if value else _FALSE), 0
+    if kind is int and _INT_MIN <= value <= _INT_MAX:
+        return _INT, value
+    if kind is float:
+        return _FLOAT, _INT_BITS.unpack(_FLOAT_BITS.pack(value))[0]
+    try:
+        text = json.dumps(encode_value(value), allow_nan=False)
+    except (TypeError, ValueError):
+        raise TypeError(f"Cannot save a value of type {kind.__name__} in a snapshot")
+    return _JSON, strings.add(text)
+
+
+def _write_column(f, column: array | bytearray) -> None:
+    if isinstance(column, array) and column.itemsize > 1 and not _LITTLE_ENDIAN:
+        column = array(column.typecode, column)
+        column.byteswap()
+    data = memoryview(column).cast("B")
+    f.write(data)
+    f.write(bytes(_padded(len(data)) - len(data)))
+
+
+def _read_column(buffer: mmap.mmap, offset: int, length: int, code: str) -> Any:
+    view = memoryview(buffer)[offset:offset + length]
+    if _LITTLE_ENDIAN or array(code).itemsize == 1:
+        return view.cast(code)
+    column = array(code, view.tobytes())  # big-endian host: swapped copy
+    column.byteswap()
+    return column
+
+
+def _sync_directory(directory: Path) -> None:
+    """Make a rename in directory durable (POSIX; a no-op elsewhere)."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _padded(length: int) -> int:
+    return (length + 7) & ~7
@@ -2,47 +2,86 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict, Iterable, Iterator
 from uuid import UUID
 
+from zeno.core.child_list import add_child, child_sequence
+from zeno.core.key_index import KeyIndex, link_error
 from zeno.core.node import Node
-from zeno.core.types import NodeType
+from zeno.core.persistent_ids import PersistentIds
+from zeno.core.traversal import postorder_ids
+from zeno.core.types import NodeId, NodeType
 
 
 class IRStore:
+    """
+    Default dict-of-Node IR store.
+
+    Public methods enforce structural rules and then delegate to a small set
+    of storage primitives (_insert_node, _attach, _detach, _set_children,
+    _forget, _assign_value, _key_*). Alternative backends override only those
+    primitives plus get_node/has_node.
+
+    Callers treat nodes returned by get_node as read-only and mutate through
+    the store API.
+    """
+
     def __init__(self) -> None:
-        self._nodes: Dict[UUID, Node] = {}
-        self._root_id: UUID | None = None
+        self._nodes: Dict[NodeId, Node] = {}
+        self._root_id: NodeId | None = None
+        # Monotonic store-local handle allocator (0 is never issued).
+        self._next_id: NodeId = 1
+        # OBJECT parent id -> {key: child id}, kept in sync by link/unlink.
+        self._key_index = KeyIndex()
+        # Persistence-only UUIDs, derived on first request.
+        self._persistent_ids = PersistentIds()
 
     @property
-    def root_id(self) -> UUID:
+    def root_id(self) -> NodeId:
         if self._root_id is None:
             raise RuntimeError("Root node not set.")
         return self._root_id
 
-    def create_root(self, node_type: NodeType) -> UUID:
+    def has_root(self) -> bool:
+        return self._root_id is not None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def create_root(self, node_type: NodeType, node_id: NodeId | None = None) -> NodeId:
         if self._root_id is not None:
             raise RuntimeError("Root already exists.")
 
         node = Node.create(node_type)
-        self._nodes[node.id] = node
+        node.id = node_id
+        self.add_unlinked_node(node)
         self._root_id = node.id
         return node.id
 
+    def allocate_id(self) -> NodeId:
+        """Reserve the next node handle."""
+        node_id = self._next_id
+        self._next_id += 1
+        return node_id
+
     def add_unlinked_node(self, node: Node) -> None:
-        if node.id in self._nodes:
+        if node.id is None:
+            node.id = self.allocate_id()
+        elif self.has_node(node.id):
             raise ValueError("Node with this ID already exists.")
+        elif node.id >= self._next_id:
+            self._next_id = node.id + 1
         if node.parent_id is not None:
             raise ValueError("Unlinked node must not have parent_id set.")
         if node.children:
             raise ValueError("Unlinked node must not have children.")
-        self._nodes[node.id] = node
+        self._insert_node(node)
 
     def link_child(
         self,
         *,
-        parent_id: UUID,
-        child_id: UUID,
+        parent_id: NodeId,
+        child_id: NodeId,
         key: str | None = None,
         index: int | None = None,
     ) -> None:
@@ -55,31 +94,17 @@ class IRStore:
         if child.parent_id is not None:
             raise ValueError("Child already has a parent.")
 
-        if parent.type == NodeType.SCALAR:
-            raise ValueError("Scalar nodes cannot have children.")
-
-        if parent.type == NodeType.OBJECT:
-            if key is None:
-                raise ValueError("Object child link requires key.")
-            if self._object_key_exists(parent, key):
-                raise ValueError(f"Duplicate object key: {key}")
-            child.key = key
+        self._check_link(parent_id, parent.type, key)
 
-        if parent.type == NodeType.LIST:
-            if key is not None:
-                raise ValueError("List child link does not allow key.")
-            child.key = None
+        if index is not None and (index < 0 or index > self.child_count(parent_id)):
+            raise ValueError("Index out of bounds.")
 
-        child.parent_id = parent_id
+        self._attach(parent_id, child_id, key, index)
 
-        if index is None:
-            parent.children.append(child_id)
-        else:
-            if index < 0 or index > len(parent.children):
-                raise ValueError("Index out of bounds.")
-            parent.children.insert(index, child_id)
+        if parent.type == NodeType.OBJECT:
+            self._key_add(parent_id, key, child_id)
 
-    def unlink_child(self, *, child_id: UUID) -> None:
+    def unlink_child(self, *, child_id: NodeId) -> None:
         child = self.get_node(child_id)
 
         if child_id == self.root_id:
@@ -88,17 +113,35 @@ class IRStore:
         if child.parent_id is None:
             raise ValueError("Child has no parent to unlink from.")
 
-        parent = self.get_node(child.parent_id)
-
-        try:
-            parent.children.remove(child_id)
-        except ValueError:
-            raise RuntimeError("Structural corruption: parent missing child link.")
+        parent_id = child.parent_id
+        key = child.key
+        parent = self.get_node(parent_id)
 
-        child.parent_id = None
-        child.key = None
+        self._detach(parent_id, child_id)
 
-    def delete_subtree(self, *, node_id: UUID) -> None:
+        if parent.type == NodeType.OBJECT:
+            self._key_remove(parent_id, key)
+
+    def insert_nodes(self, nodes: Iterable[Node]) -> int:
+        """
+        Add and link new nodes in one pass; returns how many. Each node names
+        its parent_id and key and is appended there, so parents come first
+        (pre-order); nodes may be lazy. On error, inserted nodes stay.
+        """
+        inserted = 0
+        for node in nodes:
+            parent_id, key = node.parent_id, node.key
+            parent_type = self.get_node(parent_id).type
+            self._check_link(parent_id, parent_type, key)
+            node.parent_id = node.key = None
+            self.add_unlinked_node(node)
+            self._attach(parent_id, node.id, key, None)
+            if parent_type == NodeType.OBJECT:
+                self._key_add(parent_id, key, node.id)
+            inserted += 1
+        return inserted
+
+    def delete_subtree(self, *, node_id: NodeId) -> None:
         if node_id == self.root_id:
             raise ValueError("Root node cannot be deleted.")
 
@@ -108,32 +151,150 @@ class IRStore:
         if node.parent_id is not None:
             raise ValueError("Node must be unlinked before deletion.")
 
-        # Depth-first delete.
-        for cid in list(node.children):
-            self._delete_subtree_internal(cid)
+        # Children before parents; iterative so depth is unbounded.
+        for nid in postorder_ids(self, node_id):
+            self._forget(nid)
 
-        del self._nodes[node_id]
+    def set_value(self, node_id: NodeId, value: Any) -> None:
+        """Assign a node's scalar value."""
+        self.get_node(node_id)
+        self._assign_value(node_id, value)
 
-    def _delete_subtree_internal(self, node_id: UUID) -> None:
-        node = self.get_node(node_id)
+    def iter_children(self, node_id: NodeId) -> Iterator[NodeId]:
+        return iter(self.get_node(node_id).children)
 
-        for cid in list(node.children):
-            self._delete_subtree_internal(cid)
+    def child_count(self, node_id: NodeId) -> int:
+        return len(self.get_node(node_id).children)
 
-        del self._nodes[node_id]
+    def child_index(self, child_id: NodeId) -> int:
+        """Return the position of child_id within its parent's children."""
+        child = self.get_node(child_id)
+        if child.parent_id is None:
+            raise ValueError("Node has no parent.")
+        try:
+            return self.get_node(child.parent_id).children.index(child_id)
+        except ValueError:
+            raise RuntimeError("Structural corruption: node not in parent's children.")
 
-    def get_node(self, node_id: UUID) -> Node:
+    def move_child(self, *, child_id: NodeId, index: int) -> None:
+        """Reposition child_id within its parent's children."""
+        child = self.get_node(child_id)
+        if child.parent_id is None:
+            raise ValueError("Cannot move root node.")
+
+        parent_id = child.parent_id
+        key = child.key
+        if index < 0 or index >= self.child_count(parent_id):
+            raise ValueError("Index out of bounds.")
+
+        self._detach(parent_id, child_id)
+        self._attach(parent_id, child_id, key, index)
+
+    def reorder_children(self, parent_id: NodeId, order: list[int]) -> None:
+        """Permute children: position i receives the child now at position order[i]."""
+        children = list(self.iter_children(parent_id))
+        if len(order) != len(children) or set(order) != set(range(len(children))):
+            raise ValueError("Order must be a permutation of the child positions.")
+        self._set_children(parent_id, [children[i] for i in order])
+
+    def snapshot(self) -> IRStore:
+        """Point-in-time copy for background readers (O(n) for this backend)."""
+        snap = IRStore()
+        snap._nodes = {nid: node.copy() for nid, node in self._nodes.items()}
+        snap._key_index = self._key_index.copy()
+        snap._root_id = self._root_id
+        snap._next_id = self._next_id
+        return snap
+
+    def get_node(self, node_id: NodeId) -> Node:
         try:
             return self._nodes[node_id]
         except KeyError:
             raise KeyError(f"Node {node_id} does not exist.")
 
-    def has_node(self, node_id: UUID) -> bool:
+    def has_node(self, node_id: NodeId) -> bool:
         return node_id in self._nodes
 
-    def _object_key_exists(self, parent: Node, key: str) -> bool:
-        for cid in parent.children:
-            c = self.get_node(cid)
-            if c.key == key:
-                return True
-        return False
+    def iter_node_ids(self) -> Iterator[NodeId]:
+        return iter(self._nodes)
+
+    def get_child_by_key(self, parent_id: NodeId, key: str) -> NodeId | None:
+        """Return the id of the OBJECT child stored under key, or None."""
+        parent = self.get_node(parent_id)
+        if parent.type != NodeType.OBJECT:
+            raise ValueError("Keyed child lookup requires an OBJECT node.")
+        return self._key_lookup(parent_id, key)
+
+    def _check_link(self, parent_id: NodeId, parent_type: NodeType, key: str | None) -> None:
+        """Raise ValueError if a new child cannot go under the parent with key."""
+        taken = parent_type == NodeType.OBJECT and self._key_lookup(parent_id, key) is not None
+        error = link_error(parent_type, key, taken)
+        if error is not None:
+            raise ValueError(error)
+
+    def persistent_id(self, node_id: NodeId) -> UUID:
+        """Return a stable UUID for node_id, derived on first request."""
+        self.get_node(node_id)
+        return self._persistent_ids.issue(node_id)
+
+    def resolve_persistent_id(self, uid: UUID) -> NodeId | None:
+        """Map a UUID issued by persistent_id back to its node handle."""
+        return self._persistent_ids.resolve(uid)
+
+    # ------------------------------------------------------------
+    # Storage primitives (no validation; overridden by backends)
+    # ------------------------------------------------------------
+
+    def _insert_node(self, node: Node) -> None:
+        self._nodes[node.id] = node
+
+    def _attach(
+        self,
+        parent_id: NodeId,
+        child_id: NodeId,
+        key: str | None,
+        index: int | None,
+    ) -> None:
+        parent = self._nodes[parent_id]
+        child = self._nodes[child_id]
+
+        child.parent_id = parent_id
+        child.key = key
+        # Leaves share an empty tuple; long sequences become a ChildList.
+        parent.children = add_child(parent.children, child_id, index)
+
+    def _detach(self, parent_id: NodeId, child_id: NodeId) -> None:
+        parent = self._nodes[parent_id]
+        child = self._nodes[child_id]
+
+        try:
+            parent.children.remove(child_id)
+        except ValueError:
+            raise RuntimeError("Structural corruption: parent missing child link.")
+
+        child.parent_id = None
+        child.key = None
+
+    def _set_children(self, parent_id: NodeId, child_ids: list[NodeId]) -> None:
+        """Replace the order of parent_id's existing children."""
+        self._nodes[parent_id].children = child_sequence(child_ids)
+
+    def _assign_value(self, node_id: NodeId, value: Any) -> None:
+        self._nodes[node_id].value = value
+
+    def _forget(self, node_id: NodeId) -> None:
+        del self._nodes[node_id]
+        self._drop_indexes(node_id)
+
+    def _key_lookup(self, parent_id: NodeId, key: str) -> NodeId | None:
+        return self._key_index.get(parent_id, {}).get(key)
+
+    def _key_add(self, parent_id: NodeId, key: str, child_id: NodeId) -> None:
+        self._key_index.setdefault(parent_id, {})[key] = child_id
+
+    def _key_remove(self, parent_id: NodeId, key: str) -> None:
+        self._key_index.get(parent_id, {}).pop(key, None)
+
+    def _drop_indexes(self, node_id: NodeId) -> None:
+        self._key_index.pop(node_id, None)
+        self._persistent_ids.discard(node_id)
@@ -0,0 +1,63 @@
+# src/zeno/core/traversal.py
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
+
+from zeno.core.types import NodeId
+
+if TYPE_CHECKING:
+    from zeno.core.store import IRStore
+
+
+T = TypeVar("T")
+
+
+# ============================================================
+# Generic explicit-stack walks (no recursion, any depth)
+# ============================================================
+
+def preorder(root: T, children: Callable[[T], Iterable[T]]) -> Iterator[T]:
+    """
+    Yield root, then each subtree in child order (parent before children).
+
+    children(item) is called once per yielded item; the walk is iterative,
+    so depth is bounded only by memory.
+    """
+    stack = [root]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        item = pop()
+        yield item
+        kids = list(children(item))
+        if kids:
+            kids.reverse()
+            push(kids)
+
+
+def postorder(root: T, children: Callable[[T], Iterable[T]]) -> Iterator[T]:
+    """Yield every item after all of its children (children in order)."""
+    stack = [(root, iter(children(root)))]
+    while stack:
+        item, pending = stack[-1]
+        for child in pending:
+            stack.append((child, iter(children(child))))
+            break
+        else:
+            stack.pop()
+            yield item
+
+
+# ============================================================
+# IRStore helpers
+# ============================================================
+
+def preorder_ids(store: IRStore, node_id: NodeId) -> Iterator[NodeId]:
+    """Pre-order node ids of the subtree rooted at node_id."""
+    return preorder(node_id, store.iter_children)
+
+
+def postorder_ids(store: IRStore, node_id: NodeId) -> Iterator[NodeId]:
+    """Post-order node ids of the subtree rooted at node_id."""
+    return postorder(node_id, store.iter_children)
@@ -1,9 +1,29 @@
 ﻿# src/zeno/core/types.py
 
+from __future__ import annotations
+
 from enum import Enum
 
 
 class NodeType(Enum):
     OBJECT = "object"
     LIST = "list"
-    SCALAR = "scalar"
+    SCALAR = "scalar"
+
+
+# Store-local node handle (monotonic, allocated by IRStore).
+NodeId = int
+
+
+def parse_node_id(value: object) -> NodeId | None:
+    """Coerce a node handle carried through the UI (int or decimal str) to NodeId."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return None
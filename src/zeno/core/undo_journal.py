@@ -0,0 +1,166 @@
+# src/zeno/core/undo_journal.py
+
+from __future__ import annotations
+
+import sys
+from collections import deque
+from time import monotonic
+from typing import Deque, List
+
+from zeno.core.operation import Operation
+from zeno.core.types import NodeId
+
+
+# Default memory budget for undo + redo entries.
+DEFAULT_BUDGET_BYTES = 16 * 1024 * 1024
+
+# Longest pause between scalar edits of one node that still coalesce them.
+COALESCE_SECONDS = 1.0
+
+# Rough per-record costs used by the size estimate.
+_OPERATION_BYTES = 240
+_NODE_RECORD_BYTES = 200
+
+
+class JournalEntry:
+    """One user-level edit: the operations that revert it, in apply order."""
+
+    __slots__ = ("operations", "size", "coalesce_node", "edited_at")
+
+    def __init__(
+        self,
+        operations: List[Operation],
+        coalesce_node: NodeId | None = None,
+        edited_at: float = 0.0,
+    ) -> None:
+        self.operations = operations
+        self.size = sum(_estimate(op) for op in operations)
+        # Set while a lone update_scalar entry may absorb further edits of this node.
+        self.coalesce_node = coalesce_node
+        # monotonic() time of the last edit recorded in this entry.
+        self.edited_at = edited_at
+
+
+class UndoJournal:
+    """
+    Bounded undo/redo history of inverse operations.
+
+    Each entry holds only the operations needed to revert one edit, so
+    undo and redo cost O(size of that edit). Consecutive update_scalar
+    edits of the same node coalesce into one entry (the first inverse
+    keeps the original value) while each follows the previous one within
+    coalesce_seconds, until the editor seals the entry (focus change,
+    committed value). Batches never coalesce. When the estimated size of
+    both stacks exceeds budget_bytes, the oldest undo entries are evicted.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int = DEFAULT_BUDGET_BYTES,
+        coalesce_seconds: float = COALESCE_SECONDS,
+    ) -> None:
+        self._budget = budget_bytes
+        self._coalesce_seconds = coalesce_seconds
+        self._undo: Deque[JournalEntry] = deque()
+        self._redo: List[JournalEntry] = []
+        self._size = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def record(self, inverses: List[Operation], *, coalesce: bool = True) -> None:
+        """
+        Record the inverses of a newly applied edit; clears the redo stack.
+        With coalesce=False (batches) the entry neither absorbs nor is
+        absorbed by scalar edits.
+        """
+        if not inverses:
+            return
+        self._drop_redo()
+
+        single = inverses[0] if len(inverses) == 1 else None
+        node_id = None
+        if coalesce and single is not None and single.operation_type == "update_scalar":
+            node_id = single.payload["node_id"]
+
+        now = monotonic()
+        top = self._undo[-1] if self._undo else None
+        if (
+            node_id is not None
+            and top is not None
+            and top.coalesce_node == node_id
+            and now - top.edited_at <= self._coalesce_seconds
+        ):
+            # Keep the older inverse: it restores the value before the first keystroke.
+            top.edited_at = now
+            return
+
+        self._push(self._undo, JournalEntry(inverses, node_id, now))
+        self._evict()
+
+    def seal(self) -> None:
+        """Stop the latest entry from absorbing further scalar edits."""
+        if self._undo:
+            self._undo[-1].coalesce_node = None
+
+    def pop_undo(self) -> JournalEntry:
+        entry = self._undo.pop()
+        self._size -= entry.size
+        return entry
+
+    def pop_redo(self) -> JournalEntry:
+        entry = self._redo.pop()
+        self._size -= entry.size
+        return entry
+
+    def push_undo(self, inverses: List[Operation]) -> None:
+        """Re-record an entry produced by redo (keeps the redo stack)."""
+        self._push(self._undo, JournalEntry(inverses))
+        self._evict()
+
+    def push_redo(self, inverses: List[Operation]) -> None:
+        self._push(self._redo, JournalEntry(inverses))
+        self._evict()
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._size = 0
+
+    def _push(self, stack, entry: JournalEntry) -> None:
+        stack.append(entry)
+        self._size += entry.size
+
+    def _drop_redo(self) -> None:
+        for entry in self._redo:
+            self._size -= entry.size
+        self._redo.clear()
+
+    def _evict(self) -> None:
+        # Always keep the newest entry, even if it alone exceeds the budget.
+        while self._size > self._budget and len(self._undo) > 1:
+            self._size -= self._undo.popleft().size
+
+
+def _estimate(operation: Operation) -> int:
+    payload = operation.payload
+    size = _OPERATION_BYTES
+    nodes = payload.get("nodes")
+    if nodes is not None:
+        size += len(nodes) * _NODE_RECORD_BYTES
+        size += sum(sys.getsizeof(node.value) for node in nodes if node.value is not None)
+    elif payload.get("value") is not None:
+        size += sys.getsizeof(payload["value"])
+    elif payload.get("order") is not None:
+        size += sys.getsizeof(payload["order"])
+    return size
@@ -0,0 +1,87 @@
+# src/zeno/core/version_stamps.py
+
+from __future__ import annotations
+
+from typing import Dict
+
+from zeno.core.operation import Operation
+from zeno.core.store import IRStore
+from zeno.core.traversal import preorder_ids
+from zeno.core.types import NodeId
+
+
+# Inverse types showing that an operation created the subtree at their node_id.
+_CREATED_BY = ("remove_node", "replace_subtree")
+
+
+class VersionStamps:
+    """
+    Per-node version stamps, kept up to date by OperationProcessor.
+
+    Each applied operation takes the next value of a clock and stamps the
+    nodes it touched and all of their ancestors, so a node's stamp changes
+    whenever anything in its subtree does. Nodes an operation creates are
+    stamped throughout; the stamps of nodes it deletes are dropped.
+    Untouched nodes have stamp 0. Stamps let caches of derived per-subtree
+    data (see yaml_fragments) tell what is still valid.
+    """
+
+    def __init__(self) -> None:
+        self._stamps: Dict[NodeId, int] = {}
+        self._clock = 0
+
+    def __len__(self) -> int:
+        """Nodes with a stamp."""
+        return len(self._stamps)
+
+    def stamp(self, node_id: NodeId) -> int:
+        return self._stamps.get(node_id, 0)
+
+    def copy(self) -> VersionStamps:
+        """Stamps as of now, for readers of a store snapshot taken at the same time."""
+        copy = VersionStamps()
+        copy._stamps = dict(self._stamps)
+        copy._clock = self._clock
+        return copy
+
+    def record(self, store: IRStore, operation: Operation, inverse: Operation) -> None:
+        """Stamp what operation (just applied, undone by inverse) changed."""
+        self._clock += 1
+        for node_id in _touched(operation, inverse):
+            if node_id is not None and store.has_node(node_id):
+                self._stamp_path(store, node_id)
+
+        created = inverse.payload.get("node_id")
+        if inverse.operation_type in _CREATED_BY and store.has_node(created):
+            for node_id in preorder_ids(store, created):
+                self._stamps[node_id] = self._clock
+
+        # Deleted subtrees are listed in full by "nodes" payloads (remove_node's
+        # inverse, replacements); new ids are never reused.
+        for op in (operation, inverse):
+            for node in op.payload.get("nodes") or ():
+                if not store.has_node(node.id):
+                    self._stamps.pop(node.id, None)
+
+    def _stamp_path(self, store: IRStore, node_id: NodeId | None) -> None:
+        clock = self._clock
+        while node_id is not None and self._stamps.get(node_id) != clock:
+            self._stamps[node_id] = clock
+            node_id = store.get_node(node_id).parent_id
+
+
+def _touched(operation: Operation, inverse: Operation) -> list[NodeId | None]:
+    """
+    Nodes an operation changed, read from payload conventions shared by the
+    built-in handlers: target "node_id" and "parent_id" on either side, and
+    the former parent of a removed subtree (first of inverse "nodes").
+    """
+    touched: list[NodeId | None] = []
+    for op in (operation, inverse):
+        payload = op.payload
+        touched.append(payload.get("node_id"))
+        touched.append(payload.get("parent_id"))
+        nodes = payload.get("nodes")
+        if nodes:
+            touched.append(nodes[0].parent_id)
+    return touched
@@ -1,7 +1,7 @@
 # src/zeno/schema/binder.py
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Tuple
 
 from zeno.core.ir_types import (
     IRType,
@@ -10,68 +10,121 @@ from zeno.core.ir_types import (
     ArrayType,
 )
 
+from .loader import SchemaValidationError
+
 
 # ==========================================================
 # Public Entry
 # ==========================================================
 
-def bind(root_schema: Dict[str, Any]) -> IRType:
+def bind(root_schema: Mapping[str, Any]) -> IRType:
     """
     Bind a schema root (schema.root) into IRType tree.
 
     This performs structural interpretation only.
     No IR instance creation.
     No validation execution.
+
+    Each schema mapping binds to one type object, so shared (YAML alias)
+    and self-referencing schema nodes bind to shared and cyclic types.
+    The walk is iterative: nesting depth is bounded only by memory.
+
+    Raises SchemaValidationError on constraints that cannot be bound
+    (run validator.validate_structure first for shape errors).
     """
-    return _bind_node(root_schema)
+    bound: Dict[int, Tuple[Mapping[str, Any], IRType]] = {}
+    pending: List[Tuple[Mapping[str, Any], IRType, str]] = []
+
+    def type_of(node: Mapping[str, Any], path: str) -> IRType:
+        # The node is kept alongside its type so its id stays unique.
+        entry = bound.get(id(node))
+        if entry is None:
+            ir_type = _bind_node(node, path=path)
+            bound[id(node)] = (node, ir_type)
+            pending.append((node, ir_type, path))
+            return ir_type
+        return entry[1]
+
+    root = type_of(root_schema, "root")
+    while pending:
+        node, ir_type, path = pending.pop()
+        if isinstance(ir_type, ObjectType):
+            properties = ir_type.properties
+            for name, child_schema in (node.get("properties") or {}).items():
+                properties[name] = type_of(child_schema, f"{path}.properties.{name}")
+        elif isinstance(ir_type, ArrayType):
+            # Linked after construction: items may lead back to this array.
+            object.__setattr__(ir_type, "items", type_of(node["items"], f"{path}.items"))
+    return root
 
 
 # ==========================================================
-# Core Binding Dispatcher
+# Core Binding Dispatcher (one node; children are linked by bind)
 # ==========================================================
 
-def _bind_node(node: Dict[str, Any]) -> IRType:
+def _bind_node(node: Mapping[str, Any], *, path: str) -> IRType:
+    if not isinstance(node, Mapping):
+        raise SchemaValidationError(f"{path} must be a mapping/object")
+
     if "type" not in node:
-        raise ValueError("Schema node missing required key: 'type'")
+        raise SchemaValidationError(f"{path} missing required key: 'type'")
 
     node_type = node["type"]
 
     if node_type == "object":
-        return _bind_object(node)
+        return _bind_object(node, path=path)
 
     if node_type == "array":
-        return _bind_array(node)
+        return _bind_array(node, path=path)
 
     if node_type in ("string", "integer", "number", "boolean"):
-        return _bind_scalar(node)
+        return _bind_scalar(node, path=path)
 
-    raise ValueError(f"Unsupported schema type: {node_type}")
+    raise SchemaValidationError(f"{path}: unsupported schema type: {node_type}")
+
+
+def _required_flag(node: Mapping[str, Any], *, path: str) -> bool:
+    required = node.get("required", False)
+    if not isinstance(required, bool):
+        raise SchemaValidationError(f"{path}.required must be true or false")
+    return required
 
 
 # ==========================================================
 # Object Binding
 # ==========================================================
 
-def _bind_object(node: Dict[str, Any]) -> ObjectType:
-    properties = node.get("properties", {})
+def _bind_object(node: Mapping[str, Any], *, path: str) -> ObjectType:
+    properties = node.get("properties") or {}
     required = node.get("required", [])
 
-    if not isinstance(properties, dict):
-        raise ValueError("Object 'properties' must be a mapping")
-
-    if not isinstance(required, list):
-        raise ValueError("Object 'required' must be a list")
+    if not isinstance(properties, Mapping):
+        raise SchemaValidationError(f"{path}.properties must be a mapping/object")
 
-    bound_props: Dict[str, IRType] = {}
+    # A list names required properties; a boolean flags this object itself.
+    if isinstance(required, bool):
+        names: list = []
+    elif isinstance(required, list) and all(isinstance(name, str) for name in required):
+        names = list(required)
+        required = False
+    else:
+        raise SchemaValidationError(f"{path}.required must be a list of property names or a boolean")
 
+    flagged = set()
     for name, child_schema in properties.items():
-        if not isinstance(child_schema, dict):
-            raise ValueError(f"Invalid schema for property '{name}'")
-        bound_props[name] = _bind_node(child_schema)
+        if not isinstance(child_schema, Mapping):
+            raise SchemaValidationError(f"{path}.properties.{name} must be a mapping/object")
+        if _required_flag(child_schema, path=f"{path}.properties.{name}"):
+            flagged.add(name)
+
+    for name in names:
+        if name not in properties:
+            raise SchemaValidationError(f"{path}.required names unknown property '{name}'")
 
     return ObjectType(
-        properties=bound_props,
-        required=list(required),
+        required=required,
+        properties={},  # filled by bind
+        required_properties=frozenset(names).union(flagged),
     )
 
 
@@ -79,34 +132,46 @@ def _bind_object(node: Dict[str, Any]) -> ObjectType:
 # Array Binding
 # ==========================================================
 
-def _bind_array(node: Dict[str, Any]) -> ArrayType:
+def _bind_array(node: Mapping[str, Any], *, path: str) -> ArrayType:
     if "items" not in node:
-        raise ValueError("Array schema missing 'items'")
+        raise SchemaValidationError(f"{path} of type 'array' requires 'items'")
 
-    items_schema = node["items"]
-    if not isinstance(items_schema, dict):
-        raise ValueError("Array 'items' must be a schema object")
+    min_items = _bound(node, "min_items", path=path)
+    max_items = _bound(node, "max_items", path=path)
+    if min_items is not None and max_items is not None and min_items > max_items:
+        raise SchemaValidationError(f"{path}.min_items exceeds max_items")
 
-    min_items = node.get("minItems")
-    max_items = node.get("maxItems")
+    unique_by = node.get("unique_by")
+    if unique_by is not None and (not isinstance(unique_by, str) or not unique_by):
+        raise SchemaValidationError(f"{path}.unique_by must be a field name")
 
     return ArrayType(
-        items=_bind_node(items_schema),
+        required=_required_flag(node, path=path),
+        items=None,  # linked by bind
         min_items=min_items,
         max_items=max_items,
+        unique_by=unique_by,
     )
 
 
+def _bound(node: Mapping[str, Any], key: str, *, path: str) -> int | None:
+    value = node.get(key)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise SchemaValidationError(f"{path}.{key} must be a non-negative integer")
+    return value
+
+
 # ==========================================================
 # Scalar Binding
 # ==========================================================
 
-def _bind_scalar(node: Dict[str, Any]) -> ScalarType:
+def _bind_scalar(node: Mapping[str, Any], *, path: str) -> ScalarType:
     name = node["type"]
 
     enum = node.get("enum")
     default = node.get("default")
-    required = bool(node.get("required", False))
     unique = node.get("unique")
     minimum = node.get("minimum")
     maximum = node.get("maximum")
@@ -116,8 +181,8 @@ def _bind_scalar(node: Dict[str, Any]) -> ScalarType:
     # ------------------------------------------
     if unique is not None:
         if unique != "sibling":
-            raise ValueError(
-                f"Unsupported unique scope '{unique}'. Only 'sibling' is allowed."
+            raise SchemaValidationError(
+                f"{path}: unsupported unique scope '{unique}'. Only 'sibling' is allowed."
             )
 
     # ------------------------------------------
@@ -125,22 +190,21 @@ def _bind_scalar(node: Dict[str, Any]) -> ScalarType:
     # ------------------------------------------
     if enum is not None:
         if not isinstance(enum, list):
-            raise ValueError("Scalar 'enum' must be a list")
+            raise SchemaValidationError(f"{path}.enum must be a list")
+        enum = tuple(enum)
 
     # ------------------------------------------
     # Validate numeric constraints
     # ------------------------------------------
-    if minimum is not None and not isinstance(minimum, (int, float)):
-        raise ValueError("Scalar 'minimum' must be numeric")
-
-    if maximum is not None and not isinstance(maximum, (int, float)):
-        raise ValueError("Scalar 'maximum' must be numeric")
+    for key, value in (("minimum", minimum), ("maximum", maximum)):
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise SchemaValidationError(f"{path}.{key} must be numeric")
 
     return ScalarType(
         name=name,
+        required=_required_flag(node, path=path),
         enum=enum,
         default=default,
-        required=required,
         unique=unique,
         minimum=minimum,
         maximum=maximum,
@@ -0,0 +1,148 @@
+# src/zeno/schema/compiled.py
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+
+from zeno.core import ir_types
+from zeno.core.ir_types import ObjectType
+
+from .binder import bind
+from .loader import (
+    Schema,
+    SchemaLoadError,
+    _require_file_exists,
+    _require_zs_extension,
+    loads,
+)
+from .validator import validate_structure
+
+
+# Bump when CompiledSchema, the bound types (zeno.core.ir_types) or the
+# pickled layout change.
+CACHE_FORMAT = 2
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """A schema loaded, structurally validated and bound (ready to use as is)."""
+
+    schema: Schema
+    # sha256 of the file, Zeno version and CACHE_FORMAT (the cache key).
+    content_hash: str
+    # binder.bind(schema.root): the validators' input. Derived from schema,
+    # and compared by identity, so left out of equality.
+    root_type: ObjectType = field(compare=False)
+
+
+def compile_schema(
+    path: str | Path,
+    *,
+    cache_dir: str | Path | None = None,
+    use_cache: bool = True,
+) -> CompiledSchema:
+    """
+    Load, validate and bind a .zs schema file, going through the on-disk cache.
+
+    The cache is keyed by the file content and the Zeno version, so an
+    edited schema or an upgraded Zeno compiles again; a hit is one
+    unpickle instead of a YAML parse, a validation walk and bind().
+    Invalid schemas raise as with load() + validate_structure() + bind()
+    and are never cached. A missing, unreadable or corrupt cache only costs a compile.
+    """
+    p = Path(path)
+    _require_file_exists(p)
+    _require_zs_extension(p)
+    try:
+        data = p.read_bytes()
+    except OSError as e:
+        raise SchemaLoadError(f"Failed to read schema file: {p} ({e})") from e
+
+    key = _cache_key(data)
+    entry = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    entry = entry / f"{key}.pickle"
+
+    if use_cache:
+        cached = _read_entry(entry, key)
+        if cached is not None:
+            # Same content may sit at another path; report the one asked for.
+            return dataclasses.replace(cached, schema=dataclasses.replace(cached.schema, source_path=str(p)))
+
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise SchemaLoadError(f"Schema file is not UTF-8 text: {p} ({e})") from e
+    schema = loads(text, source_path=str(p))
+    validate_structure(schema)
+    compiled = CompiledSchema(schema, key, bind(schema.root))
+
+    if use_cache:
+        _write_entry(entry, compiled)
+    return compiled
+
+
+def default_cache_dir() -> Path:
+    """$ZENO_CACHE_DIR, else $XDG_CACHE_HOME/zeno/schemas (~/.cache by default)."""
+    override = os.environ.get("ZENO_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "zeno" / "schemas"
+
+
+def zeno_version() -> str:
+    """
+    Installed Zeno version; in a source checkout, a digest of the code
+    behind cache entries: the schema package and zeno.core.ir_types,
+    whose objects the entries pickle.
+    """
+    try:
+        return metadata.version("zeno")
+    except metadata.PackageNotFoundError:
+        digest = hashlib.sha256()
+        for module in sorted(Path(__file__).parent.glob("*.py")) + [Path(ir_types.__file__)]:
+            digest.update(module.read_bytes())
+        return "dev-" + digest.hexdigest()[:16]
+
+
+def _cache_key(data: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"zeno {zeno_version()} format {CACHE_FORMAT}\n".encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def _read_entry(entry: Path, key: str) -> CompiledSchema | None:
+    try:
+        with entry.open("rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None  # missing, truncated or from an incompatible build: compile again
+    if not isinstance(cached, CompiledSchema) or cached.content_hash != key:
+        return None
+    return cached
+
+
+def _write_entry(entry: Path, compiled: CompiledSchema) -> None:
+    """Store compiled atomically; a cache that cannot be written is skipped."""
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=entry.stem, suffix=".tmp", dir=entry.parent)
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, entry)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
@@ -0,0 +1,273 @@
+# src/zeno/schema/compiler.py
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from zeno.core.ir_types import ArrayType, IRType, ObjectType
+from zeno.core.store import IRStore
+from zeno.core.types import NodeId, NodeType
+
+from .ir_semantic_validator import IRSemanticError
+from .ir_validator import ValidationIssue
+
+
+_OBJECT = NodeType.OBJECT
+_LIST = NodeType.LIST
+_SCALAR = NodeType.SCALAR
+_KINDS = {_OBJECT: "object", _LIST: "list", _SCALAR: "scalar"}
+
+# Lazy path: None for the root, else (parent path, key) for an object member
+# or (parent path, index, None) for a list item, so integer keys stay keys.
+# Formatted ("$.a[0].b") only when an error is reported.
+_Path = Optional[Tuple[Any, ...]]
+
+# Compiled check of one node: returns the children still to visit.
+_Check = Callable[[Any, _Path, "_Run"], Optional[List[Tuple["_Check", Any, _Path]]]]
+
+
+class _Run:
+    """State of one validator call, shared by the compiled checks."""
+
+    __slots__ = ("get", "by_key", "issues", "errors")
+
+    def __init__(self, store: IRStore) -> None:
+        self.get = store.get_node
+        self.by_key = store.get_child_by_key
+        self.issues: List[ValidationIssue] = []
+        self.errors: List[IRSemanticError] = []
+
+
+def format_path(path: _Path) -> str:
+    """"$" followed by ".key" / "[index]" segments (the validators' path syntax)."""
+    parts = []
+    while path is not None:
+        if len(path) == 3:
+            path, index, _ = path
+            parts.append(f"[{index}]")
+        else:
+            path, key = path
+            parts.append(f".{key}")
+    parts.append("$")
+    return "".join(reversed(parts))
+
+
+class SchemaValidator:
+    """
+    Validator compiled from a bound schema: one closure per schema type.
+
+    Calling it checks an IRStore subtree in one walk and returns
+    (issues, errors): what ir_validator.validate(view, root_type) raises
+    and what validate_ir_semantics(root_type, view) returns, in the same
+    order. Property dispatch, constraints and item types are resolved at
+    compile time; scalar leaves are checked inline by their parent; paths
+    are strings only for errors. Semantic rules run where the IR has the
+    schema's shape (the interpreters assume that it has).
+    """
+
+    def __init__(self, root_type: IRType) -> None:
+        self._checks: Dict[int, _Check] = {}
+        # Types referenced by _checks keys, kept alive so ids stay unique.
+        self._types: List[IRType] = []
+        self._root = self._compile(root_type)
+
+    def __call__(
+        self, store: IRStore, node_id: NodeId | None = None
+    ) -> Tuple[List[ValidationIssue], List[IRSemanticError]]:
+        run = _Run(store)
+        stack: list = [(self._root, run.get(store.root_id if node_id is None else node_id), None)]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            check, node, path = pop()
+            work = check(node, path, run)
+            if work:
+                work.reverse()
+                extend(work)
+        return run.issues, run.errors
+
+    # ------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------
+
+    def _compile(self, ir_type: IRType) -> _Check:
+        """Check for ir_type (scalar properties and items are checked inline by their parent)."""
+        check = self._checks.get(id(ir_type))
+        if check is None:
+            self._types.append(ir_type)
+            if isinstance(ir_type, ObjectType):
+                check = self._object(ir_type)
+            elif isinstance(ir_type, ArrayType):
+                check = self._array(ir_type)
+            else:
+                check = _scalar(ir_type.name)
+            self._checks[id(ir_type)] = check
+        return check
+
+    def _object(self, ir_type: ObjectType) -> _Check:
+        # Filled after this check is registered: properties may lead back here.
+        dispatch: Dict[str, Tuple[Optional[_Check], str]] = {}
+        expected = ir_type.name
+
+        def check_object(node, path, run):
+            if node.type is not _OBJECT:
+                return _mismatch(node, path, run, expected)
+            get = run.get
+            seen = set()
+            work = []
+            for child_id in node.children:
+                child = get(child_id)
+                key = child.key
+                seen.add(key)
+                target = dispatch.get(key)
+                if target is None:
+                    return _object_issues(node, path, run, dispatch)
+                child_check, name = target
+                if child_check is not None:
+                    work.append((child_check, child, (path, key)))
+                elif child.type is not _SCALAR:
+                    work.append((_mismatched(name), child, (path, key)))
+            if len(seen) != len(node.children):
+                return _object_issues(node, path, run, dispatch)
+            return work
+
+        self._checks[id(ir_type)] = check_object
+        for key, prop in ir_type.properties.items():
+            dispatch[key] = (self._compile(prop) if prop.kind != "scalar" else None, prop.name)
+        return check_object
+
+    def _array(self, ir_type: ArrayType) -> _Check:
+        # Linked after this check is registered: items may lead back here.
+        item: list = [None, ""]
+        expected = ir_type.name
+        unique_by = ir_type.unique_by
+
+        def check_array(node, path, run):
+            if node.type is not _LIST:
+                return _mismatch(node, path, run, expected)
+            if unique_by:
+                _enforce_unique_by(node, path, run, unique_by)
+            item_check, name = item
+            get = run.get
+            work = []
+            for idx, child_id in enumerate(node.children):
+                child = get(child_id)
+                if item_check is not None:
+                    work.append((item_check, child, (path, idx, None)))
+                elif child.type is not _SCALAR:
+                    work.append((_mismatched(name), child, (path, idx, None)))
+            return work
+
+        self._checks[id(ir_type)] = check_array
+        item_type = ir_type.items
+        item[:] = [self._compile(item_type) if item_type.kind != "scalar" else None, item_type.name]
+        return check_array
+
+
+# ============================================================
+# Shared checks
+# ============================================================
+
+def _scalar(expected: str) -> _Check:
+    def check_scalar(node, path, run):
+        if node.type is not _SCALAR:
+            return _mismatch(node, path, run, expected)
+        return None
+    return check_scalar
+
+
+def _mismatched(expected: str) -> _Check:
+    def check_mismatched(node, path, run):
+        return _mismatch(node, path, run, expected)
+    return check_mismatched
+
+
+def _mismatch(node, path: _Path, run: _Run, expected: str):
+    """Report a node of the wrong kind, then check its subtree without a schema."""
+    if node.type is not _SCALAR or node.value is not None:
+        run.issues.append(ValidationIssue(format_path(path), f"Expected {expected}, got {_KINDS[node.type]}"))
+    return _untyped(node, path, run)
+
+
+def _untyped(node, path: _Path, run: _Run):
+    """Structure only: duplicate keys, then the children."""
+    if node.type is _SCALAR:
+        return None
+    get = run.get
+    if node.type is _LIST:
+        return [(_untyped, get(child_id), (path, idx, None)) for idx, child_id in enumerate(node.children)]
+    seen = set()
+    work = []
+    for child_id in node.children:
+        child = get(child_id)
+        key = child.key or ""
+        if key in seen:
+            run.issues.append(ValidationIssue(format_path((path, key)), f"Duplicate key: {key}"))
+        seen.add(key)
+        work.append((_untyped, child, (path, key)))
+    return work
+
+
+def _object_issues(node, path: _Path, run: _Run, dispatch: dict):
+    """Slow path of an object with duplicate or unknown keys, in interpreter order."""
+    get = run.get
+    seen = set()
+    work = []
+    for child_id in node.children:
+        child = get(child_id)
+        key = child.key or ""
+        if key in seen:
+            run.issues.append(ValidationIssue(format_path((path, key)), f"Duplicate key: {key}"))
+        seen.add(key)
+        target = dispatch.get(key)
+        if target is None:
+            run.issues.append(ValidationIssue(format_path((path, key)), f"Unknown property: {key}"))
+            work.append((_untyped, child, (path, key)))
+            continue
+        child_check, name = target
+        if child_check is not None:
+            work.append((child_check, child, (path, key)))
+        elif child.type is not _SCALAR:
+            work.append((_mismatched(name), child, (path, key)))
+    return work
+
+
+def _enforce_unique_by(node, path: _Path, run: _Run, field_name: str) -> None:
+    get = run.get
+    by_key = run.by_key
+    errors = run.errors
+    seen: Dict[Any, int] = {}
+    for idx, item_id in enumerate(node.children):
+        if get(item_id).type is not _OBJECT:
+            errors.append(IRSemanticError(
+                path=f"{format_path(path)}[{idx}]",
+                message="unique_by requires array items of type 'object'",
+            ))
+            continue
+        field_id = by_key(item_id, field_name)
+        if field_id is None:
+            errors.append(IRSemanticError(
+                path=f"{format_path(path)}[{idx}].{field_name}",
+                message="missing field required by unique_by",
+            ))
+            continue
+        field_node = get(field_id)
+        if field_node.type is not _SCALAR:
+            errors.append(IRSemanticError(
+                path=f"{format_path(path)}[{idx}].{field_name}",
+                message="unique_by field must be scalar",
+            ))
+            continue
+        value = field_node.value
+        first_idx = seen.setdefault(value, idx)
+        if first_idx != idx:
+            array_path = format_path(path)
+            errors.append(IRSemanticError(
+                path=f"{array_path}[{idx}].{field_name}",
+                message=f"duplicate value {value!r} (already used at {array_path}[{first_idx}].{field_name})",
+            ))
+
+
+def compile_validator(root_type: IRType) -> SchemaValidator:
+    """Compile a bound schema (binder.bind, CompiledSchema.root_type) into a SchemaValidator."""
+    return SchemaValidator(root_type)
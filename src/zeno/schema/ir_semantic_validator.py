@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Mapping
+from typing import Any, Tuple
 
+from zeno.core.ir_types import ArrayType, IRType, ObjectType
+from zeno.core.traversal import preorder
+
+from .binder import bind
 from .loader import Schema
 from .ir_validator import IRNodeView
 
@@ -15,10 +19,17 @@ class IRSemanticError:
     message: str
 
 
-def validate_ir_semantics(schema: Schema, ir_root: IRNodeView) -> list[IRSemanticError]:
+# (bound type, IR node, path) triple visited by the validator walk.
+_Entry = Tuple[IRType, IRNodeView, str]
+
+
+def validate_ir_semantics(schema: Schema | IRType, ir_root: IRNodeView) -> list[IRSemanticError]:
     """
     Semantic validation layer.
 
+    schema is the bound root type (binder.bind, CompiledSchema.root_type);
+    a loaded Schema is bound first.
+
     Scope (current phase):
       - array.unique_by (array-local duplicate detection)
 
@@ -29,103 +40,68 @@ def validate_ir_semantics(schema: Schema, ir_root: IRNodeView) -> list[IRSemanti
 
     errors: list[IRSemanticError] = []
 
-    if schema.root.get("type") != "object":
+    root_type = schema if isinstance(schema, IRType) else bind(schema.root)
+    if not isinstance(root_type, ObjectType):
         # Structural validator should have already blocked this.
         return errors
 
-    _validate_node(
-        schema_node=schema.root,
-        ir_node=ir_root,
-        path="$",
-        errors=errors,
-    )
-
-    return errors
+    def visit(entry: _Entry) -> list[_Entry]:
+        ir_type, ir_node, path = entry
+        if isinstance(ir_type, ObjectType):
+            return _validate_object(ir_type=ir_type, ir_node=ir_node, path=path)
+        if isinstance(ir_type, ArrayType):
+            return _validate_array(ir_type=ir_type, ir_node=ir_node, path=path, errors=errors)
+        # Primitive: no semantic rules yet.
+        return []
 
+    # Explicit-stack walk: each visit checks a node and returns its children.
+    for _ in preorder((root_type, ir_root, "$"), visit):
+        pass
 
-def _validate_node(
-    *,
-    schema_node: Mapping[str, Any],
-    ir_node: IRNodeView,
-    path: str,
-    errors: list[IRSemanticError],
-) -> None:
-    schema_type = schema_node.get("type")
-    if not isinstance(schema_type, str):
-        return
-
-    if schema_type == "object":
-        _validate_object(schema_node=schema_node, ir_node=ir_node, path=path, errors=errors)
-        return
-
-    if schema_type == "array":
-        _validate_array(schema_node=schema_node, ir_node=ir_node, path=path, errors=errors)
-        return
-
-    # Primitive: no semantic rules yet.
+    return errors
 
 
 def _validate_object(
     *,
-    schema_node: Mapping[str, Any],
+    ir_type: ObjectType,
     ir_node: IRNodeView,
     path: str,
-    errors: list[IRSemanticError],
-) -> None:
-    props = schema_node.get("properties")
-    if not isinstance(props, Mapping):
-        return
+) -> list[_Entry]:
+    props = ir_type.properties
+    children: list[_Entry] = []
 
-    ir_map = {k: child for (k, child) in ir_node.object_items()}
-
-    for key, child_schema in props.items():
-        if not isinstance(key, str):
-            continue
-        if not isinstance(child_schema, Mapping):
-            continue
-
-        child_ir = ir_map.get(key)
-        if child_ir is None:
-            continue
+    # IR order: schema order is irrelevant to the checks, and unknown keys
+    # (reported by the structural validator) are skipped.
+    for key, child_ir in ir_node.object_items():
+        child_type = props.get(key)
+        if child_type is not None:
+            children.append((child_type, child_ir, f"{path}.{key}"))
 
-        _validate_node(
-            schema_node=child_schema,
-            ir_node=child_ir,
-            path=f"{path}.{key}",
-            errors=errors,
-        )
+    return children
 
 
 def _validate_array(
     *,
-    schema_node: Mapping[str, Any],
+    ir_type: ArrayType,
     ir_node: IRNodeView,
     path: str,
     errors: list[IRSemanticError],
-) -> None:
+) -> list[_Entry]:
     # --- Enforce unique_by ---
-    unique_by = schema_node.get("unique_by")
-
-    if isinstance(unique_by, str) and unique_by:
+    if ir_type.unique_by:
         _enforce_unique_by(
             ir_node=ir_node,
-            field_name=unique_by,
+            field_name=ir_type.unique_by,
             path=path,
             errors=errors,
         )
 
-    # --- Recurse into items ---
-    items_schema = schema_node.get("items")
-    if not isinstance(items_schema, Mapping):
-        return
-
-    for idx, child in enumerate(ir_node.list_items()):
-        _validate_node(
-            schema_node=items_schema,
-            ir_node=child,
-            path=f"{path}[{idx}]",
-            errors=errors,
-        )
+    # --- Descend into items ---
+    items_type = ir_type.items
+    return [
+        (items_type, child, f"{path}[{idx}]")
+        for idx, child in enumerate(ir_node.list_items())
+    ]
 
 
 def _enforce_unique_by(
@@ -184,7 +160,4 @@ def _enforce_unique_by(
 
 
 def _ir_object_get(obj_node: IRNodeView, key: str) -> IRNodeView | None:
-    for k, child in obj_node.object_items():
-        if k == key:
-            return child
-    return None
\ No newline at end of file
+    return obj_node.object_get(key)
\ No newline at end of file
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Iterable, List, Tuple
-from uuid import UUID
+from typing import Any, Iterable, List, Optional, Tuple
 
+from zeno.core.ir_types import ArrayType, IRType, ObjectType
 from zeno.core.node import Node
-from zeno.core.types import NodeType
+from zeno.core.types import NodeId, NodeType
 from zeno.core.store import IRStore
+from zeno.core.traversal import preorder
 
 
 # ============================================================
@@ -39,6 +40,13 @@ class IRNodeView(ABC):
         """Return: child views"""
         pass
 
+    def object_get(self, key: str) -> IRNodeView | None:
+        """Return child view for key, or None (override for indexed lookup)"""
+        for k, child in self.object_items():
+            if k == key:
+                return child
+        return None
+
 
 # ============================================================
 # Adapter: IRStore + Node → IRNodeView
@@ -47,7 +55,7 @@ class IRNodeView(ABC):
 class IRStoreView(IRNodeView):
     """Bridge IRStore + Node tree to protocol."""
 
-    def __init__(self, store: IRStore, node_id: UUID) -> None:
+    def __init__(self, store: IRStore, node_id: NodeId) -> None:
         self._store = store
         self._node_id = node_id
 
@@ -74,6 +82,12 @@ class IRStoreView(IRNodeView):
         for child_id in node.children:
             yield IRStoreView(self._store, child_id)
 
+    def object_get(self, key: str) -> IRNodeView | None:
+        child_id = self._store.get_child_by_key(self._node_id, key)
+        if child_id is None:
+            return None
+        return IRStoreView(self._store, child_id)
+
 
 # ============================================================
 # Error Types
@@ -91,50 +105,104 @@ class ValidationError(Exception):
         super().__init__("\n".join(f"{i.path}: {i.message}" for i in issues))
 
 
+# (view, bound type or None, path) triple visited by the validator walk.
+_Entry = Tuple[IRNodeView, Optional[IRType], str]
+
+
 # ============================================================
 # Validation Entry
 # ============================================================
 
-def validate(root_view: IRNodeView) -> None:
-    """Validate an IR node tree structure."""
+def validate(root_view: IRNodeView, root_type: IRType | None = None) -> None:
+    """
+    Validate an IR node tree structure.
+
+    Given the bound schema root (binder.bind), also checks that the tree
+    has the schema's shape: each node is the kind its type binds to and
+    objects hold only schema-defined properties. A null scalar stands for
+    an unset value of any type.
+    """
     issues: List[ValidationIssue] = []
-    _validate_node(root_view, path="$", issues=issues)
+
+    def check(entry: _Entry) -> List[_Entry]:
+        view, ir_type, path = entry
+        return _validate_node(view, ir_type, path=path, issues=issues)
+
+    # Explicit-stack walk: each visit validates a node and returns its children.
+    for _ in preorder((root_view, root_type, "$"), check):
+        pass
+
     if issues:
         raise ValidationError(issues)
 
 
 # ============================================================
-# Recursive Validator
+# Per-node Checks
 # ============================================================
 
-def _validate_node(view: IRNodeView, *, path: str, issues: List[ValidationIssue]) -> None:
+def _validate_node(
+    view: IRNodeView,
+    ir_type: IRType | None,
+    *,
+    path: str,
+    issues: List[ValidationIssue],
+) -> List[_Entry]:
     t = view.node_type()
 
+    if ir_type is not None and t != ir_type.kind:
+        if t != "scalar" or view.scalar_value() is not None:
+            issues.append(ValidationIssue(path, f"Expected {ir_type.name}, got {t}"))
+        ir_type = None  # keep checking the subtree without a schema
+
     if t == "scalar":
-        return
+        return []
 
     if t == "object":
-        _validate_object(view, path=path, issues=issues)
-        return
+        return _validate_object(view, ir_type, path=path, issues=issues)
 
     if t == "list":
-        _validate_list(view, path=path, issues=issues)
-        return
+        return _validate_list(view, ir_type, path=path, issues=issues)
 
     issues.append(ValidationIssue(path, f"Unknown node type: {t}"))
+    return []
 
 
-def _validate_object(view: IRNodeView, *, path: str, issues: List[ValidationIssue]) -> None:
+def _validate_object(
+    view: IRNodeView,
+    ir_type: ObjectType | None,
+    *,
+    path: str,
+    issues: List[ValidationIssue],
+) -> List[_Entry]:
     seen_keys = set()
+    children: List[_Entry] = []
+    properties = ir_type.properties if ir_type is not None else None
 
     for key, child_view in view.object_items():
         if key in seen_keys:
             issues.append(ValidationIssue(f"{path}.{key}", f"Duplicate key: {key}"))
         seen_keys.add(key)
 
-        _validate_node(child_view, path=f"{path}.{key}", issues=issues)
-
-
-def _validate_list(view: IRNodeView, *, path: str, issues: List[ValidationIssue]) -> None:
-    for idx, child_view in enumerate(view.list_items()):
-        _validate_node(child_view, path=f"{path}[{idx}]", issues=issues)
+        child_type = None
+        if properties is not None:
+            child_type = properties.get(key)
+            if child_type is None:
+                issues.append(ValidationIssue(f"{path}.{key}", f"Unknown property: {key}"))
+
+        children.append((child_view, child_type, f"{path}.{key}"))
+
+    return children
+
+
+def _validate_list(
+    view: IRNodeView,
+    ir_type: ArrayType | None,
+    *,
+    path: str,
+    issues: List[ValidationIssue],
+) -> List[_Entry]:
+    item_type = ir_type.items if ir_type is not None else None
+    return [
+        (child_view, item_type, f"{path}[{idx}]")
+        for idx, child_view in enumerate(view.list_items())
+    ]
@@ -8,6 +8,8 @@ from typing import Any, Mapping
 
 import yaml
 
+from zeno.adapters.yaml_backend import safe_load
+
 
 class SchemaError(Exception):
     """Base class for schema loader errors."""
@@ -53,8 +55,12 @@ def load(path: str | Path) -> Schema:
     _require_file_exists(p)
     _require_zs_extension(p)
 
-    text = _read_text(p)
-    data = _parse_yaml(text, source_path=str(p))
+    return loads(_read_text(p), source_path=str(p))
+
+
+def loads(text: str, *, source_path: str = "<string>") -> Schema:
+    """Schema from .zs text already read (same checks as load)."""
+    data = _parse_yaml(text, source_path=source_path)
 
     header = _extract_header(data)
     root = _extract_root(data)
@@ -63,7 +69,7 @@ def load(path: str | Path) -> Schema:
         header=header,
         root=root,
         raw=data,
-        source_path=str(p),
+        source_path=source_path,
     )
 
 
@@ -85,11 +91,13 @@ def _read_text(p: Path) -> str:
         return p.read_text(encoding="utf-8")
     except OSError as e:
         raise SchemaLoadError(f"Failed to read schema file: {p} ({e})") from e
+    except UnicodeDecodeError as e:
+        raise SchemaLoadError(f"Schema file is not UTF-8 text: {p} ({e})") from e
 
 
 def _parse_yaml(text: str, *, source_path: str) -> Mapping[str, Any]:
     try:
-        parsed = yaml.safe_load(text)
+        parsed = safe_load(text)
     except yaml.YAMLError as e:
         raise SchemaLoadError(f"YAML parse error in schema: {source_path} ({e})") from e
 
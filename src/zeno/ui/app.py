@@ -20,6 +20,7 @@ from zeno.ui.tree_renderer import TreeRenderer
 from zeno.ui.document_manager import DocumentManager
 from zeno.ui.node_add_operations import NodeAddOperations
 from zeno.ui.node_edit_operations import NodeEditOperations
+from zeno.ui.operation_stats_view import install_operation_stats, stats_requested
 
 
 class ZenoMainWindow(QMainWindow):
@@ -259,6 +260,10 @@ class ZenoMainWindow(QMainWindow):
 
     def _on_node_selected(self, meta: dict) -> None:
         """Handle node selection from tree panels."""
+        # Focus moved on: later value edits start a new undo step.
+        processor = self.document_manager.get_processor()
+        if processor:
+            processor.journal.seal()
         self.tree_renderer.handle_node_selection(meta, self._update_status)
 
     # ---------------- Node Operations ----------------
@@ -288,13 +293,11 @@ class ZenoMainWindow(QMainWindow):
         if not self.document_manager.get_store():
             return
 
-        from uuid import UUID
         from zeno.core.operation import Operation
-        from zeno.core.types import NodeType
+        from zeno.core.types import NodeType, parse_node_id
 
-        try:
-            node_id = UUID(node_id_str)
-        except Exception:
+        node_id = parse_node_id(node_id_str)
+        if node_id is None:
             return
 
         store = self.document_manager.get_store()
@@ -347,6 +350,7 @@ class ZenoMainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:
         """Override close event to check for unsaved changes."""
+        self.document_manager.wait_for_save()
         if not self.document_manager.is_dirty():
             event.accept()
             return
@@ -361,6 +365,7 @@ class ZenoMainWindow(QMainWindow):
 
         if reply == QMessageBox.Save:
             self._on_save()
+            self.document_manager.wait_for_save()
             if not self.document_manager.is_dirty():  # Save succeeded
                 event.accept()
             else:
@@ -374,6 +379,8 @@ class ZenoMainWindow(QMainWindow):
 def main() -> int:
     app = QApplication(sys.argv)
     win = ZenoMainWindow()
+    if stats_requested(sys.argv):
+        install_operation_stats(win, win.document_manager)
     win.show()
     return app.exec()
 
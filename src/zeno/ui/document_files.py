@@ -0,0 +1,275 @@
+"""Document files: YAML loading, the crash-recovery edit log, saves and changes on disk."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+from PySide6.QtCore import QFileSystemWatcher
+from PySide6.QtWidgets import QMessageBox, QFileDialog
+
+from zeno.adapters.yaml_adapter import parse
+from zeno.adapters.yaml_fragments import FragmentCache
+from zeno.adapters.yaml_reparse import reparse_changed
+from zeno.adapters.yaml_source import SourceMap
+from zeno.core.operation_log import LogMark, OperationLog, log_path_for, recover
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+from zeno.ui.document_saver import DocumentSaver, SaveJob
+
+
+def load_document(path: Path, source: SourceMap | None = None) -> tuple[IRStore, int]:
+    """
+    Load a YAML config into a new store (PersistentIRStore, so saves can
+    snapshot it in O(1)), recording node spans in source.
+
+    If the sidecar edit log holds unsaved edits (the last session ended
+    without save or discard), the document is rebuilt from the log instead
+    (and source left empty). Returns (store, recovered edit count).
+    """
+    recovered = recover(log_path_for(path), PersistentIRStore)
+    if recovered is not None and recovered[1] > 0:
+        if source is not None:
+            source.clear()
+        return recovered
+
+    store = PersistentIRStore()
+    store.create_root(NodeType.OBJECT)
+    parse(path.read_text(encoding="utf-8"), store, source=source)
+    return store, 0
+
+
+class DocumentLog:
+    """Sidecar edit log of the active document (inactive while untitled)."""
+
+    def __init__(self) -> None:
+        self._log: OperationLog | None = None
+
+    def start(self, path: Path | None, store: IRStore, processor: OperationProcessor) -> None:
+        """Journal processor's edits to path's sidecar log, replacing any active log."""
+        self.stop()
+        if path is not None:
+            self._log = OperationLog(log_path_for(path), store)
+            self._log.attach(processor)
+
+    def checkpoint(self) -> None:
+        """Document matches its file again: restart the log from the current state."""
+        if self._log is not None:
+            self._log.checkpoint()
+
+    def mark(self) -> LogMark | None:
+        """Position of the current state in the log (None while inactive)."""
+        return self._log.mark() if self._log is not None else None
+
+    def saved(
+        self,
+        path: Path,
+        store: IRStore,
+        processor: OperationProcessor,
+        checkpoint: Path | None,
+        mark: LogMark | None,
+    ) -> None:
+        """
+        The document as of mark was saved to path: the log there restarts
+        from checkpoint (that state, prepared by the saver) plus the edits
+        made since, so a crash still recovers them.
+
+        Without a checkpoint, or with the log rewritten since mark, a log at
+        path is kept as it is (it still recovers everything); a new one
+        starts from the document as it is now.
+        """
+        log_path = log_path_for(path)
+        tail = self._log.tail(mark) if self._log is not None else None
+        if checkpoint is None or tail is None:
+            if checkpoint is not None:
+                checkpoint.unlink(missing_ok=True)
+            if self._log is None or self._log.path != log_path:
+                self.start(path, store, processor)
+            return
+        if self._log.path != log_path:
+            self.stop()
+            self._log = OperationLog(log_path, store)
+            self._log.restart(checkpoint, *tail)
+            self._log.attach(processor, checkpoint=False)
+        else:
+            self._log.restart(checkpoint, *tail)
+
+    def stop(self) -> None:
+        """Drop the log; its edits were saved or deliberately discarded."""
+        if self._log is not None:
+            self._log.discard()
+            self._log = None
+
+
+class DocumentFiles:
+    """
+    File side of the active document: its path, the sidecar edit log, the
+    fragment cache and source spans, background saves (DocumentSaver) and
+    the watch for changes made on disk.
+
+    DocumentManager owns one and calls attach() for every document it
+    installs. Results come back through the callbacks given here:
+    on_saved(job, save_as) after the current document was saved, and
+    on_reloaded(store, source, message) after the file changed on disk
+    while is_dirty() was False (store None: updated in place).
+    """
+
+    def __init__(
+        self,
+        parent_window,
+        is_dirty: Callable[[], bool],
+        on_saved: Callable[[SaveJob, bool], None],
+        on_reloaded: Callable[[IRStore | None, SourceMap | None, str], None],
+    ) -> None:
+        self._parent = parent_window
+        self._is_dirty = is_dirty
+        self._on_saved = on_saved
+        self._on_reloaded = on_reloaded
+        self._store: IRStore | None = None
+        self._processor: OperationProcessor | None = None
+        self._path: Path | None = None
+        self._log = DocumentLog()
+        self._fragments: FragmentCache | None = None
+        self._source: SourceMap | None = None
+        self._written: tuple[int, int] | None = None
+
+        self._watcher = QFileSystemWatcher(parent_window)
+        self._watcher.fileChanged.connect(self._file_changed)
+        self._saver = DocumentSaver(parent_window)
+        self._saver.finished.connect(self._save_finished)
+
+    @property
+    def path(self) -> Path | None:
+        """File of the active document (None while untitled)."""
+        return self._path
+
+    def attach(
+        self,
+        store: IRStore | None,
+        processor: OperationProcessor | None,
+        path: Path | None = None,
+        source: SourceMap | None = None,
+    ) -> None:
+        """Follow a newly installed document (store None: no document), its text's spans in source."""
+        self._store = store
+        self._processor = processor
+        self._path = path
+        self._fragments = FragmentCache(processor.versions) if processor is not None else None
+        self._source = source
+        self._written = None
+        if store is None:
+            self._log.stop()
+        else:
+            self._log.start(path, store, processor)
+        self._watch(path)
+
+    def open(self) -> tuple[IRStore, Path, SourceMap, int] | None:
+        """
+        Ask for a config file and load it: (store, path, source spans,
+        recovered edit count) as load_document gives them, or None if
+        cancelled or the file could not be read.
+        """
+        file_path, _ = QFileDialog.getOpenFileName(
+            self._parent,
+            "Open Config",
+            "",
+            "YAML Files (*.yaml *.yml);;All Files (*)"
+        )
+        if not file_path:
+            return None
+
+        path = Path(file_path)
+        source = SourceMap()
+        try:
+            store, recovered = load_document(path, source)
+        except Exception as e:
+            QMessageBox.critical(self._parent, "Open Error", f"Failed to open: {e}")
+            return None
+        return store, path, source, recovered
+
+    def ask_save_path(self) -> Path | None:
+        """Ask where to save the document; None if cancelled."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self._parent,
+            "Save Config As",
+            "",
+            "YAML Files (*.yaml *.yml);;All Files (*)"
+        )
+        return Path(file_path) if file_path else None
+
+    def save(self, path: Path) -> None:
+        """Write the document as it is now to path on the save thread."""
+        self._saver.start(path, self._store, self._processor, self._fragments, self._log.mark())
+
+    def wait(self) -> None:
+        """Block until saves in progress are written and handled (before leaving the document)."""
+        for job in self._saver.wait():
+            self._save_finished(job)
+
+    def _file_changed(self, changed: str) -> None:
+        """
+        The open file changed on disk: take the new text into a clean
+        document, re-parsing only the edited top-level section if possible.
+        Our own saves and documents with unsaved edits are left alone.
+        """
+        path = self._path
+        if path is None or Path(changed) != path or self._is_dirty() or self._saver.busy():
+            return
+        self._watch(path)  # editors that replace the file drop it from the watch
+        try:
+            if self._written == _signature(path):
+                return
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return
+
+        if self._source is not None and reparse_changed(text, self._store, self._processor, self._source):
+            self._log.checkpoint()
+            self._on_reloaded(None, None, f"Reloaded changed section: {path.name}")
+            return
+        source = SourceMap()
+        try:
+            store, _ = load_document(path, source)
+        except Exception as e:
+            QMessageBox.critical(self._parent, "Reload Error", f"Failed to reload: {e}")
+            return
+        self._on_reloaded(store, source, f"Reloaded: {path.name}")
+
+    def _watch(self, path: Path | None) -> None:
+        """Watch path (only) for changes on disk."""
+        if self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
+        if path is not None and path.exists():
+            self._watcher.addPath(str(path))
+
+    def _save_finished(self, job: SaveJob) -> None:
+        """A background save is done: on success the edit log restarts from the saved state."""
+        if job.handled:
+            return
+        job.handled = True
+        if job.error is not None:
+            QMessageBox.critical(self._parent, "Save Error", f"Failed to save: {job.error}")
+            return
+        if job.origin is not self._store:
+            if job.checkpoint is not None:
+                job.checkpoint.unlink(missing_ok=True)
+            return  # another document was opened meanwhile
+
+        if job.fragments is not None:
+            self._fragments.adopt(job.fragments)
+        save_as = job.path != self._path
+        self._path = job.path
+        self._log.saved(job.path, self._store, self._processor, job.checkpoint, job.log_mark)
+        # Spans described the text as opened; the next change on disk reloads in full.
+        self._source = None
+        self._written = _signature(job.path)
+        self._watch(job.path)
+        self._on_saved(job, save_as)
+
+
+def _signature(path: Path) -> tuple[int, int]:
+    """(mtime, size) telling a file version apart from the one we wrote."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
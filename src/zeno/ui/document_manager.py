@@ -6,10 +6,15 @@ from pathlib import Path
 
 from PySide6.QtWidgets import QMessageBox, QFileDialog
 
-from zeno.schema.loader import load
+from zeno.schema.compiled import compile_schema
+from zeno.core.persistent_store import PersistentIRStore
 from zeno.core.store import IRStore
 from zeno.core.types import NodeType
 from zeno.core.operation_processor import OperationProcessor
+from zeno.core.operation_stats import OperationStats
+from zeno.adapters.yaml_source import SourceMap
+from zeno.ui.document_files import DocumentFiles
+from zeno.ui.document_saver import SaveJob
 
 
 class DocumentManager:
@@ -35,9 +40,12 @@ class DocumentManager:
         self._schema_path: Path | None = None
         self._store: IRStore | None = None
         self._processor: OperationProcessor | None = None
+        self._operation_stats: OperationStats | None = None
         self._root_id = None
-        self._document_path: Path | None = None
         self._is_dirty: bool = False
+
+        # Path, edit log, background saves and changes on disk
+        self._files = DocumentFiles(parent_window, self.is_dirty, self._saved, self._reloaded)
         
         # Callbacks
         self._title_callback = None
@@ -56,6 +64,10 @@ class DocumentManager:
         """Set callback for status bar updates."""
         self._status_callback = callback
 
+    def set_operation_stats(self, stats: OperationStats | None) -> None:
+        """Instrument the processors of documents opened from now on into stats."""
+        self._operation_stats = stats
+
     def get_schema(self):
         """Get current schema."""
         return self._schema
@@ -74,7 +86,7 @@ class DocumentManager:
 
     def get_document_path(self) -> Path | None:
         """Get current document path."""
-        return self._document_path
+        return self._files.path
 
     def is_dirty(self) -> bool:
         """Check if document has unsaved changes."""
@@ -92,6 +104,7 @@ class DocumentManager:
         
         Returns True if we should proceed, False if cancelled.
         """
+        self.wait_for_save()
         if not self._is_dirty:
             callback()
             return True
@@ -106,6 +119,7 @@ class DocumentManager:
 
         if reply == QMessageBox.Save:
             self.handle_save()
+            self.wait_for_save()
             if not self._is_dirty:  # Save succeeded
                 callback()
                 return True
@@ -144,7 +158,7 @@ class DocumentManager:
             return
 
         try:
-            self._schema = load(schema_path)
+            self._schema = compile_schema(schema_path).schema
             self._schema_path = schema_path
         except Exception as e:
             QMessageBox.critical(self._parent, "Error", f"Failed to load schema: {e}")
@@ -154,29 +168,13 @@ class DocumentManager:
         self._store = None
         self._processor = None
         self._root_id = None
-        self._document_path = None
+        self._files.attach(None, None)
         self._is_dirty = False
 
         # Show schema structure in tree
-        root_mapping = self._schema.root
-        properties = root_mapping.get("properties", {})
-
-        tree_data = {
-            "Schema Root": [
-                {"type": "section", "key": key, "label": key}
-                for key in properties.keys()
-            ]
-        }
-
-        self._tree_panel.set_tree(tree_data)
+        self._tree_renderer.render_schema_sections(self._schema.root)
         self._right_panel.clear_selection()
-        
-        if self._title_callback:
-            self._title_callback()
-        if self._menu_state_callback:
-            self._menu_state_callback()
-        if self._status_callback:
-            self._status_callback(f"Loaded schema: {schema_path.name}")
+        self._announce(f"Loaded schema: {schema_path.name}")
 
     def handle_new_config(self) -> None:
         """Handle New Config menu action."""
@@ -186,30 +184,15 @@ class DocumentManager:
 
         # Check for dirty document before creating new
         def create_new():
-            self._store = IRStore()
-            self._processor = OperationProcessor(self._store)
-            self._root_id = self._store.create_root(NodeType.OBJECT)
-            self._document_path = None
-            self._is_dirty = False
-
-            # Update components with new state
-            self._ir_builder._store = self._store
-            self._ir_builder._processor = self._processor
-            self._tree_renderer._store = self._store
-            self._tree_renderer.set_root_id(self._root_id)
+            store = PersistentIRStore()
+            store.create_root(NodeType.OBJECT)
+            self._install_document(store, None)
 
             # Build full IR tree from schema root
             self._ir_builder.expand_schema_into_ir(parent_id=self._root_id, schema_node=self._schema.root)
+            self._processor.journal.clear()
 
-            # Render top-level IR nodes in tree
-            self._tree_renderer.render_ir_tree_top_level()
-
-            if self._title_callback:
-                self._title_callback()
-            if self._menu_state_callback:
-                self._menu_state_callback()
-            if self._status_callback:
-                self._status_callback("New config created (schema-expanded).")
+            self._refresh_document("New config created (schema-expanded).")
 
         if self._store:  # Document already open
             self.check_dirty_and_proceed(create_new)
@@ -224,18 +207,15 @@ class DocumentManager:
 
         # Check for dirty document before opening
         def proceed_with_open():
-            file_path, _ = QFileDialog.getOpenFileName(
-                self._parent,
-                "Open Config",
-                "",
-                "YAML Files (*.yaml *.yml);;All Files (*)"
-            )
-
-            if not file_path:
+            opened = self._files.open()
+            if opened is None:
                 return
 
-            # TODO: Load config via adapter and populate IR
-            QMessageBox.information(self._parent, "Not Implemented", "Config loading not yet implemented.")
+            store, path, source, recovered = opened
+            self._install_document(store, path, source)
+            self._is_dirty = recovered > 0
+            suffix = f" (recovered {recovered} unsaved edits)" if recovered else ""
+            self._refresh_document(f"Opened: {path.name}{suffix}")
 
         if self._store:  # Document already open
             self.check_dirty_and_proceed(proceed_with_open)
@@ -244,61 +224,65 @@ class DocumentManager:
 
     def handle_save(self) -> None:
         """Handle Save menu action - direct IR serialization when valid."""
-        if not self._store:
-            return
-
-        # If first save, redirect to Save As
-        if not self._document_path:
-            self.handle_save_as()
-            return
-
-        # Save IR to file via YAML adapter
-        from zeno.adapters.yaml_adapter import serialize
-        root = self._store.get_node(self._root_id)
-        yaml_text = serialize(root, self._store)
-        
-        try:
-            self._document_path.write_text(yaml_text, encoding="utf-8")
-            self._is_dirty = False
-            if self._title_callback:
-                self._title_callback()
-            if self._status_callback:
-                self._status_callback(f"Saved: {self._document_path.name}")
-        except Exception as e:
-            QMessageBox.critical(self._parent, "Save Error", f"Failed to save: {e}")
+        if self._store:
+            # If first save, redirect to Save As
+            self._start_save(self._files.path or self._files.ask_save_path())
 
     def handle_save_as(self) -> None:
         """Handle Save As menu action - direct IR serialization when valid."""
-        if not self._store:
-            return
+        if self._store:
+            self._start_save(self._files.ask_save_path())
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self._parent,
-            "Save Config As",
-            "",
-            "YAML Files (*.yaml *.yml);;All Files (*)"
-        )
+    def wait_for_save(self) -> None:
+        """Block until saves in progress are written and handled (before leaving the document)."""
+        self._files.wait()
 
-        if not file_path:
-            return
+    def _start_save(self, path: Path | None) -> None:
+        if path is not None:
+            self._files.save(path)
+            if self._status_callback:
+                self._status_callback(f"Saving: {path.name}...")
 
-        # Save IR to file via YAML adapter
-        from zeno.adapters.yaml_adapter import serialize
-        root = self._store.get_node(self._root_id)
-        yaml_text = serialize(root, self._store)
-        
-        try:
-            Path(file_path).write_text(yaml_text, encoding="utf-8")
-            self._document_path = Path(file_path)
+    def _saved(self, job: SaveJob, save_as: bool) -> None:
+        """The current document was saved (see DocumentFiles)."""
+        # Edits made while the file was written keep the document dirty.
+        if self._processor.versions.stamp(self._root_id) == job.stamp:
             self._is_dirty = False
-            if self._title_callback:
-                self._title_callback()
-            if self._menu_state_callback:
-                self._menu_state_callback()
-            if self._status_callback:
-                self._status_callback(f"Saved as: {self._document_path.name}")
-        except Exception as e:
-            QMessageBox.critical(self._parent, "Save Error", f"Failed to save: {e}")
+        self._announce(f"Saved as: {job.path.name}" if save_as else f"Saved: {job.path.name}")
+
+    def _reloaded(self, store: IRStore | None, source: SourceMap | None, message: str) -> None:
+        """The file changed on disk (see DocumentFiles); store is None if reloaded in place."""
+        if store is not None:
+            self._install_document(store, self._files.path, source)
+        self._refresh_document(message)
+
+    def _install_document(self, store: IRStore, path: Path | None, source: SourceMap | None = None) -> None:
+        """Make store the active document (its text's spans in source) and point components at it."""
+        self._store = store
+        self._processor = OperationProcessor(store)
+        if self._operation_stats is not None:
+            self._processor.enable_instrumentation(self._operation_stats)
+        self._root_id = store.root_id
+        self._is_dirty = False
+
+        self._ir_builder._store = self._store
+        self._ir_builder._processor = self._processor
+        self._tree_renderer._store = self._store
+        self._tree_renderer.set_root_id(self._root_id)
+        self._files.attach(store, self._processor, path, source)
+
+    def _refresh_document(self, message: str) -> None:
+        self._tree_renderer.render_ir_tree_top_level()
+        self._announce(message)
+
+    def _announce(self, message: str) -> None:
+        """Update title and menu state, then show message in the status bar."""
+        if self._title_callback:
+            self._title_callback()
+        if self._menu_state_callback:
+            self._menu_state_callback()
+        if self._status_callback:
+            self._status_callback(message)
 
     def handle_config_wizard(self) -> None:
         """Handle Config Wizard menu action."""
@@ -0,0 +1,148 @@
+"""Document saves: atomic file writes of snapshots, on a worker thread."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+
+from zeno.adapters.yaml_adapter import serialize_to
+from zeno.adapters.yaml_fragments import FragmentCache
+from zeno.core.operation_log import LogMark, log_path_for, prepare_checkpoint
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.store import IRStore
+
+
+def write_document(path: Path, store: IRStore, fragments: FragmentCache | None = None) -> None:
+    """
+    Stream the IR to path via the YAML adapter (memory flat in document
+    size). With the document's fragment cache, only edited subtrees are
+    re-rendered.
+
+    The text goes to a temporary file next to path, synced to disk and
+    renamed over path, so a failed save leaves the old file intact.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            serialize_to(f, store, store.get_node(store.root_id), fragments=fragments)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class SaveJob:
+    """One save: the document as it was when the save was requested."""
+
+    __slots__ = (
+        "path", "origin", "snapshot", "fragments", "stamp", "log_mark", "checkpoint",
+        "error", "handled", "future",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        origin: IRStore,
+        snapshot: IRStore,
+        fragments: FragmentCache | None,
+        stamp: int,
+        log_mark: LogMark | None,
+    ) -> None:
+        self.path = path
+        # The live store saved from (the document may be replaced meanwhile).
+        self.origin = origin
+        self.snapshot = snapshot
+        self.fragments = fragments
+        # Root version stamp at the snapshot: unchanged means no edits since.
+        self.stamp = stamp
+        # Edit log position at the snapshot; records after it are later edits.
+        self.log_mark = log_mark
+        # Edit log checkpoint of the snapshot, written after the file.
+        self.checkpoint: Path | None = None
+        self.error: Exception | None = None
+        self.handled = False
+        self.future: Future | None = None
+
+
+class DocumentSaver(QObject):
+    """
+    Writes documents on a worker thread, one save at a time in order.
+
+    start() runs on the UI thread and only takes a snapshot of the store
+    (O(1) for PersistentIRStore) and of its version stamps, so the user
+    keeps editing while the file is written and those edits do not reach
+    it. After the file, the worker also writes a checkpoint of the snapshot
+    for the document's edit log (job.checkpoint). finished(job) is emitted on the UI thread when the file is in
+    place or the save failed (job.error).
+    """
+
+    finished = Signal(object)
+    _done = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zeno-save")
+        # Jobs in request order, until their result is handled.
+        self._jobs: list[SaveJob] = []
+        # Queued: delivered by the event loop of this object's (UI) thread.
+        self._done.connect(self._deliver, Qt.QueuedConnection)
+
+    def start(
+        self,
+        path: Path,
+        store: IRStore,
+        processor: OperationProcessor,
+        fragments: FragmentCache | None,
+        log_mark: LogMark | None = None,
+    ) -> SaveJob:
+        """Save store, as it is now (log_mark in its edit log), to path in the background."""
+        versions = processor.versions
+        job = SaveJob(
+            path,
+            store,
+            store.snapshot(),
+            fragments.fork(versions.copy()) if fragments is not None else None,
+            versions.stamp(store.root_id),
+            log_mark,
+        )
+        job.future = self._executor.submit(self._write, job)
+        job.future.add_done_callback(lambda _: self._done.emit(job))
+        self._jobs = [pending for pending in self._jobs if not pending.handled]
+        self._jobs.append(job)
+        return job
+
+    def busy(self) -> bool:
+        """True while a save is written or its result not yet handled."""
+        return any(not job.handled for job in self._jobs)
+
+    def wait(self) -> list[SaveJob]:
+        """Block until every save requested is written; returns those not yet handled, in order."""
+        jobs = [job for job in self._jobs if not job.handled]
+        for job in jobs:
+            job.future.result()
+        self._jobs = jobs
+        return jobs
+
+    def _write(self, job: SaveJob) -> None:
+        try:
+            write_document(job.path, job.snapshot, job.fragments)
+        except Exception as e:
+            job.error = e
+            return
+        try:
+            job.checkpoint = prepare_checkpoint(log_path_for(job.path), job.snapshot)
+        except OSError:
+            pass  # the edit log keeps its older checkpoint, or starts from the live document
+
+    @Slot(object)
+    def _deliver(self, job: SaveJob) -> None:
+        if not job.handled:
+            self.finished.emit(job)
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from uuid import UUID
-
-from zeno.core.types import NodeType
+from zeno.core.types import NodeId, NodeType
 from zeno.core.operation import Operation
 
 
@@ -16,7 +14,7 @@ class IRBuilder:
         self._store = store
         self._processor = processor
 
-    def expand_schema_into_ir(self, *, parent_id: UUID, schema_node: dict) -> None:
+    def expand_schema_into_ir(self, *, parent_id: NodeId, schema_node: dict) -> None:
         """
         Deterministic schema → IR expansion.
 
@@ -24,66 +22,74 @@ class IRBuilder:
         - object: create children for each property
         - array: create LIST node but DO NOT create items (empty list)
         - scalar (string/integer/bool/...): create SCALAR node with value=None
+
+        Applied as one batch: if any node cannot be added, none are.
         """
         if not self._processor or not self._store:
             return
 
-        node_type = schema_node.get("type")
+        ops = self.expansion_operations(parent_id=parent_id, schema_node=schema_node)
+        if ops:
+            self._processor.apply_batch(ops)
 
-        # Only objects have 'properties' in our schema
-        if node_type != "object":
-            return
+    def expansion_operations(self, *, parent_id: NodeId, schema_node: dict) -> list[Operation]:
+        """Build the add_node operations for expand_schema_into_ir without applying them."""
+        ops: list[Operation] = []
+        pending = [(parent_id, schema_node)]
 
-        props = schema_node.get("properties", {})
-        if not isinstance(props, dict):
-            return
+        while pending:
+            target_id, target_schema = pending.pop()
 
-        for prop_key, prop_schema in props.items():
-            if not isinstance(prop_schema, dict):
+            # Only objects have 'properties' in our schema
+            if target_schema.get("type") != "object":
                 continue
 
-            t = prop_schema.get("type")
-
-            if t == "object":
-                child_type = NodeType.OBJECT
-            elif t == "array":
-                child_type = NodeType.LIST
-            else:
-                # string/integer/bool/unknown => scalar node
-                child_type = NodeType.SCALAR
-
-            op = Operation.create(
-                operation_type="add_node",
-                target_node_id=None,
-                payload={
-                    "parent_id": parent_id,
-                    "node_type": child_type,
-                    "key": prop_key,
-                },
-            )
-            self._processor.apply(op)
-
-            # Find the newly created child by key (object children enforce unique key)
-            child_id = self.find_object_child_id(parent_id, prop_key)
-            if child_id is None:
+            props = target_schema.get("properties", {})
+            if not isinstance(props, dict):
                 continue
 
-            # Recurse only for objects; arrays remain empty; scalars stop
-            if t == "object":
-                self.expand_schema_into_ir(parent_id=child_id, schema_node=prop_schema)
-
-    def find_object_child_id(self, parent_id: UUID, key: str) -> UUID | None:
+            for prop_key, prop_schema in props.items():
+                if not isinstance(prop_schema, dict):
+                    continue
+
+                t = prop_schema.get("type")
+
+                if t == "object":
+                    child_type = NodeType.OBJECT
+                elif t == "array":
+                    child_type = NodeType.LIST
+                else:
+                    # string/integer/bool/unknown => scalar node
+                    child_type = NodeType.SCALAR
+
+                # Reserve the id so nested properties can target this node.
+                child_id = self._store.allocate_id()
+                ops.append(
+                    Operation.create(
+                        operation_type="add_node",
+                        target_node_id=None,
+                        payload={
+                            "parent_id": target_id,
+                            "node_type": child_type,
+                            "key": prop_key,
+                            "node_id": child_id,
+                        },
+                    )
+                )
+
+                # Descend only into objects; arrays remain empty; scalars stop
+                if t == "object":
+                    pending.append((child_id, prop_schema))
+
+        return ops
+
+    def find_object_child_id(self, parent_id: NodeId, key: str) -> NodeId | None:
         """Find child node ID by key in an OBJECT node."""
         if not self._store:
             return None
-        parent = self._store.get_node(parent_id)
-        for cid in parent.children:
-            c = self._store.get_node(cid)
-            if c.key == key:
-                return cid
-        return None
-
-    def get_array_item_count(self, node_id: UUID) -> int:
+        return self._store.get_child_by_key(parent_id, key)
+
+    def get_array_item_count(self, node_id: NodeId) -> int:
         """Get current number of items in a LIST node."""
         if not self._store:
             return 0
@@ -92,7 +98,7 @@ class IRBuilder:
             return len(node.children)
         return 0
 
-    def get_object_property_count(self, node_id: UUID) -> int:
+    def get_object_property_count(self, node_id: NodeId) -> int:
         """Get current number of properties in an OBJECT node."""
         if not self._store:
             return 0
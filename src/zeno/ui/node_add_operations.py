@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from uuid import UUID
-
 from PySide6.QtWidgets import QMessageBox, QInputDialog
 
-from zeno.core.types import NodeType
+from zeno.core.types import NodeId, NodeType, parse_node_id
 from zeno.core.operation import Operation
 
 
@@ -46,13 +44,8 @@ class NodeAddOperations:
             QMessageBox.warning(self._parent, "Warning", "No active configuration.")
             return
 
-        parent_id_str = parent_meta.get("node_id")
-        if not parent_id_str:
-            return
-
-        try:
-            parent_id = UUID(parent_id_str)
-        except Exception:
+        parent_id = parse_node_id(parent_meta.get("node_id"))
+        if parent_id is None:
             return
 
         parent = self._store.get_node(parent_id)
@@ -67,7 +60,7 @@ class NodeAddOperations:
         else:
             QMessageBox.warning(self._parent, "Warning", "Cannot add children to scalar nodes.")
 
-    def add_list_item(self, parent_id: UUID, parent_meta: dict) -> None:
+    def add_list_item(self, parent_id: NodeId, parent_meta: dict) -> None:
         """Add an item to a LIST node based on schema."""
         if not self._processor:
             return
@@ -103,25 +96,28 @@ class NodeAddOperations:
         else:
             item_type = NodeType.SCALAR
         
-        op = Operation.create(
-            operation_type="add_node",
-            target_node_id=None,
-            payload={
-                "parent_id": parent_id,
-                "node_type": item_type,
-                "key": None,  # LIST items don't have keys
-            },
-        )
+        new_child_id = self._store.allocate_id()
+        ops = [
+            Operation.create(
+                operation_type="add_node",
+                target_node_id=None,
+                payload={
+                    "parent_id": parent_id,
+                    "node_type": item_type,
+                    "key": None,  # LIST items don't have keys
+                    "node_id": new_child_id,
+                },
+            )
+        ]
+        
+        # If it's an object, expand it according to schema (same batch)
+        if item_type == NodeType.OBJECT:
+            ops.extend(
+                self._ir_builder.expansion_operations(parent_id=new_child_id, schema_node=item_schema)
+            )
         
         try:
-            self._processor.apply(op)
-            
-            # If it's an object, expand it according to schema
-            if item_type == NodeType.OBJECT:
-                # Find the newly added child
-                parent = self._store.get_node(parent_id)
-                new_child_id = parent.children[-1]  # Last added
-                self._ir_builder.expand_schema_into_ir(parent_id=new_child_id, schema_node=item_schema)
+            self._processor.apply_batch(ops)
             
             if self._dirty_callback:
                 self._dirty_callback(True)
@@ -131,15 +127,11 @@ class NodeAddOperations:
         except Exception as e:
             QMessageBox.critical(self._parent, "Error", f"Failed to add item: {e}")
 
-    def add_object_property(self, parent_id: UUID, parent_meta: dict) -> None:
+    def add_object_property(self, parent_id: NodeId, parent_meta: dict) -> None:
         """Add a property to an OBJECT node, showing only available schema properties."""
         if not self._processor:
             return
         
-        # Get current children keys
-        parent = self._store.get_node(parent_id)
-        existing_keys = {self._store.get_node(cid).key for cid in parent.children}
-        
         # Get schema for this object to determine available properties
         schema_path = parent_meta.get("schema_path", "")
         object_schema = self._schema_manager.resolve_object_schema(schema_path)
@@ -150,7 +142,10 @@ class NodeAddOperations:
         
         # Get available properties
         schema_properties = object_schema.get("properties", {})
-        available_properties = [key for key in schema_properties.keys() if key not in existing_keys]
+        available_properties = [
+            key for key in schema_properties.keys()
+            if self._store.get_child_by_key(parent_id, key) is None
+        ]
         
         if not available_properties:
             QMessageBox.information(
@@ -185,23 +180,28 @@ class NodeAddOperations:
         else:
             node_type = NodeType.SCALAR
         
-        op = Operation.create(
-            operation_type="add_node",
-            target_node_id=None,
-            payload={
-                "parent_id": parent_id,
-                "node_type": node_type,
-                "key": property_key,
-            },
-        )
+        child_id = self._store.allocate_id()
+        ops = [
+            Operation.create(
+                operation_type="add_node",
+                target_node_id=None,
+                payload={
+                    "parent_id": parent_id,
+                    "node_type": node_type,
+                    "key": property_key,
+                    "node_id": child_id,
+                },
+            )
+        ]
+        
+        # Expand objects according to schema (same batch)
+        if node_type == NodeType.OBJECT:
+            ops.extend(
+                self._ir_builder.expansion_operations(parent_id=child_id, schema_node=prop_schema)
+            )
         
         try:
-            self._processor.apply(op)
-            
-            # Find the newly created child and expand if it's an object
-            child_id = self._ir_builder.find_object_child_id(parent_id, property_key)
-            if child_id and node_type == NodeType.OBJECT:
-                self._ir_builder.expand_schema_into_ir(parent_id=child_id, schema_node=prop_schema)
+            self._processor.apply_batch(ops)
             
             if self._dirty_callback:
                 self._dirty_callback(True)
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from uuid import UUID
-
 from PySide6.QtWidgets import QMessageBox, QInputDialog
 
-from zeno.core.types import NodeType
+from zeno.core.types import NodeId, NodeType, parse_node_id
 from zeno.core.operation import Operation
+from zeno.ui.schema_manager import parent_path
 
 
 class NodeEditOperations:
@@ -31,7 +30,7 @@ class NodeEditOperations:
         self._dirty_callback = None
         self._status_callback = None
 
-    def set_root_id(self, root_id: UUID | None) -> None:
+    def set_root_id(self, root_id: NodeId | None) -> None:
         """Set the current IR root node ID."""
         self._root_id = root_id
 
@@ -49,13 +48,8 @@ class NodeEditOperations:
             QMessageBox.warning(self._parent, "Warning", "No active configuration.")
             return
 
-        node_id_str = node_meta.get("node_id")
-        if not node_id_str:
-            return
-
-        try:
-            node_id = UUID(node_id_str)
-        except Exception:
+        node_id = parse_node_id(node_meta.get("node_id"))
+        if node_id is None:
             return
 
         # Safety check: don't allow removing top-level children of root
@@ -74,12 +68,7 @@ class NodeEditOperations:
             
             # If parent is OBJECT and this property is required, block removal
             if parent.type == NodeType.OBJECT:
-                parent_schema_path = node_meta.get("schema_path", "")
-                # Get parent's schema path by removing the last segment
-                parent_schema_parts = parent_schema_path.split(".")
-                if parent_schema_parts and parent_schema_parts[-1]:
-                    parent_schema_parts = parent_schema_parts[:-1]
-                parent_schema_path = ".".join(parent_schema_parts)
+                parent_schema_path = parent_path(node_meta.get("schema_path", ""))
                 
                 prop_name = node.key
                 if prop_name and self._schema_manager.is_property_required(parent_schema_path, prop_name):
@@ -92,12 +81,7 @@ class NodeEditOperations:
             
             # If parent is LIST, check min_items constraint
             elif parent.type == NodeType.LIST:
-                parent_schema_path = node_meta.get("schema_path", "")
-                # Get parent's schema path by removing the last segment
-                parent_schema_parts = parent_schema_path.split(".")
-                if parent_schema_parts and parent_schema_parts[-1]:
-                    parent_schema_parts = parent_schema_parts[:-1]
-                parent_schema_path = ".".join(parent_schema_parts)
+                parent_schema_path = parent_path(node_meta.get("schema_path", ""))
                 
                 constraints = self._schema_manager.get_array_constraints(parent_schema_path)
                 min_items = constraints.get("min_items")
@@ -149,13 +133,8 @@ class NodeEditOperations:
         meta = move_data.get("meta", {})
         direction = move_data.get("direction")
         
-        node_id_str = meta.get("node_id")
-        if not node_id_str or not direction:
-            return
-
-        try:
-            node_id = UUID(node_id_str)
-        except Exception:
+        node_id = parse_node_id(meta.get("node_id"))
+        if node_id is None or not direction:
             return
 
         op = Operation.create(
@@ -187,13 +166,8 @@ class NodeEditOperations:
             QMessageBox.warning(self._parent, "Warning", "No active configuration.")
             return
 
-        node_id_str = meta.get("node_id")
-        if not node_id_str:
-            return
-
-        try:
-            node_id = UUID(node_id_str)
-        except Exception:
+        node_id = parse_node_id(meta.get("node_id"))
+        if node_id is None:
             return
 
         node = self._store.get_node(node_id)
@@ -223,6 +197,8 @@ class NodeEditOperations:
         
         try:
             self._processor.apply(op)
+            # A value committed from the dialog is one undo step of its own.
+            self._processor.journal.seal()
             if self._dirty_callback:
                 self._dirty_callback(True)
             self._tree_renderer.render_ir_tree_top_level()
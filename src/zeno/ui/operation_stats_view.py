@@ -0,0 +1,45 @@
+"""Status bar readout of operation latency statistics (--stats / ZENO_STATS=1)."""
+
+from __future__ import annotations
+
+import html
+import os
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QLabel
+
+from zeno.core.operation_stats import OperationStats, format_stats
+
+
+class OperationStatsLabel(QLabel):
+    """Permanent status bar widget: one-line summary, full table as tooltip."""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, stats: OperationStats, parent=None):
+        super().__init__(parent)
+        self._stats = stats
+
+        # Poll rather than hook every operation: keeps edits free of UI work.
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(self.REFRESH_MS)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Show the current summary and per-operation table."""
+        self.setText(self._stats.summary())
+        self.setToolTip(f"<pre>{html.escape(format_stats(self._stats.stats()))}</pre>")
+
+
+def stats_requested(argv: list[str]) -> bool:
+    """True if operation statistics were asked for on the command line or environment."""
+    return "--stats" in argv or os.environ.get("ZENO_STATS", "") not in ("", "0")
+
+
+def install_operation_stats(window, document_manager) -> OperationStats:
+    """Instrument documents opened by document_manager and show stats in window's status bar."""
+    stats = OperationStats()
+    document_manager.set_operation_stats(stats)
+    window.statusBar().addPermanentWidget(OperationStatsLabel(stats, window))
+    return stats
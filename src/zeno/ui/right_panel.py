@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Optional
-from uuid import UUID
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
@@ -17,12 +16,14 @@ from PySide6.QtWidgets import (
     QTextEdit,
 )
 
+from zeno.core.types import NodeId
+
 
 @dataclass
 class ScalarBinding:
     """Editable scalar binding for model projection rendering."""
 
-    node_id: UUID
+    node_id: NodeId
     key: str
     node_type: str
     value: Any
@@ -2,79 +2,105 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+
+# Suffix of an array's item path: "listeners" -> "listeners[]".
+ITEMS = "[]"
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaEntry:
+    """One schema node with the constraints queried while editing."""
+
+    node: Mapping[str, Any]
+    # Property names required by the object's "required" list or their own "required: true".
+    required: frozenset
+    min_items: int | None
+    max_items: int | None
+
+
+_EMPTY = SchemaEntry({}, frozenset(), None, None)
+
+
+def child_path(schema_path: str, key: str | None) -> str:
+    """Canonical path of a child: a property by key, an array item when key is None."""
+    if key is None:
+        return schema_path + ITEMS
+    return f"{schema_path}.{key}" if schema_path else key
+
+
+def parent_path(schema_path: str) -> str:
+    """Canonical path of the object or array containing schema_path."""
+    if schema_path.endswith(ITEMS):
+        return schema_path[: -len(ITEMS)]
+    # Keys always follow a "." except at the top: "a[].b" -> "a[]", "b" -> "".
+    return schema_path[: max(schema_path.rfind("."), 0)]
+
+
+def build_index(root: Mapping[str, Any]) -> dict[str, SchemaEntry]:
+    """
+    Every schema node by canonical path, walked once.
+
+    Paths are property keys joined with "." and "[]" for array items:
+    "" is the root, "listeners" an array property, "listeners[].port"
+    a property of its items.
+    """
+    index: dict[str, SchemaEntry] = {}
+    stack: list[tuple[str, Any]] = [("", root)]
+    while stack:
+        path, node = stack.pop()
+        if not isinstance(node, Mapping):
+            continue
+        properties = node.get("properties")
+        properties = properties if isinstance(properties, Mapping) else {}
+        required = node.get("required")
+        names = set(required) if isinstance(required, list) else set()
+        names.update(
+            key for key, prop in properties.items()
+            if isinstance(prop, Mapping) and prop.get("required") is True
+        )
+        index[path] = SchemaEntry(node, frozenset(names), node.get("min_items"), node.get("max_items"))
+        for key, prop in properties.items():
+            stack.append((child_path(path, key), prop))
+        if "items" in node:
+            stack.append((child_path(path, None), node["items"]))
+    return index
+
 
 class SchemaManager:
     """Manages schema resolution and constraint queries."""
 
     def __init__(self, schema=None):
         """Initialize with optional schema."""
-        self._schema = schema
+        self.set_schema(schema)
 
     def set_schema(self, schema) -> None:
-        """Update the active schema."""
+        """Update the active schema and index its nodes by canonical path."""
         self._schema = schema
+        self._index = build_index(schema.root) if schema else {}
 
     def resolve_object_schema(self, schema_path: str) -> dict:
         """Resolve schema definition for an object at given path."""
-        if not self._schema:
-            return {}
-        
-        if not schema_path:
-            return self._schema.root
-        
-        schema_node = self._schema.root
-        parts = schema_path.split(".")
-        
-        for part in parts:
-            if not isinstance(schema_node, dict):
-                return {}
-            
-            # Navigate through properties
-            props = schema_node.get("properties", {})
-            if part not in props:
-                # Might be array item, check items
-                items = schema_node.get("items", {})
-                if isinstance(items, dict):
-                    schema_node = items
-                    continue
-                return {}
-            
-            schema_node = props[part]
-        
-        return schema_node if isinstance(schema_node, dict) else {}
+        return self._index.get(schema_path, _EMPTY).node
 
     def resolve_list_item_schema(self, schema_path: str) -> dict:
         """Resolve schema definition for items in a list at given path."""
-        object_schema = self.resolve_object_schema(schema_path)
-        return object_schema.get("items", {})
+        return self._index.get(schema_path + ITEMS, _EMPTY).node
 
     def get_array_constraints(self, schema_path: str) -> dict:
         """Get min_items and max_items for an array at given path."""
-        schema = self.resolve_object_schema(schema_path)
+        entry = self._index.get(schema_path, _EMPTY)
         return {
-            "min_items": schema.get("min_items"),
-            "max_items": schema.get("max_items"),
+            "min_items": entry.min_items,
+            "max_items": entry.max_items,
         }
 
     def get_required_properties(self, schema_path: str) -> set:
         """Get set of required property names for an object at given path."""
-        schema = self.resolve_object_schema(schema_path)
-        # Some schemas may use 'required' field listing required property names
-        return set(schema.get("required", []))
+        return set(self._index.get(schema_path, _EMPTY).required)
 
     def is_property_required(self, object_schema_path: str, property_name: str) -> bool:
         """Check if a specific property is marked as required."""
-        if not self._schema:
-            return False
-        
-        schema = self.resolve_object_schema(object_schema_path)
-        props = schema.get("properties", {})
-        prop_schema = props.get(property_name, {})
-        
-        # Check per-property required flag
-        if prop_schema.get("required") is True:
-            return True
-        
-        # Or check if it's in the object's required list
-        required_list = schema.get("required", [])
-        return property_name in required_list
+        return property_name in self._index.get(object_schema_path, _EMPTY).required
@@ -143,8 +143,8 @@ class TreePanel(QWidget):
 
         if kind == "node":
             node_id = meta.get("node_id")
-            if isinstance(node_id, str) and node_id:
-                return ("node_id", node_id)
+            if node_id is not None and node_id != "":
+                return ("node_id", str(node_id))
 
             schema_path = meta.get("schema_path")
             if isinstance(schema_path, str) and schema_path:
@@ -203,7 +203,7 @@ class TreePanel(QWidget):
         
         # Check if this node itself has an error
         meta = item.data(0, Qt.UserRole) or {}
-        node_id = meta.get("node_id", "")
+        node_id = str(meta.get("node_id", ""))
         if node_id in self._error_nodes:
             # Direct error - bright red
             item.setForeground(0, QBrush(QColor(220, 20, 20)))
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from uuid import UUID
-
-from zeno.core.types import NodeType
+from zeno.core.types import NodeId, NodeType, parse_node_id
 from zeno.ui.right_panel import ScalarBinding
+from zeno.ui.schema_manager import child_path
 
 
 class TreeRenderer:
@@ -19,7 +18,7 @@ class TreeRenderer:
         self._schema_provider = schema_provider
         self._root_id = None
 
-    def set_root_id(self, root_id: UUID | None) -> None:
+    def set_root_id(self, root_id: NodeId | None) -> None:
         """Set the current IR root node ID."""
         self._root_id = root_id
 
@@ -29,65 +28,58 @@ class TreeRenderer:
             return
 
         root = self._store.get_node(self._root_id)
-        children = []
-        for cid in root.children:
-            child_data = self._build_tree_node_recursive(cid)
-            if child_data:
-                children.append(child_data)
+        children: list[dict] = []
+        # Explicit stack of (node_id, parent schema path, sibling list to append to).
+        stack = [(cid, "", children) for cid in reversed(root.children)]
+        while stack:
+            node_id, schema_path, siblings = stack.pop()
+            node_data = self._build_tree_node(node_id, schema_path)
+            siblings.append(node_data)
+            child_ids = self._store.get_node(node_id).children
+            if child_ids:
+                node_data["children"] = []
+                stack.extend(
+                    (child_id, node_data["schema_path"], node_data["children"])
+                    for child_id in reversed(child_ids)
+                )
 
         self._tree_panel.set_tree({"Config Root": children})
 
-    def _build_tree_node_recursive(self, node_id: UUID, schema_path: str = "") -> dict:
-        """Build tree node data with full recursive structure and schema path."""
-        if not self._store:
-            return {}
-
+    def render_schema_sections(self, schema_root: dict) -> None:
+        """Render the top-level sections of a schema (no document open)."""
+        properties = schema_root.get("properties", {})
+        self._tree_panel.set_tree({
+            "Schema Root": [
+                {"type": "section", "key": key, "label": key}
+                for key in properties.keys()
+            ]
+        })
+
+    def _build_tree_node(self, node_id: NodeId, schema_path: str = "") -> dict:
+        """Build one tree node's data (without children) and its schema path."""
         node = self._store.get_node(node_id)
         label = node.key or f"[{node.type.name}]"
 
-        if node.key and schema_path:
-            current_schema_path = f"{schema_path}.{node.key}"
-        elif node.key:
-            current_schema_path = node.key
-        else:
-            current_schema_path = schema_path
-
-        node_data = {
+        return {
             "type": node.type.value,
             "key": label,
             "label": label,
-            "node_id": str(node_id),
-            "schema_path": current_schema_path,
+            "node_id": node_id,
+            "schema_path": child_path(schema_path, node.key),
         }
 
-        if node.children:
-            children = []
-            for child_id in node.children:
-                child_data = self._build_tree_node_recursive(child_id, current_schema_path)
-                if child_data:
-                    children.append(child_data)
-            if children:
-                node_data["children"] = children
-
-        return node_data
-
     def handle_node_selection(self, meta: dict, status_callback) -> None:
         """Render selected node's Model projection (structured, line-numbered view)."""
         key = meta.get("key", "")
         status_callback(f"Selected: {key}")
 
-        node_id_str = meta.get("node_id")
-        if not node_id_str or not self._store:
+        nid = parse_node_id(meta.get("node_id"))
+        if nid is None or not self._store:
             schema = self._schema_provider()
             if schema and key:
                 self._render_schema_surface(key, schema)
             return
 
-        try:
-            nid = UUID(node_id_str)
-        except Exception:
-            return
-
         if not self._store.has_node(nid):
             return
 
@@ -101,7 +93,7 @@ class TreeRenderer:
         elif node.type == NodeType.OBJECT:
             self._render_object_surface(nid, node, schema_path)
 
-    def _render_scalar_surface(self, nid: UUID, node, schema_path: str) -> None:
+    def _render_scalar_surface(self, nid: NodeId, node, schema_path: str) -> None:
         """Render single scalar value as model projection."""
         lines: list[str] = []
         bindings: list[ScalarBinding] = []
@@ -138,7 +130,7 @@ class TreeRenderer:
             model_text=model_text,
         )
 
-    def _render_list_surface(self, nid: UUID, node, schema_path: str) -> None:
+    def _render_list_surface(self, nid: NodeId, node, schema_path: str) -> None:
         """Render LIST node as structured model projection."""
         lines: list[str] = []
         bindings: list[ScalarBinding] = []
@@ -169,7 +161,7 @@ class TreeRenderer:
             model_text=model_text,
         )
 
-    def _render_object_surface(self, nid: UUID, node, schema_path: str) -> None:
+    def _render_object_surface(self, nid: NodeId, node, schema_path: str) -> None:
         """Render OBJECT node as structured model projection."""
         lines: list[str] = []
         bindings: list[ScalarBinding] = []
@@ -199,7 +191,7 @@ class TreeRenderer:
 
     def _append_child_lines(
         self,
-        child_id: UUID,
+        child_id: NodeId,
         lines: list[str],
         bindings: list[ScalarBinding],
         line_spans: dict[str, tuple[int, int]],
@@ -212,7 +204,7 @@ class TreeRenderer:
         child_node = self._store.get_node(child_id)
         node_id_str = str(child_id)
 
-        child_schema_path = f"{parent_schema_path}.{child_node.key}" if child_node.key else parent_schema_path
+        child_schema_path = child_path(parent_schema_path, child_node.key)
 
         if child_node.type == NodeType.SCALAR:
             key = child_node.key or "value"
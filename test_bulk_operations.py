@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Test the table-driven operation dispatch and bulk operation types.
+
+Tests that:
+1. move_node to an index and reorder_list permute LIST items and invert exactly
+2. clone_subtree and replace_subtree build whole subtrees in one operation;
+   clones keep metadata on every backend; a bad replacement changes nothing
+3. Batches preflight the new types; processors accept custom handlers
+4. Bulk operations survive the edit log (ids replay identically)
+"""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from zeno.core.types import NodeType
+from zeno.core.node import Node
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.operation_handlers import HANDLERS
+from zeno.core.operation_log import OperationLog, recover
+from zeno.core.batch_check import BatchError
+from zeno.core.snapshot_file import load_snapshot, save_snapshot
+from zeno.adapters.yaml_adapter import serialize, parse
+
+
+BACKENDS = (IRStore, ColumnarIRStore, PersistentIRStore)
+
+SAMPLE_YAML = """
+name: gateway
+listeners:
+- port: 501
+- port: 502
+- port: 503
+- port: 504
+limits:
+  rate: 1.5
+"""
+
+
+def _load(backend=IRStore):
+    store = backend()
+    store.create_root(NodeType.OBJECT)
+    parse(SAMPLE_YAML, store)
+    return store, OperationProcessor(store)
+
+
+def _text(store):
+    return serialize(store.get_node(store.root_id), store)
+
+
+def _ports(store):
+    listeners_id = store.get_child_by_key(store.root_id, "listeners")
+    return [
+        store.get_node(store.get_child_by_key(item_id, "port")).value
+        for item_id in store.iter_children(listeners_id)
+    ]
+
+
+def _op(kind, node_id, **payload):
+    return Operation.create(kind, node_id, {"node_id": node_id, **payload})
+
+
+def test_move_to_index_and_reorder():
+    """Test index moves and permutations on every backend, with undo."""
+    for backend in BACKENDS:
+        store, processor = _load(backend)
+        listeners_id = store.get_child_by_key(store.root_id, "listeners")
+        first_id = next(store.iter_children(listeners_id))
+        before = _text(store)
+
+        processor.apply(_op("move_node", first_id, index=3))
+        assert _ports(store) == [502, 503, 504, 501]
+        processor.apply(_op("reorder_list", listeners_id, order=[3, 2, 1, 0]))
+        assert _ports(store) == [501, 504, 503, 502]
+
+        processor.undo()
+        assert _ports(store) == [502, 503, 504, 501]
+        processor.undo()
+        assert _text(store) == before
+
+        for bad in ([0, 1, 2], [0, 0, 1, 2]):
+            try:
+                processor.apply(_op("reorder_list", listeners_id, order=bad))
+                assert False, "Should reject a non-permutation"
+            except ValueError:
+                pass
+        try:
+            processor.apply(_op("move_node", first_id, index=4))
+            assert False, "Should reject out-of-range index"
+        except ValueError:
+            pass
+        assert _text(store) == before
+    print("✓ Move to index and reorder: PASSED")
+
+
+def test_clone_and_replace():
+    """Test deep copy and in-place replacement from plain data, with undo/redo."""
+    store, processor = _load()
+    root_id = store.root_id
+    listeners_id = store.get_child_by_key(root_id, "listeners")
+    limits_id = store.get_child_by_key(root_id, "limits")
+    before = _text(store)
+
+    processor.apply(Operation.create("clone_subtree", limits_id, {
+        "node_id": limits_id, "parent_id": root_id, "key": "backup",
+    }))
+    backup_id = store.get_child_by_key(root_id, "backup")
+    assert store.get_node(store.get_child_by_key(backup_id, "rate")).value == 1.5
+
+    processor.apply(Operation.create("clone_subtree", listeners_id, {
+        "node_id": listeners_id, "parent_id": listeners_id, "index": 0,
+    }))
+    assert store.child_count(listeners_id) == 5
+    assert store.get_node(next(store.iter_children(listeners_id))).type == NodeType.LIST
+
+    processor.apply(_op("replace_subtree", limits_id, data={"rate": 2, "burst": [1, 2]}))
+    assert not store.has_node(limits_id)
+    limits_id = store.get_child_by_key(root_id, "limits")
+    assert list(store.get_node(limits_id).children) == [
+        store.get_child_by_key(limits_id, "rate"), store.get_child_by_key(limits_id, "burst"),
+    ]
+    after, node_count = _text(store), len(store)
+
+    for _ in range(3):
+        processor.undo()
+    assert _text(store) == before
+    for _ in range(3):
+        processor.redo()
+    assert _text(store) == after
+
+    try:
+        processor.apply(_op("replace_subtree", root_id, data={}))
+        assert False, "Should reject replacing the root"
+    except ValueError:
+        pass
+    try:
+        processor.apply(Operation.create("clone_subtree", limits_id, {
+            "node_id": limits_id, "parent_id": root_id, "key": "name",
+        }))
+        assert False, "Should reject duplicate key"
+    except ValueError:
+        pass
+    for data in ({"rate": 1, None: 2}, {"rate": [{"a": 1}, {None: [1]}]}):
+        try:
+            processor.apply(_op("replace_subtree", limits_id, data=data))
+            assert False, "Should reject a None key before touching the document"
+        except ValueError:
+            pass
+    assert _text(store) == after and len(store) == node_count
+    print("✓ Clone and replace: PASSED")
+
+
+def test_clone_on_every_backend():
+    """Test clone_subtree copies values and metadata on every store, with undo."""
+    with tempfile.TemporaryDirectory() as tmp:
+        mapped_path = Path(tmp) / "config.zsnap"
+        save_snapshot(_load()[0], mapped_path)
+        stores = [_load(backend)[0] for backend in BACKENDS] + [load_snapshot(mapped_path)]
+        for store in stores:
+            processor = OperationProcessor(store)
+            root_id = store.root_id
+            limits_id = store.get_child_by_key(root_id, "limits")
+            note = Node(id=None, type=NodeType.SCALAR, value=10, metadata={"comment": "burst"})
+            store.add_unlinked_node(note)
+            store.link_child(parent_id=limits_id, child_id=note.id, key="burst")
+            before = _text(store)
+
+            processor.apply(Operation.create("clone_subtree", limits_id, {
+                "node_id": limits_id, "parent_id": root_id, "key": "backup",
+            }))
+            backup_id = store.get_child_by_key(root_id, "backup")
+            copy_id = store.get_child_by_key(backup_id, "burst")
+            assert copy_id != note.id and store.get_node(copy_id).value == 10
+            assert store.get_node(copy_id).get_metadata("comment") == "burst"
+            store.get_node(copy_id).metadata["comment"] = "changed"
+            assert store.get_node(note.id).get_metadata("comment") == "burst"
+
+            processor.undo()
+            assert _text(store) == before and not store.has_node(copy_id)
+    print("✓ Clone on every backend: PASSED")
+
+
+def test_batch_and_custom_handler():
+    """Test preflight of bulk types and per-processor handler registration."""
+    store, processor = _load()
+    root_id = store.root_id
+    limits_id = store.get_child_by_key(root_id, "limits")
+    before = _text(store)
+
+    try:
+        processor.apply_batch([
+            _op("replace_subtree", limits_id, data={"rate": 3}),
+            _op("update_scalar", limits_id, value=1),
+        ])
+        assert False, "Should reject an edit of the replaced node"
+    except BatchError as e:
+        assert e.index == 1
+    assert _text(store) == before
+
+    copy_id = store.allocate_id()
+    processor.apply_batch([
+        Operation.create("clone_subtree", limits_id, {
+            "node_id": limits_id, "parent_id": root_id, "key": "copy", "new_id": copy_id,
+        }),
+        _op("remove_node", copy_id),
+    ])
+    assert _text(store) == before
+
+    def rename(store, operation):
+        node_id = operation.payload["node_id"]
+        old = store.get_node(node_id).value
+        store.set_value(node_id, old.upper())
+        return Operation.create("update_scalar", node_id, {"node_id": node_id, "value": old})
+
+    processor.register_handler("uppercase", rename)
+    assert "uppercase" not in HANDLERS
+    name_id = store.get_child_by_key(root_id, "name")
+    processor.apply_batch([_op("uppercase", name_id)])
+    assert store.get_node(name_id).value == "GATEWAY"
+    processor.undo()
+    assert store.get_node(name_id).value == "gateway"
+
+    try:
+        OperationProcessor(store).apply(_op("uppercase", name_id))
+        assert False, "Other processors should not see the handler"
+    except NotImplementedError:
+        pass
+    print("✓ Batch and custom handler: PASSED")
+
+
+def test_bulk_operations_in_log():
+    """Test that recovery replays bulk operations to identical ids and text."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "config.yaml.zwal"
+        store, processor = _load()
+        log = OperationLog(path, store)
+        log.attach(processor)
+
+        root_id = store.root_id
+        listeners_id = store.get_child_by_key(root_id, "listeners")
+        limits_id = store.get_child_by_key(root_id, "limits")
+        store.allocate_id()  # an unused handle: replay must not depend on the allocator
+        processor.apply(_op("reorder_list", listeners_id, order=[1, 0, 3, 2]))
+        processor.apply(Operation.create("clone_subtree", limits_id, {
+            "node_id": limits_id, "parent_id": root_id, "key": "backup",
+        }))
+        processor.apply(_op("replace_subtree", limits_id, data={
+            "since": date(2024, 5, 1), "ids": [1, 2], 7: "seven", date(2024, 6, 1): "dated",
+        }))
+        processor.undo()
+        processor.redo()
+        log.close()
+
+        recovered, replayed = recover(path)
+        assert replayed == 5
+        assert _text(recovered) == _text(store)
+        assert sorted(recovered.iter_node_ids()) == sorted(store.iter_node_ids())
+
+        # Non-string keys also survive a checkpoint
+        log = OperationLog(path, store)
+        log.checkpoint()
+        log.close()
+        recovered, replayed = recover(path)
+        assert replayed == 0 and _text(recovered) == _text(store)
+        limits_id = recovered.get_child_by_key(root_id, "limits")
+        assert recovered.get_child_by_key(limits_id, 7) is not None
+    print("✓ Bulk operations in log: PASSED")
+
+
+if __name__ == "__main__":
+    test_move_to_index_and_reorder()
+    test_clone_and_replace()
+    test_clone_on_every_backend()
+    test_batch_and_custom_handler()
+    test_bulk_operations_in_log()
+    print("\n✅ All bulk operation tests PASSED!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test ChildList, the chunked children sequence for large containers.
+
+Tests that:
+1. ChildList matches plain list behaviour under random edits
+2. IRStore promotes long LIST children and keeps order through
+   unlink, move and index lookups
+"""
+
+import random
+
+from zeno.core.child_list import CHILD_LIST_THRESHOLD, CHUNK_MAX, ChildList
+from zeno.core.node import Node
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+
+
+def test_child_list_matches_list():
+    """Test random insert/remove/pop/index against a reference list."""
+    rng = random.Random(6)
+    ref = list(range(1, CHUNK_MAX * 3))
+    cl = ChildList(ref)
+    next_id = len(ref) + 1
+
+    for _ in range(5000):
+        op = rng.random()
+        if op < 0.4 or not ref:
+            pos = rng.randint(-len(ref) - 1, len(ref) + 1)
+            ref.insert(pos, next_id)
+            cl.insert(pos, next_id)
+            next_id += 1
+        elif op < 0.7:
+            victim = rng.choice(ref)
+            ref.remove(victim)
+            cl.remove(victim)
+        elif op < 0.8:
+            pos = rng.randrange(-len(ref), len(ref))
+            assert ref.pop(pos) == cl.pop(pos)
+        else:
+            victim = rng.choice(ref)
+            assert cl.index(victim) == ref.index(victim)
+            assert cl[ref.index(victim)] == victim
+
+    assert cl == ref
+    assert list(reversed(cl)) == ref[::-1]
+    assert len(cl) == len(ref)
+    assert cl[-1] == ref[-1]
+    assert ref[0] in cl and 0 not in cl
+
+    try:
+        cl.remove(0)
+        raise AssertionError("Missing id removed")
+    except ValueError:
+        pass
+    print("✓ ChildList matches list: PASSED")
+
+
+def test_store_promotes_long_lists():
+    """Test IRStore keeps order on a promoted LIST."""
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    list_node = Node.create(NodeType.LIST)
+    store.add_unlinked_node(list_node)
+    store.link_child(parent_id=root_id, child_id=list_node.id, key="listeners")
+
+    ids = []
+    for i in range(CHILD_LIST_THRESHOLD * 4):
+        item = Node.create(NodeType.SCALAR)
+        item.value = i
+        store.add_unlinked_node(item)
+        store.link_child(parent_id=list_node.id, child_id=item.id)
+        ids.append(item.id)
+
+    children = store.get_node(list_node.id).children
+    assert isinstance(children, ChildList)
+
+    store.move_child(child_id=ids[0], index=len(ids) - 1)
+    ids.append(ids.pop(0))
+    store.unlink_child(child_id=ids[100])
+    store.delete_subtree(node_id=ids.pop(100))
+
+    assert list(store.iter_children(list_node.id)) == ids
+    assert store.child_index(ids[-1]) == len(ids) - 1
+    assert store.child_count(list_node.id) == len(ids)
+    print("✓ Store promotes long lists: PASSED")
+
+
+if __name__ == "__main__":
+    test_child_list_matches_list()
+    test_store_promotes_long_lists()
+    print("\n✅ All child list tests PASSED!")
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Test ColumnarIRStore against the default IRStore (same public API).
+
+Tests that:
+1. Link/unlink/move/delete behave identically on both backends
+2. YAML parse → serialize round-trips identically on both backends
+3. Keys and values are interned, and their slots are freed once unused
+4. Node.children is a live view matching the sibling chain
+5. Values equal but not interchangeable (-0.0, offset datetimes, dates)
+   serialize as on IRStore
+"""
+
+from zeno.core.node import Node
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.adapters.yaml_adapter import serialize, parse
+
+
+BACKENDS = (IRStore, ColumnarIRStore, PersistentIRStore)
+
+SAMPLE_YAML = """
+name: gateway
+listeners:
+- port: 502
+  enabled: true
+- port: 503
+  enabled: false
+limits:
+  rate: 1.5
+  tags: [a, b, c]
+empty: {}
+"""
+
+
+def _add(store, parent_id, node_type, key=None, value=None, index=None):
+    node = Node.create(node_type)
+    node.value = value
+    store.add_unlinked_node(node)
+    store.link_child(parent_id=parent_id, child_id=node.id, key=key, index=index)
+    return node.id
+
+
+def _list_values(store, list_id):
+    return [store.get_node(cid).value for cid in store.get_node(list_id).children]
+
+
+def test_structural_operations_match():
+    """Test link/unlink/move/delete on every backend."""
+    for backend in BACKENDS:
+        store = backend()
+        root_id = store.create_root(NodeType.OBJECT)
+        items_id = _add(store, root_id, NodeType.LIST, key="items")
+
+        ids = [_add(store, items_id, NodeType.SCALAR, value=v) for v in "abcd"]
+        _add(store, items_id, NodeType.SCALAR, value="x", index=1)
+        assert _list_values(store, items_id) == ["a", "x", "b", "c", "d"]
+
+        store.move_child(child_id=ids[3], index=0)
+        assert _list_values(store, items_id) == ["d", "a", "x", "b", "c"]
+        assert store.child_index(ids[2]) == 4
+
+        store.unlink_child(child_id=ids[0])
+        store.delete_subtree(node_id=ids[0])
+        assert _list_values(store, items_id) == ["d", "x", "b", "c"]
+        assert not store.has_node(ids[0])
+
+        store.set_value(ids[1], "B")
+        assert store.get_node(ids[1]).value == "B"
+        assert store.get_child_by_key(root_id, "items") == items_id
+        assert store.get_node(items_id).key == "items"
+        assert len(store) == 6
+
+        store.unlink_child(child_id=items_id)
+        store.delete_subtree(node_id=items_id)
+        assert len(store) == 1
+        assert store.get_child_by_key(root_id, "items") is None
+        print(f"✓ Structural operations ({backend.__name__}): PASSED")
+
+
+def test_yaml_roundtrip_matches():
+    """Test both backends parse and serialize to identical YAML."""
+    outputs = []
+    for backend in BACKENDS:
+        store = backend()
+        root_id = store.create_root(NodeType.OBJECT)
+        parse(SAMPLE_YAML, store)
+        outputs.append(serialize(store.get_node(root_id), store))
+
+    assert outputs[0] == outputs[1]
+    print("✓ YAML round-trip parity: PASSED")
+
+
+DISTINCT_YAML = """
+zero: 0.0
+negative_zero: -0.0
+local: 2024-01-01T12:00:00+01:00
+utc: 2024-01-01T11:00:00+00:00
+days: [2024-01-01, 2024-01-01]
+2024-01-01: date key
+"""
+
+
+def test_equal_values_stay_distinct():
+    """Test only interchangeable values share a slot."""
+    outputs = []
+    for backend in (IRStore, ColumnarIRStore):
+        store = backend()
+        root_id = store.create_root(NodeType.OBJECT)
+        parse(DISTINCT_YAML, store)
+        outputs.append(serialize(store.get_node(root_id), store))
+    assert outputs[0] == outputs[1], outputs[1]
+    assert "-0.0" in outputs[1] and "&" not in outputs[1]
+
+    children = store.get_node(root_id).children
+    assert str(store.get_node(children[2]).value.tzinfo) == "UTC+01:00"
+    date_key = store.get_node(children[5]).key
+    assert store.get_child_by_key(root_id, date_key) == children[5]
+    print("✓ Equal values stay distinct: PASSED")
+
+
+def test_columnar_interning():
+    """Test repeated keys and values share one table entry."""
+    store = ColumnarIRStore()
+    root_id = store.create_root(NodeType.LIST)
+
+    for _ in range(100):
+        obj_id = _add(store, root_id, NodeType.OBJECT)
+        _add(store, obj_id, NodeType.SCALAR, key="enabled", value=True)
+        _add(store, obj_id, NodeType.SCALAR, key="port", value=1)
+
+    assert len(store._keys) == 2
+    # True and 1 compare equal but must stay distinct values.
+    assert len(store._values) == 2
+    first = store.get_node(store.get_node(root_id).children[0])
+    flags = [store.get_node(cid).value for cid in first.children]
+    assert flags == [True, 1]
+    assert type(flags[1]) is int
+    print("✓ Columnar interning: PASSED")
+
+
+def test_columnar_tables_shrink():
+    """Test reassigned and deleted keys and values release their slots."""
+    store = ColumnarIRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    port_id = _add(store, root_id, NodeType.SCALAR, key="port", value=0)
+    tags_id = _add(store, root_id, NodeType.SCALAR, key="tags", value=[0])
+
+    snap = store.snapshot()
+    for i in range(1000):
+        store.set_value(port_id, i)
+        store.set_value(tags_id, [i])  # unhashable: a slot of its own each time
+    assert len(store._values) == 2 and len(store._values._items) <= 4
+    assert store.get_node(port_id).value == 999 and store.get_node(tags_id).value == [999]
+    assert snap.get_node(port_id).value == 0 and snap.get_node(tags_id).value == [0]
+
+    obj_id = _add(store, root_id, NodeType.OBJECT, key="limits")
+    for i in range(20):
+        _add(store, obj_id, NodeType.SCALAR, key=f"k{i}", value=f"v{i}")
+    assert len(store._keys) == 23 and len(store._values) == 22
+    store.unlink_child(child_id=obj_id)
+    store.delete_subtree(node_id=obj_id)
+    assert len(store._keys) == 2 and len(store._values) == 2
+    assert store.get_child_by_key(root_id, "port") == port_id
+    print("✓ Columnar tables shrink: PASSED")
+
+
+def test_columnar_children_view():
+    """Test the children view against the child order on every access."""
+    store = ColumnarIRStore()
+    root_id = store.create_root(NodeType.LIST)
+    ids = [_add(store, root_id, NodeType.SCALAR, value=i) for i in range(7)]
+    children = store.get_node(root_id).children
+
+    assert len(children) == 7 and children == ids and list(reversed(children)) == ids[::-1]
+    assert [children[i] for i in range(-7, 7)] == ids + ids
+    assert children[2:5] == ids[2:5] and children.index(ids[4]) == 4
+    assert ids[3] in children and root_id not in children and 999 not in children
+    for bad in (7, -8):
+        try:
+            children[bad]
+            raise AssertionError("Index out of range accepted")
+        except IndexError:
+            pass
+
+    store.move_child(child_id=ids[0], index=6)
+    new_id = _add(store, root_id, NodeType.SCALAR, value=7, index=0)
+    assert children == [new_id] + ids[1:] + ids[:1]
+    assert store.get_node(root_id).copy().children == list(children)
+    print("✓ Columnar children view: PASSED")
+
+
+def test_columnar_large_object_keys():
+    """Test keyed lookup and duplicate rejection past the key-index threshold."""
+    store = ColumnarIRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+
+    ids = {f"k{i}": _add(store, root_id, NodeType.SCALAR, key=f"k{i}", value=i) for i in range(40)}
+    assert root_id in store._key_index
+    assert all(store.get_child_by_key(root_id, k) == cid for k, cid in ids.items())
+
+    try:
+        _add(store, root_id, NodeType.SCALAR, key="k7")
+        raise AssertionError("Duplicate key accepted")
+    except ValueError as e:
+        assert "Duplicate object key" in str(e)
+
+    store.unlink_child(child_id=ids["k7"])
+    assert store.get_child_by_key(root_id, "k7") is None
+    print("✓ Columnar large object keys: PASSED")
+
+
+if __name__ == "__main__":
+    test_structural_operations_match()
+    test_yaml_roundtrip_matches()
+    test_equal_values_stay_distinct()
+    test_columnar_interning()
+    test_columnar_tables_shrink()
+    test_columnar_children_view()
+    test_columnar_large_object_keys()
+    print("\n✅ All columnar store tests PASSED!")
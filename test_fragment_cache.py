@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Test the per-subtree fragment cache used for incremental saves.
+
+Tests that:
+1. Saves through the cache match serialize after random edits, on every backend
+2. Operations bump version stamps along the path to the root only, and
+   deleted nodes lose their stamps
+3. A one-scalar edit re-renders only the fragment that contains it
+4. Documents with shared objects fall back to the plain streaming path
+5. A fork writes a snapshot on another thread while the live document is edited
+"""
+
+import io
+import random
+import threading
+
+import yaml
+
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.adapters import yaml_fragments, yaml_layout
+from zeno.adapters.yaml_adapter import serialize, serialize_to, parse
+from zeno.adapters.yaml_fragments import FragmentCache
+
+
+BACKENDS = (IRStore, ColumnarIRStore, PersistentIRStore)
+
+
+def _load(text, store_class=IRStore):
+    store = store_class()
+    store.create_root(NodeType.OBJECT)
+    parse(text, store)
+    processor = OperationProcessor(store)
+    return store, processor, FragmentCache(processor.versions)
+
+
+def _cached(store, fragments):
+    out = io.StringIO()
+    serialize_to(out, store, store.get_node(store.root_id), fragments=fragments)
+    return out.getvalue()
+
+
+def _expected(store):
+    return serialize(store.get_node(store.root_id), store)
+
+
+def _op(kind, node_id, **payload):
+    return Operation.create(kind, node_id, {"node_id": node_id, **payload})
+
+
+def _devices(count):
+    devices = [{"host": f"device-{i}", "port": 502, "tags": ["a", "b"]} for i in range(count)]
+    return yaml.safe_dump({"name": "plant", "devices": devices}, sort_keys=False)
+
+
+def test_matches_serialize_after_edits():
+    """Test byte-identical saves while random edits and undos are applied."""
+    rng = random.Random(16)
+    leaves = [None, True, 0, 2.5, "", "null", "a: b", "- x", "multi\nline", "é€😀", "w " * 50]
+
+    def value(depth=0):
+        roll = rng.random()
+        if depth < 4 and roll < 0.3:
+            return {rng.choice(["k", "yes", "#x", "a: b", "key"]) + str(i): value(depth + 1)
+                    for i in range(rng.randint(0, 5))}
+        if depth < 4 and roll < 0.5:
+            return [value(depth + 1) for _ in range(rng.randint(0, 5))]
+        return rng.choice(leaves)
+
+    def random_op(store):
+        node_id = rng.choice(list(store.iter_node_ids()))
+        node = store.get_node(node_id)
+        roll = rng.random()
+        if node.type == NodeType.SCALAR and roll < 0.4:
+            return _op("update_scalar", node_id, value=value(3))
+        if node.type != NodeType.SCALAR and roll < 0.7:
+            key = f"n{rng.random():.6f}" if node.type == NodeType.OBJECT else None
+            return Operation.create("add_node", None, {
+                "parent_id": node_id, "node_type": rng.choice(list(NodeType)), "key": key,
+            })
+        if node_id != store.root_id and roll < 0.85:
+            return _op("remove_node", node_id)
+        if node_id != store.root_id and store.get_node(node.parent_id).type == NodeType.LIST:
+            return _op("move_node", node_id, index=0)
+        return None
+
+    unit_nodes = yaml_fragments.UNIT_NODES
+    yaml_fragments.UNIT_NODES = 4  # split small documents too
+    try:
+        for trial in range(60):
+            data = {"root": value(), "items": [value(), value()], "x": value()}
+            text = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+            store, processor, fragments = _load(text, BACKENDS[trial % len(BACKENDS)])
+            for _ in range(8):
+                assert _cached(store, fragments) == _expected(store), trial
+                operation = random_op(store)
+                if operation is not None:
+                    try:
+                        processor.apply(operation)
+                    except ValueError:
+                        pass
+                    if rng.random() < 0.2:
+                        processor.undo()
+    finally:
+        yaml_fragments.UNIT_NODES = unit_nodes
+    print("✓ Matches serialize after edits: PASSED")
+
+
+def test_stamps_follow_path():
+    """Test that an edit stamps its node and ancestors, not siblings."""
+    store, processor, _ = _load(_devices(3))
+    versions = processor.versions
+    root_id = store.root_id
+    devices_id = store.get_child_by_key(root_id, "devices")
+    first_id, second_id, _ = store.iter_children(devices_id)
+    port_id = store.get_child_by_key(first_id, "port")
+    name_id = store.get_child_by_key(root_id, "name")
+
+    processor.apply(_op("update_scalar", port_id, value=503))
+    path = [port_id, first_id, devices_id, root_id]
+    assert len({versions.stamp(node_id) for node_id in path}) == 1
+    assert versions.stamp(port_id) > 0
+    assert versions.stamp(second_id) == 0 and versions.stamp(name_id) == 0
+
+    before = versions.stamp(root_id)
+    processor.undo()
+    assert versions.stamp(port_id) > before and versions.stamp(second_id) == 0
+
+    stamped = len(versions)
+    processor.apply(_op("remove_node", first_id))
+    assert len(versions) == stamped - 2 and versions.stamp(port_id) == 0
+    sizes = set()
+    for _ in range(20):
+        processor.apply(_op("replace_subtree", devices_id, data=[{"port": 1}, {"port": 2}]))
+        devices_id = store.get_child_by_key(root_id, "devices")
+        sizes.add(len(versions))
+    assert len(sizes) == 1 and len(versions) < len(store)
+    print("✓ Stamps follow path: PASSED")
+
+
+def test_renders_only_edited_fragment():
+    """Test that a one-scalar edit emits one fragment, not the document."""
+    store, processor, fragments = _load(_devices(2000))
+    assert _cached(store, fragments) == _expected(store)
+
+    emitted = []
+    emit = yaml_layout.emit
+    yaml_fragments.emit = lambda events, fast: emitted.append(1) or emit(events, fast)
+    try:
+        devices_id = store.get_child_by_key(store.root_id, "devices")
+        device_id = list(store.iter_children(devices_id))[1234]
+        processor.apply(_op("update_scalar", store.get_child_by_key(device_id, "host"), value="edge"))
+        text = _cached(store, fragments)
+    finally:
+        yaml_fragments.emit = emit
+    assert text == _expected(store) and "host: edge" in text
+    assert len(emitted) == 1, len(emitted)
+    print("✓ Renders only edited fragment: PASSED")
+
+
+def test_shared_objects_fall_back():
+    """Test that anchored shared dates are written by the plain path."""
+    store, processor, fragments = _load("a: &d 2024-01-01\nb: *d\nc: [x]\n")
+    out = io.StringIO()
+    assert not fragments.write(out, store, store.get_node(store.root_id))
+    assert _cached(store, fragments) == _expected(store)
+    assert "&id001" in _cached(store, fragments)
+    print("✓ Shared objects fall back: PASSED")
+
+
+def test_fork_writes_snapshot():
+    """Test a background save of a snapshot: edits made meanwhile reach neither it nor the cache."""
+    store, processor, fragments = _load(_devices(500), PersistentIRStore)
+    devices_id = store.get_child_by_key(store.root_id, "devices")
+    first_id, last_id = list(store.iter_children(devices_id))[::499]
+    processor.apply(_op("update_scalar", store.get_child_by_key(first_id, "host"), value="saved"))
+    _cached(store, fragments)
+
+    snapshot = store.snapshot()
+    expected = _expected(snapshot)
+    fork = fragments.fork(processor.versions.copy())
+    written = []
+    worker = threading.Thread(target=lambda: written.append(_cached(snapshot, fork)))
+    processor.apply(_op("update_scalar", store.get_child_by_key(last_id, "host"), value="edit-1"))
+    worker.start()
+    processor.apply(_op("update_scalar", store.get_child_by_key(first_id, "port"), value=503))
+    worker.join()
+    fragments.adopt(fork)
+
+    assert written == [expected] and "saved" in expected and "edit-" not in expected
+    assert _cached(store, fragments) == _expected(store) and "host: edit-1" in _expected(store)
+    print("✓ Fork writes snapshot: PASSED")
+
+
+if __name__ == "__main__":
+    test_matches_serialize_after_edits()
+    test_stamps_follow_path()
+    test_renders_only_edited_fragment()
+    test_shared_objects_fall_back()
+    test_fork_writes_snapshot()
+    print("\n✅ All fragment cache tests PASSED!")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test bound schema types (binder.bind) and the validators consuming them.
+
+Tests that:
+1. bind() carries every SCHEMA_SPEC constraint into immutable types
+2. Shared and self-referencing schema nodes bind to shared / cyclic
+   types that pickle and print
+3. Invalid constraints raise SchemaValidationError with their path
+4. validate() with a bound root reports kind mismatches and unknown
+   properties; validate_ir_semantics() takes a bound root or a Schema
+"""
+
+import pickle
+from dataclasses import FrozenInstanceError
+
+from zeno.adapters import yaml_adapter
+from zeno.core.ir_types import ArrayType, ObjectType, ScalarType
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+from zeno.schema.binder import bind
+from zeno.schema.ir_semantic_validator import validate_ir_semantics
+from zeno.schema.ir_validator import IRStoreView, ValidationError, validate
+from zeno.schema.loader import SchemaValidationError, load, loads
+
+
+SCHEMA = """zeno_schema: "2.0"
+application: "ZENO"
+format: "yaml"
+
+root:
+  type: object
+  required: [name]
+  properties:
+    name:
+      type: string
+    mode:
+      type: string
+      enum: [fast, safe]
+      default: safe
+    listeners:
+      type: array
+      min_items: 1
+      max_items: 8
+      unique_by: port
+      items:
+        type: object
+        properties:
+          port:
+            type: integer
+            minimum: 1
+            maximum: 65535
+            required: true
+    sealing:
+      type: object
+      required: false
+"""
+
+
+def _store(text):
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    yaml_adapter.parse(text, store)
+    return store
+
+
+def test_bind_constraints():
+    """Test each constraint reaches the bound type."""
+    root = bind(loads(SCHEMA).root)
+    assert isinstance(root, ObjectType) and root.kind == "object"
+    assert root.required_properties == {"name"}
+    mode = root.properties["mode"]
+    assert isinstance(mode, ScalarType) and mode.enum == ("fast", "safe") and mode.default == "safe"
+    listeners = root.properties["listeners"]
+    assert isinstance(listeners, ArrayType) and listeners.kind == "list"
+    assert (listeners.min_items, listeners.max_items, listeners.unique_by) == (1, 8, "port")
+    port = listeners.items.properties["port"]
+    assert (port.name, port.minimum, port.maximum, port.required) == ("integer", 1, 65535, True)
+    assert listeners.items.required_properties == {"port"}
+    assert root.properties["sealing"].required is False
+
+    try:
+        listeners.min_items = 0
+    except FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("bound types must be immutable")
+
+    mma = bind(load("schema/mma_nested_model.zs").root)
+    assert mma.properties["listeners"].items.properties["port"].unique == "sibling"
+    print("✓ Bind constraints: PASSED")
+
+
+def test_bind_cycles():
+    """Test aliased and recursive schema nodes."""
+    port = {"type": "integer"}
+    node = {"type": "object", "properties": {"a": port, "b": port}}
+    node["properties"]["self"] = node
+    root = bind(node)
+    assert root.properties["a"] is root.properties["b"]
+    assert root.properties["self"] is root
+    assert "ObjectType" in repr(root)
+
+    copy = pickle.loads(pickle.dumps(root))
+    assert copy.properties["self"] is copy and copy.properties["a"] is copy.properties["b"]
+
+    lists = {"type": "array", "items": None}
+    lists["items"] = lists
+    nested = bind({"type": "object", "properties": {"tree": lists}}).properties["tree"]
+    assert nested.items is nested
+    print("✓ Bind cycles: PASSED")
+
+
+def test_bind_errors():
+    """Test unbindable constraints name their schema path."""
+    cases = [
+        ({"type": "array", "items": {"type": "string"}, "min_items": -1}, "root.properties.x.min_items"),
+        ({"type": "array", "items": {"type": "string"}, "min_items": 3, "max_items": 2}, "root.properties.x.min_items"),
+        ({"type": "array", "items": {"type": "string"}, "unique_by": 5}, "root.properties.x.unique_by"),
+        ({"type": "string", "enum": "abc"}, "root.properties.x.enum"),
+        ({"type": "number", "minimum": "1"}, "root.properties.x.minimum"),
+        ({"type": "string", "required": "yes"}, "root.properties.x.required"),
+        ({"type": "object", "required": ["missing"]}, "root.properties.x.required"),
+        ({"type": "string", "unique": "global"}, "root.properties.x"),
+    ]
+    for schema, path in cases:
+        try:
+            bind({"type": "object", "properties": {"x": schema}})
+        except SchemaValidationError as e:
+            assert str(e).startswith(path), (schema, str(e))
+        else:
+            raise AssertionError(f"bound {schema}")
+    print("✓ Bind errors: PASSED")
+
+
+def test_validators_take_bound_types():
+    """Test shape checks and unique_by against the bound root."""
+    schema = loads(SCHEMA)
+    root = bind(schema.root)
+    good = _store("name: a\nsealing:\nlisteners:\n- port: 1\n- port: 2\n")
+    validate(IRStoreView(good, good.root_id), root)
+    assert validate_ir_semantics(root, IRStoreView(good, good.root_id)) == []
+
+    bad = _store("name: [a]\nextra: 1\nlisteners:\n  port: 1\n")
+    try:
+        validate(IRStoreView(bad, bad.root_id), root)
+    except ValidationError as e:
+        issues = [(issue.path, issue.message) for issue in e.issues]
+    else:
+        raise AssertionError("shape errors not reported")
+    assert issues == [
+        ("$.extra", "Unknown property: extra"),
+        ("$.name", "Expected string, got list"),
+        ("$.listeners", "Expected array, got object"),
+    ]
+    validate(IRStoreView(bad, bad.root_id))  # no schema: structure only
+
+    dup = _store("listeners:\n- port: 1\n- port: 1\n")
+    for schema_input in (root, schema):
+        errors = validate_ir_semantics(schema_input, IRStoreView(dup, dup.root_id))
+        assert [e.path for e in errors] == ["$.listeners[1].port"]
+    print("✓ Validators take bound types: PASSED")
+
+
+if __name__ == "__main__":
+    test_bind_constraints()
+    test_bind_cycles()
+    test_bind_errors()
+    test_validators_take_bound_types()
+    print("\n✅ All IR type tests PASSED!")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test the JSON adapter.
+
+Tests that:
+1. serialize writes exactly json.dumps(data, indent=2), on every backend
+2. parse builds the same tree with and without orjson (big ints, NaN included)
+3. Values from YAML without a JSON type are written as strings and lists
+4. YAML configs round-trip through JSON unchanged
+"""
+
+import io
+import json
+import random
+from pathlib import Path
+
+import yaml
+
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.adapters import json_adapter, yaml_adapter
+
+
+BACKENDS = (IRStore, ColumnarIRStore, PersistentIRStore)
+
+
+def _store(data, store_class=IRStore):
+    store = store_class()
+    store.create_root(NodeType.LIST if isinstance(data, list) else NodeType.OBJECT)
+    return store
+
+
+def _json(store):
+    return json_adapter.serialize(store.get_node(store.root_id), store)
+
+
+def _random_documents(count):
+    rng = random.Random(18)
+    alphabet = [chr(c) for c in range(32, 127)] * 3 + list("éü日ß€\n\t\x00\x1f 😀\"\\")
+    leaves = [None, True, False, 0, -7, 2.5, -0.0, 1e20, 1e-7, 2 ** 70, ""]
+
+    def text(limit):
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, limit)))
+
+    def value(depth=0):
+        roll = rng.random()
+        if depth < 4 and roll < 0.25:
+            return {text(10): value(depth + 1) for _ in range(rng.randint(0, 5))}
+        if depth < 4 and roll < 0.45:
+            return [value(depth + 1) for _ in range(rng.randint(0, 5))]
+        if roll < 0.7:
+            return rng.choice(leaves)
+        return text(40)
+
+    return [{"root": value(), "items": [value()]} for _ in range(count)]
+
+
+def test_matches_json_dumps():
+    """Test byte-identical output for random documents and the flushing stream path."""
+    for data in _random_documents(300):
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+        for store_class in BACKENDS:
+            store = _store(data, store_class)
+            json_adapter.parse(text, store)
+            assert _json(store) == text + "\n", text
+
+    data = [{"host": f"device-{i}", "port": 502, "tags": ["a", "b"]} for i in range(3000)]
+    store = _store(data)
+    json_adapter.parse(json.dumps(data), store)
+    out = io.StringIO()
+    json_adapter.serialize_to(out, store, store.get_node(store.root_id))
+    assert out.getvalue() == json.dumps(data, indent=2) + "\n"
+    assert json_adapter.serialize(store.get_node(store.root_id), store) == out.getvalue()
+    print("✓ Matches json.dumps: PASSED")
+
+
+def test_parse_with_and_without_orjson():
+    """Test that the decoder in use never changes the tree."""
+    texts = [json.dumps(data) for data in _random_documents(50)]
+    texts += ['{"big": 123456789012345678901234567890, "n": -9223372036854775809}',
+              '{"x": NaN, "y": -Infinity, "z": [1e400]}', "[]", "null", '"text"']
+    orjson = json_adapter.orjson
+    for text in texts:
+        results = []
+        for decoder in (orjson, None):
+            json_adapter.orjson = decoder
+            try:
+                store = _store(json.loads(text))
+                json_adapter.parse(text.encode("utf-8"), store)
+                results.append(_json(store))
+            finally:
+                json_adapter.orjson = orjson
+        assert results[0] == results[1], text
+    store = _store({})
+    json_adapter.parse('{"big": 123456789012345678901234567890}', store)
+    assert store.get_node(store.get_child_by_key(store.root_id, "big")).value == 123456789012345678901234567890
+    print("✓ Parse with and without orjson: PASSED")
+
+
+def test_yaml_only_values():
+    """Test dates, binary, sets, ordered maps and non-string keys."""
+    store = _store({})
+    yaml_adapter.parse(
+        "when: 2024-01-02\nraw: !!binary aGVsbG8=\ntags: !!set {x}\n"
+        "pairs: !!omap [{k: 1}]\n1: one\n2024-01-01: day\nnone: ~\n",
+        store,
+    )
+    assert json.loads(_json(store)) == {
+        "when": "2024-01-02", "raw": "aGVsbG8=", "tags": ["x"],
+        "pairs": [["k", 1]], "1": "one", "2024-01-01": "day", "none": None,
+    }
+    assert '"pairs": [\n    [\n      "k",\n      1\n    ]\n  ]' in _json(store)
+    print("✓ YAML-only values: PASSED")
+
+
+def test_yaml_round_trip():
+    """Test YAML config -> JSON -> store -> YAML gives the original YAML text back."""
+    paths = sorted(Path("ConfigOutput").glob("*.yaml")) + sorted(Path("schema").glob("*.zs"))
+    for path in paths:
+        text = path.read_text(encoding="utf-8")
+        if not isinstance(yaml.safe_load(text), (dict, list)):
+            continue
+        data = yaml.safe_load(text)
+        source, copy = _store(data), _store(data)
+        yaml_adapter.parse(text, source)
+        json_adapter.parse(_json(source), copy)
+        assert yaml_adapter.serialize(copy.get_node(copy.root_id), copy) == \
+            yaml_adapter.serialize(source.get_node(source.root_id), source), path
+    print("✓ YAML round trip: PASSED")
+
+
+if __name__ == "__main__":
+    test_matches_json_dumps()
+    test_parse_with_and_without_orjson()
+    test_yaml_only_values()
+    test_yaml_round_trip()
+    print("\n✅ All JSON adapter tests PASSED!")
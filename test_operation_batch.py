@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test OperationProcessor.apply_batch.
+
+Tests that:
+1. A batch can build nested nodes through preallocated node ids
+2. Precondition failures are reported before the store is touched
+3. A failure while applying rolls back every earlier op in the batch
+4. apply / apply_batch return inverse operations that undo the edit
+5. A failing listener is reported but does not fail the committed edit
+"""
+
+from zeno.core.batch_check import BatchError
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.adapters.yaml_adapter import serialize, parse
+
+
+BACKENDS = (IRStore, ColumnarIRStore, PersistentIRStore)
+
+SAMPLE_YAML = """
+name: gateway
+listeners:
+- port: 502
+  tags: [a, b]
+- port: 503
+"""
+
+
+def _load(backend):
+    store = backend()
+    store.create_root(NodeType.OBJECT)
+    parse(SAMPLE_YAML, store)
+    return store, OperationProcessor(store)
+
+
+def _text(store):
+    return serialize(store.get_node(store.root_id), store)
+
+
+def _add(parent_id, node_type, key=None, node_id=None):
+    payload = {"parent_id": parent_id, "node_type": node_type, "key": key}
+    if node_id is not None:
+        payload["node_id"] = node_id
+    return Operation.create("add_node", None, payload)
+
+
+def _op(kind, node_id, **payload):
+    return Operation.create(kind, node_id, {"node_id": node_id, **payload})
+
+
+def test_batch_nested_add():
+    """Test a batch adds nested nodes that refer to each other."""
+    for backend in BACKENDS:
+        store, processor = _load(backend)
+        root_id = store.root_id
+        limits_id = store.allocate_id()
+        rate_id = store.allocate_id()
+
+        processor.apply_batch([
+            _add(root_id, NodeType.OBJECT, "limits", limits_id),
+            _add(limits_id, NodeType.SCALAR, "rate", rate_id),
+            _op("update_scalar", rate_id, value=1.5),
+        ])
+        assert "limits:\n  rate: 1.5" in _text(store)
+    print("✓ Batch nested add: PASSED")
+
+
+def test_batch_precondition_failure():
+    """Test invalid batches fail up front and leave the store untouched."""
+    for backend in BACKENDS:
+        store, processor = _load(backend)
+        root_id = store.root_id
+        before = _text(store)
+        listeners_id = store.get_child_by_key(root_id, "listeners")
+        first_id = list(store.iter_children(listeners_id))[0]
+        port_id = store.get_child_by_key(first_id, "port")
+
+        cases = [
+            ([_add(root_id, NodeType.SCALAR, "x"), _add(root_id, NodeType.SCALAR, "x")], 1),
+            ([_op("remove_node", first_id), _op("update_scalar", port_id, value=1)], 1),
+            ([_op("update_scalar", listeners_id, value=1)], 0),
+            ([_op("move_node", port_id, direction="up")], 0),
+            ([_op("remove_node", root_id)], 0),
+        ]
+        for ops, bad_index in cases:
+            try:
+                processor.apply_batch(ops)
+                raise AssertionError("Invalid batch accepted")
+            except BatchError as e:
+                assert e.index == bad_index
+            assert _text(store) == before
+
+        # A key freed earlier in the batch may be reused.
+        name_id = store.get_child_by_key(root_id, "name")
+        processor.apply_batch([_op("remove_node", name_id), _add(root_id, NodeType.SCALAR, "name")])
+    print("✓ Batch precondition failure: PASSED")
+
+
+def test_batch_rollback():
+    """Test an apply-time failure undoes remove, update and add."""
+    for backend in BACKENDS:
+        store, processor = _load(backend)
+        root_id = store.root_id
+        before = _text(store)
+        listeners_id = store.get_child_by_key(root_id, "listeners")
+        first_id, second_id = store.iter_children(listeners_id)
+        name_id = store.get_child_by_key(root_id, "name")
+
+        try:
+            processor.apply_batch([
+                _op("update_scalar", name_id, value="edge"),
+                _add(root_id, NodeType.LIST, "extra"),
+                _op("remove_node", first_id),
+                # Only one item left: moving it down is out of bounds.
+                _op("move_node", second_id, direction="down"),
+            ])
+            raise AssertionError("Out-of-bounds move accepted")
+        except BatchError as e:
+            assert e.index == 3
+
+        assert _text(store) == before
+        assert list(store.iter_children(listeners_id)) == [first_id, second_id]
+    print("✓ Batch rollback: PASSED")
+
+
+def test_inverse_operations():
+    """Test apply and apply_batch return their inverses."""
+    store, processor = _load(IRStore)
+    root_id = store.root_id
+    before = _text(store)
+    listeners_id = store.get_child_by_key(root_id, "listeners")
+    first_id, second_id = store.iter_children(listeners_id)
+
+    undo = processor.apply_batch([
+        _op("move_node", first_id, direction="down"),
+        _op("remove_node", second_id),
+        _add(root_id, NodeType.SCALAR, "mode"),
+    ])
+    assert _text(store) != before
+    processor.apply_batch(undo)
+    assert _text(store) == before
+
+    inverse = processor.apply(_op("remove_node", first_id))
+    processor.apply(inverse)
+    assert _text(store) == before
+    print("✓ Inverse operations: PASSED")
+
+
+def test_failing_listener():
+    """Test listener errors go to on_error and later listeners still run."""
+    store, processor = _load(IRStore)
+    name_id = store.get_child_by_key(store.root_id, "name")
+    errors, seen = [], []
+
+    def broken(operations):
+        raise TypeError("cannot log")
+
+    processor.add_listener(broken, on_error=errors.append)
+    processor.add_listener(seen.append)
+    processor.apply(_op("update_scalar", name_id, value="edge"))
+    processor.apply_batch([_op("update_scalar", name_id, value="core")])
+    assert processor.undo() and processor.redo()
+    assert store.get_node(name_id).value == "core"
+    assert len(errors) == len(seen) == 4 and all(isinstance(e, TypeError) for e in errors)
+
+    processor.remove_listener(broken)
+    processor.apply(_op("update_scalar", name_id, value="last"))
+    assert len(errors) == 4 and len(seen) == 5
+    print("✓ Failing listener: PASSED")
+
+
+if __name__ == "__main__":
+    test_batch_nested_add()
+    test_batch_precondition_failure()
+    test_batch_rollback()
+    test_inverse_operations()
+    test_failing_listener()
+    print("\n✅ All operation batch tests PASSED!")
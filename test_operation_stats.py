@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test operation instrumentation in OperationProcessor.
+
+Tests that:
+1. Counts, nodes touched and latency percentiles are kept per operation type
+2. Failed operations are counted as errors; event hooks see every dispatch
+3. Disabling instrumentation restores the plain dispatch path
+"""
+
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.operation_stats import OperationStats, format_stats
+from zeno.adapters.yaml_adapter import parse
+
+
+SAMPLE_YAML = """
+name: gateway
+listeners:
+- port: 502
+  host: a
+- port: 503
+  host: b
+"""
+
+
+def _load():
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    parse(SAMPLE_YAML, store)
+    return store, OperationProcessor(store)
+
+
+def _op(kind, node_id, **payload):
+    return Operation.create(kind, node_id, {"node_id": node_id, **payload})
+
+
+def test_counts_and_nodes_touched():
+    """Test per-type counters and the nodes-touched measure."""
+    store, processor = _load()
+    stats = processor.enable_instrumentation()
+    root_id = store.root_id
+    name_id = store.get_child_by_key(root_id, "name")
+    listeners_id = store.get_child_by_key(root_id, "listeners")
+    first_id = next(store.iter_children(listeners_id))
+
+    for value in ("a", "b", "c"):
+        processor.apply(_op("update_scalar", name_id, value=value))
+    processor.apply(Operation.create("clone_subtree", listeners_id, {
+        "node_id": listeners_id, "parent_id": root_id, "key": "copy",
+    }))
+    processor.apply(_op("reorder_list", listeners_id, order=[1, 0]))
+    processor.apply(_op("remove_node", first_id))
+    processor.undo()
+
+    result = processor.stats()
+    assert result is not None and result == stats.stats()
+    assert result["update_scalar"]["count"] == 3 and result["update_scalar"]["nodes"] == 3
+    assert result["clone_subtree"]["nodes"] == 7
+    assert result["reorder_list"]["nodes"] == 2
+    assert result["remove_node"]["nodes"] == 3
+    assert result["restore_subtree"]["nodes"] == 3
+
+    row = result["update_scalar"]
+    assert 0 < row["p50_us"] <= row["p95_us"] <= row["p99_us"] <= row["max_us"]
+    assert sum(row["histogram"].values()) == 3
+    assert "update_scalar" in format_stats(result)
+    assert stats.summary().startswith("7 ops")
+    print("✓ Counts and nodes touched: PASSED")
+
+
+def test_errors_and_event_hook():
+    """Test that failures are recorded and hooks receive structured events."""
+    store, processor = _load()
+    stats = OperationStats()
+    events = []
+    stats.add_hook(events.append)
+    processor.enable_instrumentation(stats)
+
+    name_id = store.get_child_by_key(store.root_id, "name")
+    processor.apply(_op("update_scalar", name_id, value="edge"))
+    try:
+        processor.apply(_op("update_scalar", store.root_id, value="x"))
+        assert False, "Should reject updating an OBJECT"
+    except ValueError:
+        pass
+
+    assert [(e.operation_type, e.ok) for e in events] == [("update_scalar", True), ("update_scalar", False)]
+    assert events[0].nodes == 1 and events[1].nodes == 0
+    assert events[0]._asdict()["duration_us"] > 0
+    assert stats.stats()["update_scalar"]["errors"] == 1
+
+    stats.remove_hook(events.append)
+    stats.reset()
+    assert stats.stats() == {} and stats.summary() == "No operations"
+    print("✓ Errors and event hook: PASSED")
+
+
+def test_disable_instrumentation():
+    """Test that a disabled processor records nothing and dispatches directly."""
+    store, processor = _load()
+    assert processor.stats() == {}
+    stats = processor.enable_instrumentation()
+    assert "_dispatch" in vars(processor)
+
+    processor.disable_instrumentation()
+    assert "_dispatch" not in vars(processor)
+    name_id = store.get_child_by_key(store.root_id, "name")
+    processor.apply(_op("update_scalar", name_id, value="edge"))
+    assert processor.stats() == {} and stats.stats() == {}
+    assert store.get_node(name_id).value == "edge"
+    print("✓ Disable instrumentation: PASSED")
+
+
+if __name__ == "__main__":
+    test_counts_and_nodes_touched()
+    test_errors_and_event_hook()
+    test_disable_instrumentation()
+    print("\n✅ All operation stats tests PASSED!")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test PersistentIRStore snapshots.
+
+Tests that:
+1. Snapshots keep the document as it was while the live store is edited
+   through OperationProcessor
+2. Snapshots are read-only and accepted by validators and serialize
+3. IRStore and ColumnarIRStore snapshots are independent copies
+"""
+
+from zeno.core.node import Node
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.adapters.yaml_adapter import serialize, parse
+from zeno.schema.ir_validator import IRStoreView, validate
+
+
+SAMPLE_YAML = """
+name: gateway
+listeners:
+- port: 502
+- port: 503
+"""
+
+
+def _load(backend):
+    store = backend()
+    store.create_root(NodeType.OBJECT)
+    parse(SAMPLE_YAML, store)
+    return store
+
+
+def _text(store):
+    return serialize(store.get_node(store.root_id), store)
+
+
+def test_snapshot_isolation():
+    """Test edits after a snapshot do not leak into it."""
+    store = _load(PersistentIRStore)
+    processor = OperationProcessor(store)
+    root_id = store.root_id
+    before = _text(store)
+
+    snap = store.snapshot()
+    name_id = store.get_child_by_key(root_id, "name")
+    listeners_id = store.get_child_by_key(root_id, "listeners")
+    first_id = store.get_node(listeners_id).children[0]
+
+    processor.apply(Operation.create("update_scalar", name_id, {"node_id": name_id, "value": "edge"}))
+    processor.apply(Operation.create("remove_node", first_id, {"node_id": first_id}))
+    processor.apply(Operation.create(
+        "add_node", root_id,
+        {"parent_id": root_id, "node_type": NodeType.OBJECT, "key": "limits"},
+    ))
+
+    assert _text(snap) == before
+    assert snap.get_child_by_key(root_id, "limits") is None
+    assert snap.get_node(name_id).value == "gateway"
+    assert "edge" in _text(store) and "limits" in _text(store)
+    assert store.child_count(listeners_id) == 1
+    assert snap.child_count(listeners_id) == 2
+
+    # Second snapshot sees the edits; the first is still unchanged.
+    snap2 = store.snapshot()
+    assert _text(snap2) == _text(store)
+    assert _text(snap) == before
+    print("✓ Snapshot isolation: PASSED")
+
+
+def test_snapshot_read_only():
+    """Test snapshots reject mutation and work with readers."""
+    store = _load(PersistentIRStore)
+    snap = store.snapshot()
+    assert snap.read_only and not store.read_only
+
+    validate(IRStoreView(snap, snap.root_id))
+    name_id = snap.get_child_by_key(snap.root_id, "name")
+
+    for action in (
+        lambda: snap.set_value(name_id, "x"),
+        lambda: snap.add_unlinked_node(Node.create(NodeType.SCALAR)),
+        lambda: snap.unlink_child(child_id=name_id),
+    ):
+        try:
+            action()
+            raise AssertionError("Snapshot accepted a mutation")
+        except RuntimeError as e:
+            assert "read-only" in str(e)
+
+    assert snap.get_node(name_id).value == "gateway"
+    assert snap.get_node(name_id).parent_id == snap.root_id
+    print("✓ Snapshot read-only: PASSED")
+
+
+def test_copy_snapshots():
+    """Test the O(n) snapshot fallback on the other backends."""
+    for backend in (IRStore, ColumnarIRStore):
+        store = _load(backend)
+        before = _text(store)
+        snap = store.snapshot()
+
+        name_id = store.get_child_by_key(store.root_id, "name")
+        store.set_value(name_id, "edge")
+        store.unlink_child(child_id=name_id)
+
+        assert _text(snap) == before
+        assert snap.get_child_by_key(snap.root_id, "name") == name_id
+        assert "edge" not in _text(snap)
+    print("✓ Copy snapshots: PASSED")
+
+
+if __name__ == "__main__":
+    test_snapshot_isolation()
+    test_snapshot_read_only()
+    test_copy_snapshots()
+    print("\n✅ All persistent store tests PASSED!")
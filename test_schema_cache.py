@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test the compiled schema cache.
+
+Tests that:
+1. A second compile of the same file is a cache hit equal to the first,
+   reporting the path asked for
+2. Edited content, a different Zeno version or CACHE_FORMAT miss the cache;
+   in a source checkout the version follows the bound type code too
+3. Corrupt entries and an unwritable cache directory fall back to compiling
+4. Invalid schemas raise and are not cached
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from zeno.schema import compiled
+from zeno.schema.compiled import CompiledSchema, compile_schema
+from zeno.schema.loader import SchemaValidationError
+
+
+SCHEMA = """zeno_schema: "2.0"
+application: "ZENO"
+format: "yaml"
+
+root:
+  type: object
+  properties:
+    name:
+      type: string
+"""
+
+
+def _setup():
+    folder = Path(tempfile.mkdtemp())
+    path = folder / "app.zs"
+    path.write_text(SCHEMA, encoding="utf-8")
+    return folder / "cache", path
+
+
+def _entries(cache):
+    return sorted(p.name for p in cache.iterdir()) if cache.exists() else []
+
+
+def test_cache_hit():
+    """Test the second compile comes from the cache."""
+    cache, path = _setup()
+    first = compile_schema(path, cache_dir=cache)
+    assert isinstance(first, CompiledSchema)
+    assert _entries(cache) == [first.content_hash + ".pickle"]
+
+    with mock.patch.object(compiled, "loads", side_effect=AssertionError("parsed again")):
+        second = compile_schema(path, cache_dir=cache)
+        copy = path.with_name("copy.zs")
+        copy.write_bytes(path.read_bytes())
+        moved = compile_schema(copy, cache_dir=cache)
+    assert second == first
+    assert second.schema.root["properties"]["name"] == {"type": "string"}
+    assert second.root_type.properties["name"].name == "string"
+    assert moved.schema.source_path == str(copy) and moved.content_hash == first.content_hash
+    print("✓ Cache hit: PASSED")
+
+
+def test_cache_key():
+    """Test content, version and format changes compile again."""
+    cache, path = _setup()
+    first = compile_schema(path, cache_dir=cache)
+
+    path.write_text(SCHEMA + "    port:\n      type: integer\n", encoding="utf-8")
+    edited = compile_schema(path, cache_dir=cache)
+    assert edited.content_hash != first.content_hash
+    assert "port" in edited.schema.root["properties"]
+
+    with mock.patch.object(compiled, "zeno_version", return_value="99.0"):
+        assert compile_schema(path, cache_dir=cache).content_hash not in (first.content_hash, edited.content_hash)
+    with mock.patch.object(compiled, "CACHE_FORMAT", compiled.CACHE_FORMAT + 1):
+        assert compile_schema(path, cache_dir=cache).content_hash != edited.content_hash
+    assert len(_entries(cache)) == 4
+
+    missing = compiled.metadata.PackageNotFoundError
+    with mock.patch.object(compiled.metadata, "version", side_effect=missing):
+        version = compiled.zeno_version()
+        edited_types = cache.parent / "ir_types.py"
+        edited_types.write_bytes(Path(compiled.ir_types.__file__).read_bytes() + b"# changed\n")
+        with mock.patch.object(compiled, "ir_types", SimpleNamespace(__file__=str(edited_types))):
+            assert compiled.zeno_version() != version
+    assert version.startswith("dev-")
+    print("✓ Cache key: PASSED")
+
+
+def test_cache_failures():
+    """Test corrupt entries are replaced and an unusable cache is ignored."""
+    cache, path = _setup()
+    first = compile_schema(path, cache_dir=cache)
+    entry = cache / (first.content_hash + ".pickle")
+    entry.write_bytes(entry.read_bytes()[:20])
+    assert compile_schema(path, cache_dir=cache) == first
+    assert compile_schema(path, cache_dir=cache, use_cache=False) == first
+    assert entry.stat().st_size > 20
+
+    blocked = cache.parent / "blocked"
+    blocked.write_text("a file, not a directory")
+    assert compile_schema(path, cache_dir=blocked / "schemas") == first
+
+    with mock.patch.dict(os.environ, {"ZENO_CACHE_DIR": str(cache.parent / "env")}):
+        compile_schema(path)
+    assert _entries(cache.parent / "env") == [first.content_hash + ".pickle"]
+    print("✓ Cache failures: PASSED")
+
+
+def test_invalid_not_cached():
+    """Test structurally invalid schemas raise every time and leave no entry."""
+    cache, path = _setup()
+    path.write_text(SCHEMA.replace("type: string", "type: text"), encoding="utf-8")
+    for _ in range(2):
+        try:
+            compile_schema(path, cache_dir=cache)
+        except SchemaValidationError:
+            pass
+        else:
+            raise AssertionError("invalid schema compiled")
+    assert _entries(cache) == []
+    print("✓ Invalid not cached: PASSED")
+
+
+if __name__ == "__main__":
+    test_cache_hit()
+    test_cache_key()
+    test_cache_failures()
+    test_invalid_not_cached()
+    print("\n✅ All schema cache tests PASSED!")
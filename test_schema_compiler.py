@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test validators compiled from bound schemas.
+
+Tests that:
+1. The compiled validator reports the same issues and unique_by errors,
+   in the same order, as ir_validator.validate + validate_ir_semantics,
+   with integer mapping keys written as ".n" path segments
+2. Unknown keys, wrong kinds and null scalars are handled as the
+   interpreter does
+3. Recursive schemas compile and validate beyond the recursion limit,
+   on plain and persistent stores
+"""
+
+import sys
+
+from zeno.adapters import yaml_adapter
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.core.store import IRStore
+from zeno.core.types import NodeType
+from zeno.schema.binder import bind
+from zeno.schema.compiler import compile_validator, format_path
+from zeno.schema.ir_semantic_validator import validate_ir_semantics
+from zeno.schema.ir_validator import IRStoreView, ValidationError, validate
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "listeners": {
+            "type": "array",
+            "unique_by": "port",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "port": {"type": "integer"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                    "limits": {"type": "object", "properties": {"rate": {"type": "number"}}},
+                },
+            },
+        },
+        "groups": {
+            "type": "array",
+            "items": {"type": "array", "unique_by": "id", "items": {"type": "object", "properties": {"id": {"type": "string"}}}},
+        },
+    },
+}
+
+DOCUMENTS = [
+    "name: a\nlisteners:\n- port: 1\n  tags: [x, y]\n  limits: {rate: 2.5}\n- port: 2\ngroups:\n- [{id: a}, {id: b}]\n",
+    "listeners:\n- port: 1\n- port: 1\n- {tags: [a]}\n- [1]\n- port: {x: 1}\ngroups:\n- [{id: a}, {id: a}]\n- []\n",
+    "name: [a]\nextra: {a: 1}\nlisteners:\n  port: 1\ngroups: [[1], 2]\n",
+    "name:\nlisteners:\n- port: 1\n  limits:\n  tags: [[a], {b: 1}]\n  other: 3\n",
+    "1: a\nlisteners:\n- port: 1\n  2: [x]\n  tags: {3: [y]}\ngroups: [[{id: a, 4: b}], {5: 6}]\n",
+]
+
+
+def _store(text):
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    yaml_adapter.parse(text, store)
+    return store
+
+
+def _deep(store, depth, leaf):
+    data = leaf
+    for _ in range(depth):
+        data = {"a": data}
+    root_id = store.create_root(NodeType.OBJECT)
+    yaml_adapter._parse_object(store, store.get_node(root_id), data)
+    return store
+
+
+def _interpret(store, root_type):
+    view = IRStoreView(store, store.root_id)
+    try:
+        validate(view, root_type)
+        issues = []
+    except ValidationError as e:
+        issues = e.issues
+    return issues, validate_ir_semantics(root_type, view)
+
+
+def test_matches_interpreter():
+    """Test issues and errors match the interpreters on valid and broken documents."""
+    root_type = bind(SCHEMA)
+    validator = compile_validator(root_type)
+    for text in DOCUMENTS:
+        store = _store(text)
+        issues, errors = validator(store)
+        expected_issues, expected_errors = _interpret(store, root_type)
+        assert issues == expected_issues, text
+        if not issues:
+            assert errors == expected_errors, text
+
+    store = _store(DOCUMENTS[1])
+    issues, errors = validator(store)
+    assert [i.path for i in issues] == ["$.listeners[3]", "$.listeners[4].port"]
+    assert errors == _interpret(store, root_type)[1]
+    assert [(e.path, e.message) for e in errors] == [
+        ("$.listeners[1].port", "duplicate value 1 (already used at $.listeners[0].port)"),
+        ("$.listeners[2].port", "missing field required by unique_by"),
+        ("$.listeners[3]", "unique_by requires array items of type 'object'"),
+        ("$.listeners[4].port", "unique_by field must be scalar"),
+        ("$.groups[0][1].id", "duplicate value 'a' (already used at $.groups[0][0].id)"),
+    ]
+    issues, _ = validator(_store(DOCUMENTS[4]))
+    assert [i.path for i in issues] == [
+        "$.1", "$.listeners[0].2", "$.listeners[0].tags", "$.groups[0][0].4", "$.groups[1]",
+    ]
+    print("✓ Matches interpreter: PASSED")
+
+
+def test_shape_issues():
+    """Test unknown keys, wrong kinds and null scalars."""
+    validator = compile_validator(bind(SCHEMA))
+    issues, _ = validator(_store(DOCUMENTS[2]))
+    assert [(i.path, i.message) for i in issues] == [
+        ("$.extra", "Unknown property: extra"),
+        ("$.name", "Expected string, got list"),
+        ("$.listeners", "Expected array, got object"),
+        ("$.groups[0][0]", "Expected object, got scalar"),
+        ("$.groups[1]", "Expected array, got scalar"),
+    ]
+    issues, _ = validator(_store(DOCUMENTS[3]))
+    assert [(i.path, i.message) for i in issues] == [
+        ("$.listeners[0].other", "Unknown property: other"),
+        ("$.listeners[0].tags[0]", "Expected string, got list"),
+        ("$.listeners[0].tags[1]", "Expected string, got object"),
+    ]
+    assert format_path(None) == "$" and format_path(((None, "a"), 3, None)) == "$.a[3]"
+    assert format_path(((None, "a"), 3)) == "$.a.3"
+    print("✓ Shape issues: PASSED")
+
+
+def test_recursive_schema():
+    """Test a self-referencing schema on a document deeper than the recursion limit."""
+    node = {"type": "object", "properties": {"leaf": {"type": "integer"}}}
+    node["properties"]["a"] = node
+    validator = compile_validator(bind(node))
+
+    depth = sys.getrecursionlimit() * 5
+    for store in (IRStore(), PersistentIRStore()):
+        assert validator(_deep(store, depth, {"leaf": 1})) == ([], [])
+    issues, _ = validator(_deep(IRStore(), depth, {"leaf": 1, "bad": 2}))
+    assert len(issues) == 1 and issues[0].path == "$" + ".a" * depth + ".bad"
+    print("✓ Recursive schema: PASSED")
+
+
+if __name__ == "__main__":
+    test_matches_interpreter()
+    test_shape_issues()
+    test_recursive_schema()
+    print("\n✅ All schema compiler tests PASSED!")
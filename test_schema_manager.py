@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test the SchemaManager canonical path index.
+
+Tests that:
+1. Objects, arrays and array items resolve by canonical path ("a[].b"),
+   with required sets and array bounds precomputed
+2. Unknown paths resolve to nothing instead of falling back to items
+3. child_path / parent_path round trip over every indexed path of a
+   real schema
+"""
+
+from zeno.schema.loader import load, loads
+from zeno.ui.schema_manager import SchemaManager, build_index, child_path, parent_path
+
+
+SCHEMA = """zeno_schema: "2.0"
+application: "ZENO"
+format: "yaml"
+
+root:
+  type: object
+  required: [name]
+  properties:
+    name:
+      type: string
+    listeners:
+      type: array
+      min_items: 1
+      max_items: 4
+      items:
+        type: object
+        required: [port]
+        properties:
+          port:
+            type: integer
+          host:
+            type: string
+            required: true
+    matrix:
+      type: array
+      items:
+        type: array
+        max_items: 3
+        items:
+          type: number
+"""
+
+
+def test_resolve():
+    """Test lookups of objects, arrays and items."""
+    manager = SchemaManager(loads(SCHEMA))
+    assert manager.resolve_object_schema("")["type"] == "object"
+    assert manager.get_required_properties("") == {"name"}
+    assert manager.get_array_constraints("listeners") == {"min_items": 1, "max_items": 4}
+    assert manager.resolve_list_item_schema("listeners")["required"] == ["port"]
+    assert manager.get_required_properties("listeners[]") == {"port", "host"}
+    assert manager.is_property_required("listeners[]", "host")
+    assert not manager.is_property_required("listeners[]", "missing")
+    assert manager.resolve_object_schema("listeners[].port") == {"type": "integer"}
+    assert manager.get_array_constraints("matrix[]") == {"min_items": None, "max_items": 3}
+    assert manager.resolve_list_item_schema("matrix[]") == {"type": "number"}
+    print("✓ Resolve: PASSED")
+
+
+def test_no_fallback():
+    """Test unknown paths and a missing schema give empty answers."""
+    manager = SchemaManager(loads(SCHEMA))
+    # Formerly "listeners.port" silently fell back to the array's items.
+    assert manager.resolve_object_schema("listeners.port") == {}
+    assert manager.resolve_object_schema("name.nothing") == {}
+    assert manager.resolve_list_item_schema("name") == {}
+    assert manager.get_array_constraints("unknown") == {"min_items": None, "max_items": None}
+    assert not manager.is_property_required("unknown", "name")
+
+    empty = SchemaManager()
+    assert empty.resolve_object_schema("") == {} and empty.get_required_properties("") == set()
+    empty.set_schema(loads(SCHEMA))
+    assert empty.is_property_required("", "name")
+    print("✓ No fallback: PASSED")
+
+
+def test_paths():
+    """Test child_path and parent_path over the MMA schema's index."""
+    index = build_index(load("schema/mma_nested_model.zs").root)
+    assert len(index) > 20
+    for path, entry in index.items():
+        for key, prop in entry.node.get("properties", {}).items():
+            assert index[child_path(path, key)].node is prop
+            assert parent_path(child_path(path, key)) == path
+        if "items" in entry.node:
+            assert index[child_path(path, None)].node is entry.node["items"]
+            assert parent_path(child_path(path, None)) == path
+    assert parent_path("a[].b") == "a[]" and parent_path("a") == "" and parent_path("a[][]") == "a[]"
+    print("✓ Paths: PASSED")
+
+
+if __name__ == "__main__":
+    test_resolve()
+    test_no_fallback()
+    test_paths()
+    print("\n✅ All schema manager tests PASSED!")
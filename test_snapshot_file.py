@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test binary snapshot files.
+
+Tests that:
+1. save_snapshot / load_snapshot round-trip every backend's documents
+2. The mapped store builds nodes on access and takes edits, undo and
+   snapshots like IRStore
+3. Files from another format version, cut short or of another kind are refused
+4. Saving syncs the file before the rename, and its directory after it
+"""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.snapshot_file import MAGIC, load_snapshot, save_snapshot
+from zeno.adapters.yaml_adapter import serialize, parse
+
+
+SAMPLE_YAML = """name: gateway
+listeners:
+- port: 502
+  host: plc-1
+- port: 503
+limits:
+  timeout: 1.5
+  retries: 3
+big: 123456789012345678901234567890
+when: 2024-01-02
+raw: !!binary aGVsbG8=
+1: one
+none: ~
+text: "é 😀 \\x00"
+"""
+
+
+def _load(backend=IRStore, text=SAMPLE_YAML):
+    store = backend()
+    store.create_root(NodeType.OBJECT)
+    parse(text, store)
+    return store
+
+
+def _text(store):
+    return serialize(store.get_node(store.root_id), store)
+
+
+def _reopen(store):
+    path = Path(tempfile.mkdtemp()) / "doc.zsnap"
+    save_snapshot(store, path)
+    return load_snapshot(path)
+
+
+def test_round_trip():
+    """Test ids, order, keys and values survive on every backend."""
+    items = "".join(f"- {i}\n" for i in range(300))
+    for backend in (IRStore, ColumnarIRStore, PersistentIRStore):
+        store = _load(backend, SAMPLE_YAML + "items:\n" + items)
+        mapped = _reopen(store)
+        assert _text(mapped) == _text(store)
+        assert len(mapped) == len(store)
+        assert sorted(mapped.iter_node_ids()) == sorted(store.iter_node_ids())
+        assert mapped.root_id == store.root_id
+        assert mapped.get_node(mapped.get_child_by_key(mapped.root_id, 1)).value == "one"
+
+    empty = IRStore()
+    empty.create_root(NodeType.LIST)
+    assert _text(_reopen(empty)) == _text(empty)
+    print("✓ Round trip: PASSED")
+
+
+def test_lazy_nodes_and_edits():
+    """Test nodes are built on first access and edits behave as on IRStore."""
+    store = _load()
+    processor = OperationProcessor(store)
+    name_id = store.get_child_by_key(store.root_id, "name")
+    processor.apply(Operation.create("remove_node", name_id, {"node_id": name_id}))
+
+    mapped = _reopen(store)
+    assert len(mapped._nodes) == 0 and not mapped.has_node(name_id)
+    limits_id = mapped.get_child_by_key(mapped.root_id, "limits")
+    assert set(mapped._nodes) == {mapped.root_id}
+    assert mapped.get_node(limits_id).key == "limits"
+    assert set(mapped._nodes) == {mapped.root_id, limits_id}
+
+    expected = _load()
+    expected_processor = OperationProcessor(expected)
+    mapped_processor = OperationProcessor(mapped)
+    for proc, target in ((expected_processor, expected), (mapped_processor, mapped)):
+        limits = target.get_child_by_key(target.root_id, "limits")
+        timeout = target.get_child_by_key(limits, "timeout")
+        proc.apply(Operation.create("update_scalar", timeout, {"node_id": timeout, "value": 2.5}))
+        proc.apply(Operation.create("add_node", limits, {
+            "parent_id": limits, "node_type": NodeType.SCALAR, "key": "mode",
+        }))
+        listeners = target.get_child_by_key(target.root_id, "listeners")
+        proc.apply(Operation.create("reorder_list", listeners, {"node_id": listeners, "order": [1, 0]}))
+    target_name = expected.get_child_by_key(expected.root_id, "name")
+    expected_processor.apply(Operation.create("remove_node", target_name, {"node_id": target_name}))
+    assert _text(mapped) == _text(expected)
+    assert mapped.get_child_by_key(limits_id, "mode") is not None
+
+    snap = mapped.snapshot()
+    mapped_processor.undo()
+    mapped_processor.undo()
+    assert "mode" not in _text(mapped) and "mode" in _text(snap)
+    assert len(mapped) == len(snap) - 1
+    assert _text(_reopen(mapped)) == _text(mapped)
+    print("✓ Lazy nodes and edits: PASSED")
+
+
+def test_refused_files():
+    """Test other versions, truncated files and non-snapshots raise ValueError."""
+    folder = Path(tempfile.mkdtemp())
+    path = folder / "doc.zsnap"
+    save_snapshot(_load(), path)
+    data = path.read_bytes()
+    cases = {
+        "version": data[:len(MAGIC)] + (99).to_bytes(4, "little") + data[len(MAGIC) + 4:],
+        "truncated": data[:len(data) // 2],
+        "yaml": SAMPLE_YAML.encode("utf-8"),
+        "empty": b"",
+    }
+    for name, content in cases.items():
+        bad = folder / name
+        bad.write_bytes(content)
+        try:
+            load_snapshot(bad)
+            raise AssertionError(f"{name} file accepted")
+        except ValueError as e:
+            assert name != "version" or "version 99" in str(e)
+    assert not os.path.exists(str(path) + ".tmp")
+    print("✓ Refused files: PASSED")
+
+
+def test_synced_save():
+    """Test the snapshot is fsynced before os.replace and the folder after."""
+    path = Path(tempfile.mkdtemp()) / "doc.zsnap"
+    calls = []
+    fsync, replace = os.fsync, os.replace
+
+    def record_fsync(fd):
+        calls.append(("fsync", stat.S_ISDIR(os.fstat(fd).st_mode)))
+        fsync(fd)
+
+    def record_replace(src, dst):
+        calls.append(("replace", None))
+        replace(src, dst)
+
+    os.fsync, os.replace = record_fsync, record_replace
+    try:
+        save_snapshot(_load(), path)
+    finally:
+        os.fsync, os.replace = fsync, replace
+    expected = [("fsync", False), ("replace", None)]
+    if os.name == "posix":
+        expected.append(("fsync", True))
+    assert calls == expected, calls
+    assert _text(load_snapshot(path)) == _text(_load())
+    print("✓ Synced save: PASSED")
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_lazy_nodes_and_edits()
+    test_refused_files()
+    test_synced_save()
+    print("\n✅ All snapshot file tests PASSED!")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test IRStore structural bookkeeping and Node layout.
+
+Verifies that:
+1. The OBJECT key index stays in sync with link/unlink/delete
+2. Leaves share empty children and metadata is allocated lazily
+3. Node handles are store-local integers with lazily derived UUIDs
+"""
+
+from zeno.core.node import Node, EMPTY_CHILDREN
+from zeno.core.types import NodeType, parse_node_id
+from zeno.core.store import IRStore
+
+
+def _add_scalar(store: IRStore, parent_id, key=None, value=None):
+    node = Node.create(NodeType.SCALAR)
+    node.value = value
+    store.add_unlinked_node(node)
+    store.link_child(parent_id=parent_id, child_id=node.id, key=key)
+    return node.id
+
+
+def test_get_child_by_key():
+    """Test keyed lookup returns linked children and None for missing keys."""
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+
+    name_id = _add_scalar(store, root_id, "name", "Alice")
+    age_id = _add_scalar(store, root_id, "age", 30)
+
+    assert store.get_child_by_key(root_id, "name") == name_id
+    assert store.get_child_by_key(root_id, "age") == age_id
+    assert store.get_child_by_key(root_id, "missing") is None
+    print("✓ Keyed child lookup: PASSED")
+
+
+def test_key_index_follows_unlink_and_delete():
+    """Test unlinked and deleted children disappear from the key index."""
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+
+    name_id = _add_scalar(store, root_id, "name", "Alice")
+    store.unlink_child(child_id=name_id)
+    assert store.get_child_by_key(root_id, "name") is None
+
+    # Key is free again after unlink.
+    store.link_child(parent_id=root_id, child_id=name_id, key="alias")
+    assert store.get_child_by_key(root_id, "alias") == name_id
+
+    person = Node.create(NodeType.OBJECT)
+    store.add_unlinked_node(person)
+    store.link_child(parent_id=root_id, child_id=person.id, key="person")
+    _add_scalar(store, person.id, "city", "Oslo")
+
+    store.unlink_child(child_id=person.id)
+    store.delete_subtree(node_id=person.id)
+    assert store.get_child_by_key(root_id, "person") is None
+    assert person.id not in store._key_index
+    print("✓ Key index sync on unlink/delete: PASSED")
+
+
+def test_get_child_by_key_rejects_list():
+    """Test keyed lookup is only defined for OBJECT nodes."""
+    store = IRStore()
+    root_id = store.create_root(NodeType.LIST)
+
+    try:
+        store.get_child_by_key(root_id, "x")
+        raise AssertionError("Keyed lookup on LIST should fail")
+    except ValueError:
+        print("✓ Keyed lookup rejects LIST: PASSED")
+
+
+def test_node_compact_layout():
+    """Test leaves share empty children and metadata is allocated lazily."""
+    leaf = Node.create(NodeType.SCALAR)
+    other = Node.create(NodeType.SCALAR)
+    assert leaf.children is EMPTY_CHILDREN
+    assert other.children is EMPTY_CHILDREN
+    assert not hasattr(leaf, "__dict__")
+
+    assert leaf.get_metadata("origin") is None
+    assert leaf._metadata is None
+    leaf.metadata["origin"] = "import"
+    assert leaf.get_metadata("origin") == "import"
+
+    container = Node.create(NodeType.LIST)
+    assert isinstance(container.children, list)
+    assert container.children is not Node.create(NodeType.LIST).children
+    print("✓ Compact node layout: PASSED")
+
+
+def test_link_into_retyped_container():
+    """Test a node retyped from SCALAR gets its own children list on link."""
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+
+    node = Node.create(NodeType.SCALAR)
+    node.type = NodeType.LIST
+    store.add_unlinked_node(node)
+    store.link_child(parent_id=root_id, child_id=node.id, key="items")
+
+    item_id = _add_scalar(store, node.id, value=1)
+    assert list(node.children) == [item_id]
+    assert EMPTY_CHILDREN == ()
+    print("✓ Retyped container link: PASSED")
+
+
+def test_integer_handles_and_persistent_ids():
+    """Test store-local handles are monotonic and UUIDs are derived lazily."""
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+
+    a_id = _add_scalar(store, root_id, "a")
+    b_id = _add_scalar(store, root_id, "b")
+    assert isinstance(root_id, int)
+    assert root_id < a_id < b_id
+
+    # Handles are never reused after delete.
+    store.unlink_child(child_id=b_id)
+    store.delete_subtree(node_id=b_id)
+    c_id = _add_scalar(store, root_id, "c")
+    assert c_id > b_id
+
+    assert not store._persistent_ids
+    uid = store.persistent_id(a_id)
+    assert store.persistent_id(a_id) == uid
+    assert store.resolve_persistent_id(uid) == a_id
+
+    store.unlink_child(child_id=a_id)
+    store.delete_subtree(node_id=a_id)
+    assert store.resolve_persistent_id(uid) is None
+    print("✓ Integer handles and persistent ids: PASSED")
+
+
+def test_parse_node_id():
+    """Test UI-carried handles are coerced back to NodeId."""
+    assert parse_node_id(7) == 7
+    assert parse_node_id("42") == 42
+    assert parse_node_id("") is None
+    assert parse_node_id("not-a-handle") is None
+    assert parse_node_id(True) is None
+    print("✓ Node id parsing: PASSED")
+
+
+if __name__ == "__main__":
+    test_get_child_by_key()
+    test_key_index_follows_unlink_and_delete()
+    test_get_child_by_key_rejects_list()
+    test_node_compact_layout()
+    test_link_into_retyped_container()
+    test_integer_handles_and_persistent_ids()
+    test_parse_node_id()
+    print("\n✅ All store tests PASSED!")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test iterative tree traversal (no recursion limit on document depth).
+
+Tests that:
+1. preorder/postorder visit nodes in the expected order
+2. Delete, serialize, validate and parse handle trees deeper than the
+   interpreter recursion limit
+3. Semantic validation still reports unique_by violations
+"""
+
+import sys
+
+from zeno.core.node import Node
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.traversal import preorder, postorder, preorder_ids, postorder_ids
+from zeno.adapters import yaml_adapter
+from zeno.schema.ir_validator import IRStoreView, validate
+from zeno.schema.ir_semantic_validator import validate_ir_semantics
+from zeno.schema.loader import Schema, SchemaHeader
+
+
+DEPTH = sys.getrecursionlimit() * 5
+
+
+def _add(store, parent_id, node_type, key=None, value=None):
+    node = Node.create(node_type)
+    node.value = value
+    store.add_unlinked_node(node)
+    store.link_child(parent_id=parent_id, child_id=node.id, key=key)
+    return node.id
+
+
+def _deep_store(depth):
+    """root -> a -> a -> ... (OBJECT chain) ending in a scalar leaf."""
+    store = IRStore()
+    parent_id = store.create_root(NodeType.OBJECT)
+    for _ in range(depth):
+        parent_id = _add(store, parent_id, NodeType.OBJECT, key="a")
+    _add(store, parent_id, NodeType.SCALAR, key="leaf", value=1)
+    return store
+
+
+def test_traversal_order():
+    """Test pre- and post-order visit sequences."""
+    tree = {1: [2, 5], 2: [3, 4], 3: [], 4: [], 5: [6], 6: []}
+
+    assert list(preorder(1, tree.__getitem__)) == [1, 2, 3, 4, 5, 6]
+    assert list(postorder(1, tree.__getitem__)) == [3, 4, 2, 6, 5, 1]
+
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    a = _add(store, root_id, NodeType.LIST, key="a")
+    a0 = _add(store, a, NodeType.SCALAR, value=0)
+    b = _add(store, root_id, NodeType.SCALAR, key="b", value=1)
+
+    assert list(preorder_ids(store, root_id)) == [root_id, a, a0, b]
+    assert list(postorder_ids(store, root_id)) == [a0, a, b, root_id]
+    print("✓ Traversal order: PASSED")
+
+
+def test_deep_delete_and_serialize():
+    """Test delete_subtree and serialization beyond the recursion limit."""
+    store = _deep_store(DEPTH)
+
+    plain = yaml_adapter._node_to_plain(store.get_node(store.root_id), store)
+    for _ in range(DEPTH):
+        plain = plain["a"]
+    assert plain == {"leaf": 1}
+
+    top_id = store.get_child_by_key(store.root_id, "a")
+    store.unlink_child(child_id=top_id)
+    store.delete_subtree(node_id=top_id)
+    assert len(store) == 1
+    print("✓ Deep delete and serialize: PASSED")
+
+
+def test_deep_validate_and_parse():
+    """Test validation and IR build beyond the recursion limit."""
+    store = _deep_store(DEPTH)
+    validate(IRStoreView(store, store.root_id))
+
+    data = {"leaf": 1}
+    for _ in range(DEPTH):
+        data = {"a": data}
+
+    parsed = IRStore()
+    root_id = parsed.create_root(NodeType.OBJECT)
+    yaml_adapter._parse_object(parsed, parsed.get_node(root_id), data)
+    assert len(parsed) == len(store)
+
+    schema_node = {"type": "object", "properties": {}}
+    schema_node["properties"]["a"] = schema_node
+    schema = Schema(
+        header=SchemaHeader(zeno_schema="2.0", application="ZENO", format="yaml"),
+        root=schema_node,
+        raw={},
+        source_path="<test>",
+    )
+    assert validate_ir_semantics(schema, IRStoreView(parsed, root_id)) == []
+    print("✓ Deep validate and parse: PASSED")
+
+
+def test_semantic_unique_by():
+    """Test unique_by is still enforced on nested arrays."""
+    schema = Schema(
+        header=SchemaHeader(zeno_schema="2.0", application="ZENO", format="yaml"),
+        root={
+            "type": "object",
+            "properties": {
+                "listeners": {
+                    "type": "array",
+                    "unique_by": "port",
+                    "items": {"type": "object", "properties": {"port": {"type": "integer"}}},
+                },
+            },
+        },
+        raw={},
+        source_path="<test>",
+    )
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    yaml_adapter.parse("listeners:\n- port: 1\n- port: 1\n", store)
+
+    errors = validate_ir_semantics(schema, IRStoreView(store, root_id))
+    assert [e.path for e in errors] == ["$.listeners[1].port"]
+    print("✓ Semantic unique_by: PASSED")
+
+
+if __name__ == "__main__":
+    test_traversal_order()
+    test_deep_delete_and_serialize()
+    test_deep_validate_and_parse()
+    test_semantic_unique_by()
+    print("\n✅ All traversal tests PASSED!")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test the undo/redo journal in OperationProcessor.
+
+Tests that:
+1. Undo and redo walk a mixed edit history back and forth exactly
+2. Consecutive scalar edits of one node coalesce into a single entry,
+   until sealed or after a pause; batches never coalesce
+3. A new edit clears redo; the journal evicts by memory budget
+"""
+
+from unittest import mock
+
+from zeno.core import undo_journal
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.core.undo_journal import UndoJournal
+from zeno.adapters.yaml_adapter import serialize, parse
+
+
+SAMPLE_YAML = """
+name: gateway
+listeners:
+- port: 502
+- port: 503
+"""
+
+
+def _load(journal=None):
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    parse(SAMPLE_YAML, store)
+    return store, OperationProcessor(store, journal)
+
+
+def _text(store):
+    return serialize(store.get_node(store.root_id), store)
+
+
+def _op(kind, node_id, **payload):
+    return Operation.create(kind, node_id, {"node_id": node_id, **payload})
+
+
+def test_undo_redo_history():
+    """Test undo/redo through add, update, move, remove and a batch."""
+    store, processor = _load()
+    root_id = store.root_id
+    name_id = store.get_child_by_key(root_id, "name")
+    listeners_id = store.get_child_by_key(root_id, "listeners")
+    first_id, second_id = store.iter_children(listeners_id)
+
+    states = [_text(store)]
+    processor.apply(_op("update_scalar", name_id, value="edge"))
+    states.append(_text(store))
+    processor.apply(_op("move_node", first_id, direction="down"))
+    states.append(_text(store))
+    processor.apply(_op("remove_node", second_id))
+    states.append(_text(store))
+    mode_id = store.allocate_id()
+    processor.apply_batch([
+        Operation.create("add_node", None, {
+            "parent_id": root_id, "node_type": NodeType.SCALAR, "key": "mode", "node_id": mode_id,
+        }),
+        _op("update_scalar", mode_id, value="rtu"),
+    ])
+    states.append(_text(store))
+    assert len(processor.journal) == 4
+
+    for expected in reversed(states[:-1]):
+        assert processor.undo()
+        assert _text(store) == expected
+    assert not processor.undo()
+
+    for expected in states[1:]:
+        assert processor.redo()
+        assert _text(store) == expected
+    assert not processor.redo()
+    print("✓ Undo/redo history: PASSED")
+
+
+def test_scalar_edits_coalesce():
+    """Test keystroke edits collapse into one entry until sealed."""
+    store, processor = _load()
+    name_id = store.get_child_by_key(store.root_id, "name")
+    port_id = store.get_child_by_key(list(store.iter_children(
+        store.get_child_by_key(store.root_id, "listeners")))[0], "port")
+
+    for text in ("e", "ed", "edg", "edge"):
+        processor.apply(_op("update_scalar", name_id, value=text))
+    assert len(processor.journal) == 1
+
+    processor.journal.seal()
+    processor.apply(_op("update_scalar", name_id, value="edge2"))
+    processor.apply(_op("update_scalar", port_id, value=1))
+    processor.apply(_op("update_scalar", port_id, value=15))
+    assert len(processor.journal) == 3
+
+    processor.undo()
+    assert store.get_node(port_id).value == 502
+    processor.undo()
+    assert store.get_node(name_id).value == "edge"
+    processor.undo()
+    assert store.get_node(name_id).value == "gateway"
+    print("✓ Scalar edits coalesce: PASSED")
+
+
+def test_coalesce_window_and_batches():
+    """Test a pause between edits and single-op batches start new entries."""
+    store, processor = _load()
+    port_id = store.get_child_by_key(list(store.iter_children(
+        store.get_child_by_key(store.root_id, "listeners")))[0], "port")
+
+    clock = [100.0]
+    with mock.patch.object(undo_journal, "monotonic", lambda: clock[0]):
+        for value, pause in ((80, 0.0), (808, 0.5), (8080, 0.5), (9090, 5.0), (90, 0.2)):
+            clock[0] += pause
+            processor.apply(_op("update_scalar", port_id, value=value))
+        assert len(processor.journal) == 2
+
+        processor.apply_batch([_op("update_scalar", port_id, value=1)])
+        processor.apply(_op("update_scalar", port_id, value=2))
+        processor.apply_batch([_op("update_scalar", port_id, value=3)])
+        assert len(processor.journal) == 5
+
+    for expected in (2, 1, 90, 8080, 502):
+        processor.undo()
+        assert store.get_node(port_id).value == expected
+    print("✓ Coalesce window and batches: PASSED")
+
+
+def test_redo_cleared_and_eviction():
+    """Test a new edit drops redo and the budget evicts old entries."""
+    store, processor = _load(UndoJournal(budget_bytes=2000))
+    name_id = store.get_child_by_key(store.root_id, "name")
+
+    processor.apply(_op("update_scalar", name_id, value="a"))
+    processor.undo()
+    assert processor.journal.can_redo()
+    processor.apply(_op("update_scalar", name_id, value="b"))
+    assert not processor.journal.can_redo()
+
+    for i in range(50):
+        processor.journal.seal()
+        processor.apply(_op("update_scalar", name_id, value=f"v{i}"))
+    assert 1 <= len(processor.journal) < 50
+    assert processor.journal.size_bytes <= 2000
+
+    while processor.undo():
+        pass
+    assert store.get_node(name_id).value != "gateway"  # oldest edits were evicted
+
+    processor.journal.clear()
+    assert not processor.journal.can_undo() and processor.journal.size_bytes == 0
+    print("✓ Redo cleared and eviction: PASSED")
+
+
+if __name__ == "__main__":
+    test_undo_redo_history()
+    test_scalar_edits_coalesce()
+    test_coalesce_window_and_batches()
+    test_redo_cleared_and_eviction()
+    print("\n✅ All undo journal tests PASSED!")
@@ -6,6 +6,8 @@ Tests that:
 1. serialize(Node tree) → YAML string
 2. parse(YAML string) → Node tree
 3. Round-trip: original tree == parse(serialize(original tree))
+4. Recursive aliases raise instead of building nodes forever; shared
+   (non-recursive) aliases still expand
 """
 
 from zeno.core.node import Node
@@ -197,6 +199,28 @@ def test_roundtrip_nested():
     print("✓ Roundtrip nested: PASSED")
 
 
+def test_recursive_alias():
+    """Test recursive aliases are rejected on both parse paths."""
+    for text in ("a: &a [*a]\n", "a: &a {b: *a}\n"):
+        for streaming in (True, False):
+            store = IRStore()
+            store.create_root(NodeType.OBJECT)
+            try:
+                parse(text, store, streaming=streaming)
+            except ValueError as e:
+                assert "Recursive alias" in str(e)
+            else:
+                raise AssertionError(f"parsed {text!r}")
+            assert len(store) < 10
+    
+    store = IRStore()
+    root_id = store.create_root(NodeType.OBJECT)
+    parse("a: &a [1, [2]]\nb: *a\nc: [*a, *a]\n", store, streaming=False)
+    assert len(store.get_node(root_id).children) == 3 and len(store) == 1 + 4 + 4 + 9
+    
+    print("✓ Recursive alias: PASSED")
+
+
 if __name__ == "__main__":
     test_serialize_scalar()
     test_serialize_object()
@@ -204,4 +228,5 @@ if __name__ == "__main__":
     test_parse_nested_object()
     test_roundtrip_object()
     test_roundtrip_nested()
+    test_recursive_alias()
     print("\n✅ All adapter tests PASSED!")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test the libyaml-backed YAML load/dump helpers.
+
+Tests that:
+1. Serialized text is byte-identical to the pure-Python dumper
+2. Inputs the C emitter renders differently fall back to the pure dumper
+3. The C loader builds the same data as the pure-Python loader
+"""
+
+import random
+from datetime import date, datetime
+from pathlib import Path
+
+import yaml
+
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.adapters.yaml_adapter import serialize, parse
+from zeno.adapters.yaml_backend import emits_identically, safe_dump, safe_load
+
+
+def _pure_dump(data):
+    return yaml.dump(data, Dumper=yaml.SafeDumper, sort_keys=False, allow_unicode=True)
+
+
+def _dump(data):
+    return safe_dump(data, sort_keys=False, allow_unicode=True)
+
+
+def _round_trip(text):
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    parse(text, store)
+    return serialize(store.get_node(store.root_id), store)
+
+
+SAMPLE = {
+    "name": "gateway",
+    "description": "A long description that is well past the eighty column limit, " * 3,
+    "unicode": "café – 日本語",
+    "special": ["yes", "null", "~", "0x1F", "1.0", "a: b", "#tag", "'quoted'", "- item", ""],
+    "numbers": [0, -3, 2.5, 1e20, 10**25, float("inf"), True, None],
+    "when": {"day": date(2024, 5, 1), "at": datetime(2024, 5, 1, 12, 30, 5)},
+    "blob": b"\x00\x01binary",
+    "nested": [{"port": 502, "tags": ["a", "b"], "empty": {}, "none": []}],
+}
+
+DIVERGENT = (
+    {"": "empty key"},
+    {"text": "line one\nline two\n"},
+    {"tab": "a\tb"},
+    {"emoji": "ok 😀"},
+    {"bom": "\ufeffx"},
+    {1: "int key"},
+)
+
+
+def test_byte_identical_dump():
+    """Test that dumps and parse → serialize match the pure-Python output."""
+    assert emits_identically(SAMPLE)
+    assert _dump(SAMPLE) == _pure_dump(SAMPLE)
+    for data in DIVERGENT:
+        assert not emits_identically(data)
+        assert _dump(data) == _pure_dump(data)
+
+    for path in sorted(Path("ConfigOutput").glob("*.yaml")) + sorted(Path("schema").glob("*.zs")):
+        text = path.read_text(encoding="utf-8")
+        data = yaml.safe_load(text)
+        if isinstance(data, dict):
+            assert _round_trip(text) == _pure_dump(data), path
+    print("✓ Byte-identical dump: PASSED")
+
+
+def test_randomized_documents():
+    """Test byte-identical output on generated configs (seeded)."""
+    rng = random.Random(13)
+    alphabet = [chr(c) for c in range(32, 127)] * 3 + [" "] * 40 + list("éü日ß€\n\t")
+    leaves = [None, True, 0, -7, 2.5, 1e20, "", "null", "Yes", "1.0", "a: b", date(2024, 1, 2)]
+
+    def text(limit):
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, limit)))
+
+    def value(depth=0):
+        roll = rng.random()
+        if depth < 4 and roll < 0.2:
+            return {text(20) or "k": value(depth + 1) for _ in range(rng.randint(0, 5))}
+        if depth < 4 and roll < 0.35:
+            return [value(depth + 1) for _ in range(rng.randint(0, 5))]
+        if roll < 0.5:
+            return rng.choice(leaves)
+        return text(rng.choice((20, 80, 300)))
+
+    fast = 0
+    for _ in range(300):
+        data = {"root": value(), "items": [value(), value()]}
+        fast += emits_identically(data)
+        dumped = _dump(data)
+        assert dumped == _pure_dump(data)
+        assert safe_load(dumped) == yaml.safe_load(dumped)
+    assert fast > 30  # the C path is actually exercised
+    print("✓ Randomized documents: PASSED")
+
+
+def test_loader_matches():
+    """Test that safe_load equals yaml.safe_load, including errors."""
+    text = _pure_dump(SAMPLE)
+    assert safe_load(text) == yaml.safe_load(text)
+    try:
+        safe_load("a: [1, 2\nb: 3")
+        assert False, "Should raise on malformed YAML"
+    except yaml.YAMLError:
+        pass
+    print("✓ Loader matches: PASSED")
+
+
+if __name__ == "__main__":
+    test_byte_identical_dump()
+    test_randomized_documents()
+    test_loader_matches()
+    print("\n✅ All YAML backend tests PASSED!")
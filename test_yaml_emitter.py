@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test the streaming YAML serializer.
+
+Tests that:
+1. serialize_to writes exactly the text serialize returns, on every backend
+2. Shared dates, odd strings and scalar documents still match safe_dump
+3. Peak memory does not grow with document size
+"""
+
+import io
+import random
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+import yaml
+
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.adapters.yaml_adapter import serialize, serialize_to, parse
+
+
+BACKENDS = (IRStore, ColumnarIRStore, PersistentIRStore)
+
+
+def _store(text, store_class=IRStore, streaming=True):
+    data = yaml.safe_load(text)
+    store = store_class()
+    store.create_root(NodeType.LIST if isinstance(data, list) else NodeType.OBJECT)
+    parse(text, store, streaming=streaming)
+    return store
+
+
+def _streamed(store):
+    out = io.StringIO()
+    serialize_to(out, store, store.get_node(store.root_id))
+    return out.getvalue()
+
+
+def _same(text, store_class=IRStore, streaming=True):
+    store = _store(text, store_class, streaming)
+    assert _streamed(store) == serialize(store.get_node(store.root_id), store), text
+
+
+def test_matches_serialize():
+    """Test byte-identical output for configs and random documents."""
+    paths = sorted(Path("ConfigOutput").glob("*.yaml")) + sorted(Path("schema").glob("*.zs"))
+    for store_class in BACKENDS:
+        for path in paths:
+            _same(path.read_text(encoding="utf-8"), store_class)
+
+    rng = random.Random(15)
+    alphabet = [chr(c) for c in range(32, 127)] * 3 + list("éü日ß€\n\t😀")
+    leaves = [None, True, 0, -7, 2.5, 1e20, float("inf"), "", "null", "Yes", "a: b", date(2024, 1, 2)]
+
+    def text(limit):
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, limit)))
+
+    def value(depth=0):
+        roll = rng.random()
+        if depth < 4 and roll < 0.2:
+            return {text(20) or "k": value(depth + 1) for _ in range(rng.randint(0, 5))}
+        if depth < 4 and roll < 0.35:
+            return [value(depth + 1) for _ in range(rng.randint(0, 5))]
+        if roll < 0.5:
+            return rng.choice(leaves)
+        return text(rng.choice((20, 80, 300)))
+
+    for _ in range(200):
+        data = {"root": value(), "items": [value(), value()]}
+        _same(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), streaming=False)
+    print("✓ Matches serialize: PASSED")
+
+
+def test_edge_documents():
+    """Test anchors for shared values, divergent strings and scalar roots."""
+    shared = "a: &d 2024-01-01\nb: *d\nc: [*d, 2024-01-01]\n"
+    for text in (shared, "", "42\n", "~\n", "'': e\nt: \"a\\tb\"\n", "e: {}\nf: []\n", "x: !!binary aGVsbG8=\n"):
+        for store_class in BACKENDS:
+            for streaming in (True, False):
+                _same(text, store_class, streaming)
+
+    store = _store(shared, streaming=False)
+    assert "&id001" in _streamed(store) and "*id001" in _streamed(store)
+    print("✓ Edge documents: PASSED")
+
+
+class _Sink:
+    """Text stream that drops what it is given."""
+
+    def write(self, data):
+        pass
+
+    def flush(self):
+        pass
+
+
+def test_flat_memory():
+    """Test that peak memory while writing does not scale with the document."""
+    def peak_for(count):
+        store = IRStore()
+        root_id = store.create_root(NodeType.OBJECT)
+        items = {"devices": [{"host": f"device-{i}", "port": 502, "tags": ["a", "b"]} for i in range(count)]}
+        parse(yaml.safe_dump(items, sort_keys=False), store)
+        tracemalloc.start()
+        serialize_to(_Sink(), store, store.get_node(root_id))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    small, large = peak_for(500), peak_for(5000)
+    assert large < 2 * small + 64 * 1024, (small, large)
+    print("✓ Flat memory: PASSED")
+
+
+if __name__ == "__main__":
+    test_matches_serialize()
+    test_edge_documents()
+    test_flat_memory()
+    print("\n✅ All YAML emitter tests PASSED!")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test the event-stream YAML parse path.
+
+Tests that:
+1. Streaming and plain-data parsing build identical trees on every backend
+2. Aliases, merge keys, duplicate keys and tagged collections match safe_load
+3. A failed parse leaves the store untouched
+4. IRStore.insert_nodes applies the link rules
+"""
+
+import random
+from pathlib import Path
+
+import yaml
+
+from zeno.core.node import Node
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.columnar_store import ColumnarIRStore
+from zeno.core.persistent_store import PersistentIRStore
+from zeno.adapters.yaml_adapter import serialize, parse
+
+
+BACKENDS = (IRStore, ColumnarIRStore, PersistentIRStore)
+
+
+def _build(text, store_class=IRStore, streaming=True):
+    data = yaml.safe_load(text)
+    store = store_class()
+    store.create_root(NodeType.LIST if isinstance(data, list) else NodeType.OBJECT)
+    parse(text, store, streaming=streaming)
+    return store
+
+
+def _shape(store):
+    root = store.get_node(store.root_id)
+    return len(store), root.value, serialize(root, store)
+
+
+def _same(text, store_class=IRStore):
+    assert _shape(_build(text, store_class)) == _shape(_build(text, store_class, False)), text
+
+
+def test_matches_plain_parse():
+    """Test that both paths give the same tree for configs and random documents."""
+    paths = sorted(Path("ConfigOutput").glob("*.yaml")) + sorted(Path("schema").glob("*.zs"))
+    texts = [path.read_text(encoding="utf-8") for path in paths]
+    texts += ["- 1\n- [a, b]\n- {k: v}\n", "", "~\n", "42\n", "1: one\ntrue: t\n2024-01-01: d\n"]
+
+    rng = random.Random(14)
+    leaves = ["1", "-2.5", "true", "null", "~", "2024-01-02", "0x1F", "'quoted'", "plain text", "!!str 7"]
+
+    def value(depth, indent):
+        roll = rng.random()
+        pad = " " * indent
+        if depth < 4 and roll < 0.25:
+            keys = rng.sample(range(50), rng.randint(1, 4))
+            return "".join(f"\n{pad}k{k}:{value(depth + 1, indent + 2)}" for k in keys)
+        if depth < 4 and roll < 0.4:
+            return "".join(f"\n{pad}-{value(depth + 1, indent + 2)}" for _ in range(rng.randint(1, 4)))
+        return " " + rng.choice(leaves)
+
+    texts += [f"root:{value(0, 2)}\nitems:{value(1, 2)}\n" for _ in range(200)]
+
+    for store_class in BACKENDS:
+        for text in texts:
+            _same(text, store_class)
+    print("✓ Matches plain parse: PASSED")
+
+
+def test_yaml_features():
+    """Test aliases and the constructs handed to the full loader."""
+    aliases = "base: &b {x: 1, y: [1, 2]}\nother: *b\nname: &n hello\ncopy: *n\n"
+    store = _build(aliases)
+    assert yaml.safe_load(serialize(store.get_node(store.root_id), store)) == yaml.safe_load(aliases)
+    assert len(store) == 13  # the aliased mapping is copied, not shared
+
+    fallbacks = (
+        "a: 1\na: 2\n",
+        "base: &b {x: 1}\nm:\n  <<: *b\n  y: 2\n",
+        "s: !!set {a, b}\n",
+        "o: !!omap [{a: 1}, {b: 2}]\n",
+        "x: !!binary aGVsbG8=\n",
+    )
+    for text in fallbacks:
+        for store_class in BACKENDS:
+            _same(text, store_class)
+    print("✓ YAML features: PASSED")
+
+
+def test_failed_parse_rolls_back():
+    """Test that errors leave no partial tree behind."""
+    for text in ("a: {b: [1, 2]}\nc: [1, 2\n", "a: 1\n---\nb: 2\n", "a: [1]\nb: *missing\n", "a: !custom x\n"):
+        for store_class in BACKENDS:
+            store = store_class()
+            store.create_root(NodeType.OBJECT)
+            try:
+                parse(text, store)
+                assert False, "Should reject the document"
+            except yaml.YAMLError:
+                pass
+            assert len(store) == 1 and store.child_count(store.root_id) == 0
+
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    try:
+        parse("- a\n- b\n", store)
+        assert False, "Should reject list items under an object root"
+    except ValueError:
+        pass
+    assert len(store) == 1
+    print("✓ Failed parse rolls back: PASSED")
+
+
+def test_insert_nodes():
+    """Test the bulk insert path used by the event parser."""
+    for store_class in BACKENDS:
+        store = store_class()
+        root_id = store.create_root(NodeType.OBJECT)
+        items = Node(id=store.allocate_id(), type=NodeType.LIST, parent_id=root_id, key="items")
+        first = Node(id=store.allocate_id(), type=NodeType.SCALAR, parent_id=items.id, value=1)
+        second = Node(id=store.allocate_id(), type=NodeType.SCALAR, parent_id=items.id, value=2)
+        assert store.insert_nodes(iter([items, first, second])) == 3
+        assert list(store.iter_children(items.id)) == [first.id, second.id]
+        assert store.get_child_by_key(root_id, "items") == items.id
+
+        for bad in (
+            Node(id=None, type=NodeType.SCALAR, parent_id=root_id, key="items"),
+            Node(id=None, type=NodeType.SCALAR, parent_id=items.id, key="x"),
+            Node(id=None, type=NodeType.SCALAR, parent_id=first.id),
+        ):
+            try:
+                store.insert_nodes([bad])
+                assert False, "Should reject the link"
+            except ValueError:
+                pass
+        assert len(store) == 4
+    print("✓ insert_nodes: PASSED")
+
+
+if __name__ == "__main__":
+    test_matches_plain_parse()
+    test_yaml_features()
+    test_failed_parse_rolls_back()
+    test_insert_nodes()
+    print("\n✅ All YAML event tests PASSED!")
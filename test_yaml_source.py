@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test source spans and partial re-parse of YAML configs.
+
+Tests that:
+1. Parsing records each node's span (key to end of value) in a SourceMap
+2. A change inside one top-level section re-parses only that section
+3. Changes elsewhere, new keys, anchors and edited documents need a full load
+"""
+
+from zeno.core.types import NodeType
+from zeno.core.store import IRStore
+from zeno.core.operation import Operation
+from zeno.core.operation_processor import OperationProcessor
+from zeno.adapters.yaml_adapter import serialize, parse
+from zeno.adapters.yaml_reparse import reparse_changed
+from zeno.adapters.yaml_source import SourceMap
+
+
+SAMPLE_YAML = """# gateway config
+name: gateway
+listeners:
+- port: 502
+  host: plc-1
+- port: 503
+limits:
+  timeout: 1.5
+"""
+
+
+def _load(text):
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    source = SourceMap()
+    parse(text, store, source=source)
+    return store, OperationProcessor(store), source
+
+
+def _text(store):
+    return serialize(store.get_node(store.root_id), store)
+
+
+def _at(store, *path):
+    node_id = store.root_id
+    for step in path:
+        if isinstance(step, int):
+            node_id = list(store.iter_children(node_id))[step]
+        else:
+            node_id = store.get_child_by_key(node_id, step)
+    return node_id
+
+
+def test_spans():
+    """Test spans and locations of keyed entries, list items and the root."""
+    store, _, source = _load(SAMPLE_YAML)
+
+    host = source.span(_at(store, "listeners", 0, "host"))
+    assert SAMPLE_YAML[host.start_index:host.end_index] == "host: plc-1"
+    assert (host.start_line, host.start_column, host.end_column) == (4, 2, 13)
+    item = source.span(_at(store, "listeners", 1))
+    assert SAMPLE_YAML[item.start_index:item.end_index] == "port: 503\n"
+    assert source.location(_at(store, "limits", "timeout")) == "line 8, column 3"
+    assert source.span(store.root_id).end_index == len(SAMPLE_YAML)
+    assert [section.key for section in source.sections] == ["name", "listeners", "limits"]
+
+    unsectioned = ("a: &x 1\nb: *x\n", "{a: 1, b: 2}\n", "- 1\n- 2\n", "  a: 1\n  b: 2\n")
+    for text in unsectioned:
+        store = IRStore()
+        store.create_root(NodeType.LIST if text.startswith("-") else NodeType.OBJECT)
+        parse(text, store, source=source)
+        assert source.sections == [] and source.span(store.root_id) is not None, text
+
+    store = IRStore()
+    store.create_root(NodeType.OBJECT)
+    parse("a: 1\nb: [1, 2]\n", store, streaming=False, source=source)
+    assert source.span(store.root_id) is None
+    print("✓ Spans: PASSED")
+
+
+def test_reparse_one_section():
+    """Test that a one-section change swaps in that subtree and moves later spans."""
+    store, processor, source = _load(SAMPLE_YAML)
+    name_id, limits_id = _at(store, "name"), _at(store, "limits")
+    changed = SAMPLE_YAML.replace("- port: 503\n", "- port: 503\n  host: plc-2\n- port: 504\n")
+
+    assert reparse_changed(changed, store, processor, source)
+    full, _, _ = _load(changed)
+    assert _text(store) == _text(full)
+    assert _at(store, "name") == name_id and _at(store, "limits") == limits_id
+    timeout = source.span(_at(store, "limits", "timeout"))
+    assert changed[timeout.start_index:timeout.end_index] == "timeout: 1.5"
+    assert source.location(_at(store, "limits", "timeout")) == "line 10, column 3"
+    host = source.span(_at(store, "listeners", 1, "host"))
+    assert changed[host.start_index:host.end_index] == "host: plc-2"
+
+    again = changed.replace("timeout: 1.5", "timeout: 2.5")
+    assert reparse_changed(again, store, processor, source)
+    assert store.get_node(_at(store, "limits", "timeout")).value == 2.5
+    assert reparse_changed(again, store, processor, source)  # unchanged text
+
+    processor.undo()
+    processor.undo()
+    assert _text(store) == _text(_load(SAMPLE_YAML)[0])
+    print("✓ Reparse one section: PASSED")
+
+
+def test_full_load_needed():
+    """Test the cases that leave the document alone and ask for a full load."""
+    cases = (
+        SAMPLE_YAML.replace("# gateway", "# edge"),
+        SAMPLE_YAML.replace("gateway", "edge").replace("1.5", "2"),
+        SAMPLE_YAML.replace("- port: 503\n", "- port: 503\nmode: fast\n"),
+        SAMPLE_YAML.replace("- port: 503\n", "- port: 503\n limits: 3\n"),
+        SAMPLE_YAML.replace("name: gateway", "title: gateway"),
+        SAMPLE_YAML.replace("- port: 503\n", "- port: &p 503\n"),
+        SAMPLE_YAML.replace("- port: 503\n", "- port: 503\n...\n"),
+        SAMPLE_YAML.replace("- port: 503\n", "- port: [503\n"),
+    )
+    for changed in cases:
+        store, processor, source = _load(SAMPLE_YAML)
+        before = _text(store)
+        assert not reparse_changed(changed, store, processor, source), changed
+        assert _text(store) == before and source.text == SAMPLE_YAML
+
+    store, processor, source = _load(SAMPLE_YAML)
+    name_id = _at(store, "name")
+    processor.apply(Operation.create("update_scalar", name_id, {"node_id": name_id, "value": "edge"}))
+    assert not reparse_changed(SAMPLE_YAML.replace("1.5", "2"), store, processor, source)
+    print("✓ Full load needed: PASSED")
+
+
+if __name__ == "__main__":
+    test_spans()
+    test_reparse_one_section()
+    test_full_load_needed()
+    print("\n✅ All YAML source tests PASSED!")